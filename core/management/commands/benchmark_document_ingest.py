@@ -0,0 +1,89 @@
+import io
+import resource
+import time
+import tracemalloc
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from PIL import Image
+
+from core.utilities.document_ingest import ingest_document_file
+
+# Representative camera/phone photo sizes: label -> (width, height)
+IMAGE_SIZES = {
+    '1 MP': (1280, 800),
+    '6 MP': (3000, 2000),
+    '12 MP': (4032, 3024),
+    '24 MP': (6000, 4000),
+}
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the document ingest pipeline (EXIF strip, hashes, thumbnail) across image sizes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='Ingest runs per image size (default: 3)',
+        )
+        parser.add_argument(
+            '--format',
+            choices=['jpeg', 'png'],
+            default='jpeg',
+            help='Image format to generate (default: jpeg)',
+        )
+
+    def handle(self, *args, **options):
+        repeat = max(1, options['repeat'])
+        image_format = options['format']
+
+        self.stdout.write(
+            f"{'Size':>6}  {'Upload':>9}  {'Best':>8}  {'Mean':>8}  {'Python peak':>11}  {'Max RSS':>9}"
+        )
+        for label, size in IMAGE_SIZES.items():
+            content = _make_image(size, image_format)
+            durations = []
+            python_peak = 0
+            for _ in range(repeat):
+                upload = SimpleUploadedFile(f'benchmark.{image_format}', content, content_type=f'image/{image_format}')
+                tracemalloc.start()
+                started = time.perf_counter()
+                ingested = ingest_document_file(upload)
+                durations.append(time.perf_counter() - started)
+                python_peak = max(python_peak, tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+                if not ingested.image_hash:
+                    self.stdout.write(self.style.WARNING(f"  {label}: no image hash produced"))
+
+            # ru_maxrss is the process high-water mark (KiB on Linux), so sizes run smallest first
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+            self.stdout.write(
+                f"{label:>6}  {_megabytes(len(content)):>9}  {min(durations):>7.2f}s  "
+                f"{sum(durations) / len(durations):>7.2f}s  {_megabytes(python_peak):>11}  {_megabytes(max_rss):>9}"
+            )
+
+        self.stdout.write(self.style.SUCCESS('\nBenchmark complete'))
+
+
+def _make_image(size: tuple[int, int], image_format: str) -> bytes:
+    """Encode a gradient-plus-noise test image of the given size, with EXIF for JPEG."""
+    image = Image.merge('RGB', (
+        Image.linear_gradient('L').resize(size),
+        Image.linear_gradient('L').rotate(90).resize(size),
+        Image.effect_noise(size, 64),
+    ))
+    buffer = io.BytesIO()
+    if image_format == 'jpeg':
+        exif = Image.Exif()
+        exif[0x010F] = 'Benchmark Camera'  # Make
+        exif[0x0132] = '2024:01:01 00:00:00'  # DateTime
+        image.save(buffer, format='JPEG', quality=90, exif=exif.tobytes())
+    else:
+        image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def _megabytes(byte_count: int) -> str:
+    return f'{byte_count / (1024 * 1024):.1f} MB'
@@ -0,0 +1,74 @@
+import io
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from openpyxl.styles import Border, Side
+from openpyxl.workbook import Workbook
+
+from core.utilities.tabular_export import ExportColumn, write_xlsx
+
+COLUMNS = [ExportColumn(title=f"Column {index}", group=f"Group {index // 5}") for index in range(14)] + [
+    ExportColumn(title="Ratio", group="Group 2", number_format="0.00"),
+]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the streaming XLSX export engine against an in-memory workbook as row counts grow'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            nargs='+',
+            default=[1_000, 10_000, 50_000],
+            help='Row counts to export (default: 1000 10000 50000)',
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'Rows':>8}  {'Engine':<10}  {'Time':>8}  {'Python peak':>11}  {'File':>9}")
+        for row_count in sorted(options['rows']):
+            for engine, export in (('in-memory', _export_in_memory), ('streaming', _export_streaming)):
+                tracemalloc.start()
+                started = time.perf_counter()
+                size = export(row_count)
+                duration = time.perf_counter() - started
+                python_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                self.stdout.write(
+                    f"{row_count:>8}  {engine:<10}  {duration:>7.2f}s  {_megabytes(python_peak):>11}  {_megabytes(size):>9}"
+                )
+
+        self.stdout.write(self.style.SUCCESS('\nBenchmark complete'))
+
+
+def _rows(row_count: int):
+    for index in range(row_count):
+        yield [f"developer-{index}", *range(index, index + 13), index / 7]
+
+
+def _export_in_memory(row_count: int) -> int:
+    """The previous approach: a regular workbook with a style object on every cell, saved to a BytesIO."""
+    workbook = Workbook()
+    sheet = workbook.active
+    thin_side = Side(style="thin")
+    for row in _rows(row_count):
+        sheet.append(row)
+    for row in sheet.iter_rows(min_row=1):
+        for cell in row:
+            cell.border = Border(bottom=thin_side, left=thin_side, right=thin_side, top=thin_side)
+    output = io.BytesIO()
+    workbook.save(output)
+    return len(output.getvalue())
+
+
+def _export_streaming(row_count: int) -> int:
+    output = write_xlsx(columns=COLUMNS, rows=_rows(row_count))
+    try:
+        return output.seek(0, io.SEEK_END)
+    finally:
+        output.close()
+
+
+def _megabytes(byte_count: int) -> str:
+    return f'{byte_count / (1024 * 1024):.1f} MB'
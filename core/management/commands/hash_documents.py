@@ -1,9 +1,23 @@
 import hashlib
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import Optional
 
+from django.conf import settings
+from django.core.files.storage import default_storage
 from django.core.management.base import BaseCommand
-from django.db.models import Count
+from django.db.models import Count, Q
+from simple_history.utils import bulk_update_with_history
 
 from core.models.document import Document
+from core.utilities.image_similarity import compute_dhash, is_image_file
+from core.utilities.minio_object_storage import get_object
+
+# Bytes read from storage per call while hashing
+READ_CHUNK_SIZE = 1024 * 1024
 
 
 class Command(BaseCommand):
@@ -15,50 +29,178 @@ class Command(BaseCommand):
             action='store_true',
             help='Recalculate hashes for all documents, not just those missing hashes',
         )
+        parser.add_argument(
+            '--image-hashes',
+            action='store_true',
+            help='Also compute perceptual hashes (dhash) of image files in the same pass',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Documents read and hashed concurrently (default: 8)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Documents per batch; progress is saved after each batch (default: 500)',
+        )
+        parser.add_argument(
+            '--checkpoint-file',
+            default='hash_documents.checkpoint.json',
+            help='Where progress is saved so an interrupted run resumes (default: hash_documents.checkpoint.json)',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore any saved progress and start from the first document',
+        )
 
     def handle(self, *args, **options):
-        if options['all']:
-            documents = Document.objects.filter(file__isnull=False).exclude(file='')
-        else:
-            documents = Document.objects.filter(
-                file__isnull=False,
-                file_hash__isnull=True
-            ).exclude(file='')
-
-        total = documents.count()
+        workers = max(options['workers'], 1)
+        batch_size = max(options['batch_size'], 1)
+        image_hashes = options['image_hashes']
+        checkpoint_file = options['checkpoint_file']
+        run = {'all': options['all'], 'image_hashes': image_hashes}
+
+        documents = Document.objects.filter(file__isnull=False).exclude(file='')
+        if not options['all']:
+            missing = Q(file_hash__isnull=True)
+            if image_hashes:
+                missing |= Q(image_hash__isnull=True)
+            documents = documents.filter(missing)
+
+        checkpoint = None if options['restart'] else _load_checkpoint(checkpoint_file)
+        if checkpoint and checkpoint['run'] != run:
+            self.stdout.write(self.style.WARNING("Saved progress is from a run with other options, starting over"))
+            checkpoint = None
+        checkpoint = checkpoint or {'run': run, 'last_id': 0, 'hashed': 0, 'errors': 0}
+        if checkpoint['last_id']:
+            self.stdout.write(f"Resuming after document ID {checkpoint['last_id']}")
+
+        remaining = documents.filter(id__gt=checkpoint['last_id']).order_by('id')
+        total = remaining.count()
         self.stdout.write(f"Found {total} document(s) to process")
 
-        updated = 0
-        errors = 0
-
-        for doc in documents:
-            try:
-                if doc.file:
-                    doc.file.seek(0)
-                    sha256 = hashlib.sha256()
-                    for chunk in doc.file.chunks():
-                        sha256.update(chunk)
-                    doc.file_hash = sha256.hexdigest()
-                    doc.save(update_fields=['file_hash'])
-                    updated += 1
-                    self.stdout.write(f"  Hashed: {doc.name} -> {doc.file_hash[:16]}...")
-            except Exception as e:
-                errors += 1
-                self.stdout.write(self.style.ERROR(f"  Error hashing {doc.name}: {e}"))
-
-        self.stdout.write(self.style.SUCCESS(f"\nCompleted: {updated} hashed, {errors} errors"))
-
-        # Show duplicates summary
-        duplicates = Document.objects.filter(
+        processed = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                batch = list(remaining.filter(id__gt=checkpoint['last_id'])[:batch_size])
+                if not batch:
+                    break
+
+                if not options['all']:
+                    # Only missing image hashes can be filled in for already hashed files
+                    batch_to_hash = [
+                        doc for doc in batch if doc.file_hash is None or is_image_file(doc.file.name)
+                    ]
+                else:
+                    batch_to_hash = batch
+
+                changed = []
+                for doc, result in zip(batch_to_hash, executor.map(
+                    lambda doc: _hash_document(doc, image_hashes), batch_to_hash
+                )):
+                    file_hash, image_hash, error = result
+                    if error:
+                        checkpoint['errors'] += 1
+                        self.stdout.write(self.style.ERROR(f"  Error hashing {doc.name} (ID: {doc.id}): {error}"))
+                        continue
+                    if not image_hashes:
+                        image_hash = doc.image_hash
+                    if (file_hash, image_hash) != (doc.file_hash, doc.image_hash):
+                        doc.file_hash, doc.image_hash = file_hash, image_hash
+                        changed.append(doc)
+                    checkpoint['hashed'] += 1
+
+                if changed:
+                    # With history, so image similarity indexes in other processes pick the changes up
+                    bulk_update_with_history(changed, Document, ['file_hash', 'image_hash'], batch_size=batch_size)
+
+                processed += len(batch)
+                checkpoint['last_id'] = batch[-1].id
+                _save_checkpoint(checkpoint_file, checkpoint)
+                self.stdout.write(f"  Processed {processed}/{total} ({len(changed)} updated in this batch)")
+
+        if os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
+        self.stdout.write(self.style.SUCCESS(
+            f"\nCompleted: {checkpoint['hashed']} hashed, {checkpoint['errors']} errors"
+        ))
+
+        self._write_duplicates_summary()
+
+    def _write_duplicates_summary(self):
+        """List documents sharing a SHA-256, loaded in a single query."""
+        duplicated_hashes = Document.objects.filter(
             file_hash__isnull=False
         ).values('file_hash').annotate(
             count=Count('id')
-        ).filter(count__gt=1)
-
-        if duplicates:
-            self.stdout.write(self.style.WARNING(f"\nFound {len(duplicates)} duplicate file(s):"))
-            for dup in duplicates:
-                docs = Document.objects.filter(file_hash=dup['file_hash'])
-                self.stdout.write(f"  Hash {dup['file_hash'][:16]}... ({dup['count']} copies):")
-                for d in docs:
-                    self.stdout.write(f"    - {d.name} (ID: {d.id})")
+        ).filter(count__gt=1).values('file_hash')
+
+        duplicates = Document.objects.filter(
+            file_hash__in=duplicated_hashes
+        ).order_by('file_hash', 'id').values_list('file_hash', 'id', 'name')
+
+        groups = [
+            (file_hash, list(rows)) for file_hash, rows in groupby(duplicates, key=lambda row: row[0])
+        ]
+        if groups:
+            self.stdout.write(self.style.WARNING(f"\nFound {len(groups)} duplicate file(s):"))
+            for file_hash, rows in groups:
+                self.stdout.write(f"  Hash {file_hash[:16]}... ({len(rows)} copies):")
+                for _, doc_id, name in rows:
+                    self.stdout.write(f"    - {name} (ID: {doc_id})")
+
+
+def _hash_document(doc: Document, image_hashes: bool) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Hash one document's file; runs on a worker thread without database access.
+
+    Returns:
+        (file_hash, image_hash, error); image_hash is only computed for image
+        files when ``image_hashes`` is set
+    """
+    try:
+        stream = _open_stored_file(doc.file.name)
+        try:
+            sha256 = hashlib.sha256()
+            image = io.BytesIO() if image_hashes and is_image_file(doc.file.name) else None
+            while chunk := stream.read(READ_CHUNK_SIZE):
+                sha256.update(chunk)
+                if image is not None:
+                    image.write(chunk)
+        finally:
+            stream.close()
+
+        image_hash = None
+        if image is not None:
+            image.seek(0)
+            image_hash = compute_dhash(image)
+        return sha256.hexdigest(), image_hash, None
+    except Exception as e:
+        return None, None, str(e) or e.__class__.__name__
+
+
+def _open_stored_file(name: str):
+    """Open a stored file for streaming; MinIO reads share the pooled client."""
+    if settings.USE_MINIO:
+        return get_object(name)['Body']
+    return default_storage.open(name, 'rb')
+
+
+def _load_checkpoint(path: str) -> Optional[dict]:
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_checkpoint(path: str, checkpoint: dict) -> None:
+    """Write the checkpoint atomically, so an interrupt never leaves it truncated."""
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w') as file:
+        json.dump(checkpoint, file)
+    os.replace(temp_path, path)
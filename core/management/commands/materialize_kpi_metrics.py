@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models.sprint import Sprint
+from kpi.utilities.materialize_sprint_metrics import closed_sprints_to_materialize, materialize_sprint_metrics
+
+
+class Command(BaseCommand):
+    help = 'Materialize the cached KPI metric columns of closed sprints (the GitLab sync does this on sprint close)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sprint',
+            help='UUID of a single sprint to materialize, closed or not',
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Re-materialize every closed sprint, not just those without cached metrics',
+        )
+
+    def handle(self, *args, **options):
+        if options['sprint']:
+            sprint = Sprint.from_uuid(uuid=options['sprint'])
+            if sprint is None:
+                raise CommandError(f"Sprint {options['sprint']} not found")
+            sprints = [sprint]
+        else:
+            sprints = closed_sprints_to_materialize(include_materialized=options['all'])
+
+        materialized = 0
+        for sprint in sprints:
+            count = materialize_sprint_metrics(sprint=sprint)
+            materialized += 1
+            self.stdout.write(f"  {sprint}: {count} KPI row(s)")
+
+        self.stdout.write(self.style.SUCCESS(f"Materialized {materialized} sprint(s)"))
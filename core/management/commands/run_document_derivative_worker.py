@@ -0,0 +1,137 @@
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from django.core.management.base import BaseCommand
+
+from core.models.document import Document
+from core.utilities.document_derivatives import (
+    apply_document_derivatives,
+    claim_document_derivatives,
+    fail_document_derivatives,
+    renew_document_derivative_leases,
+)
+from core.utilities.document_ingest import derive_document_file
+
+
+class Command(BaseCommand):
+    help = "Generates document derivatives (EXIF stripping, hashes, thumbnails) in a process pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes for CPU-bound decode/encode work (default: CPU count)",
+        )
+        parser.add_argument(
+            "--lease-seconds",
+            type=int,
+            default=600,
+            help="Lease duration; documents of a worker silent for this long are retried (default: 600)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds between queue polls when idle (default: 2.0)",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=3,
+            help="Maximum attempts per document before it is marked failed (default: 3)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is drained instead of polling forever",
+        )
+
+    def handle(self, *args, **options):
+        processes = max(options["processes"], 1)
+        lease_seconds = max(options["lease_seconds"], 30)
+        max_attempts = max(options["max_attempts"], 1)
+        # Read the next files from storage while the pool is busy with the current ones
+        max_in_flight = processes * 2
+        stop_event = threading.Event()
+
+        def request_stop(signum, frame):
+            if stop_event.is_set():
+                # Abandoned documents keep their lease until it expires, then get retried
+                self.stdout.write(self.style.ERROR("Aborting in-flight documents"))
+                os._exit(1)
+            self.stdout.write(
+                self.style.WARNING("Stopping after in-flight documents finish (signal again to abort)...")
+            )
+            stop_event.set()
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+
+        def create_pool() -> ProcessPoolExecutor:
+            # spawn: children never inherit the parent's database connections or threads
+            return ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+
+        self.stdout.write(f"Document derivative worker started ({processes} processes)")
+
+        pool = create_pool()
+        in_flight: dict[Future, Document] = {}
+        try:
+            while in_flight or not stop_event.is_set():
+                renew_document_derivative_leases(
+                    [document.id for document in in_flight.values()], lease_seconds=lease_seconds
+                )
+
+                if not stop_event.is_set() and len(in_flight) < max_in_flight:
+                    for document in claim_document_derivatives(
+                        limit=max_in_flight - len(in_flight),
+                        lease_seconds=lease_seconds,
+                        max_attempts=max_attempts,
+                    ):
+                        try:
+                            document.file.open("rb")
+                            try:
+                                content = document.file.read()
+                            finally:
+                                document.file.close()
+                        except Exception as e:
+                            fail_document_derivatives(document.id, f"Could not read file: {e}", max_attempts)
+                            self.stdout.write(self.style.ERROR(f"  Could not read document {document.id}: {e}"))
+                            continue
+                        in_flight[pool.submit(derive_document_file, document.file.name, content)] = document
+
+                if not in_flight:
+                    if options["once"]:
+                        break
+                    stop_event.wait(options["poll_interval"])
+                    continue
+
+                done, _ = wait(in_flight, timeout=options["poll_interval"], return_when=FIRST_COMPLETED)
+                pool_broken = False
+                for future in done:
+                    document = in_flight.pop(future)
+                    try:
+                        if apply_document_derivatives(document, future.result()):
+                            self.stdout.write(f"  Processed document {document.id} ({document.name})")
+                        else:
+                            self.stdout.write(f"  Discarded results for changed document {document.id}")
+                    except Exception as e:
+                        pool_broken = pool_broken or isinstance(e, BrokenProcessPool)
+                        fail_document_derivatives(document.id, str(e) or e.__class__.__name__, max_attempts)
+                        self.stdout.write(self.style.ERROR(f"  Failed document {document.id}: {e}"))
+
+                if pool_broken:
+                    # A child crashed (e.g. killed for memory); every pending future of the pool fails too
+                    for future, document in in_flight.items():
+                        fail_document_derivatives(document.id, "Worker process pool crashed", max_attempts)
+                    in_flight.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = create_pool()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        self.stdout.write(self.style.SUCCESS("Document derivative worker stopped"))
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-18 18:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0024_proposalupdate_documents'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalthisserverconfiguration',
+            name='gitlab_sync_fetch_concurrency',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='thisserverconfiguration',
+            name='gitlab_sync_fetch_concurrency',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.7 on 2026-10-18 21:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_add_gitlab_sync_fetch_concurrency'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='derivative_attempts',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='derivative_error',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='derivative_lease_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='derivative_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='done', help_text='State of background derivative generation for the current file', max_length=16),
+        ),
+        migrations.AddField(
+            model_name='historicaldocument',
+            name='derivative_attempts',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='historicaldocument',
+            name='derivative_error',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='historicaldocument',
+            name='derivative_lease_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='historicaldocument',
+            name='derivative_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('done', 'Done'), ('failed', 'Failed')], db_index=True, default='done', help_text='State of background derivative generation for the current file', max_length=16),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1.7 on 2026-10-18 23:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def group_legacy_snapshots(apps, schema_editor):
+    """
+    Give every row of a legacy snapshot the snapshot's first timestamp.
+
+    Snapshots used to be saved one row per table with auto_now_add, so each row
+    got its own recorded_at and only the last table written looked like the
+    latest snapshot. A snapshot holds each table once: a repeated table name,
+    in id order, starts the next one.
+    """
+    DatabaseSizeHistory = apps.get_model('core', 'DatabaseSizeHistory')
+    batch_ids = []
+    batch_tables = set()
+    batch_recorded_at = None
+
+    def save_batch():
+        if len(batch_ids) > 1:
+            DatabaseSizeHistory.objects.filter(id__in=batch_ids).update(recorded_at=batch_recorded_at)
+
+    rows = DatabaseSizeHistory.objects.order_by('id').values_list('id', 'table_name', 'recorded_at')
+    for row_id, table_name, recorded_at in rows.iterator():
+        if table_name in batch_tables:
+            save_batch()
+            batch_ids, batch_tables = [], set()
+        if not batch_ids:
+            batch_recorded_at = recorded_at
+        batch_ids.append(row_id)
+        batch_tables.add(table_name)
+    save_batch()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_add_cache_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='databasesizehistory',
+            name='recorded_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='When this snapshot was recorded'),
+        ),
+        migrations.RunPython(group_legacy_snapshots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-18 21:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0028_alter_databasesizehistory_recorded_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='estimation',
+            name='cached_rollup',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='historicalestimation',
+            name='cached_rollup',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import models
+from django.db.models import F
+
+from core.models.common.abstract.abstract_base_model import AbstractBaseModel
+
+
+class CacheVersion(AbstractBaseModel):
+    """
+    Version counter of a process-level cache.
+
+    Every process compares the counter against the version it cached; bumping
+    it in the same transaction as the change invalidates all other processes.
+    """
+
+    _disable_history = True  # Counter bumped on every change, an audit trail adds nothing
+
+    name: str = models.CharField(max_length=255, unique=True)
+    version: int = models.BigIntegerField(default=0)
+
+    @staticmethod
+    def get_version(name: str) -> int:
+        return CacheVersion.objects.filter(name=name).values_list('version', flat=True).first() or 0
+
+    @staticmethod
+    def bump(name: str) -> None:
+        if not CacheVersion.objects.filter(name=name).update(version=F('version') + 1):
+            _, created = CacheVersion.objects.get_or_create(name=name, defaults={'version': 1})
+            if not created:
+                CacheVersion.objects.filter(name=name).update(version=F('version') + 1)
+
+    def __str__(self) -> str:
+        return f"{self.name} (v{self.version})"
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = "Cache Version"
+        verbose_name_plural = "Cache Versions"
@@ -0,0 +1,12 @@
+DOCUMENT_DERIVATIVE_STATUS_PENDING: str = "pending"
+DOCUMENT_DERIVATIVE_STATUS_PROCESSING: str = "processing"
+DOCUMENT_DERIVATIVE_STATUS_DONE: str = "done"
+DOCUMENT_DERIVATIVE_STATUS_FAILED: str = "failed"
+
+# noinspection DuplicatedCode
+DOCUMENT_DERIVATIVE_STATUS_CHOICES: list[tuple[str, str]] = [
+    (DOCUMENT_DERIVATIVE_STATUS_PENDING, "Pending"),
+    (DOCUMENT_DERIVATIVE_STATUS_PROCESSING, "Processing"),
+    (DOCUMENT_DERIVATIVE_STATUS_DONE, "Done"),
+    (DOCUMENT_DERIVATIVE_STATUS_FAILED, "Failed"),
+]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from core.models.common.abstract.abstract_base_model import AbstractBaseModel
 
 
@@ -14,7 +15,8 @@ class DatabaseSizeHistory(AbstractBaseModel):
         default=0
     )
     row_count = models.IntegerField(null=True, blank=True)
-    recorded_at = models.DateTimeField(auto_now_add=True, help_text="When this snapshot was recorded")
+    # Shared by every row of one snapshot, so the latest snapshot is a single timestamp
+    recorded_at = models.DateTimeField(default=timezone.now, help_text="When this snapshot was recorded")
 
     def __str__(self):
         return f"{self.table_name} - {self.size_bytes} bytes ({self.recorded_at})"
@@ -1,13 +1,16 @@
-import hashlib
-
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from core.models.common.abstract.abstract_base_model import AbstractBaseModel
 from core.models.common.abstract.abstract_comment import AbstractComment
 from core.models.common.abstract.abstract_name import AbstractName
 from core.models.common.abstract.abstract_version import AbstractVersion
-from core.utilities.strip_exif import strip_exif_from_file
+from core.models.common.enums.document_derivative_status_choices import (
+    DOCUMENT_DERIVATIVE_STATUS_CHOICES,
+    DOCUMENT_DERIVATIVE_STATUS_DONE,
+    DOCUMENT_DERIVATIVE_STATUS_PENDING,
+)
+from core.utilities.image_hash_index import document_image_hash_index
 from core.utilities.uuid_upload_path import uuid_upload_path
 
 
@@ -41,32 +44,17 @@ class Document(AbstractBaseModel, AbstractComment, AbstractName, AbstractVersion
         help_text='AVIF thumbnail for fast preview'
     )
 
-    def _calculate_file_hash(self):
-        """Calculate SHA-256 hash of file contents."""
-        if not self.file:
-            return None
-        try:
-            self.file.seek(0)
-            sha256 = hashlib.sha256()
-            for chunk in self.file.chunks():
-                sha256.update(chunk)
-            self.file.seek(0)
-            return sha256.hexdigest()
-        except Exception:
-            return None
-
-    def _calculate_image_hash(self):
-        """Calculate perceptual hash for images."""
-        if not self.file:
-            return None
-        try:
-            from core.utilities.image_similarity import compute_dhash, is_image_file
-            filename = self.file.name if self.file else ''
-            if not is_image_file(filename):
-                return None
-            return compute_dhash(self.file)
-        except Exception:
-            return None
+    # Derivatives (EXIF stripping, hashes, thumbnail) are generated by run_document_derivative_worker
+    derivative_status = models.CharField(
+        max_length=16,
+        choices=DOCUMENT_DERIVATIVE_STATUS_CHOICES,
+        default=DOCUMENT_DERIVATIVE_STATUS_DONE,
+        db_index=True,
+        help_text='State of background derivative generation for the current file'
+    )
+    derivative_error = models.TextField(null=True, blank=True)
+    derivative_attempts = models.IntegerField(default=0)
+    derivative_lease_expires_at = models.DateTimeField(null=True, blank=True)
 
     @property
     def is_image(self):
@@ -87,18 +75,23 @@ class Document(AbstractBaseModel, AbstractComment, AbstractName, AbstractVersion
         return None
 
     def save(self, *args, **kwargs):
-        # Strip EXIF data from images before saving
-        if self.file and hasattr(self.file, 'seek'):
-            self.file = strip_exif_from_file(self.file)
-            # Calculate hashes after EXIF stripping
-            self.file_hash = self._calculate_file_hash()
-            self.image_hash = self._calculate_image_hash()
-            # Generate thumbnail
-            from core.utilities.thumbnail_generator import generate_thumbnail
-            thumb = generate_thumbnail(self.file, self.file.name)
-            if thumb:
-                self.thumbnail = thumb
+        # Newly uploaded files are stored as-is; a derivative worker strips, hashes and thumbnails them
+        if self.file and not self.file._committed:
+            self.file_hash = None
+            self.image_hash = None
+            self.derivative_status = DOCUMENT_DERIVATIVE_STATUS_PENDING
+            self.derivative_error = None
+            self.derivative_attempts = 0
+            self.derivative_lease_expires_at = None
         super().save(*args, **kwargs)
+        doc_id, image_hash = self.pk, self.image_hash
+        transaction.on_commit(lambda: document_image_hash_index.update(doc_id, image_hash))
+
+    def delete(self, *args, **kwargs):
+        doc_id = self.pk
+        result = super().delete(*args, **kwargs)
+        transaction.on_commit(lambda: document_image_hash_index.discard(doc_id))
+        return result
 
     def get_duplicates(self):
         """Find other documents with the same file hash."""
@@ -113,18 +106,18 @@ class Document(AbstractBaseModel, AbstractComment, AbstractName, AbstractVersion
         """
         if not self.image_hash:
             return []
-        from core.utilities.image_similarity import hamming_distance, similarity_percentage
-        similar = []
-        for doc in Document.objects.filter(image_hash__isnull=False).exclude(pk=self.pk):
-            distance = hamming_distance(self.image_hash, doc.image_hash)
-            if 0 <= distance <= threshold:
-                similarity = similarity_percentage(self.image_hash, doc.image_hash)
-                similar.append({
-                    'document': doc,
-                    'distance': distance,
-                    'similarity': similarity
-                })
-        return sorted(similar, key=lambda x: x['distance'])
+        from core.utilities.image_similarity import similarity_from_distance
+        matches = document_image_hash_index.query(self.image_hash, threshold, exclude_id=self.pk)
+        documents = Document.objects.in_bulk([doc_id for doc_id, _ in matches])
+        return [
+            {
+                'document': documents[doc_id],
+                'distance': distance,
+                'similarity': similarity_from_distance(distance)
+            }
+            for doc_id, distance in matches
+            if doc_id in documents
+        ]
 
     @property
     def has_file(self):
@@ -1,12 +1,15 @@
 from decimal import Decimal
+from functools import cached_property
 
-from django.db import models
+from django.db import OperationalError, models, transaction
 
 from core.models.application import Application
 from core.models.common.abstract.abstract_base_model import AbstractBaseModel
 from core.models.common.abstract.abstract_comment import AbstractComment
 from core.models.common.abstract.abstract_name import AbstractName
 from core.models.project import Project
+from core.utilities.estimation_rollup import EstimationRollup, compute_estimation_rollup, \
+    estimation_rollup_from_json, estimation_rollup_to_json
 
 
 class Estimation(AbstractBaseModel, AbstractComment, AbstractName):
@@ -70,93 +73,129 @@ class Estimation(AbstractBaseModel, AbstractComment, AbstractName):
         help_text="Order of groups for display (list of group names)"
     )
 
+    # Snapshot of the item totals (see rollup); cleared whenever an item changes
+    cached_rollup = models.JSONField(null=True, blank=True, editable=False)
+
+    @cached_property
+    def rollup(self) -> EstimationRollup:
+        """
+        Item totals behind every get_* method, loaded once per instance (so once per request).
+
+        Served from the cached_rollup snapshot when there is one; otherwise the
+        items are loaded in one query, rolled up in one pass and the snapshot is
+        stored without adding a history record.
+
+        The snapshot is read, computed and stored in one transaction. SQLite
+        ignores select_for_update and locks the whole database instead: once the
+        transaction has read, an item save committed before the snapshot is
+        written makes that write fail, and one committed after it clears the
+        snapshot again, so a snapshot of replaced items never survives. A write
+        that fails because the database is locked only skips the snapshot; the
+        computed totals are returned either way.
+        """
+        if self.cached_rollup is not None:
+            return estimation_rollup_from_json(self.cached_rollup)
+        if self.pk is None:
+            return compute_estimation_rollup(items=self.items.all())
+        rollup: EstimationRollup | None = None
+        try:
+            with transaction.atomic():
+                # Row lock on databases that support it, a no-op on SQLite
+                cached_rollup: dict | None = Estimation.objects.select_for_update().filter(
+                    pk=self.pk
+                ).values_list('cached_rollup', flat=True).first()
+                if cached_rollup is not None:
+                    self.cached_rollup = cached_rollup
+                    return estimation_rollup_from_json(cached_rollup)
+                rollup = compute_estimation_rollup(items=self.items.all())
+                # Only fill an empty snapshot; never overwrite one another request stored meanwhile
+                Estimation.objects.filter(pk=self.pk, cached_rollup__isnull=True).update(
+                    cached_rollup=estimation_rollup_to_json(rollup)
+                )
+        except OperationalError:
+            # The snapshot is optional: a concurrent item write holds the database lock
+            if rollup is None:
+                rollup = compute_estimation_rollup(items=self.items.all())
+        return rollup
+
+    def refresh_rollup(self) -> None:
+        """Forget this instance's rollup and snapshot, e.g. after changing its items in bulk."""
+        self.__dict__.pop('rollup', None)
+        self.cached_rollup = None
+        Estimation.clear_rollup_snapshot(estimation_id=self.pk)
+
+    @staticmethod
+    def clear_rollup_snapshot(estimation_id: int | None) -> None:
+        if estimation_id is not None:
+            Estimation.objects.filter(pk=estimation_id).update(cached_rollup=None)
+
     # Base hours (before uncertainty) - includes dev + code review + testing
     def get_base_hours_junior(self):
         """Calculate total base junior developer hours from all items (dev + code review + testing, before uncertainty)."""
-        return sum(
-            (item.hours_junior or 0) +
-            (item.code_review_hours_junior or 0) +
-            (item.tests_hours_junior or 0)
-            for item in self.items.all()
-        )
+        return self.rollup['base']['junior']
 
     def get_base_hours_mid(self):
         """Calculate total base mid-level developer hours from all items (dev + code review + testing, before uncertainty)."""
-        return sum(
-            (item.hours_mid or 0) +
-            (item.code_review_hours_mid or 0) +
-            (item.tests_hours_mid or 0)
-            for item in self.items.all()
-        )
+        return self.rollup['base']['mid']
 
     def get_base_hours_senior(self):
         """Calculate total base senior developer hours from all items (dev + code review + testing, before uncertainty)."""
-        return sum(
-            (item.hours_senior or 0) +
-            (item.code_review_hours_senior or 0) +
-            (item.tests_hours_senior or 0)
-            for item in self.items.all()
-        )
+        return self.rollup['base']['senior']
 
     def get_base_hours_lead(self):
         """Calculate total base lead developer hours from all items (dev + code review + testing, before uncertainty)."""
-        return sum(
-            (item.hours_lead or 0) +
-            (item.code_review_hours_lead or 0) +
-            (item.tests_hours_lead or 0)
-            for item in self.items.all()
-        )
+        return self.rollup['base']['lead']
 
     # Hours with uncertainty applied per level
     def get_total_hours_junior_with_uncertainty(self):
         """Calculate total junior developer hours from all items with uncertainty applied."""
-        return sum(item.get_junior_hours_with_uncertainty() for item in self.items.all())
+        return self.rollup['with_uncertainty']['junior']
 
     def get_total_hours_mid_with_uncertainty(self):
         """Calculate total mid-level developer hours from all items with uncertainty applied."""
-        return sum(item.get_mid_hours_with_uncertainty() for item in self.items.all())
+        return self.rollup['with_uncertainty']['mid']
 
     def get_total_hours_senior_with_uncertainty(self):
         """Calculate total senior developer hours from all items with uncertainty applied."""
-        return sum(item.get_senior_hours_with_uncertainty() for item in self.items.all())
+        return self.rollup['with_uncertainty']['senior']
 
     def get_total_hours_lead_with_uncertainty(self):
         """Calculate total lead developer hours from all items with uncertainty applied."""
-        return sum(item.get_lead_hours_with_uncertainty() for item in self.items.all())
+        return self.rollup['with_uncertainty']['lead']
 
     # Best case hours (minimum uncertainty - 1.1x multiplier)
     def get_total_hours_junior_best_case(self):
         """Calculate total junior developer hours with best case uncertainty (1.1x)."""
-        return sum(item.get_base_hours_junior() * Decimal('1.1') for item in self.items.all())
+        return self.rollup['best_case']['junior']
 
     def get_total_hours_mid_best_case(self):
         """Calculate total mid-level developer hours with best case uncertainty (1.1x)."""
-        return sum(item.get_base_hours_mid() * Decimal('1.1') for item in self.items.all())
+        return self.rollup['best_case']['mid']
 
     def get_total_hours_senior_best_case(self):
         """Calculate total senior developer hours with best case uncertainty (1.1x)."""
-        return sum(item.get_base_hours_senior() * Decimal('1.1') for item in self.items.all())
+        return self.rollup['best_case']['senior']
 
     def get_total_hours_lead_best_case(self):
         """Calculate total lead developer hours with best case uncertainty (1.1x)."""
-        return sum(item.get_base_hours_lead() * Decimal('1.1') for item in self.items.all())
+        return self.rollup['best_case']['lead']
 
     # Worst case hours (maximum uncertainty - 4.0x multiplier)
     def get_total_hours_junior_worst_case(self):
         """Calculate total junior developer hours with worst case uncertainty (4.0x)."""
-        return sum(item.get_base_hours_junior() * Decimal('4.0') for item in self.items.all())
+        return self.rollup['worst_case']['junior']
 
     def get_total_hours_mid_worst_case(self):
         """Calculate total mid-level developer hours with worst case uncertainty (4.0x)."""
-        return sum(item.get_base_hours_mid() * Decimal('4.0') for item in self.items.all())
+        return self.rollup['worst_case']['mid']
 
     def get_total_hours_senior_worst_case(self):
         """Calculate total senior developer hours with worst case uncertainty (4.0x)."""
-        return sum(item.get_base_hours_senior() * Decimal('4.0') for item in self.items.all())
+        return self.rollup['worst_case']['senior']
 
     def get_total_hours_lead_worst_case(self):
         """Calculate total lead developer hours with worst case uncertainty (4.0x)."""
-        return sum(item.get_base_hours_lead() * Decimal('4.0') for item in self.items.all())
+        return self.rollup['worst_case']['lead']
 
     # Contingency padding per level (applied to base hours only)
     def get_contingency_hours_junior(self):
@@ -232,12 +271,12 @@ class Estimation(AbstractBaseModel, AbstractComment, AbstractName):
         Calculate average hours across all developer levels with uncertainty applied.
         This is an optional aggregate view since hours per level are alternatives, not additive.
         """
-        return sum(item.get_average_hours_with_uncertainty() for item in self.items.all())
+        return self.rollup['average_with_uncertainty']
 
     # Story points total
     def get_total_story_points(self):
         """Calculate total story points across all items."""
-        return sum(item.story_points or 0 for item in self.items.all())
+        return self.rollup['story_points']
 
     # Duration estimation methods (based on 40-hour work week)
     def get_duration_weeks_junior(self):
@@ -504,6 +543,12 @@ class Estimation(AbstractBaseModel, AbstractComment, AbstractName):
         total_story_points = self.get_total_story_points()
         return Decimal(str(total_story_points)) / duration_weeks
 
+    def save(self, *args, **kwargs):
+        """Never write the snapshot back: it may predate item changes made since this instance was loaded."""
+        self.cached_rollup = None
+        self.__dict__.pop('rollup', None)
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.name}"
 
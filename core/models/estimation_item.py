@@ -1,8 +1,11 @@
 from decimal import Decimal
 
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from core.models.common.abstract.abstract_base_model import AbstractBaseModel
+from core.models.estimation import Estimation
 
 
 class EstimationItem(AbstractBaseModel):
@@ -212,8 +215,9 @@ class EstimationItem(AbstractBaseModel):
         raw_points = base_hours / Decimal('4.0')
 
         # Apply the estimation's story points modifier if available
+        # An unsaved or not reloaded estimation still holds the float field default
         if self.estimation and self.estimation.story_points_modifier:
-            raw_points = raw_points * self.estimation.story_points_modifier
+            raw_points = raw_points * Decimal(str(self.estimation.story_points_modifier))
 
         # Round to nearest Fibonacci number
         fibonacci_points = self._round_to_nearest_fibonacci(float(raw_points))
@@ -319,3 +323,11 @@ class EstimationItem(AbstractBaseModel):
         ordering = ['order', 'id']
         verbose_name = 'Estimation Item'
         verbose_name_plural = 'Estimation Items'
+
+
+@receiver(post_save, sender=EstimationItem)
+@receiver(post_delete, sender=EstimationItem)
+def clear_estimation_rollup_snapshot(sender, instance: EstimationItem, update_fields=None, **kwargs) -> None:
+    if update_fields is not None and set(update_fields) <= {'order'}:
+        return  # Reordering leaves every total unchanged
+    Estimation.clear_rollup_snapshot(estimation_id=instance.estimation_id)
@@ -1,9 +1,18 @@
+import threading
+import time
+
 from django.db import models
 from core.models.common.abstract.abstract_base_model import AbstractBaseModel
 from core.models.common.abstract.abstract_comment import AbstractComment
 from core.models.common.abstract.abstract_name import AbstractName
 from core.utilities.encryption import encrypt_secret, decrypt_secret
 
+# How long a decrypted value is reused before it is decrypted again
+DECRYPTED_SECRET_TTL_SECONDS = 60
+
+_decrypted_secrets: dict[tuple[int, str], tuple[float, str | None]] = {}
+_decrypted_secrets_lock = threading.Lock()
+
 class Secret(AbstractBaseModel, AbstractComment, AbstractName):
     encrypted_value = models.CharField(max_length=255, null=True, blank=True)
 
@@ -21,6 +30,37 @@ class Secret(AbstractBaseModel, AbstractComment, AbstractName):
     def get_encrypted_value(self) -> str | None:
         return decrypt_secret(encrypted_secret=self.encrypted_value)
 
+    def get_cached_encrypted_value(self) -> str | None:
+        """
+        Decrypted value, reused for DECRYPTED_SECRET_TTL_SECONDS per process.
+
+        Keyed by the ciphertext, so a changed secret is never served stale.
+        """
+        if self.pk is None or self.encrypted_value is None:
+            return self.get_encrypted_value()
+        key = (self.pk, self.encrypted_value)
+        now = time.monotonic()
+        with _decrypted_secrets_lock:
+            cached = _decrypted_secrets.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        decrypted = self.get_encrypted_value()
+        with _decrypted_secrets_lock:
+            # Drop expired and superseded values of this secret
+            for stale_key in [k for k, (expires_at, _) in _decrypted_secrets.items() if k[0] == self.pk or expires_at <= now]:
+                del _decrypted_secrets[stale_key]
+            _decrypted_secrets[key] = (now + DECRYPTED_SECRET_TTL_SECONDS, decrypted)
+        return decrypted
+
+    @staticmethod
+    def clear_decrypted_cache(secret_id: int | None = None) -> None:
+        with _decrypted_secrets_lock:
+            if secret_id is None:
+                _decrypted_secrets.clear()
+                return
+            for key in [k for k in _decrypted_secrets if k[0] == secret_id]:
+                del _decrypted_secrets[key]
+
     def __str__(self):
         return f"{self.name}"
 
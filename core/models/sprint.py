@@ -1,8 +1,10 @@
 from datetime import date
-from typing import Optional
+from typing import Optional, TypedDict
 
 from django.db.models import QuerySet
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from core.models.common.abstract.abstract_alias import AbstractAlias
 from core.models.common.abstract.abstract_base_model import AbstractBaseModel
@@ -12,10 +14,31 @@ from core.models.common.abstract.abstract_start_end_dates import AbstractStartEn
 from core.models.git_lab_iteration import GitLabIteration
 from core.models.this_server_configuration import ThisServerConfiguration
 from core.utilities.cast_query_set import cast_query_set
+from core.utilities.coerce_float import coerce_float
 from core.utilities.coerce_integer import coerce_integer
 from core.utilities.safe_divide import safe_divide
+from core.utilities.sprint_interval_index import SPRINT_INTERVAL_FIELDS, invalidate_sprint_interval_indexes
 from core.utilities.string_or_na import string_or_na
 
+SPRINT_CACHED_METRIC_FIELDS: list[str] = [
+    "cached_accuracy",
+    "cached_total_adjusted_capacity",
+    "cached_total_number_of_merge_requests_approved",
+    "cached_total_number_of_story_points_committed_to",
+    "cached_total_number_of_story_points_delivered",
+    "cached_velocity",
+]
+
+
+class SprintMetrics(TypedDict):
+    accuracy: float
+    total_adjusted_capacity: int
+    total_number_of_merge_requests_approved: int
+    total_number_of_story_points_committed_to: int
+    total_number_of_story_points_delivered: int
+    velocity: float
+
+
 class Sprint(
     AbstractAlias,
     AbstractBaseModel,
@@ -34,16 +57,7 @@ class Sprint(
 
     @property
     def accuracy(self) -> float:
-        value: float = round(
-            ndigits=2,
-            number=safe_divide(
-                dividend=self.total_number_of_story_points_delivered,
-                divisor=self.total_number_of_story_points_committed_to,
-            )
-        )
-        self.cached_accuracy = value
-        self.save()
-        return value
+        return self.compute_metrics()["accuracy"]
 
     @property
     def coerced_number_of_holidays_during_sprint(self) -> int:
@@ -78,46 +92,88 @@ class Sprint(
             val=KeyPerformanceIndicatorSprint.developers_actively_employed().filter(sprint=self)
         )
 
+    @property
+    def has_materialized_metrics(self) -> bool:
+        # Open sprints are still changing, so only closed sprints are served from the cache
+        if self.date_end is None or self.date_end >= date.today():
+            return False
+        return self.cached_velocity is not None and self.cached_accuracy is not None
+
+    @property
+    def metrics(self) -> SprintMetrics:
+        """Materialized cached_* metrics once available, otherwise computed live (never written)."""
+        if self.has_materialized_metrics:
+            return {
+                "accuracy": coerce_float(value=self.cached_accuracy),
+                "total_adjusted_capacity": coerce_integer(value=self.cached_total_adjusted_capacity),
+                "total_number_of_merge_requests_approved": coerce_integer(value=self.cached_total_number_of_merge_requests_approved),
+                "total_number_of_story_points_committed_to": coerce_integer(value=self.cached_total_number_of_story_points_committed_to),
+                "total_number_of_story_points_delivered": coerce_integer(value=self.cached_total_number_of_story_points_delivered),
+                "velocity": coerce_float(value=self.cached_velocity),
+            }
+        return self.compute_metrics()
+
     @property
     def total_adjusted_capacity(self) -> int:
-        value: int = sum(kpi_sprint.adjusted_capacity for kpi_sprint in self.kpi_sprints)
-        self.cached_total_adjusted_capacity = value
-        self.save()
-        return value
+        return self.compute_metrics()["total_adjusted_capacity"]
 
     @property
     def total_number_of_merge_requests_approved(self) -> int:
-        value: int = sum(kpi_sprint.coerced_number_of_merge_requests_approved for kpi_sprint in self.kpi_sprints)
-        self.cached_total_number_of_merge_requests_approved = value
-        self.save()
-        return value
+        return self.compute_metrics()["total_number_of_merge_requests_approved"]
 
     @property
     def total_number_of_story_points_committed_to(self) -> int:
-        value: int = sum(kpi_sprint.coerced_number_of_story_points_committed_to for kpi_sprint in self.kpi_sprints)
-        self.cached_total_number_of_story_points_committed_to = value
-        self.save()
-        return value
+        return self.compute_metrics()["total_number_of_story_points_committed_to"]
 
     @property
     def total_number_of_story_points_delivered(self) -> int:
-        value: int = sum(kpi_sprint.coerced_number_of_story_points_delivered for kpi_sprint in self.kpi_sprints)
-        self.cached_total_number_of_story_points_delivered = value
-        self.save()
-        return value
+        return self.compute_metrics()["total_number_of_story_points_delivered"]
 
     @property
     def velocity(self) -> float:
-        value: float = round(
-            ndigits=2,
-            number=safe_divide(
-                dividend=self.total_number_of_story_points_delivered,
-                divisor=self.total_adjusted_capacity,
-            )
-        )
-        self.cached_velocity = value
-        self.save()
-        return value
+        return self.compute_metrics()["velocity"]
+
+    def compute_metrics(self) -> SprintMetrics:
+        """Compute the sprint totals from its KPI rows in one pass, without saving anything."""
+        total_adjusted_capacity: int = 0
+        total_number_of_merge_requests_approved: int = 0
+        total_number_of_story_points_committed_to: int = 0
+        total_number_of_story_points_delivered: int = 0
+        for kpi_sprint in self.kpi_sprints.select_related("person_developer", "sprint"):
+            total_adjusted_capacity += kpi_sprint.adjusted_capacity
+            total_number_of_merge_requests_approved += kpi_sprint.coerced_number_of_merge_requests_approved
+            total_number_of_story_points_committed_to += kpi_sprint.coerced_number_of_story_points_committed_to
+            total_number_of_story_points_delivered += kpi_sprint.coerced_number_of_story_points_delivered
+        return {
+            "accuracy": round(
+                ndigits=2,
+                number=safe_divide(
+                    dividend=total_number_of_story_points_delivered,
+                    divisor=total_number_of_story_points_committed_to,
+                )
+            ),
+            "total_adjusted_capacity": total_adjusted_capacity,
+            "total_number_of_merge_requests_approved": total_number_of_merge_requests_approved,
+            "total_number_of_story_points_committed_to": total_number_of_story_points_committed_to,
+            "total_number_of_story_points_delivered": total_number_of_story_points_delivered,
+            "velocity": round(
+                ndigits=2,
+                number=safe_divide(
+                    dividend=total_number_of_story_points_delivered,
+                    divisor=total_adjusted_capacity,
+                )
+            ),
+        }
+
+    def refresh_cached_metrics(self) -> None:
+        """Copy freshly computed metrics into the cached_* fields; the caller saves."""
+        metrics: SprintMetrics = self.compute_metrics()
+        self.cached_accuracy = metrics["accuracy"]
+        self.cached_total_adjusted_capacity = metrics["total_adjusted_capacity"]
+        self.cached_total_number_of_merge_requests_approved = metrics["total_number_of_merge_requests_approved"]
+        self.cached_total_number_of_story_points_committed_to = metrics["total_number_of_story_points_committed_to"]
+        self.cached_total_number_of_story_points_delivered = metrics["total_number_of_story_points_delivered"]
+        self.cached_velocity = metrics["velocity"]
 
     @staticmethod
     def current_sprint() -> Optional['Sprint']:
@@ -141,3 +197,11 @@ class Sprint(
         ordering = ['-date_end', '-id']
         verbose_name = 'Sprint'
         verbose_name_plural = 'Sprints'
+
+
+@receiver(post_save, sender=Sprint)
+@receiver(post_delete, sender=Sprint)
+def invalidate_sprint_interval_index(sender, update_fields=None, **kwargs) -> None:
+    if update_fields is not None and not SPRINT_INTERVAL_FIELDS.intersection(update_fields):
+        return  # Dates untouched, e.g. cached metrics being saved
+    invalidate_sprint_interval_indexes()
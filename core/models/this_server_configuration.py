@@ -1,6 +1,13 @@
+import copy
+import threading
+import time
+
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from math import ceil
 
+from core.models.cache_version import CacheVersion
 from core.models.common.abstract.abstract_base_model import AbstractBaseModel
 from core.models.common.abstract.abstract_comment import AbstractComment
 from core.models.common.abstract.abstract_name import AbstractName
@@ -9,6 +16,16 @@ from core.models.common.enums.git_lab_api_version_choices import GIT_LAB_API_VER
 from core.models.role import Role
 from core.models.secret import Secret
 
+THIS_SERVER_CONFIGURATION_CACHE_NAME = "this_server_configuration"
+# How long a process trusts its cached configuration before re-checking the version row
+THIS_SERVER_CONFIGURATION_VERSION_CHECK_SECONDS = 5
+
+_cached_configuration: 'ThisServerConfiguration | None' = None
+_cached_version: int = 0
+_cached_checked_at: float = 0.0
+_cached_configuration_lock = threading.Lock()
+
+
 class ThisServerConfiguration(
     AbstractBaseModel,
     AbstractComment,
@@ -26,6 +43,7 @@ class ThisServerConfiguration(
     gitlab_sync_pipelines_days_back: int | None = models.IntegerField(null=True, blank=True)
     gitlab_sync_max_pipelines_per_project: int | None = models.IntegerField(null=True, blank=True)
     gitlab_sync_commits_days_back: int | None = models.IntegerField(null=True, blank=True)
+    gitlab_sync_fetch_concurrency: int | None = models.IntegerField(null=True, blank=True)
     gitlab_sync_max_issues_per_project: int | None = models.IntegerField(null=True, blank=True)
     gitlab_sync_max_merge_requests_per_project: int | None = models.IntegerField(null=True, blank=True)
     gitlab_sync_max_events_per_project: int | None = models.IntegerField(null=True, blank=True)
@@ -42,14 +60,14 @@ class ThisServerConfiguration(
     def google_maps_api_key_decrypted(self) -> str | None:
         """Returns the decrypted Google Maps API key if configured, None otherwise."""
         if self.connection_google_maps_api_key:
-            return self.connection_google_maps_api_key.get_encrypted_value()
+            return self.connection_google_maps_api_key.get_cached_encrypted_value()
         return None
 
     @property
     def chatgpt_api_key_decrypted(self) -> str | None:
         """Returns the decrypted ChatGPT API key if configured, None otherwise."""
         if self.connection_chatgpt_api_key:
-            return self.connection_chatgpt_api_key.get_encrypted_value()
+            return self.connection_chatgpt_api_key.get_cached_encrypted_value()
         return None
 
     @property
@@ -107,6 +125,11 @@ class ThisServerConfiguration(
         """Only sync commits from last X days (default: 30)."""
         return self.gitlab_sync_commits_days_back or 30
 
+    @property
+    def coerced_gitlab_sync_fetch_concurrency(self) -> int:
+        """Number of projects fetched from GitLab in parallel during a sync (default: 4, max: 16)."""
+        return min(max(self.gitlab_sync_fetch_concurrency or 4, 1), 16)
+
     @property
     def coerced_gitlab_sync_max_issues_per_project(self) -> int:
         """Max issues to sync per project (default: 100)."""
@@ -143,13 +166,51 @@ class ThisServerConfiguration(
 
     @staticmethod
     def current() -> 'ThisServerConfiguration':
-        return ThisServerConfiguration.objects.last() or ThisServerConfiguration.default()
+        """
+        The active configuration, memoized per process.
+
+        Saves and deletes drop the local copy and bump the shared version row;
+        other processes notice the bump within
+        THIS_SERVER_CONFIGURATION_VERSION_CHECK_SECONDS. Callers get a copy,
+        so editing it (e.g. in a form) never leaks into the cache.
+        """
+        global _cached_configuration, _cached_version, _cached_checked_at
+        now = time.monotonic()
+        with _cached_configuration_lock:
+            configuration, version, checked_at = _cached_configuration, _cached_version, _cached_checked_at
+        if configuration is not None and now - checked_at < THIS_SERVER_CONFIGURATION_VERSION_CHECK_SECONDS:
+            return copy.copy(configuration)
+
+        current_version: int = CacheVersion.get_version(name=THIS_SERVER_CONFIGURATION_CACHE_NAME)
+        if configuration is None or current_version != version:
+            configuration = ThisServerConfiguration.objects.select_related(
+                "connection_chatgpt_api_key",
+                "connection_git_lab_token",
+                "connection_google_maps_api_key",
+                "type_developer_role",
+            ).last() or ThisServerConfiguration.default()
+        with _cached_configuration_lock:
+            _cached_configuration, _cached_version, _cached_checked_at = configuration, current_version, now
+        return copy.copy(configuration)
+
+    @staticmethod
+    def clear_cached() -> None:
+        """Forget this process' cached configuration."""
+        global _cached_configuration
+        with _cached_configuration_lock:
+            _cached_configuration = None
+
+    @staticmethod
+    def invalidate_cached() -> None:
+        """Forget the cached configuration in this and, via the version row, every other process."""
+        ThisServerConfiguration.clear_cached()
+        CacheVersion.bump(name=THIS_SERVER_CONFIGURATION_CACHE_NAME)
 
     @staticmethod
     def default() -> 'ThisServerConfiguration':
         return ThisServerConfiguration(
             connection_git_lab_api_version=GIT_LAB_API_VERSION_FOUR,
-            connection_git_lab_group_id=None,
+            connection_git_lab_top_level_group_id=None,
             connection_git_lab_hostname="gitlab.com",
             connection_git_lab_token=None,
             scrum_capacity_base=30,
@@ -167,3 +228,18 @@ class ThisServerConfiguration(
         ordering = ['-id']
         verbose_name = "This Server Configuration"
         verbose_name_plural = "These Server Configurations"
+
+
+@receiver(post_save, sender=ThisServerConfiguration)
+@receiver(post_delete, sender=ThisServerConfiguration)
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def invalidate_this_server_configuration(sender, **kwargs) -> None:
+    ThisServerConfiguration.invalidate_cached()
+
+
+@receiver(post_save, sender=Secret)
+@receiver(post_delete, sender=Secret)
+def invalidate_this_server_configuration_secret(sender, instance: Secret, **kwargs) -> None:
+    Secret.clear_decrypted_cache(secret_id=instance.pk)
+    ThisServerConfiguration.invalidate_cached()
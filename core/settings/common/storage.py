@@ -6,6 +6,7 @@ or local filesystem storage based on the USE_MINIO environment variable.
 """
 
 import os
+import tempfile
 from core.settings.common.environment import env, BASE_DIR
 
 # Storage backend selection
@@ -67,3 +68,10 @@ else:
             "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
         },
     }
+
+# Local on-disk LRU cache for document thumbnails served from object storage
+THUMBNAIL_CACHE_DIR = env.str(
+    'THUMBNAIL_CACHE_DIR',
+    default=os.path.join(tempfile.gettempdir(), 'document-thumbnail-cache'),
+)
+THUMBNAIL_CACHE_MAX_BYTES = env.int('THUMBNAIL_CACHE_MAX_BYTES', default=256 * 1024 * 1024)
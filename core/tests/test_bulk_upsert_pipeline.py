@@ -0,0 +1,115 @@
+"""
+Tests for the batched GitLab sync ingestion stage.
+
+Verifies that BulkUpsertPipeline:
+1. Creates new rows and links foreign keys / many-to-many relations from prefetched maps
+2. Skips rows whose updated_at has not advanced
+3. Updates changed rows without dropping links to entities that are not synced yet
+4. Writes a page with a bounded number of queries instead of ~10 per row
+"""
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from gitlab_sync.apis.gitlab_sync_merge_requests_api import MERGE_REQUEST_UPSERT_PIPELINE
+from gitlab_sync.models import (
+    GitLabSyncMergeRequest,
+    GitLabSyncMilestone,
+    GitLabSyncProject,
+    GitLabSyncUser,
+)
+from gitlab_sync.utilities import SyncResult
+
+
+def _merge_request_dict(mr_id: int, updated_at: str, **overrides) -> dict:
+    merge_request_dict = {
+        "id": mr_id,
+        "iid": mr_id,
+        "title": f"MR {mr_id}",
+        "state": "opened",
+        "updated_at": updated_at,
+        "author": {"id": 1},
+        "milestone": {"id": 500},
+        "assignees": [{"id": 1}, {"id": 2}],
+        "reviewers": [{"id": 2}],
+    }
+    merge_request_dict.update(overrides)
+    return merge_request_dict
+
+
+class TestBulkUpsertPipeline(TestCase):
+    """Unit tests for BulkUpsertPipeline using the merge request configuration."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.project = GitLabSyncProject.objects.create(id=10, name="Project")
+        GitLabSyncUser.objects.create(id=1, username="alice")
+        GitLabSyncUser.objects.create(id=2, username="bob")
+        self.milestone = GitLabSyncMilestone.objects.create(gitlab_id=500, title="M1")
+        self.sync_result = SyncResult(entity_type="GitLabSyncMergeRequest")
+
+    def _upsert(self, entity_dicts: list[dict]):
+        return MERGE_REQUEST_UPSERT_PIPELINE.upsert_page(
+            entity_dicts=entity_dicts,
+            sync_result=self.sync_result,
+            extra_fields={"project": self.project},
+        )
+
+    def test_creates_rows_with_relations(self):
+        """Verify new rows are inserted with resolved foreign keys and M2M links."""
+        page_result = self._upsert([_merge_request_dict(100, "2025-01-01T00:00:00Z")])
+
+        self.assertEqual(page_result.created_count, 1)
+        merge_request = GitLabSyncMergeRequest.objects.get(id=100)
+        self.assertEqual(merge_request.project_id, self.project.id)
+        self.assertEqual(merge_request.author_id, 1)
+        self.assertEqual(merge_request.milestone_id, self.milestone.id)
+        self.assertEqual(
+            sorted(merge_request.assignees.values_list("id", flat=True)), [1, 2]
+        )
+        self.assertEqual(list(merge_request.reviewers.values_list("id", flat=True)), [2])
+
+    def test_skips_unchanged_rows(self):
+        """Verify rows whose updated_at has not advanced are not rewritten."""
+        self._upsert([_merge_request_dict(100, "2025-01-01T00:00:00Z")])
+        page_result = self._upsert(
+            [_merge_request_dict(100, "2025-01-01T00:00:00Z", title="Changed")]
+        )
+
+        self.assertEqual(page_result.skipped_count, 1)
+        self.assertEqual(GitLabSyncMergeRequest.objects.get(id=100).title, "MR 100")
+
+    def test_updates_changed_rows_and_keeps_unresolved_links(self):
+        """Verify updates apply and unknown referenced IDs keep the stored link."""
+        self._upsert([_merge_request_dict(100, "2025-01-01T00:00:00Z")])
+        enumeration_attack_uuid = GitLabSyncMergeRequest.objects.get(id=100).enumeration_attack_uuid
+
+        page_result = self._upsert(
+            [
+                _merge_request_dict(
+                    100,
+                    "2025-02-01T00:00:00Z",
+                    title="Changed",
+                    author={"id": 999},
+                    assignees=[],
+                )
+            ]
+        )
+
+        self.assertEqual(page_result.updated_count, 1)
+        merge_request = GitLabSyncMergeRequest.objects.get(id=100)
+        self.assertEqual(merge_request.title, "Changed")
+        self.assertEqual(merge_request.author_id, 1)
+        self.assertEqual(merge_request.enumeration_attack_uuid, enumeration_attack_uuid)
+        self.assertFalse(merge_request.assignees.exists())
+
+    def test_page_uses_bounded_number_of_queries(self):
+        """Verify a full page is written in a handful of queries, not one set per row."""
+        with CaptureQueriesContext(connection) as page_queries:
+            self._upsert(
+                [_merge_request_dict(mr_id, "2025-01-01T00:00:00Z") for mr_id in range(1, 101)]
+            )
+
+        # SQLite's bound-parameter limit splits the INSERT into a few statements
+        self.assertLess(len(page_queries.captured_queries), 25)
+        self.assertEqual(self.sync_result.synced_count, 100)
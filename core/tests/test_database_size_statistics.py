@@ -0,0 +1,82 @@
+"""
+Tests for the SQLite table statistics behind the database size page.
+
+Verifies that:
+1. Sizes and row counts are collected in a fixed number of queries
+2. A recorded snapshot shares one timestamp and is served as the latest statistics
+3. Historical model record counts come from the statistics instead of COUNT queries
+4. Legacy snapshots with a timestamp per row are grouped under one timestamp on upgrade
+"""
+from datetime import timedelta
+from importlib import import_module
+
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from core.models.database_size_history import DatabaseSizeHistory
+from core.utilities.sqlite_table_statistics import collect_table_statistics
+from core.views.database_size.database_size_view import get_historical_models, get_latest_snapshot, record_snapshot
+
+group_legacy_snapshots = import_module(
+    "core.migrations.0028_alter_databasesizehistory_recorded_at"
+).group_legacy_snapshots
+
+
+class TestDatabaseSizeStatistics(TestCase):
+    """Tests for collect_table_statistics and the snapshot helpers."""
+
+    def test_collected_in_fixed_queries(self):
+        """Verify the number of queries does not depend on the number of tables."""
+        with CaptureQueriesContext(connection) as queries:
+            table_stats = collect_table_statistics()
+
+        self.assertGreater(len(table_stats), 50)
+        self.assertLessEqual(len(queries.captured_queries), 5)
+        stats = {stat['table_name']: stat for stat in table_stats}
+        self.assertIn(DatabaseSizeHistory._meta.db_table, stats)
+        self.assertAlmostEqual(sum(stat['percentage'] for stat in table_stats), 100, places=3)
+
+    def test_latest_snapshot(self):
+        """Verify the page reads the newest snapshot without scanning."""
+        self.assertEqual(get_latest_snapshot(), (None, []))
+
+        count = record_snapshot()
+
+        self.assertEqual(DatabaseSizeHistory.objects.values('recorded_at').distinct().count(), 1)
+        with self.assertNumQueries(2):
+            recorded_at, table_stats = get_latest_snapshot()
+        self.assertIsNotNone(recorded_at)
+        self.assertEqual(len(table_stats), count)
+
+    def test_historical_models_from_statistics(self):
+        """Verify record counts are looked up, not counted."""
+        table_stats = [{'table_name': 'core_historicaldocument', 'row_count': 42}]
+        with self.assertNumQueries(0):
+            historical_models = get_historical_models(table_stats=table_stats)
+
+        counts = {model['table_name']: model['record_count'] for model in historical_models}
+        self.assertEqual(counts['core_historicaldocument'], 42)
+
+    def test_legacy_snapshots_grouped(self):
+        """Verify rows saved one timestamp apart form whole snapshots after the migration."""
+        start = timezone.now() - timedelta(days=1)
+        for snapshot in range(2):
+            for index, table_name in enumerate(['core_document', 'core_estimation', 'core_user']):
+                DatabaseSizeHistory.objects.create(
+                    table_name=table_name,
+                    size_bytes=snapshot + 1,
+                    recorded_at=start + timedelta(hours=snapshot, seconds=index),
+                )
+
+        group_legacy_snapshots(apps, connection.schema_editor())
+
+        self.assertEqual(DatabaseSizeHistory.objects.values('recorded_at').distinct().count(), 2)
+        recorded_at, table_stats = get_latest_snapshot()
+        self.assertEqual(recorded_at, start + timedelta(hours=1))
+        self.assertEqual(
+            {(stat['table_name'], stat['size_bytes']) for stat in table_stats},
+            {('core_document', 2), ('core_estimation', 2), ('core_user', 2)},
+        )
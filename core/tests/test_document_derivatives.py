@@ -0,0 +1,136 @@
+"""
+Tests for background document derivative generation.
+
+Verifies that:
+1. New uploads are stored as-is and queued as pending
+2. Claimed documents receive their derivatives and are marked done
+3. Results for documents re-uploaded while processing are discarded
+4. Failed attempts are retried up to max_attempts, then marked failed
+5. Images without metadata are hashed without being re-encoded
+"""
+import hashlib
+import io
+import shutil
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from core.models.common.enums.document_derivative_status_choices import (
+    DOCUMENT_DERIVATIVE_STATUS_DONE,
+    DOCUMENT_DERIVATIVE_STATUS_FAILED,
+    DOCUMENT_DERIVATIVE_STATUS_PENDING,
+    DOCUMENT_DERIVATIVE_STATUS_PROCESSING,
+)
+from core.models.document import Document
+from core.tests.test_document_ingest import make_jpeg_with_exif
+from core.utilities.document_derivatives import (
+    apply_document_derivatives,
+    claim_document_derivatives,
+    fail_document_derivatives,
+    queue_document_derivatives,
+)
+from core.utilities.document_ingest import derive_document_file
+
+
+class TestDocumentDerivatives(TestCase):
+    """Tests for the derivative queue and derive_document_file."""
+
+    def setUp(self):
+        """Store uploaded files in a throwaway media directory."""
+        self.media_root = tempfile.mkdtemp()
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+
+    def _upload(self, content: bytes, filename: str = 'photo.jpg') -> Document:
+        document = Document(name='Photo', file=SimpleUploadedFile(filename, content))
+        document.save()
+        return document
+
+    def _derive(self, document: Document):
+        with document.file.open('rb') as file:
+            return derive_document_file(document.file.name, file.read())
+
+    def test_upload_stored_as_is_and_pending(self):
+        """Verify saving an upload defers all processing to the worker."""
+        content = make_jpeg_with_exif()
+        document = self._upload(content)
+
+        document.refresh_from_db()
+        self.assertEqual(document.derivative_status, DOCUMENT_DERIVATIVE_STATUS_PENDING)
+        self.assertIsNone(document.file_hash)
+        with document.file.open('rb') as file:
+            self.assertEqual(file.read(), content)
+
+    def test_claim_and_apply(self):
+        """Verify a claimed document gets stripped, hashed and marked done."""
+        document = self._upload(make_jpeg_with_exif())
+
+        claimed = claim_document_derivatives(limit=5)
+        self.assertEqual([doc.pk for doc in claimed], [document.pk])
+        self.assertEqual(claimed[0].derivative_status, DOCUMENT_DERIVATIVE_STATUS_PROCESSING)
+        self.assertEqual(claimed[0].derivative_attempts, 1)
+        self.assertEqual(claim_document_derivatives(limit=5), [])
+
+        derivatives = self._derive(claimed[0])
+        self.assertIsNotNone(derivatives.stripped_content)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(apply_document_derivatives(claimed[0], derivatives))
+
+        document.refresh_from_db()
+        self.assertEqual(document.derivative_status, DOCUMENT_DERIVATIVE_STATUS_DONE)
+        self.assertIsNone(document.derivative_lease_expires_at)
+        with document.file.open('rb') as file:
+            stored = file.read()
+        self.assertNotIn('exif', Image.open(io.BytesIO(stored)).info)
+        self.assertEqual(document.file_hash, hashlib.sha256(stored).hexdigest())
+        self.assertIsNotNone(document.image_hash)
+
+    def test_results_for_reuploaded_document_discarded(self):
+        """Verify a re-upload during processing invalidates the running job."""
+        document = self._upload(make_jpeg_with_exif())
+        claimed = claim_document_derivatives(limit=1)[0]
+        derivatives = self._derive(claimed)
+
+        document.file = SimpleUploadedFile('other.jpg', make_jpeg_with_exif())
+        document.save()
+
+        self.assertFalse(apply_document_derivatives(claimed, derivatives))
+        document.refresh_from_db()
+        self.assertEqual(document.derivative_status, DOCUMENT_DERIVATIVE_STATUS_PENDING)
+        self.assertIsNone(document.file_hash)
+
+    def test_failures_retried_then_failed(self):
+        """Verify failures re-queue the document until attempts run out."""
+        document = self._upload(make_jpeg_with_exif())
+
+        claim_document_derivatives(limit=1, max_attempts=2)
+        fail_document_derivatives(document.pk, 'boom', max_attempts=2)
+        document.refresh_from_db()
+        self.assertEqual(document.derivative_status, DOCUMENT_DERIVATIVE_STATUS_PENDING)
+
+        claim_document_derivatives(limit=1, max_attempts=2)
+        fail_document_derivatives(document.pk, 'boom', max_attempts=2)
+        document.refresh_from_db()
+        self.assertEqual(document.derivative_status, DOCUMENT_DERIVATIVE_STATUS_FAILED)
+        self.assertEqual(document.derivative_error, 'boom')
+
+        self.assertEqual(queue_document_derivatives(Document.objects.all()), 1)
+        document.refresh_from_db()
+        self.assertEqual(document.derivative_status, DOCUMENT_DERIVATIVE_STATUS_PENDING)
+        self.assertEqual(document.derivative_attempts, 0)
+
+    def test_image_without_metadata_not_reencoded(self):
+        """Verify clean images keep their original bytes."""
+        buffer = io.BytesIO()
+        Image.linear_gradient('L').save(buffer, format='PNG')
+        content = buffer.getvalue()
+
+        derivatives = derive_document_file('clean.png', content)
+
+        self.assertIsNone(derivatives.stripped_content)
+        self.assertEqual(derivatives.file_hash, hashlib.sha256(content).hexdigest())
+        self.assertIsNotNone(derivatives.image_hash)
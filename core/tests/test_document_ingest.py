@@ -0,0 +1,72 @@
+"""
+Tests for the single-pass document ingest pipeline.
+
+Verifies that:
+1. EXIF is stripped and the SHA-256 matches the stored (re-encoded) bytes
+2. The dhash and thumbnail come from the same decode and match a fresh decode
+3. Non-image and undecodable files are stored unchanged with a SHA-256
+"""
+import hashlib
+import io
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+from PIL import Image
+
+from core.utilities.document_ingest import ingest_document_file
+from core.utilities.image_similarity import compute_dhash
+
+
+def make_jpeg_with_exif() -> bytes:
+    """A small JPEG carrying an EXIF camera model."""
+    image = Image.merge('RGB', (
+        Image.linear_gradient('L').resize((320, 240)),
+        Image.linear_gradient('L').rotate(90).resize((320, 240)),
+        Image.effect_noise((320, 240), 32),
+    ))
+    exif = Image.Exif()
+    exif[0x0110] = 'Secret Camera'  # Model
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+class TestDocumentIngest(SimpleTestCase):
+    """Unit tests for ingest_document_file."""
+
+    def test_image_stripped_hashed_and_thumbnailed(self):
+        """Verify every derivative of an image upload."""
+        content = make_jpeg_with_exif()
+        self.assertIn('exif', Image.open(io.BytesIO(content)).info)
+
+        ingested = ingest_document_file(SimpleUploadedFile('photo.jpg', content, content_type='image/jpeg'))
+
+        stored = ingested.file.read()
+        self.assertNotIn('exif', Image.open(io.BytesIO(stored)).info)
+        self.assertEqual(ingested.file.name, 'photo.jpg')
+        self.assertEqual(ingested.file_hash, hashlib.sha256(stored).hexdigest())
+        self.assertEqual(ingested.image_hash, compute_dhash(io.BytesIO(stored)))
+        self.assertIsNotNone(ingested.thumbnail)
+        self.assertEqual(ingested.thumbnail.content_type, 'image/avif')
+
+    def test_non_image_stored_unchanged(self):
+        """Verify non-image files are only hashed."""
+        upload = SimpleUploadedFile('notes.txt', b'hello', content_type='text/plain')
+
+        ingested = ingest_document_file(upload)
+
+        self.assertIs(ingested.file, upload)
+        self.assertEqual(ingested.file_hash, hashlib.sha256(b'hello').hexdigest())
+        self.assertIsNone(ingested.image_hash)
+        self.assertIsNone(ingested.thumbnail)
+
+    def test_undecodable_image_stored_unchanged(self):
+        """Verify a corrupt image falls back to storing the upload as-is."""
+        upload = SimpleUploadedFile('broken.png', b'not a png', content_type='image/png')
+
+        with self.assertLogs('core.utilities.document_ingest', level='WARNING'):
+            ingested = ingest_document_file(upload)
+
+        self.assertIs(ingested.file, upload)
+        self.assertEqual(ingested.file_hash, hashlib.sha256(b'not a png').hexdigest())
+        self.assertIsNone(ingested.image_hash)
@@ -0,0 +1,119 @@
+"""
+Tests for the estimation item bulk write paths.
+
+Verifies that:
+1. Reordering writes only the items whose order or group changes, with one history row each
+2. A reorder that changes nothing costs a single query
+3. Items of another estimation are never reordered
+4. Recalculation derives the other hours from lead hours and skips unchanged items
+"""
+from decimal import Decimal
+
+from django.test import TestCase
+
+from core.models.estimation import Estimation
+from core.models.estimation_item import EstimationItem
+from core.utilities.estimation_item_bulk_writes import recalculate_estimation_items, reorder_estimation_items
+
+
+class TestReorderEstimationItems(TestCase):
+    """Tests for reorder_estimation_items."""
+
+    def setUp(self):
+        self.estimation = Estimation.objects.create(name="Estimation")
+        self.items = [
+            EstimationItem.objects.create(estimation=self.estimation, order=index, group="Backend")
+            for index in range(1, 5)
+        ]
+
+    def test_writes_changed_items_only(self):
+        """Verify swapping two items updates those two and records their history."""
+        first, second, third, fourth = self.items
+        history_count = EstimationItem.history.count()
+
+        updated_count = reorder_estimation_items(
+            estimation_id=self.estimation.id,
+            item_ids=[second.id, first.id, third.id, fourth.id],
+        )
+
+        self.assertEqual(updated_count, 2)
+        self.assertEqual(
+            list(EstimationItem.objects.filter(estimation=self.estimation).order_by('order').values_list('id', flat=True)),
+            [second.id, first.id, third.id, fourth.id],
+        )
+        self.assertEqual(EstimationItem.history.count(), history_count + 2)
+
+    def test_moves_item_to_group(self):
+        """Verify the moved item changes group even when its position stays the same."""
+        moved = self.items[2]
+
+        updated_count = reorder_estimation_items(
+            estimation_id=self.estimation.id,
+            item_ids=[item.id for item in self.items],
+            moved_item_id=str(moved.id),
+            new_group=None,
+            change_group=True,
+        )
+
+        self.assertEqual(updated_count, 1)
+        self.assertIsNone(EstimationItem.objects.get(id=moved.id).group)
+        self.assertEqual(EstimationItem.objects.get(id=self.items[0].id).group, "Backend")
+
+    def test_ignores_other_estimations(self):
+        """Verify IDs of another estimation's items are skipped."""
+        other = EstimationItem.objects.create(estimation=Estimation.objects.create(name="Other"), order=1)
+
+        updated_count = reorder_estimation_items(
+            estimation_id=self.estimation.id,
+            item_ids=[other.id] + [item.id for item in self.items],
+        )
+
+        self.assertEqual(updated_count, 4)
+        self.assertEqual(EstimationItem.objects.get(id=other.id).order, 1)
+
+    def test_unchanged_order_is_one_query(self):
+        """Verify an unchanged order only reads the items."""
+        with self.assertNumQueries(1):
+            updated_count = reorder_estimation_items(
+                estimation_id=self.estimation.id,
+                item_ids=[item.id for item in self.items],
+            )
+
+        self.assertEqual(updated_count, 0)
+
+
+class TestRecalculateEstimationItems(TestCase):
+    """Tests for recalculate_estimation_items."""
+
+    def setUp(self):
+        self.estimation = Estimation.objects.create(name="Estimation")
+        self.item = EstimationItem.objects.create(estimation=self.estimation, hours_lead=Decimal('8'))
+        self.empty_item = EstimationItem.objects.create(estimation=self.estimation)
+        # 1.3 x 1.25 = 1.625, which is stored rounded to two decimal places
+        self.fractional_item = EstimationItem.objects.create(estimation=self.estimation, hours_lead=Decimal('1.3'))
+
+    def test_recalculates_from_lead_hours(self):
+        """Verify the derived hours and story points of items with lead hours."""
+        updated_count = recalculate_estimation_items(estimation=self.estimation)
+
+        self.assertEqual(updated_count, 2)
+        item = EstimationItem.objects.get(id=self.item.id)
+        self.assertEqual(item.hours_senior, Decimal('10'))
+        self.assertEqual(item.hours_junior, Decimal('24'))
+        self.assertEqual(item.code_review_hours_mid, Decimal('8'))
+        self.assertEqual(item.tests_hours_lead, Decimal('8'))
+        self.assertEqual(item.code_reviewer_hours, Decimal('4'))
+        self.assertEqual(item.story_points, item.calculate_story_points())
+        self.assertEqual(EstimationItem.objects.get(id=self.fractional_item.id).hours_senior, Decimal('1.62'))
+
+    def test_second_run_writes_nothing(self):
+        """Verify a repeated recalculation leaves the items and their history alone."""
+        recalculate_estimation_items(estimation=self.estimation)
+        history_count = EstimationItem.history.count()
+
+        estimation = Estimation.objects.get(id=self.estimation.id)
+        with self.assertNumQueries(1):
+            updated_count = recalculate_estimation_items(estimation=estimation)
+
+        self.assertEqual(updated_count, 0)
+        self.assertEqual(EstimationItem.history.count(), history_count)
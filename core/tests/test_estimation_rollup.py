@@ -0,0 +1,113 @@
+"""
+Tests for the estimation rollup engine.
+
+Verifies that:
+1. The rollup matches the per-item EstimationItem calculations
+2. All estimation totals cost one item query per instance
+3. The persisted snapshot is reused and cleared when an item is saved or deleted
+4. A snapshot stored by another request meanwhile is reused, not overwritten
+5. A locked database only skips storing the snapshot
+"""
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import OperationalError
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from core.models.estimation import Estimation
+from core.models.estimation_item import EstimationItem
+
+
+class TestEstimationRollup(TestCase):
+    """Tests for Estimation.rollup and the get_* totals built on it."""
+
+    def setUp(self):
+        self.estimation = Estimation.objects.create(name="Estimation", contingency_padding_percent=Decimal('20'))
+        self.items = [
+            EstimationItem.objects.create(
+                estimation=self.estimation, group="Backend", story_points=Decimal('3'),
+                hours_lead=Decimal('4'), code_review_hours_lead=Decimal('2'), tests_hours_lead=Decimal('4'),
+                hours_junior=Decimal('12'), code_reviewer_hours=Decimal('2'), cone_of_uncertainty='APPROVED_PRODUCT',
+            ),
+            EstimationItem.objects.create(
+                estimation=self.estimation, group="Backend", hours_mid=Decimal('8'), cone_of_uncertainty='DESIGN_COMPLETE',
+            ),
+            EstimationItem.objects.create(estimation=self.estimation, story_points=Decimal('5'), hours_senior=Decimal('5')),
+        ]
+
+    def test_matches_item_calculations(self):
+        """Verify every total equals the sum of the item methods."""
+        estimation = Estimation.objects.get(id=self.estimation.id)
+        items = self.items
+
+        self.assertEqual(estimation.get_base_hours_lead(), sum(item.get_base_hours_lead() for item in items))
+        self.assertEqual(
+            estimation.get_total_hours_mid_with_uncertainty(),
+            sum(item.get_mid_hours_with_uncertainty() for item in items),
+        )
+        self.assertEqual(
+            estimation.get_total_hours_junior_worst_case(),
+            sum(item.get_base_hours_junior() * Decimal('4.0') for item in items),
+        )
+        self.assertEqual(
+            estimation.get_average_hours_with_uncertainty(),
+            sum(item.get_average_hours_with_uncertainty() for item in items),
+        )
+        self.assertEqual(estimation.get_total_story_points(), Decimal('8'))
+        self.assertEqual(estimation.get_grand_total_hours_lead(), Decimal('20') + Decimal('2'))
+
+        backend = estimation.rollup['groups']['Backend']
+        self.assertEqual(backend['mid_with_uncertainty'], Decimal('10'))
+        self.assertEqual(backend['reviewer_hours'], Decimal('2'))
+        self.assertEqual(estimation.rollup['groups']['Ungrouped']['story_points'], Decimal('5'))
+
+    def test_one_item_query(self):
+        """Verify the getters share one rollup, computed once and then snapshotted."""
+        estimation = Estimation.objects.get(id=self.estimation.id)
+        estimation.senior_developer_count = 1
+        estimation.sprint_duration_weeks = 2
+
+        # Savepoint, lock the estimation row, load the items, store the snapshot, release
+        with self.assertNumQueries(5):
+            estimation.get_grand_total_hours_senior_worst_case()
+            estimation.get_combined_project_duration_weeks_best_case()
+            estimation.get_required_velocity_per_developer_per_sprint()
+            estimation.get_bottleneck_level()
+
+        fresh = Estimation.objects.get(id=self.estimation.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(fresh.get_base_hours_senior(), Decimal('5'))
+
+    def test_snapshot_cleared_on_item_change(self):
+        """Verify item saves and deletes invalidate the snapshot."""
+        Estimation.objects.get(id=self.estimation.id).get_total_story_points()
+        self.assertIsNotNone(Estimation.objects.get(id=self.estimation.id).cached_rollup)
+
+        self.items[2].story_points = Decimal('8')
+        self.items[2].save()
+        self.assertIsNone(Estimation.objects.get(id=self.estimation.id).cached_rollup)
+        self.assertEqual(Estimation.objects.get(id=self.estimation.id).get_total_story_points(), Decimal('11'))
+
+        self.items[0].delete()
+        self.assertEqual(Estimation.objects.get(id=self.estimation.id).get_total_story_points(), Decimal('8'))
+
+    def test_snapshot_stored_meanwhile(self):
+        """Verify an instance loaded before another request stored the snapshot reuses it."""
+        estimation = Estimation.objects.get(id=self.estimation.id)
+        Estimation.objects.get(id=self.estimation.id).get_total_story_points()
+        stored = Estimation.objects.get(id=self.estimation.id).cached_rollup
+
+        with self.assertNumQueries(3):  # Savepoint, lock and read the stored snapshot, release
+            self.assertEqual(estimation.get_total_story_points(), Decimal('8'))
+
+        self.assertEqual(Estimation.objects.get(id=self.estimation.id).cached_rollup, stored)
+
+    def test_snapshot_write_locked(self):
+        """Verify the totals are still returned when storing the snapshot hits a locked database."""
+        estimation = Estimation.objects.get(id=self.estimation.id)
+
+        with patch.object(QuerySet, 'update', side_effect=OperationalError("database is locked")):
+            self.assertEqual(estimation.get_total_story_points(), Decimal('8'))
+
+        self.assertIsNone(Estimation.objects.get(id=self.estimation.id).cached_rollup)
@@ -0,0 +1,133 @@
+"""
+Tests for the dependency-ordered GitLab full sync.
+
+Verifies that:
+1. Stages only start after their dependencies and independent stages overlap
+2. Dependents of a failed stage are blocked and finished stages are skipped
+3. Rerunning a stage selects everything downstream of it
+4. A stage that raises is logged with its traceback and reported to the caller
+5. Stages run one at a time on SQLite
+"""
+import threading
+import time
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from gitlab_sync.apis.gitlab_sync_full_sync_api import (
+    FULL_SYNC_MAX_PARALLEL_STAGES,
+    FULL_SYNC_STAGES,
+    _full_sync_max_parallel_stages,
+    _select_full_sync_stages,
+)
+from gitlab_sync.utilities import run_dependency_stages
+
+
+class TestFullSyncStages(SimpleTestCase):
+    """Unit tests for run_dependency_stages and full sync stage selection."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.stages = {
+            "groups": (),
+            "projects": ("groups",),
+            "users": ("groups",),
+            "merge-requests": ("projects", "users"),
+        }
+
+    def test_runs_in_dependency_order_with_parallel_branches(self):
+        """Verify ordering and that independent stages run concurrently."""
+        lock = threading.Lock()
+        started: list[str] = []
+        running = {"now": 0, "max": 0}
+
+        def run_stage(stage: str) -> bool:
+            with lock:
+                started.append(stage)
+                running["now"] += 1
+                running["max"] = max(running["max"], running["now"])
+            time.sleep(0.05)
+            with lock:
+                running["now"] -= 1
+            return True
+
+        outcomes = list(
+            run_dependency_stages(
+                stages=self.stages, run_stage=run_stage, max_workers=2, poll_seconds=0.01
+            )
+        )
+
+        self.assertEqual(started[0], "groups")
+        self.assertEqual(started[-1], "merge-requests")
+        self.assertEqual(running["max"], 2)
+        self.assertEqual({outcome for _, outcome in outcomes}, {"completed"})
+
+    def test_failed_stage_blocks_dependents_and_skips_finished(self):
+        """Verify blocked dependents and that earlier finished stages are not rerun."""
+        ran: list[str] = []
+
+        def run_stage(stage: str) -> bool:
+            ran.append(stage)
+            return stage != "users"
+
+        outcomes = dict(
+            run_dependency_stages(
+                stages=self.stages,
+                run_stage=run_stage,
+                max_workers=1,
+                completed={"groups"},
+                poll_seconds=0.01,
+            )
+        )
+
+        self.assertNotIn("groups", ran)
+        self.assertEqual(
+            outcomes,
+            {
+                "groups": "skipped",
+                "projects": "completed",
+                "users": "failed",
+                "merge-requests": "blocked",
+            },
+        )
+
+    def test_raising_stage_logged_and_reported(self):
+        """Verify an exception is logged with its traceback and handed to on_stage_error."""
+        errors: list[tuple[str, Exception]] = []
+
+        def run_stage(stage: str) -> bool:
+            if stage == "projects":
+                raise RuntimeError("database is locked")
+            return True
+
+        with self.assertLogs("gitlab_sync.utilities.run_dependency_stages", level="ERROR") as logs:
+            outcomes = dict(
+                run_dependency_stages(
+                    stages=self.stages,
+                    run_stage=run_stage,
+                    max_workers=1,
+                    poll_seconds=0.01,
+                    on_stage_error=lambda stage, error: errors.append((stage, error)),
+                )
+            )
+
+        self.assertEqual(outcomes["projects"], "failed")
+        self.assertEqual(outcomes["merge-requests"], "blocked")
+        self.assertEqual([(stage, str(error)) for stage, error in errors], [("projects", "database is locked")])
+        self.assertIn("Traceback", logs.output[0])
+
+    def test_parallel_stages_by_database(self):
+        """Verify SQLite runs one stage at a time and other databases fan out."""
+        with patch("gitlab_sync.apis.gitlab_sync_full_sync_api.connection") as connection:
+            connection.vendor = "sqlite"
+            self.assertEqual(_full_sync_max_parallel_stages(), 1)
+            connection.vendor = "postgresql"
+            self.assertEqual(_full_sync_max_parallel_stages(), FULL_SYNC_MAX_PARALLEL_STAGES)
+
+    def test_stage_selection_includes_downstream(self):
+        """Verify ?stages= reruns the stage plus every stage depending on it."""
+        selected = _select_full_sync_stages("milestones")
+
+        self.assertEqual(set(selected), {"milestones", "merge-requests", "issues"})
+        self.assertEqual(_select_full_sync_stages(None), FULL_SYNC_STAGES)
+        self.assertEqual(_select_full_sync_stages("unknown"), {})
@@ -0,0 +1,93 @@
+"""
+Tests for the GitLab changes aggregation.
+
+Verifies that:
+1. The diff line scanner counts what splitting the diff into lines counted
+2. File flags are summarized per merge request
+3. Only the aggregates are stored on GitLabChange, with users and sprints resolved
+"""
+from datetime import date
+
+from django.test import SimpleTestCase, TestCase
+
+from core.utilities.sprint_interval_index import SprintIntervalIndex
+from git_lab.apis.git_lab_changes_api.git_lab_changes_api_save_change import git_lab_changes_api_save_change
+from git_lab.apis.git_lab_changes_api.git_lab_changes_api_summarize_changes import count_diff_lines, \
+    git_lab_changes_api_summarize_changes
+from git_lab.models.git_lab_change import GitLabChange
+from git_lab.models.git_lab_project import GitLabProject
+from git_lab.models.git_lab_user import GitLabUser
+from scrum.models.scrum_sprint import ScrumSprint
+
+DIFF = "@@ -1,3 +1,4 @@\n-old\n+new\n+newer\n context\n-gone\n"
+
+
+def file_change(diff: str | None, **flags) -> dict:
+    return {
+        "deleted_file": False, "generated_file": False, "new_file": False, "renamed_file": False,
+        **flags, "diff": diff,
+    }
+
+
+class TestSummarizeChanges(SimpleTestCase):
+    """Tests for count_diff_lines and git_lab_changes_api_summarize_changes."""
+
+    def test_count_diff_lines(self):
+        """Verify counts match the line-by-line definition."""
+        for diff in (DIFF, "+first\n-second", "\r\n+crlf\r\n-crlf\r\n", "", "   ", None):
+            lines = (diff or "").splitlines()
+            expected = (
+                sum(line.startswith("+") for line in lines),
+                sum(line.startswith("-") for line in lines),
+            )
+            self.assertEqual(count_diff_lines(diff=diff), expected, repr(diff))
+
+    def test_summarize(self):
+        """Verify file flags and line totals."""
+        summary = git_lab_changes_api_summarize_changes(changes=[
+            file_change(DIFF),
+            file_change("+a\n", new_file=True),
+            file_change(None, deleted_file=True),
+        ])
+
+        self.assertEqual(summary["total_files_changed"], 3)
+        self.assertEqual(summary["total_files_updated"], 1)
+        self.assertEqual(summary["total_files_created"], 1)
+        self.assertEqual(summary["total_files_deleted"], 1)
+        self.assertEqual(summary["total_lines_added"], 3)
+        self.assertEqual(summary["total_lines_removed"], 2)
+
+
+class TestSaveChange(TestCase):
+    """Tests for git_lab_changes_api_save_change."""
+
+    def test_save(self):
+        """Verify aggregates and references are stored, then updated in place."""
+        alice = GitLabUser.objects.create(id=1, username="alice")
+        project = GitLabProject.objects.create(id=1)
+        sprint = ScrumSprint.objects.create(name="Sprint 1", date_start=date(2024, 1, 1), date_end=date(2024, 1, 14))
+        change_dict = {
+            "id": 10,
+            "assignees": [{"id": 1}, {"id": 99}],
+            "author": {"id": 1},
+            "created_at": "2024-01-05T10:00:00Z",
+            "project_id": 1,
+            "title": "Fix",
+        }
+        summary = git_lab_changes_api_summarize_changes(changes=[file_change(DIFF)])
+        arguments = {
+            "projects": {project.id: project},
+            "scrum_sprint_index": SprintIntervalIndex(intervals=[(sprint.id, sprint.date_start, sprint.date_end)]),
+            "user_ids": {alice.id},
+        }
+
+        self.assertTrue(git_lab_changes_api_save_change(change_dict=change_dict, summary=summary, **arguments))
+        self.assertFalse(git_lab_changes_api_save_change(change_dict=change_dict, summary=summary, **arguments))
+
+        change = GitLabChange.objects.get(id=10)
+        self.assertEqual(change.total_lines_added, 2)
+        self.assertEqual(change.total_lines_removed, 2)
+        self.assertEqual(change.total_files_updated, 1)
+        self.assertEqual(change.author, alice)
+        self.assertEqual(change.scrum_sprint, sprint)
+        self.assertEqual(list(change.assignees.all()), [alice])
@@ -0,0 +1,123 @@
+"""
+Tests for the batched GitLab discussions ingester.
+
+Verifies that:
+1. Discussions and notes are created with authors, projects and sprints resolved from the lookups
+2. System notes are skipped and a rerun updates the existing rows
+3. The number of queries does not grow with the number of notes
+"""
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.utilities.sprint_interval_index import clear_sprint_interval_indexes
+from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_ingest_merge_request import \
+    git_lab_discussions_api_ingest_merge_request
+from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_lookups import load_git_lab_discussions_api_lookups
+from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_payload import \
+    get_initial_git_lab_discussions_api_payload
+from git_lab.models.git_lab_discussion import GitLabDiscussion
+from git_lab.models.git_lab_group import GitLabGroup
+from git_lab.models.git_lab_merge_request import GitLabMergeRequest
+from git_lab.models.git_lab_note import GitLabNote
+from git_lab.models.git_lab_project import GitLabProject
+from git_lab.models.git_lab_user import GitLabUser
+from scrum.models.scrum_sprint import ScrumSprint
+
+
+def note_dict(note_id: int, author_id: int = 1, day: int = 3, system: bool = False) -> dict:
+    return {
+        "id": note_id,
+        "author": {"id": author_id, "username": f"user{author_id}"},
+        "body": f"Note {note_id}",
+        "created_at": f"2024-01-{day:02d}T10:00:00Z",
+        "noteable_id": 1,
+        "noteable_iid": 7,
+        "noteable_type": "MergeRequest",
+        "project_id": 1,
+        "system": system,
+        "type": "DiscussionNote",
+        "updated_at": f"2024-01-{day:02d}T11:00:00Z",
+    }
+
+
+class TestGitLabDiscussionsIngest(TestCase):
+    """Tests for git_lab_discussions_api_ingest_merge_request."""
+
+    def setUp(self):
+        clear_sprint_interval_indexes()  # Rolled-back sprints of earlier tests sent no signals
+        self.sprint = ScrumSprint.objects.create(name="Sprint 1", date_start=date(2024, 1, 1), date_end=date(2024, 1, 14))
+        self.alice = GitLabUser.objects.create(id=1, username="user1")
+        self.group = GitLabGroup.objects.create(id=1)
+        self.project = GitLabProject.objects.create(id=1, group=self.group, path_with_namespace="group/project")
+        self.merge_request = GitLabMergeRequest.objects.create(id=1, title="Fix", web_url="https://gitlab/mr/7")
+
+    def ingest(self, discussion_dicts: list[dict]) -> dict:
+        return git_lab_discussions_api_ingest_merge_request(
+            discussion_dicts=discussion_dicts,
+            lookups=load_git_lab_discussions_api_lookups(),
+            model_merge_request=self.merge_request,
+            payload=get_initial_git_lab_discussions_api_payload(),
+        )
+
+    def test_create(self):
+        """Verify discussions and notes are written with resolved references."""
+        payload = self.ingest([
+            {"id": "d1", "individual_note": False, "notes": [note_dict(1), note_dict(2, author_id=99, day=20)]},
+        ])
+
+        self.assertEqual(payload["total_number_of_discussions_created"], 1)
+        self.assertEqual(payload["total_number_of_notes_created"], 2)
+        first = GitLabNote.objects.get(id=1)
+        self.assertEqual(first.author, self.alice)
+        self.assertEqual(first.group, self.group)
+        self.assertEqual(first.scrum_sprint, self.sprint)
+        self.assertEqual(first.title, "user1 on Fix for group/project")
+        self.assertEqual(first.web_url, "https://gitlab/mr/7#note_1")
+        second = GitLabNote.objects.get(id=2)
+        self.assertIsNone(second.author)  # Unknown user
+        self.assertIsNone(second.scrum_sprint)  # Outside every sprint
+
+        discussion = GitLabDiscussion.objects.get(id="d1")
+        self.assertEqual(discussion.started_by, self.alice)
+        self.assertEqual(discussion.created_at, first.created_at)
+        self.assertEqual(discussion.updated_at, second.updated_at)  # Latest note wins
+        self.assertIsNone(discussion.scrum_sprint)
+        self.assertEqual(GitLabNote.history.count(), 2)
+
+    def test_system_notes_and_rerun(self):
+        """Verify system notes are skipped and existing rows are updated."""
+        discussion_dicts = [{"id": "d1", "notes": [note_dict(1), note_dict(2, system=True)]}]
+        self.ingest(discussion_dicts)
+        discussion_dicts[0]["notes"][0]["body"] = "Edited"
+
+        payload = self.ingest(discussion_dicts)
+
+        self.assertEqual(payload["total_number_of_system_notes_skipped"], 1)
+        self.assertEqual(payload["total_number_of_discussions_updated"], 1)
+        self.assertEqual(payload["total_number_of_notes_updated"], 1)
+        self.assertFalse(GitLabNote.objects.filter(id=2).exists())
+        self.assertEqual(GitLabNote.objects.get(id=1).body, "Edited")
+
+    def test_query_count_independent_of_notes(self):
+        """Verify more notes and discussions do not add queries."""
+        lookups = load_git_lab_discussions_api_lookups()
+
+        def count_queries(discussion_dicts: list[dict]) -> int:
+            with CaptureQueriesContext(connection) as queries:
+                git_lab_discussions_api_ingest_merge_request(
+                    discussion_dicts=discussion_dicts,
+                    lookups=lookups,
+                    model_merge_request=self.merge_request,
+                )
+            return len(queries.captured_queries)
+
+        few = count_queries([{"id": "d1", "notes": [note_dict(1)]}])
+        many = count_queries([
+            {"id": f"d{index}", "notes": [note_dict(index * 10 + offset) for offset in range(3)]}
+            for index in range(2, 12)
+        ])
+
+        self.assertEqual(many, few)
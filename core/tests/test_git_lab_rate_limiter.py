@@ -0,0 +1,103 @@
+"""
+Tests for the shared rate-limit-aware GitLab session.
+
+Verifies that:
+1. RateLimit-Remaining / RateLimit-Reset slow requests down before the budget runs out
+2. A 429 with Retry-After pauses every caller until the deadline
+3. Requests are counted in the metrics of the job context, including fetch threads
+"""
+import time
+from unittest.mock import patch
+
+import requests
+from django.test import SimpleTestCase
+from requests.adapters import BaseAdapter
+
+from core.utilities.git_lab.git_lab_rate_limiter import GitLabRateLimiter
+from core.utilities.git_lab.git_lab_request_metrics import (
+    collect_git_lab_request_metrics,
+)
+from core.utilities.git_lab.git_lab_session import GitLabSession
+from gitlab_sync.utilities import fetch_concurrently
+
+
+class FakeGitLabAdapter(BaseAdapter):
+    """Transport adapter answering every request with a fixed status and headers."""
+
+    def __init__(self, status_code: int = 200, headers: dict | None = None):
+        super().__init__()
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.headers.update(self.headers)
+        response.url = request.url
+        response.request = request
+        response._content = b"[]"
+        return response
+
+    def close(self):
+        pass
+
+
+class TestGitLabRateLimiter(SimpleTestCase):
+    """Unit tests for GitLabRateLimiter and GitLabSession."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.rate_limiter = GitLabRateLimiter(burst=2, reserve_fraction=0.1)
+
+    @patch("core.utilities.git_lab.git_lab_rate_limiter.time.sleep")
+    def test_paces_requests_from_rate_limit_headers(self, sleep):
+        """Verify the remaining budget is spread over the rest of the window."""
+        self.assertEqual(self.rate_limiter.acquire(), 0)
+
+        # 20 of 100 left for 10 seconds, 10 kept in reserve -> 1 request per second
+        self.rate_limiter.observe(
+            200,
+            {
+                "RateLimit-Limit": "100",
+                "RateLimit-Remaining": "20",
+                "RateLimit-Reset": str(time.time() + 10),
+            },
+        )
+        waits = [self.rate_limiter.acquire() for _ in range(3)]
+
+        # The burst goes out immediately, then requests are spaced one second apart
+        self.assertEqual(waits[:2], [0, 0])
+        self.assertAlmostEqual(waits[2], 1.0, delta=0.1)
+        sleep.assert_called_once()
+
+    @patch("core.utilities.git_lab.git_lab_rate_limiter.time.sleep")
+    def test_retry_after_blocks_all_callers(self, sleep):
+        """Verify a 429 makes the next request wait for Retry-After."""
+        self.rate_limiter.observe(429, {"Retry-After": "30"})
+
+        self.assertAlmostEqual(self.rate_limiter.blocked_seconds(), 30, delta=0.5)
+        self.assertAlmostEqual(self.rate_limiter.acquire(), 30, delta=0.5)
+        sleep.assert_called_once()
+
+    def test_session_records_metrics_for_job_and_fetch_threads(self):
+        """Verify requests from the job thread and fetch threads land in the job's metrics."""
+        session = GitLabSession(rate_limiter=self.rate_limiter, pool_size=4)
+        session.mount("https://", FakeGitLabAdapter(status_code=404))
+
+        with collect_git_lab_request_metrics() as request_metrics:
+            session.get("https://gitlab.example.com/api/v4/projects")
+            list(
+                fetch_concurrently(
+                    items=range(3),
+                    fetch=lambda project_id: session.get(
+                        f"https://gitlab.example.com/api/v4/projects/{project_id}"
+                    ),
+                    max_workers=2,
+                )
+            )
+        session.get("https://gitlab.example.com/api/v4/version")
+
+        metrics = request_metrics.to_dict()
+        self.assertEqual(metrics["request_count"], 4)
+        self.assertEqual(metrics["error_count"], 4)
+        self.assertEqual(sum(metrics["latency_histogram"].values()), 4)
@@ -0,0 +1,132 @@
+"""
+Tests for streaming GitLab list pagination.
+
+Verifies that GitLabPageStream:
+1. Requests a lazy iterator and yields bounded pages with page-level progress
+2. Retries a failed page request without dropping items already read
+3. Ends the stream with an error once a page keeps failing
+4. Requests keyset pagination ordered by id when asked
+"""
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from gitlab.exceptions import GitlabListError
+
+from gitlab_sync.utilities import GitLabPageStream, SyncResult
+
+
+class FakeGitLabObject:
+    """Stand-in for a python-gitlab RESTObject."""
+
+    def __init__(self, object_id: int):
+        self.object_id = object_id
+
+    def asdict(self) -> dict:
+        return {"id": self.object_id}
+
+
+class FakeObjectList:
+    """Stand-in for RESTObjectList that fails the next request at given item indexes."""
+
+    def __init__(self, count: int, fail_at: dict[int, int] | None = None):
+        self.total = count
+        self._objects = iter([FakeGitLabObject(object_id) for object_id in range(count)])
+        self._position = 0
+        self._failures = dict(fail_at or {})
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> FakeGitLabObject:
+        if self._failures.get(self._position, 0) > 0:
+            self._failures[self._position] -= 1
+            raise GitlabListError(error_message="502 Bad Gateway", response_code=502)
+        gitlab_object = next(self._objects)
+        self._position += 1
+        return gitlab_object
+
+
+@patch("gitlab_sync.utilities.handle_gitlab_api_errors.time.sleep")
+class TestGitLabPageStream(SimpleTestCase):
+    """Unit tests for GitLabPageStream."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.list_calls: list[dict] = []
+
+    def list_objects(self, object_list: FakeObjectList):
+        def list_method(**parameters):
+            self.list_calls.append(parameters)
+            return object_list
+
+        return list_method
+
+    def test_yields_bounded_pages_with_progress(self, _sleep):
+        """Verify pages are capped at page_size and max_items and reported to SyncResult."""
+        sync_result = SyncResult(entity_type="Test")
+
+        stream, error = GitLabPageStream.open(
+            list_objects=self.list_objects(FakeObjectList(count=250)),
+            entity_name="Commits",
+            max_items=230,
+            since="2025-01-01",
+        )
+        pages = list(stream.pages(sync_result=sync_result))
+
+        self.assertIsNone(error)
+        self.assertEqual(
+            self.list_calls, [{"iterator": True, "per_page": 100, "since": "2025-01-01"}]
+        )
+        self.assertEqual([len(page) for page in pages], [100, 100, 30])
+        self.assertEqual(pages[2][-1], {"id": 229})
+        self.assertEqual(stream.total_pages, 3)
+        self.assertEqual(sync_result.pages_fetched, 3)
+        self.assertIn("Commits: page 3/3 (30 items)", sync_result.logs[-1])
+
+    def test_retries_page_without_dropping_items(self, _sleep):
+        """Verify a transient failure mid-page resumes where it stopped."""
+        stream, error = GitLabPageStream.open(
+            list_objects=self.list_objects(FakeObjectList(count=25, fail_at={15: 1})),
+            entity_name="Merge requests",
+            page_size=10,
+        )
+        ids = [item["id"] for page in stream.pages() for item in page]
+
+        self.assertIsNone(error)
+        self.assertIsNone(stream.error)
+        self.assertEqual(ids, list(range(25)))
+        self.assertEqual(stream.page_number, 3)
+
+    def test_persistent_failure_ends_stream_with_error(self, _sleep):
+        """Verify a page that keeps failing stops the stream and records the error."""
+        stream, error = GitLabPageStream.open(
+            list_objects=self.list_objects(FakeObjectList(count=25, fail_at={10: 3})),
+            entity_name="Merge requests",
+            page_size=10,
+        )
+        pages = list(stream.pages())
+
+        self.assertIsNone(error)
+        self.assertEqual(len(pages), 1)
+        self.assertIn("502 Bad Gateway", stream.error)
+
+    def test_keyset_pagination_parameters(self, _sleep):
+        """Verify keyset mode asks GitLab for keyset pages ordered by id."""
+        GitLabPageStream.open(
+            list_objects=self.list_objects(FakeObjectList(count=0)),
+            entity_name="Projects",
+            keyset=True,
+        )
+
+        self.assertEqual(
+            self.list_calls,
+            [
+                {
+                    "iterator": True,
+                    "per_page": 100,
+                    "pagination": "keyset",
+                    "order_by": "id",
+                    "sort": "asc",
+                }
+            ],
+        )
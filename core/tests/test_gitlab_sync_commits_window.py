@@ -0,0 +1,93 @@
+"""
+Tests for the commits sync window.
+
+Verifies that:
+1. Every run lists the whole configured days-back window, not just commits after the last one seen
+2. A commit merged after a later-dated one is still stored on the next run
+3. Already synced commits are skipped without being written again
+"""
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models.this_server_configuration import ThisServerConfiguration
+from gitlab_sync.apis.gitlab_sync_commits_api import _sync_commits_background
+from gitlab_sync.models import GitLabSyncCommit, GitLabSyncJobTracker, GitLabSyncProject
+
+
+class FakeCommit:
+    """Stand-in for a python-gitlab ProjectCommit."""
+
+    def __init__(self, sha: str, committed_date: str):
+        self.sha = sha
+        self.committed_date = committed_date
+
+    def asdict(self) -> dict:
+        return {"id": self.sha, "short_id": self.sha[:8], "committed_date": self.committed_date}
+
+
+class FakeCommitList:
+    """Stand-in for the lazy RESTObjectList of a commits listing."""
+
+    def __init__(self, commits: list[FakeCommit]):
+        self.total = len(commits)
+        self._commits = iter(commits)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> FakeCommit:
+        return next(self._commits)
+
+
+class TestGitLabSyncCommitsWindow(TestCase):
+    """Tests for _sync_commits_background."""
+
+    def setUp(self):
+        ThisServerConfiguration.clear_cached()
+        self.addCleanup(ThisServerConfiguration.clear_cached)
+        self.project = GitLabSyncProject.objects.create(id=1, name="Project", path_with_namespace="group/project")
+        self.commits: list[FakeCommit] = []
+        self.list_calls: list[dict] = []
+        client = MagicMock()
+        client.projects.get.return_value.commits.list.side_effect = self.list_commits
+        patcher = patch("gitlab_sync.apis.gitlab_sync_commits_api.get_git_lab_client", return_value=client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def list_commits(self, **parameters):
+        self.list_calls.append(parameters)
+        return FakeCommitList(commits=list(self.commits))
+
+    def sync(self) -> None:
+        _sync_commits_background(request=None, job_tracker=GitLabSyncJobTracker.objects.create(job_type="commits"))
+
+    def test_older_commit_merged_later(self):
+        """Verify the second run still asks for the window and stores the older-dated commit."""
+        now = timezone.now()
+        self.commits = [FakeCommit(sha="a" * 40, committed_date=(now - timedelta(hours=1)).isoformat())]
+        self.sync()
+        # A long-lived branch is merged: its commit is dated before the one already synced
+        self.commits.append(FakeCommit(sha="b" * 40, committed_date=(now - timedelta(days=3)).isoformat()))
+        self.sync()
+
+        # Both runs start at the days-back cutoff, well before either commit
+        for list_call in self.list_calls:
+            self.assertLess(datetime.fromisoformat(list_call["since"]), now - timedelta(days=3))
+        self.assertEqual(
+            set(GitLabSyncCommit.objects.values_list("sha", flat=True)),
+            {"a" * 40, "b" * 40},
+        )
+
+    def test_known_commits_skipped(self):
+        """Verify a synced commit is not saved again."""
+        self.commits = [FakeCommit(sha="a" * 40, committed_date=timezone.now().isoformat())]
+        self.sync()
+
+        with patch.object(GitLabSyncCommit, "save") as save:
+            self.sync()
+
+        save.assert_not_called()
+        self.assertEqual(GitLabSyncCommit.objects.count(), 1)
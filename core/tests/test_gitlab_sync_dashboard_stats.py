@@ -0,0 +1,74 @@
+"""
+Tests for the cached GitLab sync dashboard statistics.
+
+Verifies that:
+1. Status breakdowns and totals are computed from grouped counts
+2. Stored row counts are bumped by sync writers and recounted when a sync finishes
+3. Cached stats are reused until a sync job finishes
+"""
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from gitlab_sync.models import (
+    GitLabSyncGroup,
+    GitLabSyncJobTracker,
+    GitLabSyncPipeline,
+    GitLabSyncRowCount,
+)
+from gitlab_sync.utilities import (
+    SyncResult,
+    get_gitlab_sync_dashboard_stats,
+    get_sync_row_counts,
+    increment_sync_row_count,
+)
+
+
+class TestGitLabSyncDashboardStats(TestCase):
+    """Unit tests for get_gitlab_sync_dashboard_stats and sync row counts."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        for pipeline_id, status in enumerate(["success", "success", "failed", "canceled"], 1):
+            GitLabSyncPipeline.objects.create(id=pipeline_id, status=status)
+        GitLabSyncGroup.objects.create(id=1, name="Group")
+
+    def test_breakdowns_and_totals(self):
+        """Verify grouped status counts and entity totals."""
+        dashboard_stats = get_gitlab_sync_dashboard_stats()
+
+        self.assertEqual(
+            dashboard_stats["pipeline_stats"],
+            {"total": 4, "success": 2, "failed": 1, "running": 0, "pending": 0},
+        )
+        self.assertEqual(dashboard_stats["stats"]["pipelines"], 4)
+        self.assertEqual(dashboard_stats["stats"]["groups"], 1)
+        self.assertEqual(dashboard_stats["stats"]["total_entities"], 5)
+
+    def test_row_counts_follow_sync_writers(self):
+        """Verify writer increments and the exact recount when a sync finishes."""
+        self.assertEqual(get_sync_row_counts([GitLabSyncGroup]), {"GitLabSyncGroup": 1})
+
+        increment_sync_row_count(GitLabSyncGroup, 5)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_sync_row_counts([GitLabSyncGroup]), {"GitLabSyncGroup": 6})
+
+        SyncResult(entity_type="GitLabSyncGroup").finish()
+        self.assertEqual(
+            GitLabSyncRowCount.objects.get(model_name="GitLabSyncGroup").row_count, 1
+        )
+
+    def test_cache_invalidated_when_job_finishes(self):
+        """Verify cached stats are served until a job completes."""
+        get_gitlab_sync_dashboard_stats()
+        GitLabSyncPipeline.objects.create(id=5, status="running")
+
+        with self.assertNumQueries(1):
+            cached = get_gitlab_sync_dashboard_stats()
+        self.assertEqual(cached["pipeline_stats"]["running"], 0)
+
+        GitLabSyncJobTracker.objects.create(
+            job_type="pipelines", status="completed", end_time=timezone.now()
+        )
+        self.assertEqual(get_gitlab_sync_dashboard_stats()["pipeline_stats"]["running"], 1)
@@ -0,0 +1,92 @@
+"""
+Tests for the hash_documents management command.
+
+Verifies that:
+1. Missing SHA-256 and image hashes are filled in and the checkpoint is removed
+2. A saved checkpoint makes a rerun resume after the last processed document
+3. Duplicate files are reported with every copy
+"""
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+
+from core.models.document import Document
+
+
+class TestHashDocumentsCommand(TestCase):
+    """Tests for hash_documents."""
+
+    def setUp(self):
+        """Store uploaded files and the checkpoint in throwaway directories."""
+        self.media_root = tempfile.mkdtemp()
+        settings_override = override_settings(MEDIA_ROOT=self.media_root, USE_MINIO=False)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.checkpoint_file = os.path.join(self.media_root, 'checkpoint.json')
+
+    def _upload(self, filename: str, content: bytes) -> Document:
+        document = Document(name=filename, file=SimpleUploadedFile(filename, content))
+        document.save()
+        return document
+
+    def _run(self, *args) -> str:
+        out = io.StringIO()
+        call_command('hash_documents', '--checkpoint-file', self.checkpoint_file, *args, stdout=out)
+        return out.getvalue()
+
+    def test_missing_hashes_filled_in(self):
+        """Verify SHA-256 and dhash are computed in one pass."""
+        buffer = io.BytesIO()
+        Image.linear_gradient('L').save(buffer, format='PNG')
+        image = self._upload('gradient.png', buffer.getvalue())
+        text = self._upload('notes.txt', b'hello')
+
+        self._run('--image-hashes')
+
+        image.refresh_from_db()
+        text.refresh_from_db()
+        self.assertEqual(image.file_hash, hashlib.sha256(buffer.getvalue()).hexdigest())
+        self.assertIsNotNone(image.image_hash)
+        self.assertEqual(text.file_hash, hashlib.sha256(b'hello').hexdigest())
+        self.assertIsNone(text.image_hash)
+        self.assertFalse(os.path.exists(self.checkpoint_file))
+
+    def test_resumes_from_checkpoint(self):
+        """Verify documents before the checkpoint are not processed again."""
+        first = self._upload('first.txt', b'one')
+        second = self._upload('second.txt', b'two')
+        with open(self.checkpoint_file, 'w') as file:
+            json.dump({
+                'run': {'all': False, 'image_hashes': False},
+                'last_id': first.id,
+                'hashed': 1,
+                'errors': 0,
+            }, file)
+
+        output = self._run()
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertIn(f'Resuming after document ID {first.id}', output)
+        self.assertIsNone(first.file_hash)
+        self.assertEqual(second.file_hash, hashlib.sha256(b'two').hexdigest())
+
+    def test_duplicates_reported(self):
+        """Verify every copy of a duplicated file is listed."""
+        copies = [self._upload(f'copy{index}.txt', b'same') for index in range(2)]
+        self._upload('unique.txt', b'other')
+
+        output = self._run()
+
+        self.assertIn('Found 1 duplicate file(s)', output)
+        for copy in copies:
+            self.assertIn(f'(ID: {copy.id})', output)
@@ -0,0 +1,98 @@
+"""
+Tests for the perceptual-hash similarity index.
+
+Verifies that:
+1. Threshold queries and all-pairs neighbors match a brute-force comparison
+2. Updating and discarding documents keeps the index current
+3. Hashes that are not 16x16 dhashes are ignored
+"""
+import random
+
+from django.test import SimpleTestCase
+
+from core.utilities.image_hash_index import ImageHashIndex
+from core.utilities.image_similarity import hamming_distance
+
+
+def flip_bits(image_hash: str, bit_count: int, rng: random.Random) -> str:
+    """Return ``image_hash`` with ``bit_count`` distinct random bits flipped."""
+    value = int(image_hash, 16)
+    for bit in rng.sample(range(256), bit_count):
+        value ^= 1 << bit
+    return format(value, '064x')
+
+
+class TestImageHashIndex(SimpleTestCase):
+    """Unit tests for ImageHashIndex."""
+
+    def setUp(self):
+        """Build random hashes with clusters of near-duplicates."""
+        rng = random.Random(42)
+        self.hashes: dict[int, str] = {}
+        for doc_id in range(1, 401):
+            if doc_id % 3 == 0:
+                self.hashes[doc_id] = flip_bits(
+                    self.hashes[rng.randrange(1, doc_id)], rng.randrange(0, 60), rng
+                )
+            else:
+                self.hashes[doc_id] = format(rng.getrandbits(256), '064x')
+        self.index = ImageHashIndex(self.hashes.items())
+
+    def brute_force_pairs(self, threshold: int) -> set[tuple[int, int, int]]:
+        """All (lower id, higher id, distance) pairs within threshold."""
+        pairs = set()
+        for doc_id, image_hash in self.hashes.items():
+            for other_id, other_hash in self.hashes.items():
+                if doc_id < other_id:
+                    distance = hamming_distance(image_hash, other_hash)
+                    if distance <= threshold:
+                        pairs.add((doc_id, other_id, distance))
+        return pairs
+
+    def test_neighbors_match_brute_force(self):
+        """Verify all-pairs neighbors for thresholds around the chunk boundaries."""
+        for threshold in (0, 10, 15, 16, 17, 25, 35, 50):
+            with self.subTest(threshold=threshold):
+                neighbors = self.index.neighbors(threshold)
+                pairs = {
+                    (doc_id, other_id, distance)
+                    for doc_id, matches in neighbors.items()
+                    for other_id, distance in matches
+                    if doc_id < other_id
+                }
+                self.assertEqual(pairs, self.brute_force_pairs(threshold))
+
+    def test_query_matches_brute_force(self):
+        """Verify single-hash threshold queries, sorted by distance."""
+        image_hash = self.hashes[3]
+        expected = sorted(
+            (
+                (doc_id, hamming_distance(image_hash, other_hash))
+                for doc_id, other_hash in self.hashes.items()
+                if doc_id != 3 and hamming_distance(image_hash, other_hash) <= 25
+            ),
+            key=lambda match: (match[1], match[0]),
+        )
+
+        self.assertEqual(self.index.query(image_hash, 25, exclude_id=3), expected)
+
+    def test_update_and_discard(self):
+        """Verify added, replaced and removed hashes are reflected in queries."""
+        image_hash = self.hashes[1]
+
+        self.index.update(1000, image_hash)
+        self.assertIn((1000, 0), self.index.query(image_hash, 0))
+
+        self.index.update(1000, flip_bits(image_hash, 5, random.Random(1)))
+        self.assertIn((1000, 5), self.index.query(image_hash, 5))
+
+        self.index.discard(1000)
+        self.assertNotIn(1000, [doc_id for doc_id, _ in self.index.query(image_hash, 256)])
+        self.assertEqual(len(self.index), len(self.hashes))
+
+    def test_invalid_hashes_ignored(self):
+        """Verify empty, short and non-hex hashes are not indexed."""
+        index = ImageHashIndex([(1, None), (2, ''), (3, 'abc'), (4, 'z' * 64), (5, '0' * 64)])
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.query('0' * 64, 0), [(5, 0)])
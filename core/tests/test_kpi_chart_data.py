@@ -0,0 +1,132 @@
+"""
+Tests for the batched KPI chart data.
+
+Verifies that:
+1. Velocity and accuracy series match the per-developer chart definitions
+2. The number of queries does not grow with the number of developers
+3. The bulk endpoint answers 304 until a KPI row, sprint, developer or capacity changes
+4. The endpoint serves the configured developers, and everyone on an install without a configuration
+"""
+import json
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models.person import Person
+from core.models.role import Role
+from core.models.sprint import Sprint
+from core.models.this_server_configuration import ThisServerConfiguration
+from kpi.ajax.chart_data.common.get_chart_data_for_developers import get_chart_data_for_developers
+from kpi.ajax.chart_data.kpi_chart_data_for_developers_ajax_view import kpi_chart_data_for_developers_ajax_view
+from kpi.models.key_performance_indicator_sprint import KeyPerformanceIndicatorSprint
+
+
+class TestKpiChartData(TestCase):
+    """Tests for get_chart_data_for_developers and its endpoint."""
+
+    def setUp(self):
+        # The process-wide configuration cache outlives each test's rolled back transaction
+        ThisServerConfiguration.clear_cached()
+        self.addCleanup(ThisServerConfiguration.clear_cached)
+        start = date(2024, 1, 1)
+        self.sprints = [
+            Sprint.objects.create(
+                name=f"Sprint {index}",
+                date_start=start + timedelta(days=14 * index),
+                date_end=start + timedelta(days=14 * index + 13),
+            )
+            for index in range(3)
+        ]
+        self.ada = Person.objects.create(name_first="Ada", name_last="Lovelace", scrum_capacity_base=20)
+        self.kpi_sprint = KeyPerformanceIndicatorSprint.objects.create(
+            person_developer=self.ada,
+            sprint=self.sprints[2],
+            number_of_paid_time_off_days=4,
+            number_of_story_points_committed_to=10,
+            number_of_story_points_delivered=8,
+        )
+
+    def test_series(self):
+        """Verify series run oldest to newest and are padded to five sprints."""
+        data = get_chart_data_for_developers(developers=[self.ada])
+
+        self.assertEqual(data["labels"], ["No Sprint Data", "No Sprint Data", "Sprint 0", "Sprint 1", "Sprint 2"])
+        ada = data["developers"][str(self.ada.uuid)]
+        self.assertEqual(ada["velocity"], [0, 0, 0, 0, 0.5])
+        self.assertEqual(ada["accuracy"], [0, 0, 0, 0, 0.8])
+
+    def test_query_count_independent_of_developers(self):
+        """Verify adding developers does not add queries."""
+        with CaptureQueriesContext(connection) as one_developer:
+            get_chart_data_for_developers(developers=[self.ada])
+
+        developers = [self.ada]
+        for index in range(10):
+            developer = Person.objects.create(name_first=f"Dev {index}", scrum_capacity_base=20)
+            KeyPerformanceIndicatorSprint.objects.create(
+                person_developer=developer, sprint=self.sprints[index % 3], number_of_story_points_delivered=5,
+            )
+            developers.append(developer)
+        with CaptureQueriesContext(connection) as many_developers:
+            data = get_chart_data_for_developers(developers=developers)
+
+        self.assertEqual(len(many_developers.captured_queries), len(one_developer.captured_queries))
+        self.assertEqual(len(data["developers"]), 11)
+
+    def test_endpoint_revalidation(self):
+        """Verify the ETag changes when KPI rows change."""
+        ThisServerConfiguration.objects.create(name="Server")
+        factory = RequestFactory()
+        response = kpi_chart_data_for_developers_ajax_view(factory.get("/"))
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        response = kpi_chart_data_for_developers_ajax_view(factory.get("/", HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, 304)
+
+        self.kpi_sprint.number_of_story_points_delivered = 9
+        self.kpi_sprint.save()
+        response = kpi_chart_data_for_developers_ajax_view(factory.get("/", HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_endpoint_revalidation_without_kpi_changes(self):
+        """Verify a new sprint, a new developer or a capacity change also changes the ETag."""
+        ThisServerConfiguration.objects.create(name="Server")
+        factory = RequestFactory()
+        etags = [kpi_chart_data_for_developers_ajax_view(factory.get("/"))["ETag"]]
+
+        Sprint.objects.create(name="Sprint 3", date_start=date(2024, 2, 12), date_end=date(2024, 2, 25))
+        etags.append(kpi_chart_data_for_developers_ajax_view(factory.get("/"))["ETag"])
+        grace = Person.objects.create(name_first="Grace", name_last="Hopper")
+        etags.append(kpi_chart_data_for_developers_ajax_view(factory.get("/"))["ETag"])
+        grace.scrum_capacity_base = 15
+        grace.save()
+
+        response = kpi_chart_data_for_developers_ajax_view(factory.get("/", HTTP_IF_NONE_MATCH=etags[-1]))
+        self.assertEqual(response.status_code, 200)
+        etags.append(response["ETag"])
+        self.assertEqual(len(set(etags)), 4)
+
+    def test_endpoint_developer_role(self):
+        """Verify only people with the configured developer role are charted."""
+        developer_role = Role.objects.create(name="Developer")
+        ThisServerConfiguration.objects.create(name="Server", type_developer_role=developer_role)
+        self.ada.roles.add(developer_role)
+        Person.objects.create(name_first="Grace", name_last="Hopper")
+
+        response = kpi_chart_data_for_developers_ajax_view(RequestFactory().get("/"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(json.loads(response.content)["developers"]), [str(self.ada.uuid)])
+
+    def test_endpoint_without_configuration(self):
+        """Verify a fresh install without a configuration row charts every person."""
+        Person.objects.create(name_first="Grace", name_last="Hopper")
+
+        response = kpi_chart_data_for_developers_ajax_view(RequestFactory().get("/"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)["developers"]), 2)
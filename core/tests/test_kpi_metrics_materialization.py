@@ -0,0 +1,97 @@
+"""
+Tests for side-effect-free KPI metrics and their materialization.
+
+Verifies that:
+1. Reading KPI and sprint metrics performs no writes
+2. materialize_sprint_metrics fills the cached_* columns of the sprint and its KPI rows
+3. Closed sprints serve metrics from the cache; open sprints compute them live
+4. Sprints are materialized once after they close
+"""
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models.person import Person
+from core.models.sprint import Sprint
+from core.models.this_server_configuration import ThisServerConfiguration
+from kpi.models.key_performance_indicator_sprint import KeyPerformanceIndicatorSprint
+from kpi.utilities.materialize_sprint_metrics import materialize_closed_sprint_metrics, materialize_sprint_metrics
+
+
+class TestKpiMetricsMaterialization(TestCase):
+    """Tests for pure KPI accessors and materialize_sprint_metrics."""
+
+    def setUp(self):
+        # The process-wide configuration cache outlives each test's rolled back transaction
+        ThisServerConfiguration.clear_cached()
+        self.addCleanup(ThisServerConfiguration.clear_cached)
+        self.sprint = Sprint.objects.create(
+            name="Sprint 1",
+            date_start=date.today() - timedelta(days=20),
+            date_end=date.today() - timedelta(days=6),
+            number_of_business_days_in_sprint=10,
+        )
+        person = Person.objects.create(name_first="Ada", name_last="Lovelace")
+        self.kpi_sprint = KeyPerformanceIndicatorSprint.objects.create(
+            person_developer=person,
+            sprint=self.sprint,
+            scrum_capacity_base=20,
+            number_of_story_points_committed_to=20,
+            number_of_story_points_delivered=10,
+            number_of_merge_requests_approved=3,
+        )
+
+    def test_reads_do_not_write(self):
+        """Verify computed accessors only ever SELECT."""
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.kpi_sprint.adjusted_capacity, 20)
+            self.assertEqual(self.kpi_sprint.capacity_based_velocity, 0.5)
+            self.assertEqual(self.kpi_sprint.commitment_accuracy, 0.5)
+            metrics = self.sprint.compute_metrics()
+            self.assertEqual(self.sprint.velocity, 0.5)
+
+        self.assertEqual(metrics["total_adjusted_capacity"], 20)
+        self.assertEqual(metrics["total_number_of_merge_requests_approved"], 3)
+        for query in queries.captured_queries:
+            self.assertTrue(query["sql"].lstrip().upper().startswith("SELECT"), query["sql"])
+        self.kpi_sprint.refresh_from_db()
+        self.assertIsNone(self.kpi_sprint.cached_capacity_adjusted)
+
+    def test_materialize(self):
+        """Verify the cached columns are written and then served."""
+        self.assertFalse(self.sprint.has_materialized_metrics)
+
+        self.assertEqual(materialize_sprint_metrics(sprint=self.sprint), 1)
+
+        self.kpi_sprint.refresh_from_db()
+        self.assertEqual(self.kpi_sprint.cached_capacity_adjusted, 20)
+        self.assertEqual(float(self.kpi_sprint.cached_capacity_base_velocity), 0.5)
+        self.sprint.refresh_from_db()
+        self.assertTrue(self.sprint.has_materialized_metrics)
+
+        # Served from the cache: later KPI changes are not picked up
+        KeyPerformanceIndicatorSprint.objects.filter(pk=self.kpi_sprint.pk).update(number_of_story_points_delivered=20)
+        with self.assertNumQueries(0):
+            metrics = self.sprint.metrics
+        self.assertEqual(metrics["velocity"], 0.5)
+        self.assertEqual(metrics["total_number_of_story_points_delivered"], 10)
+
+    def test_open_sprint_computed_live(self):
+        """Verify an open sprint ignores stale cached values."""
+        self.sprint.date_end = date.today() + timedelta(days=1)
+        self.sprint.cached_velocity = 9
+        self.sprint.cached_accuracy = 9
+        self.sprint.save()
+
+        self.assertEqual(self.sprint.metrics["velocity"], 0.5)
+
+    def test_materialize_closed_sprints(self):
+        """Verify only closed sprints without cached metrics are materialized."""
+        Sprint.objects.create(name="Sprint 2", date_start=date.today() - timedelta(days=5), date_end=date.today() + timedelta(days=9))
+
+        self.assertEqual(materialize_closed_sprint_metrics(), 1)
+        self.sprint.refresh_from_db()
+        self.assertTrue(self.sprint.has_materialized_metrics)
+        self.assertEqual(materialize_closed_sprint_metrics(), 0)
@@ -0,0 +1,110 @@
+"""
+Tests for the set-based KPI sprint computation.
+
+Verifies that:
+1. Per-user metrics match the definitions of the former per-user loop
+2. Existing KPI rows are updated in place and links are only added
+3. The number of queries does not grow with the number of users
+"""
+from datetime import date, datetime, timezone
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from git_lab.models.git_lab_change import GitLabChange
+from git_lab.models.git_lab_discussion import GitLabDiscussion
+from git_lab.models.git_lab_issue import GitLabIssue
+from git_lab.models.git_lab_iteration import GitLabIteration
+from git_lab.models.git_lab_merge_request import GitLabMergeRequest
+from git_lab.models.git_lab_note import GitLabNote
+from git_lab.models.git_lab_project import GitLabProject
+from git_lab.models.git_lab_user import GitLabUser
+from kpi.models.key_performance_indicator_sprint import KeyPerformanceIndicatorSprint
+from kpi.utilities.calculate_kpi_sprints import calculate_kpi_sprints
+from scrum.models.scrum_sprint import ScrumSprint
+
+
+def in_sprint(day: int) -> datetime:
+    return datetime(2024, 1, day, 12, tzinfo=timezone.utc)
+
+
+class TestCalculateKpiSprints(TestCase):
+    """Tests for calculate_kpi_sprints."""
+
+    def setUp(self):
+        self.sprint = ScrumSprint.objects.create(name="Sprint 1", date_start=date(2024, 1, 1), date_end=date(2024, 1, 14))
+        self.iteration = GitLabIteration.objects.create(id=1, scrum_sprint=self.sprint)
+        self.alice = GitLabUser.objects.create(id=1, username="alice")
+        self.bob = GitLabUser.objects.create(id=2, username="bob")
+        project_a = GitLabProject.objects.create(id=1)
+        project_b = GitLabProject.objects.create(id=2)
+
+        written = GitLabIssue.objects.create(id=1, author=self.alice, iteration=self.iteration, project=project_a, weight=3)
+        written.assignees.add(self.bob)
+        delivered = GitLabIssue.objects.create(
+            id=2, author=self.bob, iteration=self.iteration, project=project_b,
+            weight=5, state="closed", closed_at=in_sprint(10),
+        )
+        delivered.assignees.add(self.alice)
+        GitLabIssue.objects.create(id=3, author=self.alice, weight=8)  # Outside the sprint
+
+        merge_request = GitLabMergeRequest.objects.create(id=1, merged_at=in_sprint(5))
+        merge_request.reviewers.add(self.alice)
+        GitLabMergeRequest.objects.create(id=2, merged_at=datetime(2024, 2, 1, tzinfo=timezone.utc)).reviewers.add(self.alice)
+
+        discussion = GitLabDiscussion.objects.create(id="d1")
+        GitLabNote.objects.create(id=1, author=self.alice, discussion=discussion, scrum_sprint=self.sprint, system=False)
+        GitLabNote.objects.create(id=2, author=self.alice, discussion=discussion, scrum_sprint=self.sprint, system=False)
+        GitLabNote.objects.create(id=3, author=self.alice, discussion=discussion, scrum_sprint=self.sprint, system=True)
+
+        GitLabChange.objects.create(id=1, author=self.alice, scrum_sprint=self.sprint, total_lines_added=10, total_lines_removed=2)
+        GitLabChange.objects.create(id=2, author=self.alice, scrum_sprint=self.sprint, total_lines_added=5)
+
+    def test_metrics(self):
+        """Verify each metric per user."""
+        self.assertEqual(calculate_kpi_sprints(scrum_sprint=self.sprint), 2)
+
+        alice = KeyPerformanceIndicatorSprint.objects.get(git_lab_user=self.alice, scrum_sprint=self.sprint)
+        self.assertEqual(alice.number_of_issues_written, 1)
+        self.assertEqual(alice.number_of_story_points_committed_to, 5)
+        self.assertEqual(alice.number_of_story_points_delivered, 5)
+        self.assertEqual(alice.number_of_merge_requests_approved, 1)
+        self.assertEqual(alice.number_of_comments_made, 2)
+        self.assertEqual(alice.number_of_threads_made, 1)
+        self.assertEqual(alice.number_of_code_lines_added, 15)
+        self.assertEqual(alice.number_of_code_lines_removed, 2)
+        self.assertEqual(alice.number_of_context_switches, 2)
+        self.assertEqual(set(alice.git_lab_issues.values_list("id", flat=True)), {1})
+        self.assertEqual(set(alice.git_lab_iterations.values_list("id", flat=True)), {1})
+
+        bob = KeyPerformanceIndicatorSprint.objects.get(git_lab_user=self.bob, scrum_sprint=self.sprint)
+        self.assertEqual(bob.number_of_story_points_committed_to, 3)
+        self.assertEqual(bob.number_of_story_points_delivered, 0)
+        self.assertEqual(bob.number_of_comments_made, 0)
+        self.assertEqual(bob.number_of_code_lines_added, 0)
+
+    def test_existing_rows_updated(self):
+        """Verify rerunning updates the same rows without duplicating links."""
+        calculate_kpi_sprints(scrum_sprint=self.sprint)
+        GitLabChange.objects.filter(id=2).update(total_lines_added=20)
+
+        calculate_kpi_sprints(scrum_sprint=self.sprint)
+
+        self.assertEqual(KeyPerformanceIndicatorSprint.objects.filter(scrum_sprint=self.sprint).count(), 2)
+        alice = KeyPerformanceIndicatorSprint.objects.get(git_lab_user=self.alice, scrum_sprint=self.sprint)
+        self.assertEqual(alice.number_of_code_lines_added, 30)
+        self.assertEqual(alice.git_lab_issues.count(), 1)
+
+    def test_query_count_independent_of_users(self):
+        """Verify adding users does not add queries."""
+        calculate_kpi_sprints(scrum_sprint=self.sprint)
+        with CaptureQueriesContext(connection) as two_users:
+            calculate_kpi_sprints(scrum_sprint=self.sprint)
+
+        GitLabUser.objects.bulk_create([GitLabUser(id=100 + index, username=f"user{index}") for index in range(20)])
+        calculate_kpi_sprints(scrum_sprint=self.sprint)
+        with CaptureQueriesContext(connection) as many_users:
+            calculate_kpi_sprints(scrum_sprint=self.sprint)
+
+        self.assertEqual(len(many_users.captured_queries), len(two_users.captured_queries))
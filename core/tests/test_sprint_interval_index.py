@@ -0,0 +1,78 @@
+"""
+Tests for the in-memory sprint interval index.
+
+Verifies that:
+1. Timestamps resolve to the sprint the former range query returned, including overlaps and edges
+2. Batches resolve in order
+3. The memoized index is dropped when a sprint's dates change
+"""
+from datetime import date, datetime, timezone
+
+from django.test import SimpleTestCase, TestCase
+
+from core.models.sprint import Sprint
+from core.utilities.sprint_interval_index import SprintIntervalIndex, clear_sprint_interval_indexes, \
+    get_sprint_interval_index
+from scrum.models.scrum_sprint import ScrumSprint
+
+
+class TestSprintIntervalIndex(SimpleTestCase):
+    """Tests for SprintIntervalIndex.resolve."""
+
+    def setUp(self):
+        self.index = SprintIntervalIndex(intervals=[
+            (1, date(2024, 1, 1), date(2024, 1, 14)),
+            (2, date(2024, 1, 15), date(2024, 1, 28)),
+            (3, date(2024, 1, 10), date(2024, 1, 20)),  # Overlaps both
+            (4, None, date(2024, 3, 1)),  # Undated sprints never match
+        ])
+
+    def test_resolve(self):
+        """Verify the latest-ending containing sprint wins, like ordering by -date_end."""
+        self.assertEqual(len(self.index), 3)
+        self.assertIsNone(self.index.resolve(date(2023, 12, 31)))
+        self.assertEqual(self.index.resolve(date(2024, 1, 1)), 1)
+        self.assertEqual(self.index.resolve(date(2024, 1, 12)), 3)
+        self.assertEqual(self.index.resolve(date(2024, 1, 21)), 2)
+        self.assertEqual(self.index.resolve(datetime(2024, 1, 28, 23, 59, tzinfo=timezone.utc)), 2)
+        self.assertIsNone(self.index.resolve(date(2024, 1, 29)))
+        self.assertIsNone(self.index.resolve(None))
+
+    def test_ties_prefer_highest_id(self):
+        """Verify sprints with the same end date resolve to the highest id."""
+        index = SprintIntervalIndex(intervals=[(7, date(2024, 1, 1), date(2024, 1, 5)), (5, date(2024, 1, 2), date(2024, 1, 5))])
+
+        self.assertEqual(index.resolve(date(2024, 1, 3)), 7)
+
+    def test_resolve_many(self):
+        """Verify a batch keeps its order."""
+        self.assertEqual(
+            self.index.resolve_many([date(2024, 1, 20), None, date(2024, 1, 2), date(2025, 1, 1)]),
+            [2, None, 1, None],
+        )
+
+
+class TestGetSprintIntervalIndex(TestCase):
+    """Tests for the memoized index and its invalidation."""
+
+    def setUp(self):
+        clear_sprint_interval_indexes()
+        self.scrum_sprint = ScrumSprint.objects.create(name="Sprint 1", date_start=date(2024, 1, 1), date_end=date(2024, 1, 14))
+
+    def test_memoized_and_invalidated_on_save(self):
+        """Verify repeated calls are free and a date change is picked up."""
+        self.assertEqual(get_sprint_interval_index(model=ScrumSprint).resolve(date(2024, 1, 20)), None)
+        with self.assertNumQueries(0):
+            get_sprint_interval_index(model=ScrumSprint)
+
+        self.scrum_sprint.date_end = date(2024, 1, 21)
+        self.scrum_sprint.save()
+
+        self.assertEqual(get_sprint_interval_index(model=ScrumSprint).resolve(date(2024, 1, 20)), self.scrum_sprint.id)
+
+    def test_models_indexed_separately(self):
+        """Verify Sprint and ScrumSprint each get their own index."""
+        sprint = Sprint.objects.create(name="Sprint A", date_start=date(2024, 1, 1), date_end=date(2024, 1, 14))
+
+        self.assertEqual(get_sprint_interval_index(model=Sprint).resolve(date(2024, 1, 5)), sprint.id)
+        self.assertEqual(get_sprint_interval_index(model=ScrumSprint).resolve(date(2024, 1, 5)), self.scrum_sprint.id)
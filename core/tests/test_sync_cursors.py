@@ -0,0 +1,63 @@
+"""
+Tests for incremental GitLab sync cursors.
+
+Verifies that SyncCursors:
+1. Stores the newest written timestamp and requests deltas from it next time
+2. Never moves a cursor backwards
+3. Ignores stored cursors on a full resync
+"""
+from datetime import datetime, timezone
+
+from django.test import TestCase
+
+from gitlab_sync.models import GitLabSyncCursor, GitLabSyncProject
+from gitlab_sync.utilities import SyncCursors
+
+
+class TestSyncCursors(TestCase):
+    """Unit tests for SyncCursors."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.project = GitLabSyncProject.objects.create(id=10, name="Project")
+
+    def test_advance_stores_high_water_mark(self):
+        """Verify the newest timestamp is persisted and used for delta parameters."""
+        cursors = SyncCursors.load(entity_type="issues")
+        self.assertEqual(cursors.updated_after_parameters(self.project.id), {})
+
+        cursors.advance(
+            project_id=self.project.id,
+            timestamps=["2025-01-01T10:00:00Z", None, "2025-01-03T08:30:00.000Z"],
+        )
+
+        reloaded = SyncCursors.load(entity_type="issues")
+        expected = datetime(2025, 1, 3, 8, 30, tzinfo=timezone.utc)
+        self.assertEqual(reloaded.updated_after(self.project.id), expected)
+        self.assertEqual(
+            reloaded.updated_after_parameters(self.project.id),
+            {"updated_after": expected.isoformat(), "order_by": "updated_at", "sort": "asc"},
+        )
+        self.assertIsNone(SyncCursors.load(entity_type="merge-requests").updated_after(self.project.id))
+
+    def test_advance_never_moves_backwards(self):
+        """Verify older timestamps leave the stored cursor untouched."""
+        cursors = SyncCursors.load(entity_type="issues")
+        cursors.advance(project_id=self.project.id, timestamps=["2025-01-03T00:00:00Z"])
+        cursors.advance(project_id=self.project.id, timestamps=["2025-01-01T00:00:00Z"])
+
+        cursor = GitLabSyncCursor.objects.get(project=self.project, entity_type="issues")
+        self.assertEqual(cursor.high_water_mark, datetime(2025, 1, 3, tzinfo=timezone.utc))
+
+    def test_full_resync_ignores_and_resets_cursor(self):
+        """Verify a full resync fetches everything and rewrites the cursor."""
+        SyncCursors.load(entity_type="issues").advance(
+            project_id=self.project.id, timestamps=["2025-01-03T00:00:00Z"]
+        )
+
+        cursors = SyncCursors.load(entity_type="issues", full_resync=True)
+        self.assertIsNone(cursors.updated_after(self.project.id))
+        cursors.advance(project_id=self.project.id, timestamps=["2025-01-02T00:00:00Z"])
+
+        cursor = GitLabSyncCursor.objects.get(project=self.project, entity_type="issues")
+        self.assertEqual(cursor.high_water_mark, datetime(2025, 1, 2, tzinfo=timezone.utc))
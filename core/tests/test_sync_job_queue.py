@@ -0,0 +1,137 @@
+"""
+Tests for the durable GitLab sync job queue.
+
+Verifies that:
+1. Identical queued jobs are deduplicated while pending
+2. Workers claim by priority and respect the per-job-type concurrency limit
+3. Jobs whose worker stopped heartbeating are requeued, then failed after max attempts
+4. A claimed job runs its sync function with the stored query parameters
+5. Two competing claims of one job type never exceed its concurrency limit
+6. A worker runs one job at a time on SQLite unless --concurrency is given
+"""
+from datetime import timedelta
+from importlib import import_module
+from unittest import mock
+
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from core.models.user import User
+from gitlab_sync.management.commands.run_gitlab_sync_worker import DEFAULT_CONCURRENCY, _default_concurrency
+from gitlab_sync.models import GitLabSyncJobTracker
+from gitlab_sync.utilities import (
+    claim_sync_job,
+    enqueue_sync_job,
+    is_full_resync_requested,
+    requeue_expired_sync_jobs,
+    run_sync_job,
+)
+
+# The package re-exports the function under the module's name
+claim_sync_job_module = import_module("gitlab_sync.utilities.claim_sync_job")
+
+
+class TestSyncJobQueue(TestCase):
+    """Unit tests for enqueueing, leasing and running sync jobs."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username="syncer", password="password")
+
+    def _request(self, path="/authenticated/api/gitlab-sync/issue/"):
+        request = self.factory.get(path)
+        request.user = self.user
+        return request
+
+    def test_enqueue_deduplicates_pending_jobs(self):
+        """Verify the same job type and parameters reuse the pending job."""
+        first = enqueue_sync_job("issues", self._request())
+        second = enqueue_sync_job("issues", self._request("/x/?priority=5"))
+        full_resync = enqueue_sync_job("issues", self._request("/x/?full_resync=1"))
+
+        self.assertEqual(first.id, second.id)
+        self.assertNotEqual(first.id, full_resync.id)
+        first.refresh_from_db()
+        self.assertEqual(first.status, "pending")
+        self.assertEqual(first.priority, 5)
+        self.assertEqual(GitLabSyncJobTracker.objects.count(), 2)
+
+    def test_claim_orders_by_priority_and_limits_per_type(self):
+        """Verify priority ordering and that a running type is not claimed twice."""
+        enqueue_sync_job("issues", self._request())
+        enqueue_sync_job("issues", self._request("/x/?full_resync=1"))
+        urgent = enqueue_sync_job("merge-requests", self._request("/x/?priority=10"))
+
+        self.assertEqual(claim_sync_job(worker_id="worker-a").id, urgent.id)
+        issues_job = claim_sync_job(worker_id="worker-a")
+        self.assertEqual(issues_job.job_type, "issues")
+        self.assertEqual(issues_job.lease_owner, "worker-a")
+        self.assertEqual(issues_job.attempts, 1)
+        self.assertIsNone(claim_sync_job(worker_id="worker-b"))
+
+    def test_competing_claims_respect_limit(self):
+        """Verify a worker whose candidates were read before another claim cannot exceed the limit."""
+        enqueue_sync_job("issues", self._request())
+        enqueue_sync_job("issues", self._request("/x/?full_resync=1"))
+        claim_candidate = claim_sync_job_module._claim_candidate
+        worker_a_jobs = []
+
+        def claim_after_competitor(**kwargs):
+            # Worker b already picked its candidates; worker a claims in between
+            if kwargs["worker_id"] == "worker-b" and not worker_a_jobs:
+                worker_a_jobs.append(claim_sync_job(worker_id="worker-a"))
+            return claim_candidate(**kwargs)
+
+        with mock.patch.object(claim_sync_job_module, "_claim_candidate", side_effect=claim_after_competitor):
+            worker_b_job = claim_sync_job(worker_id="worker-b")
+
+        self.assertEqual(worker_a_jobs[0].lease_owner, "worker-a")
+        self.assertIsNone(worker_b_job)
+        self.assertEqual(GitLabSyncJobTracker.objects.filter(job_type="issues", status="running").count(), 1)
+
+    def test_expired_lease_is_requeued_then_failed(self):
+        """Verify abandoned jobs resume on another worker until max attempts."""
+        enqueue_sync_job("issues", self._request())
+        job = claim_sync_job(worker_id="worker-a")
+        expired = timezone.now() - timedelta(seconds=1)
+        GitLabSyncJobTracker.objects.filter(id=job.id).update(lease_expires_at=expired)
+
+        self.assertEqual(requeue_expired_sync_jobs(max_attempts=2), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "pending")
+
+        self.assertEqual(claim_sync_job(worker_id="worker-b").id, job.id)
+        GitLabSyncJobTracker.objects.filter(id=job.id).update(lease_expires_at=expired)
+        requeue_expired_sync_jobs(max_attempts=2)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.attempts, 2)
+
+    def test_run_sync_job_replays_request(self):
+        """Verify the worker passes the stored query string and user to the sync function."""
+        enqueue_sync_job("issues", self._request("/x/?full_resync=1"))
+        job = claim_sync_job(worker_id="worker-a")
+        seen = {}
+
+        def fake_sync(request, job_tracker):
+            seen["full_resync"] = is_full_resync_requested(request)
+            seen["user"] = request.user
+
+        with mock.patch(
+            "gitlab_sync.utilities.run_sync_job.get_sync_job_function", return_value=fake_sync
+        ), mock.patch("gitlab_sync.utilities.run_sync_job.connection"):
+            run_sync_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "completed")
+        self.assertTrue(seen["full_resync"])
+        self.assertEqual(seen["user"], self.user)
+
+    def test_worker_concurrency_by_database(self):
+        """Verify the worker defaults to one job at a time on SQLite."""
+        with mock.patch("gitlab_sync.management.commands.run_gitlab_sync_worker.connection") as connection:
+            connection.vendor = "sqlite"
+            self.assertEqual(_default_concurrency(), 1)
+            connection.vendor = "postgresql"
+            self.assertEqual(_default_concurrency(), DEFAULT_CONCURRENCY)
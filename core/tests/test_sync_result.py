@@ -0,0 +1,58 @@
+"""
+Tests for buffered SyncResult progress writes.
+
+Verifies that SyncResult:
+1. Buffers log lines until the line budget is spent
+2. Appends logs as GitLabSyncJobLog rows readable through the job tracker
+3. Does not overwrite a cancellation when the sync finishes
+"""
+from django.test import TestCase
+from django.utils import timezone
+
+from gitlab_sync.models import GitLabSyncJobLog, GitLabSyncJobTracker
+from gitlab_sync.utilities import SyncResult
+
+
+class TestSyncResult(TestCase):
+    """Unit tests for SyncResult job tracker flushing."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.job_tracker = GitLabSyncJobTracker.objects.create(
+            job_type="issues", status="running", start_time=timezone.now()
+        )
+        self.sync_result = SyncResult(
+            entity_type="GitLabSyncIssue",
+            job_tracker_id=self.job_tracker.id,
+            flush_interval_seconds=3600,
+            flush_max_lines=3,
+        )
+
+    def test_logs_are_buffered_until_line_budget(self):
+        """Verify nothing is written until flush_max_lines lines are pending."""
+        self.sync_result.add_log("one")
+        self.sync_result.add_log("two")
+        self.assertEqual(GitLabSyncJobLog.objects.count(), 0)
+
+        self.sync_result.add_log("three")
+        self.assertEqual(GitLabSyncJobLog.objects.count(), 3)
+
+    def test_finish_flushes_logs_and_progress(self):
+        """Verify finish() writes pending lines, progress and final status."""
+        self.sync_result.update_progress(5, 10, "halfway")
+        self.sync_result.finish()
+
+        self.job_tracker.refresh_from_db()
+        self.assertEqual(self.job_tracker.status, "completed")
+        self.assertEqual(self.job_tracker.progress_percent, 50)
+        self.assertEqual(self.job_tracker.log_count, 1)
+        self.assertTrue(self.job_tracker.get_log_lines()[0].endswith("halfway"))
+        self.assertEqual(self.job_tracker.get_log_lines(offset=1), [])
+
+    def test_finish_keeps_cancelled_status(self):
+        """Verify a job cancelled mid-sync stays cancelled after finish()."""
+        GitLabSyncJobTracker.objects.filter(id=self.job_tracker.id).update(status="cancelled")
+        self.sync_result.finish()
+
+        self.job_tracker.refresh_from_db()
+        self.assertEqual(self.job_tracker.status, "cancelled")
@@ -0,0 +1,68 @@
+"""
+Tests for the streaming tabular export engine.
+
+Verifies that:
+1. XLSX exports carry merged group headers, headers and column number formats
+2. CSV exports stream one line per row with proper quoting
+3. Peak memory of an XLSX export does not grow with the number of rows
+"""
+import tracemalloc
+
+from django.test import SimpleTestCase
+from openpyxl import load_workbook
+
+from core.utilities.tabular_export import EXPORT_FORMAT_CSV, ExportColumn, stream_tabular_export, write_xlsx
+
+COLUMNS = [
+    ExportColumn(title="Developer", group="Developer"),
+    ExportColumn(title="Committed", group="Commitments"),
+    ExportColumn(title="Velocity", group="Commitments", number_format="0.00"),
+]
+
+
+def make_rows(count: int):
+    for index in range(count):
+        yield [f"developer-{index}", index, index / 3]
+
+
+class TestTabularExport(SimpleTestCase):
+    """Tests for stream_tabular_export and write_xlsx."""
+
+    def test_xlsx_layout(self):
+        """Verify group headers are merged and number formats applied."""
+        output = write_xlsx(columns=COLUMNS, rows=make_rows(3), sheet_title="Sprint 1 KPIs")
+        sheet = load_workbook(output).active
+
+        self.assertEqual(sheet.title, "Sprint 1 KPIs")
+        self.assertEqual([str(cell_range) for cell_range in sheet.merged_cells.ranges], ["B1:C1"])
+        self.assertEqual([cell.value for cell in sheet[2]], ["Developer", "Committed", "Velocity"])
+        self.assertEqual([cell.value for cell in sheet[4]], ["developer-1", 1, 1 / 3])
+        self.assertEqual(sheet["C4"].number_format, "0.00")
+        self.assertTrue(sheet["A1"].font.b)
+
+    def test_csv_streamed(self):
+        """Verify CSV rows are written lazily and quoted."""
+        response = stream_tabular_export(
+            columns=COLUMNS,
+            export_format=EXPORT_FORMAT_CSV,
+            filename="kpis",
+            rows=[["Lovelace, Ada", 5, 0.5]],
+        )
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="kpis.csv"')
+        self.assertEqual(
+            b"".join(response.streaming_content).decode(),
+            'Developer,Committed,Velocity\r\n"Lovelace, Ada",5,0.5\r\n',
+        )
+
+    def test_xlsx_memory_flat(self):
+        """Verify ten times the rows do not need ten times the memory."""
+        peaks = []
+        for count in (1_000, 10_000):
+            tracemalloc.start()
+            write_xlsx(columns=COLUMNS, rows=make_rows(count)).close()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        self.assertLess(peaks[1], peaks[0] * 2)
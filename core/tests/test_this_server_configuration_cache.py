@@ -0,0 +1,91 @@
+"""
+Tests for the memoized ThisServerConfiguration.current().
+
+Verifies that:
+1. Repeated calls are served from the process cache without queries
+2. Saving the configuration or one of its secrets invalidates the cache
+3. A version bump from another process is picked up after the check interval
+4. Decrypted secrets are reused until their ciphertext changes
+5. Without a configuration row the unsaved default is served
+"""
+from unittest import mock
+
+from django.test import TestCase
+
+from core.models import secret as secret_module
+from core.models import this_server_configuration as configuration_module
+from core.models.cache_version import CacheVersion
+from core.models.secret import Secret
+from core.models.this_server_configuration import THIS_SERVER_CONFIGURATION_CACHE_NAME, ThisServerConfiguration
+
+
+class TestThisServerConfigurationCache(TestCase):
+    """Tests for ThisServerConfiguration.current() caching."""
+
+    def setUp(self):
+        ThisServerConfiguration.clear_cached()
+        Secret.clear_decrypted_cache()
+        self.addCleanup(ThisServerConfiguration.clear_cached)
+        self.configuration = ThisServerConfiguration.objects.create(name="Server", scrum_capacity_base=25)
+
+    def test_repeated_calls_cached(self):
+        """Verify only the first call queries the database."""
+        self.assertEqual(ThisServerConfiguration.current().scrum_capacity_base, 25)
+        with self.assertNumQueries(0):
+            for _ in range(50):
+                self.assertEqual(ThisServerConfiguration.current().coerced_scrum_capacity_base, 25)
+
+    def test_callers_get_a_copy(self):
+        """Verify editing a returned configuration does not change the cache."""
+        ThisServerConfiguration.current().scrum_capacity_base = 99
+        self.assertEqual(ThisServerConfiguration.current().scrum_capacity_base, 25)
+
+    def test_save_invalidates(self):
+        """Verify saves of the configuration and its secrets bump the version."""
+        ThisServerConfiguration.current()
+        version = CacheVersion.get_version(name=THIS_SERVER_CONFIGURATION_CACHE_NAME)
+
+        self.configuration.scrum_capacity_base = 40
+        self.configuration.save()
+        self.assertEqual(ThisServerConfiguration.current().scrum_capacity_base, 40)
+
+        Secret.objects.create(name="Token")
+        self.assertEqual(CacheVersion.get_version(name=THIS_SERVER_CONFIGURATION_CACHE_NAME), version + 2)
+
+    def test_version_bump_from_other_process(self):
+        """Verify a bumped version row is noticed once the check interval passed."""
+        ThisServerConfiguration.current()
+        # Another process changed the configuration; its signals do not run here
+        ThisServerConfiguration.objects.filter(pk=self.configuration.pk).update(scrum_capacity_base=30)
+        CacheVersion.bump(name=THIS_SERVER_CONFIGURATION_CACHE_NAME)
+        self.assertEqual(ThisServerConfiguration.current().scrum_capacity_base, 25)
+
+        with mock.patch.object(configuration_module, 'THIS_SERVER_CONFIGURATION_VERSION_CHECK_SECONDS', 0):
+            self.assertEqual(ThisServerConfiguration.current().scrum_capacity_base, 30)
+            # Unchanged version: one query for the version row only
+            with self.assertNumQueries(1):
+                ThisServerConfiguration.current()
+
+    def test_default_without_configuration(self):
+        """Verify a fresh install gets the default configuration."""
+        self.configuration.delete()
+
+        configuration = ThisServerConfiguration.current()
+
+        self.assertIsNone(configuration.pk)
+        self.assertIsNone(configuration.connection_git_lab_top_level_group_id)
+        self.assertEqual(configuration.connection_git_lab_hostname, "gitlab.com")
+        self.assertEqual(configuration.coerced_scrum_capacity_base, 30)
+
+    def test_decrypted_secret_cached(self):
+        """Verify a secret is decrypted once until its value changes."""
+        secret = Secret(name="Token", encrypted_value="ciphertext-1")
+        secret.save()
+        with mock.patch.object(secret_module, 'decrypt_secret', side_effect=lambda encrypted_secret: f"plain:{encrypted_secret}") as decrypt:
+            self.assertEqual(secret.get_cached_encrypted_value(), "plain:ciphertext-1")
+            self.assertEqual(secret.get_cached_encrypted_value(), "plain:ciphertext-1")
+            self.assertEqual(decrypt.call_count, 1)
+
+            secret.encrypted_value = "ciphertext-2"
+            self.assertEqual(secret.get_cached_encrypted_value(), "plain:ciphertext-2")
+            self.assertEqual(decrypt.call_count, 2)
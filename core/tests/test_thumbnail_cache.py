@@ -0,0 +1,73 @@
+"""
+Tests for the thumbnail disk cache and MinIO range handling.
+
+Verifies that:
+1. Cached thumbnails are keyed by object key and ETag
+2. The least recently used entries are evicted once over budget
+3. Only single, well-formed byte ranges are passed on to MinIO
+"""
+import os
+import shutil
+import tempfile
+import time
+
+from django.test import SimpleTestCase
+
+from core.utilities.minio_object_storage import object_etag, parse_range_header
+from core.utilities.thumbnail_cache import ThumbnailCache
+
+
+class TestThumbnailCache(SimpleTestCase):
+    """Unit tests for ThumbnailCache."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def test_keyed_by_object_key_and_etag(self):
+        """Verify a changed ETag misses the cache."""
+        cache = ThumbnailCache(self.directory, max_bytes=1024)
+        cache.set('thumbnails/a.avif', '"1"', b'first')
+
+        self.assertEqual(cache.get('thumbnails/a.avif', '"1"'), b'first')
+        self.assertIsNone(cache.get('thumbnails/a.avif', '"2"'))
+        self.assertIsNone(cache.get('thumbnails/b.avif', '"1"'))
+
+    def test_least_recently_used_evicted(self):
+        """Verify eviction keeps recently read entries."""
+        cache = ThumbnailCache(self.directory, max_bytes=250)
+        for name in ('a', 'b'):
+            cache.set(name, 'etag', b'x' * 100)
+        # Age both entries, then read "a" so "b" is the least recently used
+        for name in ('a', 'b'):
+            path = cache._path(name, 'etag')
+            os.utime(path, (time.time() - 60, time.time() - 60))
+        self.assertIsNotNone(cache.get('a', 'etag'))
+
+        cache.set('c', 'etag', b'x' * 100)
+
+        self.assertIsNotNone(cache.get('a', 'etag'))
+        self.assertIsNone(cache.get('b', 'etag'))
+        self.assertIsNotNone(cache.get('c', 'etag'))
+
+
+class TestParseRangeHeader(SimpleTestCase):
+    """Unit tests for parse_range_header and object_etag."""
+
+    def test_single_ranges_accepted(self):
+        """Verify closed, open-ended and suffix ranges."""
+        self.assertEqual(parse_range_header('bytes=0-99'), 'bytes=0-99')
+        self.assertEqual(parse_range_header('bytes=100-'), 'bytes=100-')
+        self.assertEqual(parse_range_header('bytes=-500'), 'bytes=-500')
+
+    def test_unsupported_ranges_ignored(self):
+        """Verify malformed and multi-range headers fall back to the full object."""
+        for value in (None, '', 'bytes=-', 'bytes=5-1', 'bytes=0-1,4-5', 'items=0-1'):
+            self.assertIsNone(parse_range_header(value))
+
+    def test_etag_is_stable_and_quoted(self):
+        """Verify ETags are strong validators derived from the version."""
+        etag = object_etag('abc')
+        self.assertEqual(etag, object_etag('abc'))
+        self.assertNotEqual(etag, object_etag('abd'))
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
@@ -0,0 +1,153 @@
+"""
+Queue bookkeeping for background document derivative generation.
+
+Documents whose derivatives (metadata-stripped file, SHA-256, dhash, thumbnail)
+are missing have derivative_status "pending". run_document_derivative_worker
+leases them with conditional UPDATEs, generates the derivatives in a process
+pool via derive_document_file, and writes the results back here.
+"""
+import os
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F, Q, QuerySet
+from django.utils import timezone
+
+from core.models.common.enums.document_derivative_status_choices import (
+    DOCUMENT_DERIVATIVE_STATUS_DONE,
+    DOCUMENT_DERIVATIVE_STATUS_FAILED,
+    DOCUMENT_DERIVATIVE_STATUS_PENDING,
+    DOCUMENT_DERIVATIVE_STATUS_PROCESSING,
+)
+from core.models.document import Document
+from core.utilities.document_ingest import DocumentDerivatives
+
+
+def queue_document_derivatives(documents: QuerySet) -> int:
+    """
+    Queue documents for derivative (re)generation with a single UPDATE.
+
+    Args:
+        documents: Documents to reprocess; those without a file are skipped
+
+    Returns:
+        Number of documents queued
+    """
+    return documents.filter(file__isnull=False).exclude(file='').update(
+        derivative_status=DOCUMENT_DERIVATIVE_STATUS_PENDING,
+        derivative_error=None,
+        derivative_attempts=0,
+        derivative_lease_expires_at=None,
+    )
+
+
+def claim_document_derivatives(limit: int, lease_seconds: int = 600, max_attempts: int = 3) -> list[Document]:
+    """
+    Lease up to ``limit`` documents awaiting derivatives for a worker.
+
+    Newest uploads are taken first, so a bulk reprocess never delays fresh
+    uploads. Leases that expired (the worker died) are taken over, or marked
+    failed once ``max_attempts`` leases have been used up. Each claim is a
+    conditional UPDATE, so competing workers never lease the same document.
+
+    Returns:
+        The leased documents
+    """
+    now = timezone.now()
+    expired = Q(derivative_status=DOCUMENT_DERIVATIVE_STATUS_PROCESSING, derivative_lease_expires_at__lt=now)
+    Document.objects.filter(expired, derivative_attempts__gte=max_attempts).update(
+        derivative_status=DOCUMENT_DERIVATIVE_STATUS_FAILED,
+        derivative_error='Worker stopped while generating derivatives',
+        derivative_lease_expires_at=None,
+    )
+
+    claimable = Document.objects.filter(Q(derivative_status=DOCUMENT_DERIVATIVE_STATUS_PENDING) | expired)
+    candidate_ids = list(claimable.order_by('-uploaded_at', '-id').values_list('id', flat=True)[:limit * 2])
+    claimed_ids = []
+    for candidate_id in candidate_ids:
+        if len(claimed_ids) >= limit:
+            break
+        claimed = claimable.filter(id=candidate_id).update(
+            derivative_status=DOCUMENT_DERIVATIVE_STATUS_PROCESSING,
+            derivative_attempts=F('derivative_attempts') + 1,
+            derivative_lease_expires_at=now + timedelta(seconds=lease_seconds),
+        )
+        if claimed:
+            claimed_ids.append(candidate_id)
+
+    return list(Document.objects.filter(id__in=claimed_ids))
+
+
+def renew_document_derivative_leases(document_ids: list[int], lease_seconds: int = 600) -> None:
+    """Extend the leases of documents a worker is still processing."""
+    if document_ids:
+        Document.objects.filter(
+            id__in=document_ids, derivative_status=DOCUMENT_DERIVATIVE_STATUS_PROCESSING
+        ).update(derivative_lease_expires_at=timezone.now() + timedelta(seconds=lease_seconds))
+
+
+def apply_document_derivatives(document: Document, derivatives: DocumentDerivatives) -> bool:
+    """
+    Store generated derivatives on a leased document.
+
+    A stripped replacement file and a new thumbnail are uploaded under new
+    names; the objects they replace are deleted once the row is committed.
+
+    Args:
+        document: The document as leased (its file name identifies the processed file)
+        derivatives: Result of derive_document_file for that file
+
+    Returns:
+        False if the document was deleted, re-uploaded or re-queued meanwhile
+        (the results are then discarded)
+    """
+    with transaction.atomic():
+        current = Document.objects.select_for_update().filter(
+            pk=document.pk, derivative_status=DOCUMENT_DERIVATIVE_STATUS_PROCESSING
+        ).first()
+        if current is None or current.file.name != document.file.name:
+            return False
+
+        update_fields = ['file_hash', 'image_hash', 'derivative_status', 'derivative_error', 'derivative_lease_expires_at']
+        replaced_files = []
+        if derivatives.stripped_content is not None:
+            replaced_files.append((current.file.storage, current.file.name))
+            current.file.save(
+                os.path.basename(current.file.name), ContentFile(derivatives.stripped_content), save=False
+            )
+            update_fields.append('file')
+        if derivatives.thumbnail_content is not None:
+            if current.thumbnail:
+                replaced_files.append((current.thumbnail.storage, current.thumbnail.name))
+            current.thumbnail.save('thumbnail.avif', ContentFile(derivatives.thumbnail_content), save=False)
+            update_fields.append('thumbnail')
+
+        current.file_hash = derivatives.file_hash
+        current.image_hash = derivatives.image_hash
+        current.derivative_status = DOCUMENT_DERIVATIVE_STATUS_DONE
+        current.derivative_error = None
+        current.derivative_lease_expires_at = None
+        current.save(update_fields=update_fields)
+
+        def delete_replaced_files():
+            for storage, name in replaced_files:
+                storage.delete(name)
+
+        transaction.on_commit(delete_replaced_files)
+    return True
+
+
+def fail_document_derivatives(document_id: int, error: str, max_attempts: int = 3) -> None:
+    """Record a failed attempt: re-queue the document, or mark it failed after ``max_attempts``."""
+    leased = Document.objects.filter(pk=document_id, derivative_status=DOCUMENT_DERIVATIVE_STATUS_PROCESSING)
+    leased.filter(derivative_attempts__lt=max_attempts).update(
+        derivative_status=DOCUMENT_DERIVATIVE_STATUS_PENDING,
+        derivative_error=error,
+        derivative_lease_expires_at=None,
+    )
+    leased.update(
+        derivative_status=DOCUMENT_DERIVATIVE_STATUS_FAILED,
+        derivative_error=error,
+        derivative_lease_expires_at=None,
+    )
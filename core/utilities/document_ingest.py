@@ -0,0 +1,157 @@
+"""
+Single-pass derivative generation for uploaded document files.
+
+Images are decoded once. From that one decode the file is re-encoded without
+metadata (only if it carries any), and the perceptual hash and AVIF thumbnail
+are computed; the SHA-256 is taken over the re-encoded bytes already in
+memory. Other files are read once for the SHA-256 and once more only if a
+thumbnail (PDF) is generated.
+
+derive_document_file is the entry point for the derivative worker's process
+pool: it takes and returns plain bytes and touches neither Django settings nor
+the database.
+"""
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from django.core.files.uploadedfile import InMemoryUploadedFile, SimpleUploadedFile
+from PIL import Image
+
+from core.utilities.image_similarity import compute_dhash_from_image, is_image_file
+from core.utilities.strip_exif import (
+    IMAGE_EXTENSIONS as METADATA_STRIPPED_EXTENSIONS,
+    encode_without_metadata,
+    uploaded_file_from_buffer,
+)
+from core.utilities.thumbnail_generator import generate_image_thumbnail, generate_thumbnail
+
+logger = logging.getLogger(__name__)
+
+# Image.info entries that identify the camera, author or editing history
+METADATA_INFO_KEYS = ('exif', 'xmp', 'XML:com.adobe.xmp', 'icc_profile', 'comment', 'photoshop')
+
+
+@dataclass
+class IngestedDocumentFile:
+    """Everything derived from a document file, ready to assign to a Document."""
+
+    file: Any  # File to store: the metadata-stripped copy, or the upload itself
+    file_hash: Optional[str] = None
+    image_hash: Optional[str] = None
+    thumbnail: Optional[InMemoryUploadedFile] = None
+
+
+@dataclass
+class DocumentDerivatives:
+    """Picklable result of derive_document_file."""
+
+    file_hash: Optional[str] = None
+    image_hash: Optional[str] = None
+    stripped_content: Optional[bytes] = None  # Replacement file content, if metadata was stripped
+    thumbnail_content: Optional[bytes] = None  # AVIF thumbnail
+
+
+def derive_document_file(filename: str, content: bytes) -> DocumentDerivatives:
+    """
+    Generate the derivatives of one document file from its bytes.
+
+    Args:
+        filename: Stored file name (its extension selects the processing)
+        content: The file's bytes
+
+    Returns:
+        DocumentDerivatives with hashes and any replacement file / thumbnail bytes
+    """
+    upload = SimpleUploadedFile(filename, content)
+    ingested = ingest_document_file(upload)
+
+    stripped_content = None
+    if ingested.file is not upload:
+        ingested.file.seek(0)
+        stripped_content = ingested.file.read()
+
+    return DocumentDerivatives(
+        file_hash=ingested.file_hash,
+        image_hash=ingested.image_hash,
+        stripped_content=stripped_content,
+        thumbnail_content=ingested.thumbnail.read() if ingested.thumbnail else None,
+    )
+
+
+def ingest_document_file(uploaded_file) -> IngestedDocumentFile:
+    """
+    Strip metadata from, hash and thumbnail a document file.
+
+    Peak memory for an image is about twice its decoded pixel buffer plus the
+    re-encoded bytes; images above Pillow's MAX_IMAGE_PIXELS are rejected
+    and stored as uploaded.
+
+    Args:
+        uploaded_file: The uploaded file (or the FieldFile wrapping it)
+
+    Returns:
+        IngestedDocumentFile with the file to store and its derivatives
+    """
+    filename = uploaded_file.name or ''
+    if is_image_file(filename):
+        try:
+            return _ingest_image(uploaded_file, '.' + filename.lower().rsplit('.', 1)[-1])
+        except Exception as e:
+            logger.warning(f"Image ingest failed for {filename}, storing it unprocessed: {e}")
+
+    return IngestedDocumentFile(
+        file=uploaded_file,
+        file_hash=_calculate_file_hash(uploaded_file),
+        thumbnail=generate_thumbnail(uploaded_file, filename),
+    )
+
+
+def _ingest_image(uploaded_file, extension: str) -> IngestedDocumentFile:
+    """Decode an image once and derive every output from that decode."""
+    uploaded_file.seek(0)
+    with Image.open(uploaded_file) as image:
+        image.load()
+
+        if extension in METADATA_STRIPPED_EXTENSIONS and _has_metadata(image):
+            buffer = encode_without_metadata(image, extension)
+            stored_file = uploaded_file_from_buffer(buffer, uploaded_file)
+            file_hash = hashlib.sha256(buffer.getbuffer()).hexdigest()
+        else:
+            stored_file = uploaded_file
+            file_hash = _calculate_file_hash(uploaded_file)
+
+        image_hash = compute_dhash_from_image(image)
+
+        # Last: shrinks the decoded image in place
+        try:
+            thumbnail = generate_image_thumbnail(image)
+        except Exception as e:
+            logger.warning(f"Thumbnail generation failed for {uploaded_file.name}: {e}")
+            thumbnail = None
+
+    return IngestedDocumentFile(
+        file=stored_file,
+        file_hash=file_hash,
+        image_hash=image_hash,
+        thumbnail=thumbnail,
+    )
+
+
+def _has_metadata(image: Image.Image) -> bool:
+    """Whether re-encoding would remove anything (files without metadata are kept byte-identical)."""
+    return bool(image.getexif()) or any(key in image.info for key in METADATA_INFO_KEYS)
+
+
+def _calculate_file_hash(uploaded_file) -> Optional[str]:
+    """Calculate SHA-256 hash of file contents, streamed in chunks."""
+    try:
+        uploaded_file.seek(0)
+        sha256 = hashlib.sha256()
+        for chunk in uploaded_file.chunks():
+            sha256.update(chunk)
+        uploaded_file.seek(0)
+        return sha256.hexdigest()
+    except Exception:
+        return None
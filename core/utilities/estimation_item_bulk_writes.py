@@ -0,0 +1,128 @@
+from decimal import Decimal
+
+from django.db import transaction
+from simple_history.utils import bulk_update_with_history
+
+from core.models.estimation import Estimation
+from core.models.estimation_item import EstimationItem
+
+# Dev hours of the other levels relative to lead dev hours, as in the item form
+REVERSE_MULTIPLIERS: dict[str, Decimal] = {
+    'SENIOR': Decimal('1.25'),
+    'MID': Decimal('2.0'),
+    'JUNIOR': Decimal('3.0'),
+}
+
+RECALCULATED_FIELDS: list[str] = [
+    'hours_senior', 'hours_mid', 'hours_junior',
+    'code_review_hours_lead', 'code_review_hours_senior',
+    'code_review_hours_mid', 'code_review_hours_junior',
+    'tests_hours_lead', 'tests_hours_senior',
+    'tests_hours_mid', 'tests_hours_junior',
+    'code_reviewer_hours', 'story_points',
+]
+
+FIELD_PRECISIONS: dict[str, Decimal] = {
+    field_name: Decimal(1).scaleb(-EstimationItem._meta.get_field(field_name).decimal_places)
+    for field_name in RECALCULATED_FIELDS
+}
+
+
+def reorder_estimation_items(
+        estimation_id: int,
+        item_ids: list[int],
+        moved_item_id: int | None = None,
+        new_group: str | None = None,
+        change_group: bool = False,
+) -> int:
+    """
+    Give items the order of ``item_ids`` (1-based) and, with ``change_group``, move
+    ``moved_item_id`` to ``new_group`` (None for Ungrouped).
+
+    IDs of items that belong to another estimation are ignored.
+
+    Only items whose order or group actually changes are written: one bulk
+    UPDATE with a CASE per field, plus one bulk insert of their history rows.
+
+    Returns:
+        Number of items updated
+    """
+    positions: dict[int, int] = {int(item_id): index for index, item_id in enumerate(item_ids, start=1)}
+    ids: set[int] = set(positions)
+    if moved_item_id is not None:
+        moved_item_id = int(moved_item_id)
+        ids.add(moved_item_id)
+    changed: list[EstimationItem] = []
+    is_group_changed: bool = False
+    for item in EstimationItem.objects.filter(estimation_id=estimation_id, id__in=ids):
+        is_changed: bool = False
+        if item.id in positions and item.order != positions[item.id]:
+            item.order = positions[item.id]
+            is_changed = True
+        if item.id == moved_item_id and change_group and item.group != new_group:
+            item.group = new_group
+            is_changed = is_group_changed = True
+        if is_changed:
+            changed.append(item)
+    if changed:
+        bulk_update_with_history(changed, EstimationItem, ['order', 'group'])
+        if is_group_changed:
+            # The group subtotals move with the item
+            Estimation.clear_rollup_snapshot(estimation_id=estimation_id)
+    return len(changed)
+
+
+def recalculate_estimation_items(estimation: Estimation) -> int:
+    """
+    Derive every item's other hours and story points from its lead dev hours.
+
+    Uses the reverse multipliers for senior, mid and junior dev hours, 0.5x of
+    dev hours for code review, 1x for testing and 1x of lead code review for
+    the code reviewer. Items without lead hours, or whose values come out the
+    same at the fields' stored precision, are left alone; the rest are
+    written in bulk with their history.
+
+    Returns:
+        Number of items updated
+    """
+    changed: list[EstimationItem] = []
+    for item in EstimationItem.objects.filter(estimation=estimation):
+        item.estimation = estimation  # calculate_story_points reads its modifier
+        lead_hours = item.hours_lead or Decimal('0')
+        if lead_hours <= 0:
+            continue
+        hours_senior = lead_hours * REVERSE_MULTIPLIERS['SENIOR']
+        hours_mid = lead_hours * REVERSE_MULTIPLIERS['MID']
+        hours_junior = lead_hours * REVERSE_MULTIPLIERS['JUNIOR']
+        values: dict[str, Decimal] = {
+            'hours_senior': hours_senior,
+            'hours_mid': hours_mid,
+            'hours_junior': hours_junior,
+            'code_review_hours_lead': lead_hours * Decimal('0.5'),
+            'code_review_hours_senior': hours_senior * Decimal('0.5'),
+            'code_review_hours_mid': hours_mid * Decimal('0.5'),
+            'code_review_hours_junior': hours_junior * Decimal('0.5'),
+            'tests_hours_lead': lead_hours,
+            'tests_hours_senior': hours_senior,
+            'tests_hours_mid': hours_mid,
+            'tests_hours_junior': hours_junior,
+            'code_reviewer_hours': lead_hours * Decimal('0.5'),
+        }
+        is_changed: bool = False
+        for field_name, value in values.items():
+            # Compare at the stored precision, or fractional hours never match
+            value = value.quantize(FIELD_PRECISIONS[field_name])
+            if getattr(item, field_name) != value:
+                setattr(item, field_name, value)
+                is_changed = True
+        story_points: Decimal = item.calculate_story_points()
+        if item.story_points != story_points:
+            item.story_points = story_points
+            is_changed = True
+        if is_changed:
+            changed.append(item)
+    if changed:
+        with transaction.atomic():
+            bulk_update_with_history(changed, EstimationItem, RECALCULATED_FIELDS)
+            estimation.refresh_rollup()
+    return len(changed)
@@ -0,0 +1,130 @@
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any, TypedDict
+
+ESTIMATION_LEVELS: tuple[str, ...] = ("junior", "mid", "senior", "lead")
+ESTIMATION_UNGROUPED: str = "Ungrouped"
+
+# Cone of uncertainty extremes used for the best and worst case scenarios
+BEST_CASE_MULTIPLIER: Decimal = Decimal('1.1')
+WORST_CASE_MULTIPLIER: Decimal = Decimal('4.0')
+
+
+class EstimationGroupSubtotals(TypedDict):
+    story_points: Decimal
+    junior_with_uncertainty: Decimal
+    mid_with_uncertainty: Decimal
+    senior_with_uncertainty: Decimal
+    lead_with_uncertainty: Decimal
+    reviewer_hours: Decimal
+
+
+class EstimationRollup(TypedDict):
+    """Item totals of an estimation; everything else is derived from these and the estimation's own fields."""
+    item_count: int
+    base: dict[str, Decimal]  # Per level: dev + code review + tests, before uncertainty
+    with_uncertainty: dict[str, Decimal]
+    best_case: dict[str, Decimal]
+    worst_case: dict[str, Decimal]
+    average_with_uncertainty: Decimal
+    story_points: Decimal
+    reviewer_hours: Decimal
+    groups: dict[str, EstimationGroupSubtotals]  # Keyed by group name, ESTIMATION_UNGROUPED for items without one
+
+
+def compute_estimation_rollup(items: Iterable[Any]) -> EstimationRollup:
+    """
+    Every item total of an estimation in a single pass over its items.
+
+    Each item's base hours and uncertainty multiplier are worked out once and
+    added to the per-level, per-group, best, worst and uncertainty totals
+    together, with the same Decimal operations as the EstimationItem methods.
+
+    Args:
+        items: EstimationItem instances (a list or an already evaluated queryset)
+    """
+    zero = Decimal('0')
+    base: dict[str, Decimal] = dict.fromkeys(ESTIMATION_LEVELS, zero)
+    with_uncertainty: dict[str, Decimal] = dict.fromkeys(ESTIMATION_LEVELS, zero)
+    best_case: dict[str, Decimal] = dict.fromkeys(ESTIMATION_LEVELS, zero)
+    worst_case: dict[str, Decimal] = dict.fromkeys(ESTIMATION_LEVELS, zero)
+    average_with_uncertainty: Decimal = zero
+    story_points: Decimal = zero
+    reviewer_hours: Decimal = zero
+    groups: dict[str, EstimationGroupSubtotals] = {}
+    item_count: int = 0
+
+    for item in items:
+        item_count += 1
+        multiplier: Decimal = item.get_uncertainty_multiplier()
+        group: EstimationGroupSubtotals | None = groups.get(item.group or ESTIMATION_UNGROUPED)
+        if group is None:
+            group = groups[item.group or ESTIMATION_UNGROUPED] = {
+                'story_points': zero,
+                'junior_with_uncertainty': zero,
+                'mid_with_uncertainty': zero,
+                'senior_with_uncertainty': zero,
+                'lead_with_uncertainty': zero,
+                'reviewer_hours': zero,
+            }
+        item_with_uncertainty: Decimal = zero
+        levels_with_hours: int = 0
+        for level in ESTIMATION_LEVELS:
+            item_base = (
+                (getattr(item, f'hours_{level}') or 0)
+                + (getattr(item, f'code_review_hours_{level}') or 0)
+                + (getattr(item, f'tests_hours_{level}') or 0)
+            )
+            level_with_uncertainty: Decimal = item_base * multiplier
+            base[level] += item_base
+            with_uncertainty[level] += level_with_uncertainty
+            best_case[level] += item_base * BEST_CASE_MULTIPLIER
+            worst_case[level] += item_base * WORST_CASE_MULTIPLIER
+            group[f'{level}_with_uncertainty'] += level_with_uncertainty
+            item_with_uncertainty += level_with_uncertainty
+            if getattr(item, f'hours_{level}'):
+                levels_with_hours += 1
+        average_with_uncertainty += item_with_uncertainty / levels_with_hours if levels_with_hours > 0 else zero
+        story_points += item.story_points or zero
+        reviewer_hours += item.code_reviewer_hours or zero
+        group['story_points'] += item.story_points or zero
+        group['reviewer_hours'] += item.code_reviewer_hours or zero
+
+    return {
+        'item_count': item_count,
+        'base': base,
+        'with_uncertainty': with_uncertainty,
+        'best_case': best_case,
+        'worst_case': worst_case,
+        'average_with_uncertainty': average_with_uncertainty,
+        'story_points': story_points,
+        'reviewer_hours': reviewer_hours,
+        'groups': groups,
+    }
+
+
+def estimation_rollup_to_json(value: Any) -> Any:
+    """The rollup with Decimals as strings, so a JSONField stores them without loss."""
+    if isinstance(value, dict):
+        return {key: estimation_rollup_to_json(item) for key, item in value.items()}
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def estimation_rollup_from_json(data: dict) -> EstimationRollup:
+    """Inverse of estimation_rollup_to_json."""
+    def to_decimals(values: dict) -> dict:
+        return {key: Decimal(value) for key, value in values.items()}
+
+    return {
+        'item_count': data['item_count'],
+        'base': to_decimals(data['base']),
+        'with_uncertainty': to_decimals(data['with_uncertainty']),
+        'best_case': to_decimals(data['best_case']),
+        'worst_case': to_decimals(data['worst_case']),
+        'average_with_uncertainty': Decimal(data['average_with_uncertainty']),
+        'story_points': Decimal(data['story_points']),
+        'reviewer_hours': Decimal(data['reviewer_hours']),
+        'groups': {name: to_decimals(subtotals) for name, subtotals in data['groups'].items()},
+    }
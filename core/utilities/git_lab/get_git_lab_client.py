@@ -1,10 +1,27 @@
+import threading
+
 from gitlab import Gitlab
 
 from core.models.secret import Secret
 from core.models.this_server_configuration import ThisServerConfiguration
+from core.utilities.git_lab.git_lab_rate_limiter import git_lab_rate_limiter
+from core.utilities.git_lab.git_lab_session import GitLabSession
+
+# Concurrent sync jobs (worker threads, full sync stages) whose fetch threads share the pool
+GIT_LAB_CONCURRENT_SYNC_JOBS = 4
+
+_git_lab_clients: dict[tuple[str, str, str, int], Gitlab] = {}
+_git_lab_clients_lock = threading.Lock()
 
 
 def get_git_lab_client() -> Gitlab | None:
+    """
+    Return the process-wide GitLab client for the configured connection.
+
+    Clients are cached per hostname, API version, token and pool size, so
+    every caller reuses the same pooled session and rate limiter; changing the
+    connection settings transparently builds a new client.
+    """
     this_server_configuration: ThisServerConfiguration = ThisServerConfiguration.current()
     connection_git_lab_hostname: str | None = this_server_configuration.connection_git_lab_hostname
     if connection_git_lab_hostname is None:
@@ -15,11 +32,25 @@ def get_git_lab_client() -> Gitlab | None:
     connection_git_lab_token_secret: Secret | None = this_server_configuration.connection_git_lab_token
     if connection_git_lab_token_secret is None:
         return None
-    decrypted_token: str | None = connection_git_lab_token_secret.get_encrypted_value()
+    decrypted_token: str | None = connection_git_lab_token_secret.get_cached_encrypted_value()
     if decrypted_token is None:
         return None
-    return Gitlab(
-        api_version=connection_git_lab_api_version.replace("v", ""),
-        private_token=decrypted_token,
-        url=f"https://{connection_git_lab_hostname}/"
+
+    pool_size = max(
+        10,
+        this_server_configuration.coerced_gitlab_sync_fetch_concurrency * GIT_LAB_CONCURRENT_SYNC_JOBS,
     )
+    cache_key = (connection_git_lab_hostname, connection_git_lab_api_version, decrypted_token, pool_size)
+    with _git_lab_clients_lock:
+        git_lab_client = _git_lab_clients.get(cache_key)
+        if git_lab_client is None:
+            # Syncs still holding the old client keep using it until they finish
+            _git_lab_clients.clear()
+            git_lab_client = Gitlab(
+                api_version=connection_git_lab_api_version.replace("v", ""),
+                private_token=decrypted_token,
+                url=f"https://{connection_git_lab_hostname}/",
+                session=GitLabSession(rate_limiter=git_lab_rate_limiter, pool_size=pool_size),
+            )
+            _git_lab_clients[cache_key] = git_lab_client
+    return git_lab_client
@@ -0,0 +1,104 @@
+import threading
+import time
+from typing import Mapping
+
+from core.utilities.coerce_float import coerce_float
+
+
+class GitLabRateLimiter:
+    """
+    Process-wide token bucket pacing every request made to the GitLab API.
+
+    GitLab reports the remaining budget of the current rate limit window in the
+    ``RateLimit-Remaining`` / ``RateLimit-Reset`` response headers. After each
+    response the refill rate is set so the remaining budget (minus a reserve for
+    other clients) lasts until the window resets, so all threads slow down
+    together well before GitLab starts answering 429. A 429 or ``Retry-After``
+    blocks every thread until the server's deadline instead of letting each one
+    discover it separately.
+
+    Servers without rate limit headers are not throttled until they send a 429.
+    """
+
+    def __init__(self, burst: int = 10, reserve_fraction: float = 0.1) -> None:
+        """
+        Args:
+            burst: Requests that may go out back to back before pacing applies
+            reserve_fraction: Share of each window's limit left for other clients
+        """
+        self.burst = max(burst, 1)
+        self.reserve_fraction = reserve_fraction
+        self._lock = threading.Lock()
+        self._rate: float | None = None
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+
+    def acquire(self) -> float:
+        """
+        Take one request slot, sleeping until one is available.
+
+        Slots are reserved under the lock and slept for outside it, so waiting
+        threads queue up in order instead of all waking at once.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait_seconds = max(self._blocked_until - now, 0.0)
+            if self._rate is not None:
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._last_refill) * self._rate
+                )
+                self._last_refill = now
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait_seconds = max(wait_seconds, -self._tokens / self._rate)
+
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt the pace to the rate limit headers of a GitLab response."""
+        now = time.monotonic()
+        retry_after = coerce_float(headers.get("Retry-After"))
+        reset_in = self._seconds_until_reset(headers)
+        remaining = headers.get("RateLimit-Remaining")
+        limit = coerce_float(headers.get("RateLimit-Limit"))
+
+        with self._lock:
+            if status_code == 429 or retry_after > 0:
+                # Fall back to a short pause if the server gave no deadline
+                pause = retry_after or reset_in or 1.0
+                self._blocked_until = max(self._blocked_until, now + pause)
+                self._tokens = min(self._tokens, 0.0)
+                return
+
+            if remaining is None or reset_in <= 0:
+                return
+
+            usable = coerce_float(remaining) - limit * self.reserve_fraction
+            if usable <= 0:
+                self._blocked_until = max(self._blocked_until, now + reset_in)
+                self._tokens = min(self._tokens, 0.0)
+                return
+            self._rate = usable / reset_in
+
+    def blocked_seconds(self) -> float:
+        """Seconds until requests may go out again after a 429, or 0."""
+        with self._lock:
+            return max(self._blocked_until - time.monotonic(), 0.0)
+
+    @staticmethod
+    def _seconds_until_reset(headers: Mapping[str, str]) -> float:
+        """``RateLimit-Reset`` is a Unix timestamp; convert it to seconds from now."""
+        reset_at = coerce_float(headers.get("RateLimit-Reset"))
+        if reset_at <= 0:
+            return 0.0
+        return max(reset_at - time.time(), 0.0)
+
+
+# One rate limit budget per process, shared by every GitLab client
+git_lab_rate_limiter = GitLabRateLimiter()
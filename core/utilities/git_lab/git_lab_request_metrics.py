@@ -0,0 +1,120 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+# Upper bounds (seconds) of the latency histogram buckets; slower requests land in "+Inf"
+LATENCY_BUCKET_SECONDS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class GitLabRequestMetrics:
+    """
+    GitLab API request statistics for one unit of work (usually one sync job).
+
+    Recorded by the shared GitLab session from whichever thread makes the
+    request, so all counters are updated under a lock.
+    """
+
+    request_count: int = 0
+    error_count: int = 0
+    rate_limited_count: int = 0
+    throttle_seconds: float = 0.0
+    total_latency_seconds: float = 0.0
+    max_latency_seconds: float = 0.0
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKET_SECONDS) + 1)
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def record(
+        self, status_code: int | None, latency_seconds: float, throttle_seconds: float
+    ) -> None:
+        """Record one request; ``status_code`` is None when no response arrived."""
+        bucket = next(
+            (
+                index
+                for index, upper_bound in enumerate(LATENCY_BUCKET_SECONDS)
+                if latency_seconds <= upper_bound
+            ),
+            len(LATENCY_BUCKET_SECONDS),
+        )
+        with self._lock:
+            self.request_count += 1
+            if status_code is None or status_code >= 400:
+                self.error_count += 1
+            if status_code == 429:
+                self.rate_limited_count += 1
+            self.throttle_seconds += throttle_seconds
+            self.total_latency_seconds += latency_seconds
+            self.max_latency_seconds = max(self.max_latency_seconds, latency_seconds)
+            self.latency_buckets[bucket] += 1
+
+    @property
+    def average_latency_seconds(self) -> float:
+        """Mean request latency in seconds."""
+        if self.request_count == 0:
+            return 0.0
+        return self.total_latency_seconds / self.request_count
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        with self._lock:
+            return {
+                "request_count": self.request_count,
+                "error_count": self.error_count,
+                "rate_limited_count": self.rate_limited_count,
+                "throttle_seconds": round(self.throttle_seconds, 3),
+                "average_latency_seconds": round(self.average_latency_seconds, 3),
+                "max_latency_seconds": round(self.max_latency_seconds, 3),
+                "latency_histogram": {
+                    **{
+                        f"le_{upper_bound}": count
+                        for upper_bound, count in zip(
+                            LATENCY_BUCKET_SECONDS, self.latency_buckets
+                        )
+                    },
+                    "le_inf": self.latency_buckets[-1],
+                },
+            }
+
+    def __str__(self) -> str:
+        """String representation of the request metrics."""
+        return (
+            f"{self.request_count} GitLab requests, "
+            f"{self.error_count} errors ({self.rate_limited_count} rate limited), "
+            f"avg {self.average_latency_seconds:.2f}s, max {self.max_latency_seconds:.2f}s, "
+            f"{self.throttle_seconds:.1f}s throttled"
+        )
+
+
+_current_git_lab_request_metrics: ContextVar[GitLabRequestMetrics | None] = ContextVar(
+    "current_git_lab_request_metrics", default=None
+)
+
+
+def get_current_git_lab_request_metrics() -> GitLabRequestMetrics | None:
+    """Metrics collector of the work running in the current context, if any."""
+    return _current_git_lab_request_metrics.get()
+
+
+@contextmanager
+def collect_git_lab_request_metrics() -> Iterator[GitLabRequestMetrics]:
+    """
+    Attribute GitLab requests made in this context to a new metrics collector.
+
+    Threads started from inside the block only report to it if they run in a
+    copy of the context (``contextvars.copy_context().run``).
+
+    Example:
+        with collect_git_lab_request_metrics() as request_metrics:
+            sync_function(request, job_tracker)
+        print(request_metrics)
+    """
+    request_metrics = GitLabRequestMetrics()
+    token = _current_git_lab_request_metrics.set(request_metrics)
+    try:
+        yield request_metrics
+    finally:
+        _current_git_lab_request_metrics.reset(token)
@@ -0,0 +1,45 @@
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.utilities.git_lab.git_lab_rate_limiter import GitLabRateLimiter
+from core.utilities.git_lab.git_lab_request_metrics import (
+    get_current_git_lab_request_metrics,
+)
+
+
+class GitLabSession(requests.Session):
+    """
+    requests.Session shared by every GitLab client in the process.
+
+    Keeps enough pooled keep-alive connections for all concurrent sync fetches,
+    paces requests through a shared GitLabRateLimiter and reports each request
+    to the metrics collector of the calling context.
+    """
+
+    def __init__(self, rate_limiter: GitLabRateLimiter, pool_size: int) -> None:
+        super().__init__()
+        self.rate_limiter = rate_limiter
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method: str | bytes, url: str | bytes, *args: Any, **kwargs: Any) -> requests.Response:
+        throttle_seconds = self.rate_limiter.acquire()
+        started = time.perf_counter()
+        status_code: int | None = None
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            status_code = response.status_code
+            self.rate_limiter.observe(status_code, response.headers)
+            return response
+        finally:
+            request_metrics = get_current_git_lab_request_metrics()
+            if request_metrics is not None:
+                request_metrics.record(
+                    status_code=status_code,
+                    latency_seconds=time.perf_counter() - started,
+                    throttle_seconds=throttle_seconds,
+                )
@@ -0,0 +1,335 @@
+"""
+In-memory similarity index over document perceptual hashes (dhash).
+
+The 256-bit hashes are packed into an (n, 4) uint64 matrix and compared with
+vectorized XOR + popcount, so no hex string is parsed per comparison.
+
+Threshold queries use multi-index hashing: each hash is split into 16 chunks
+of 16 bits. Writing t = 16 * r + a, two hashes within Hamming distance t
+differ in at most r bits on one of the first a + 1 chunks, or in at most
+r - 1 bits on one of the others (pigeonhole). Only rows whose chunk matches
+within that radius are compared.
+"""
+import threading
+from itertools import combinations
+from typing import Iterable, Optional
+
+import numpy as np
+
+HASH_BITS = 256
+HASH_WORDS = HASH_BITS // 64
+HASH_HEX_LENGTH = HASH_BITS // 4
+CHUNK_BITS = 16
+CHUNK_COUNT = HASH_BITS // CHUNK_BITS
+
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def _pack_hash(image_hash: Optional[str]) -> Optional[bytes]:
+    """Raw 32 bytes of a 16x16 dhash hex string, or None if it is not one."""
+    if not image_hash or len(image_hash) != HASH_HEX_LENGTH:
+        return None
+    try:
+        return bytes.fromhex(image_hash)
+    except ValueError:
+        return None
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """Number of set bits in each element of a uint64 array (SWAR popcount)."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words).astype(np.int64)
+    words = words - ((words >> np.uint64(1)) & _M1)
+    words = (words & _M2) + ((words >> np.uint64(2)) & _M2)
+    words = (words + (words >> np.uint64(4))) & _M4
+    return ((words * _H01) >> np.uint64(56)).astype(np.int64)
+
+
+def _within_threshold(
+    columns: np.ndarray,
+    rows: np.ndarray,
+    others: np.ndarray,
+    threshold: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Keep the (rows[k], others[k]) pairs within ``threshold`` bits of each other.
+
+    ``columns`` is the (HASH_WORDS, n) word-major hash matrix. Distances are
+    accumulated one 64-bit word at a time and pairs already over the
+    threshold are dropped, so most unrelated pairs cost a single word.
+
+    Returns:
+        (rows, others, distances) of the pairs kept
+    """
+    distances = np.zeros(len(rows), dtype=np.int64)
+    for word in columns:
+        distances += _popcount(word[rows] ^ word[others])
+        keep = distances <= threshold
+        rows, others, distances = rows[keep], others[keep], distances[keep]
+    return rows, others, distances
+
+
+def _flip_masks(radius: int) -> np.ndarray:
+    """All CHUNK_BITS-bit masks with at most ``radius`` bits set."""
+    masks = [0]
+    for flipped in range(1, min(radius, CHUNK_BITS) + 1):
+        for bits in combinations(range(CHUNK_BITS), flipped):
+            masks.append(sum(1 << bit for bit in bits))
+    return np.array(masks, dtype=np.int64)
+
+
+def _chunk_flip_masks(threshold: int) -> list[np.ndarray]:
+    """Flip masks to probe for each chunk; an empty array means the chunk is skipped."""
+    radius, remainder = divmod(threshold, CHUNK_COUNT)
+    masks = _flip_masks(radius)
+    reduced_masks = _flip_masks(radius - 1) if radius else np.array([], dtype=np.int64)
+    return [masks if column <= remainder else reduced_masks for column in range(CHUNK_COUNT)]
+
+
+def _expand_ranges(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """For ranges [starts[k], ends[k]), return (k, position) for every position covered."""
+    counts = ends - starts
+    owners = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, np.repeat(starts, counts) + offsets
+
+
+class ImageHashIndex:
+    """
+    Hamming-distance index of document id -> 16x16 dhash.
+
+    Rows are added, replaced and removed in place; the lookup tables are
+    rebuilt lazily on the next query after a change. Hashes that are not
+    64 hex characters are not indexed (they never compared as similar).
+    """
+
+    def __init__(self, entries: Iterable[tuple[int, Optional[str]]] = ()):
+        self._lock = threading.RLock()
+        self.replace(entries)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def replace(self, entries: Iterable[tuple[int, Optional[str]]]) -> None:
+        """Replace the whole index with (document id, image hash) pairs."""
+        ids: list[int] = []
+        packed: list[bytes] = []
+        for doc_id, image_hash in entries:
+            raw = _pack_hash(image_hash)
+            if raw is not None:
+                ids.append(doc_id)
+                packed.append(raw)
+        with self._lock:
+            self._ids = np.array(ids, dtype=np.int64)
+            self._matrix = np.frombuffer(b''.join(packed), dtype=np.uint64).reshape(-1, HASH_WORDS).copy()
+            self._row_by_id = {doc_id: row for row, doc_id in enumerate(ids)}
+            self._lookup_tables = None
+
+    def update(self, doc_id: int, image_hash: Optional[str]) -> None:
+        """Add or replace one document's hash; an empty or invalid hash removes it."""
+        raw = _pack_hash(image_hash)
+        if raw is None:
+            self.discard(doc_id)
+            return
+        words = np.frombuffer(raw, dtype=np.uint64)
+        with self._lock:
+            row = self._row_by_id.get(doc_id)
+            if row is None:
+                self._row_by_id[doc_id] = len(self._ids)
+                self._ids = np.append(self._ids, doc_id)
+                self._matrix = np.vstack([self._matrix, words])
+            elif np.array_equal(self._matrix[row], words):
+                return
+            else:
+                self._matrix[row] = words
+            self._lookup_tables = None
+
+    def discard(self, doc_id: int) -> None:
+        """Remove a document from the index if present."""
+        with self._lock:
+            row = self._row_by_id.pop(doc_id, None)
+            if row is None:
+                return
+            self._ids = np.delete(self._ids, row)
+            self._matrix = np.delete(self._matrix, row, axis=0)
+            self._row_by_id = {int(other_id): other_row for other_row, other_id in enumerate(self._ids)}
+            self._lookup_tables = None
+
+    def _get_lookup_tables(self) -> tuple[np.ndarray, np.ndarray, list[tuple[np.ndarray, np.ndarray]]]:
+        """
+        Lookup tables for the current rows, rebuilt after any change.
+
+        Returns:
+            (columns, chunks, tables): the (HASH_WORDS, n) word-major hash
+            matrix, the (n, CHUNK_COUNT) chunk values, and per chunk c
+            tables[c] = (order, starts) where the rows holding chunk value v
+            are order[starts[v]:starts[v + 1]]
+        """
+        if self._lookup_tables is None:
+            columns = np.ascontiguousarray(self._matrix.T)
+            chunks = self._matrix.view(np.uint16).astype(np.int64)
+            tables = []
+            for column in range(CHUNK_COUNT):
+                order = np.argsort(chunks[:, column], kind='stable')
+                starts = np.searchsorted(chunks[order, column], np.arange((1 << CHUNK_BITS) + 1))
+                tables.append((order, starts))
+            self._lookup_tables = (columns, chunks, tables)
+        return self._lookup_tables
+
+    def query(
+        self,
+        image_hash: str,
+        threshold: int,
+        exclude_id: Optional[int] = None,
+    ) -> list[tuple[int, int]]:
+        """
+        Documents whose hash is within ``threshold`` bits of ``image_hash``.
+
+        Returns:
+            List of (document id, distance) tuples sorted by distance
+        """
+        raw = _pack_hash(image_hash)
+        if raw is None or threshold < 0:
+            return []
+        words = np.frombuffer(raw, dtype=np.uint64)
+        query_chunks = words.view(np.uint16).astype(np.int64)
+        chunk_masks = _chunk_flip_masks(threshold)
+
+        with self._lock:
+            if not len(self._ids):
+                return []
+            columns, _, tables = self._get_lookup_tables()
+            candidates = []
+            for column, (order, starts) in enumerate(tables):
+                keys = query_chunks[column] ^ chunk_masks[column]
+                _, positions = _expand_ranges(starts[keys], starts[keys + 1])
+                candidates.append(order[positions])
+            rows = np.unique(np.concatenate(candidates))
+            distances = np.zeros(len(rows), dtype=np.int64)
+            for word, query_word in zip(columns, words):
+                distances += _popcount(word[rows] ^ query_word)
+            ids = self._ids[rows]
+
+        keep = distances <= threshold
+        if exclude_id is not None:
+            keep &= ids != exclude_id
+        ids, distances = ids[keep], distances[keep]
+        ranked = np.lexsort((ids, distances))
+        return list(zip(ids[ranked].tolist(), distances[ranked].tolist()))
+
+    def neighbors(self, threshold: int) -> dict[int, list[tuple[int, int]]]:
+        """
+        Every pair of indexed documents within ``threshold`` bits of each other.
+
+        Returns:
+            Document id -> list of (other document id, distance), for every
+            document with at least one neighbor
+        """
+        if threshold < 0:
+            return {}
+        chunk_masks = _chunk_flip_masks(threshold)
+
+        with self._lock:
+            row_count = len(self._ids)
+            if row_count < 2:
+                return {}
+            columns, chunks, tables = self._get_lookup_tables()
+            pair_keys = []
+            for column, (order, starts) in enumerate(tables):
+                values = chunks[:, column]
+                for mask in chunk_masks[column]:
+                    if mask:
+                        # Probe from the smaller chunk value only, so each pair is found once
+                        rows = np.flatnonzero(values < values ^ mask)
+                        partners = values[rows] ^ mask
+                        owners, positions = _expand_ranges(starts[partners], starts[partners + 1])
+                        rows, others = rows[owners], order[positions]
+                    else:
+                        rows, positions = _expand_ranges(starts[values], starts[values + 1])
+                        others = order[positions]
+                        ordered = rows < others
+                        rows, others = rows[ordered], others[ordered]
+                    rows, others, _ = _within_threshold(columns, rows, others, threshold)
+                    pair_keys.append(np.minimum(rows, others) * row_count + np.maximum(rows, others))
+            # Similar pairs usually share several chunks; keep each once
+            rows, others = np.divmod(np.unique(np.concatenate(pair_keys)), row_count)
+            rows, others, distances = _within_threshold(columns, rows, others, threshold)
+            ids, other_ids = self._ids[rows], self._ids[others]
+
+        neighbors: dict[int, list[tuple[int, int]]] = {}
+        for doc_id, other_id, distance in zip(ids.tolist(), other_ids.tolist(), distances.tolist()):
+            neighbors.setdefault(doc_id, []).append((other_id, distance))
+            neighbors.setdefault(other_id, []).append((doc_id, distance))
+        return neighbors
+
+
+class DocumentImageHashIndex(ImageHashIndex):
+    """
+    Process-wide index of Document.image_hash, built on first use.
+
+    Document.save and Document.delete update it directly. Changes made by other
+    processes are picked up before each query by replaying Document history
+    rows newer than the last one seen.
+    """
+
+    # Replaying more history rows than this is slower than reloading
+    MAX_REPLAYED_CHANGES = 1000
+
+    def __init__(self):
+        super().__init__()
+        self._loaded = False
+        self._last_history_id = 0
+
+    def refresh(self) -> None:
+        """Load the index on first use, then catch up on Document changes."""
+        from django.db.models import Max
+
+        from core.models.document import Document
+
+        with self._lock:
+            if self._loaded:
+                changes = list(
+                    Document.history.filter(history_id__gt=self._last_history_id)
+                    .order_by('history_id')
+                    .values_list('history_id', 'id', 'image_hash', 'history_type')[:self.MAX_REPLAYED_CHANGES + 1]
+                )
+                if len(changes) <= self.MAX_REPLAYED_CHANGES:
+                    for history_id, doc_id, image_hash, history_type in changes:
+                        if history_type == '-':
+                            self.discard(doc_id)
+                        else:
+                            self.update(doc_id, image_hash)
+                        self._last_history_id = history_id
+                    return
+
+            self._last_history_id = Document.history.aggregate(last=Max('history_id'))['last'] or 0
+            self.replace(
+                Document.objects.filter(image_hash__isnull=False)
+                .exclude(image_hash='')
+                .values_list('id', 'image_hash')
+            )
+            self._loaded = True
+
+    def update(self, doc_id: int, image_hash: Optional[str]) -> None:
+        with self._lock:
+            if self._loaded:
+                super().update(doc_id, image_hash)
+
+    def discard(self, doc_id: int) -> None:
+        with self._lock:
+            if self._loaded:
+                super().discard(doc_id)
+
+    def query(self, image_hash: str, threshold: int, exclude_id: Optional[int] = None) -> list[tuple[int, int]]:
+        self.refresh()
+        return super().query(image_hash, threshold, exclude_id=exclude_id)
+
+    def neighbors(self, threshold: int) -> dict[int, list[tuple[int, int]]]:
+        self.refresh()
+        return super().neighbors(threshold)
+
+
+document_image_hash_index = DocumentImageHashIndex()
@@ -36,29 +36,34 @@ def compute_dhash(image_file, hash_size: int = 16) -> Optional[str]:
     """
     try:
         image_file.seek(0)
-        img = Image.open(image_file)
+        with Image.open(image_file) as img:
+            hash_value = compute_dhash_from_image(img, hash_size)
+        image_file.seek(0)
+        return hash_value
+    except Exception:
+        return None
 
-        # Convert to grayscale
-        img = img.convert('L')
 
-        # Resize to hash_size+1 x hash_size
-        img = img.resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
+def compute_dhash_from_image(img: Image.Image, hash_size: int = 16) -> str:
+    """Compute the dhash (see compute_dhash) of an already decoded image."""
+    # Convert to grayscale
+    img = img.convert('L')
 
-        # Convert to numpy array
-        pixels = np.array(img)
+    # Resize to hash_size+1 x hash_size
+    img = img.resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS)
 
-        # Compute differences between adjacent pixels
-        diff = pixels[:, 1:] > pixels[:, :-1]
+    # Convert to numpy array
+    pixels = np.array(img)
 
-        # Convert to hash
-        hash_value = 0
-        for bit in diff.flatten():
-            hash_value = (hash_value << 1) | int(bit)
+    # Compute differences between adjacent pixels
+    diff = pixels[:, 1:] > pixels[:, :-1]
 
-        image_file.seek(0)
-        return format(hash_value, f'0{hash_size * hash_size // 4}x')
-    except Exception:
-        return None
+    # Convert to hash
+    hash_value = 0
+    for bit in diff.flatten():
+        hash_value = (hash_value << 1) | int(bit)
+
+    return format(hash_value, f'0{hash_size * hash_size // 4}x')
 
 
 def hamming_distance(hash1: str, hash2: str) -> int:
@@ -84,7 +89,14 @@ def similarity_percentage(hash1: str, hash2: str, hash_size: int = 16) -> float:
     Calculate similarity percentage between two hashes.
     Returns 0-100 where 100 is identical.
     """
-    distance = hamming_distance(hash1, hash2)
+    return similarity_from_distance(hamming_distance(hash1, hash2), hash_size)
+
+
+def similarity_from_distance(distance: int, hash_size: int = 16) -> float:
+    """
+    Convert a Hamming distance between two hashes to a similarity percentage.
+    Returns 0-100 where 100 is identical.
+    """
     if distance < 0:
         return 0.0
 
@@ -0,0 +1,110 @@
+"""
+Shared, pooled access to objects in MinIO for the document views.
+
+A boto3 client is thread-safe but expensive to build (credential and
+endpoint resolution, a new connection pool), so one client per process
+serves every request.
+"""
+import hashlib
+import re
+import threading
+from typing import Any, Optional
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from django.conf import settings
+
+# Connections kept open to MinIO; covers the concurrent requests of one process
+MINIO_MAX_POOL_CONNECTIONS = 32
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+_RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+# ClientError codes meaning the object is gone
+MISSING_OBJECT_ERROR_CODES = ('NoSuchKey', '404', 'NotFound')
+
+
+def get_s3_client():
+    """Return the process-wide S3 client for the configured MinIO endpoint."""
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                _s3_client = boto3.client(
+                    's3',
+                    endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_S3_REGION_NAME,
+                    config=Config(
+                        max_pool_connections=MINIO_MAX_POOL_CONNECTIONS,
+                        signature_version=settings.AWS_S3_SIGNATURE_VERSION,
+                        retries={'max_attempts': 3, 'mode': 'standard'},
+                    ),
+                )
+    return _s3_client
+
+
+def get_object(key: str, byte_range: Optional[str] = None) -> dict[str, Any]:
+    """
+    Fetch an object (or one byte range of it) from the media bucket.
+
+    Args:
+        key: Object key (the FieldFile name)
+        byte_range: Optional ``bytes=start-end`` range, see parse_range_header
+
+    Returns:
+        The get_object response; its Body streams the content
+    """
+    kwargs = {'Bucket': settings.AWS_STORAGE_BUCKET_NAME, 'Key': key}
+    if byte_range:
+        kwargs['Range'] = byte_range
+    return get_s3_client().get_object(**kwargs)
+
+
+def get_object_size(key: str) -> int:
+    """Return the size in bytes of an object in the media bucket."""
+    return get_s3_client().head_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)['ContentLength']
+
+
+def is_missing_object_error(error: ClientError) -> bool:
+    """Whether a ClientError means the requested object does not exist."""
+    return error.response.get('Error', {}).get('Code') in MISSING_OBJECT_ERROR_CODES
+
+
+def is_invalid_range_error(error: ClientError) -> bool:
+    """Whether a ClientError means the requested range lies beyond the object."""
+    return error.response.get('Error', {}).get('Code') == 'InvalidRange'
+
+
+def parse_range_header(value: Optional[str]) -> Optional[str]:
+    """
+    Validate a Range request header.
+
+    Only a single byte range is passed on to MinIO; multi-range and malformed
+    headers return None, in which case the full object is served as RFC 9110
+    allows.
+    """
+    match = _RANGE_RE.match((value or '').strip())
+    if match is None:
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if start and end and int(start) > int(end):
+        return None
+    return f'bytes={start}-{end}'
+
+
+def object_etag(version: str) -> str:
+    """
+    Build a strong ETag from a value identifying an object's content.
+
+    The ETag is derived from database state (e.g. the file's SHA-256 or an
+    object key that is never overwritten), so conditional requests can be
+    answered without contacting MinIO.
+    """
+    return f'"{hashlib.sha256(version.encode()).hexdigest()[:32]}"'
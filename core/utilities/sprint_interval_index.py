@@ -0,0 +1,119 @@
+import threading
+import time
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import date, datetime
+
+from django.db import models
+from django.utils import timezone
+
+from core.models.cache_version import CacheVersion
+
+SPRINT_INTERVAL_INDEX_CACHE_NAME = "sprint_interval_index"
+# Saving any of these moves a sprint in its index
+SPRINT_INTERVAL_FIELDS = frozenset({"date_end", "date_start", "id"})
+# How long a process trusts its cached indexes before re-checking the version row
+SPRINT_INTERVAL_INDEX_VERSION_CHECK_SECONDS = 5
+
+_cached_indexes: dict[str, 'SprintIntervalIndex'] = {}
+_cached_version: int = 0
+_cached_checked_at: float = 0.0
+_cached_indexes_lock = threading.Lock()
+
+
+class SprintIntervalIndex:
+    """
+    Date ranges of one sprint model, sorted by start date and searched by bisection.
+
+    Resolves a timestamp to the sprint a ``filter(date_start__lte=at,
+    date_end__gte=at).first()`` query returns under the sprint ordering
+    (latest ``date_end``, then highest id), also when sprints overlap: next to
+    each start date it keeps the latest-ending sprint that started on or
+    before it, so one bisection answers the query.
+    """
+
+    def __init__(self, intervals: Iterable[tuple[int, date | None, date | None]]) -> None:
+        rows: list[tuple[date, date, int]] = sorted(
+            (date_start, date_end, sprint_id)
+            for sprint_id, date_start, date_end in intervals
+            if date_start is not None and date_end is not None
+        )
+        self._starts: list[date] = [row[0] for row in rows]
+        self._latest_ending: list[tuple[date, int]] = []
+        latest: tuple[date, int] | None = None
+        for _, date_end, sprint_id in rows:
+            if latest is None or (date_end, sprint_id) > latest:
+                latest = (date_end, sprint_id)
+            self._latest_ending.append(latest)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @staticmethod
+    def load(model: type[models.Model]) -> 'SprintIntervalIndex':
+        return SprintIntervalIndex(intervals=model.objects.values_list("id", "date_start", "date_end"))
+
+    def resolve(self, at: date | datetime | None) -> int | None:
+        """Id of the sprint containing ``at``, or None."""
+        if at is None:
+            return None
+        day: date = _to_date(at)
+        position: int = bisect_right(self._starts, day) - 1
+        if position < 0:
+            return None
+        date_end, sprint_id = self._latest_ending[position]
+        return sprint_id if date_end >= day else None
+
+    def resolve_many(self, timestamps: Iterable[date | datetime | None]) -> list[int | None]:
+        """Sprint ids for a whole batch, in the order of ``timestamps``."""
+        return [self.resolve(at) for at in timestamps]
+
+
+def get_sprint_interval_index(model: type[models.Model]) -> SprintIntervalIndex:
+    """
+    The index of ``model`` (ScrumSprint or Sprint), memoized per process.
+
+    Sprint saves and deletes bump a shared version row; every process drops
+    its indexes once it sees the bump, within
+    SPRINT_INTERVAL_INDEX_VERSION_CHECK_SECONDS.
+    """
+    global _cached_version, _cached_checked_at
+    label: str = model._meta.label
+    now = time.monotonic()
+    with _cached_indexes_lock:
+        index, version, checked_at = _cached_indexes.get(label), _cached_version, _cached_checked_at
+    if index is not None and now - checked_at < SPRINT_INTERVAL_INDEX_VERSION_CHECK_SECONDS:
+        return index
+
+    current_version: int = CacheVersion.get_version(name=SPRINT_INTERVAL_INDEX_CACHE_NAME)
+    with _cached_indexes_lock:
+        if current_version != version:
+            _cached_indexes.clear()
+        _cached_version, _cached_checked_at = current_version, now
+        index = _cached_indexes.get(label)
+    if index is None:
+        index = SprintIntervalIndex.load(model=model)
+        with _cached_indexes_lock:
+            _cached_indexes[label] = index
+    return index
+
+
+def clear_sprint_interval_indexes() -> None:
+    """Forget this process' indexes."""
+    with _cached_indexes_lock:
+        _cached_indexes.clear()
+
+
+def invalidate_sprint_interval_indexes() -> None:
+    """Forget the indexes in this and, via the version row, every other process."""
+    clear_sprint_interval_indexes()
+    CacheVersion.bump(name=SPRINT_INTERVAL_INDEX_CACHE_NAME)
+
+
+def _to_date(at: date | datetime) -> date:
+    """The calendar day a DateField lookup compares ``at`` as."""
+    if not isinstance(at, datetime):
+        return at
+    if timezone.is_aware(at):
+        at = timezone.make_naive(at)
+    return at.date()
@@ -0,0 +1,113 @@
+from typing import Any, TypedDict
+
+from django.db import connection
+
+# Compound SELECT terms per row count query; SQLite allows 500 by default
+ROW_COUNT_QUERY_BATCH = 400
+
+# Rough per-row sizes used when SQLite was built without the dbstat table
+ESTIMATED_ROW_BYTES = 100
+ESTIMATED_INDEX_ENTRY_BYTES = 20
+
+
+class TableStatistics(TypedDict):
+    table_name: str
+    row_count: int
+    size_bytes: int
+    index_size_bytes: int
+    total_bytes: int
+    percentage: float
+
+
+def collect_table_statistics() -> list[TableStatistics]:
+    """
+    Size, index size and row count of every table, in a fixed number of queries.
+
+    Page sizes come from a single ``dbstat`` pass grouped by b-tree name, with
+    indexes mapped onto their tables in memory. Row counts come from the
+    ``sqlite_stat1`` estimates left by ANALYZE where available; the remaining
+    tables are counted exactly in batched UNION ALL queries.
+
+    Returns:
+        Statistics sorted by total size, largest first
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT type, name, tbl_name
+            FROM sqlite_master
+            WHERE type IN ('table', 'index')
+            AND tbl_name NOT LIKE 'sqlite_%'
+            AND tbl_name NOT LIKE 'django_session'
+        """)
+        tables: list[str] = []
+        index_tables: dict[str, str] = {}
+        for object_type, name, table_name in cursor.fetchall():
+            if object_type == 'table':
+                tables.append(name)
+            else:
+                index_tables[name] = table_name
+
+        page_sizes: dict[str, int] | None = _dbstat_page_sizes(cursor=cursor)
+        row_counts: dict[str, int] = _row_counts(cursor=cursor, tables=tables)
+
+    sizes: dict[str, int] = dict.fromkeys(tables, 0)
+    index_sizes: dict[str, int] = dict.fromkeys(tables, 0)
+    if page_sizes is not None:
+        for name, size in page_sizes.items():
+            if name in sizes:
+                sizes[name] += size
+            elif index_tables.get(name) in index_sizes:
+                index_sizes[index_tables[name]] += size
+    else:
+        for table_name in tables:
+            sizes[table_name] = row_counts[table_name] * ESTIMATED_ROW_BYTES
+            index_sizes[table_name] = row_counts[table_name] * ESTIMATED_INDEX_ENTRY_BYTES
+
+    return with_percentages([
+        {
+            'table_name': table_name,
+            'row_count': row_counts[table_name],
+            'size_bytes': sizes[table_name],
+            'index_size_bytes': index_sizes[table_name],
+            'total_bytes': sizes[table_name] + index_sizes[table_name],
+            'percentage': 0.0,
+        }
+        for table_name in tables
+    ])
+
+
+def with_percentages(table_stats: list[Any]) -> list[Any]:
+    """Fill in each table's share of the total size and sort largest first."""
+    total_size: int = sum(stat['total_bytes'] for stat in table_stats)
+    for stat in table_stats:
+        stat['percentage'] = (stat['total_bytes'] / total_size * 100) if total_size > 0 else 0
+    table_stats.sort(key=lambda stat: stat['total_bytes'], reverse=True)
+    return table_stats
+
+
+def _dbstat_page_sizes(cursor) -> dict[str, int] | None:
+    """Bytes used per table/index b-tree from one dbstat scan, or None without dbstat."""
+    try:
+        cursor.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")
+    except Exception:
+        return None
+    return {name: size or 0 for name, size in cursor.fetchall()}
+
+
+def _row_counts(cursor, tables: list[str]) -> dict[str, int]:
+    row_counts: dict[str, int] = {}
+    try:
+        # The first number of each stat is the (estimated) number of rows in the table
+        cursor.execute("SELECT tbl, MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 GROUP BY tbl")
+        row_counts.update({table_name: count for table_name, count in cursor.fetchall() if table_name in tables})
+    except Exception:
+        pass  # No ANALYZE has run yet
+
+    uncounted: list[str] = [table_name for table_name in tables if table_name not in row_counts]
+    for start in range(0, len(uncounted), ROW_COUNT_QUERY_BATCH):
+        batch = uncounted[start:start + ROW_COUNT_QUERY_BATCH]
+        cursor.execute(" UNION ALL ".join(
+            f"SELECT %s, COUNT(*) FROM {connection.ops.quote_name(table_name)}" for table_name in batch
+        ), batch)
+        row_counts.update(dict(cursor.fetchall()))
+    return row_counts
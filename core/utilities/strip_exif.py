@@ -1,9 +1,12 @@
 import io
+
 from django.core.files.uploadedfile import InMemoryUploadedFile, TemporaryUploadedFile
 from PIL import Image
 
 
 IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.tiff', '.tif'}
+# Info entries that affect how pixels render; everything else (EXIF, XMP, ICC, comments) is dropped
+PRESERVED_INFO_KEYS = ('transparency',)
 
 
 def strip_exif_from_file(uploaded_file):
@@ -24,40 +27,50 @@ def strip_exif_from_file(uploaded_file):
 
     try:
         uploaded_file.seek(0)
-        image = Image.open(uploaded_file)
-
-        # Create a new image without EXIF data
-        data = list(image.getdata())
-        clean_image = Image.new(image.mode, image.size)
-        clean_image.putdata(data)
-
-        # Save to buffer
-        buffer = io.BytesIO()
-        image_format = _get_image_format(extension)
-        save_kwargs = {'format': image_format}
-
-        # Preserve quality for JPEG
-        if image_format == 'JPEG':
-            save_kwargs['quality'] = 95
-
-        clean_image.save(buffer, **save_kwargs)
-        buffer.seek(0)
-
-        # Create new uploaded file
-        return InMemoryUploadedFile(
-            file=buffer,
-            field_name=uploaded_file.field_name if hasattr(uploaded_file, 'field_name') else None,
-            name=uploaded_file.name,
-            content_type=uploaded_file.content_type,
-            size=buffer.getbuffer().nbytes,
-            charset=None
-        )
+        with Image.open(uploaded_file) as image:
+            buffer = encode_without_metadata(image, extension)
+        return uploaded_file_from_buffer(buffer, uploaded_file)
     except Exception:
         # If processing fails, return original file
         uploaded_file.seek(0)
         return uploaded_file
 
 
+def encode_without_metadata(image: Image.Image, extension: str) -> io.BytesIO:
+    """
+    Re-encode a decoded image without EXIF or other metadata.
+
+    The pixels are copied into a fresh image in C (no per-pixel Python
+    objects), so peak memory is about twice the decoded pixel buffer.
+    """
+    clean_image = image.copy()
+    clean_image.info = {key: image.info[key] for key in PRESERVED_INFO_KEYS if key in image.info}
+
+    buffer = io.BytesIO()
+    image_format = _get_image_format(extension)
+    save_kwargs = {'format': image_format}
+
+    # Preserve quality for JPEG
+    if image_format == 'JPEG':
+        save_kwargs['quality'] = 95
+
+    clean_image.save(buffer, **save_kwargs)
+    buffer.seek(0)
+    return buffer
+
+
+def uploaded_file_from_buffer(buffer: io.BytesIO, uploaded_file) -> InMemoryUploadedFile:
+    """Wrap re-encoded bytes as an upload with the original file's name and content type."""
+    return InMemoryUploadedFile(
+        file=buffer,
+        field_name=uploaded_file.field_name if hasattr(uploaded_file, 'field_name') else None,
+        name=uploaded_file.name,
+        content_type=getattr(uploaded_file, 'content_type', None),
+        size=buffer.getbuffer().nbytes,
+        charset=None
+    )
+
+
 def _get_image_format(extension: str) -> str:
     """Map file extension to PIL image format."""
     format_map = {
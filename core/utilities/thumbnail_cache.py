@@ -0,0 +1,99 @@
+"""
+Local on-disk LRU cache for thumbnails fetched from object storage.
+
+Entries are keyed by object key and ETag, written atomically, and shared by
+every process on the host. Reads refresh an entry's mtime; once the cache
+grows beyond its byte budget the least recently used entries are evicted.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from typing import Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Evict down to this fraction of the budget, so eviction runs rarely
+EVICTION_TARGET_RATIO = 0.9
+
+
+class ThumbnailCache:
+    """Byte-budgeted file cache; the on-disk state is the source of truth."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None  # Approximate, re-measured on eviction
+        self._lock = threading.Lock()
+
+    def _path(self, key: str, etag: str) -> str:
+        digest = hashlib.sha256(f'{key}\0{etag}'.encode()).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def get(self, key: str, etag: str) -> Optional[bytes]:
+        """Return the cached content, or None on a miss."""
+        path = self._path(key, etag)
+        try:
+            with open(path, 'rb') as file:
+                content = file.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return content
+
+    def set(self, key: str, etag: str, content: bytes) -> None:
+        """Store content, evicting least recently used entries when over budget."""
+        path = self._path(key, etag)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(file_descriptor, 'wb') as file:
+                file.write(content)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache thumbnail {key}: {e}")
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += len(content)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[tuple[str, int, float]]:
+        """List (path, size, mtime) of every cached entry."""
+        entries = []
+        if not os.path.isdir(self.directory):
+            return entries
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target = self.max_bytes * EVICTION_TARGET_RATIO
+        for path, entry_size, _ in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+
+thumbnail_cache = ThumbnailCache(settings.THUMBNAIL_CACHE_DIR, settings.THUMBNAIL_CACHE_MAX_BYTES)
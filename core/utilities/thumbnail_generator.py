@@ -40,25 +40,38 @@ def generate_thumbnail(file_field, filename: str) -> InMemoryUploadedFile | None
 
 def _generate_image_thumbnail(file_field) -> InMemoryUploadedFile | None:
     """Generate thumbnail from an image file."""
-    import pillow_avif  # noqa: F401 - registers AVIF support
     from PIL import Image
 
     file_field.seek(0)
-    image = Image.open(file_field)
+    with Image.open(file_field) as image:
+        return generate_image_thumbnail(image)
+
+
+def generate_image_thumbnail(image) -> InMemoryUploadedFile:
+    """
+    Generate an AVIF thumbnail from an already decoded PIL image.
+
+    The image is shrunk in place before any mode conversion, so only the
+    thumbnail-sized copy is ever converted.
+    """
+    import pillow_avif  # noqa: F401 - registers AVIF support
+    from PIL import Image
+
+    # Palette images only resize with nearest-neighbour; expand them first
+    if image.mode == 'P':
+        image = image.convert('RGBA')
+
+    # Create thumbnail maintaining aspect ratio
+    image.thumbnail(THUMBNAIL_MAX_SIZE, Image.Resampling.LANCZOS)
 
     # Convert to RGB if necessary (AVIF doesn't support all modes)
-    if image.mode in ('RGBA', 'P'):
+    if image.mode == 'RGBA':
         background = Image.new('RGB', image.size, (255, 255, 255))
-        if image.mode == 'P':
-            image = image.convert('RGBA')
-        background.paste(image, mask=image.split()[3] if len(image.split()) > 3 else None)
+        background.paste(image, mask=image.split()[3])
         image = background
     elif image.mode != 'RGB':
         image = image.convert('RGB')
 
-    # Create thumbnail maintaining aspect ratio
-    image.thumbnail(THUMBNAIL_MAX_SIZE, Image.Resampling.LANCZOS)
-
     # Save to AVIF format
     output = io.BytesIO()
     image.save(output, format='AVIF', quality=THUMBNAIL_QUALITY)
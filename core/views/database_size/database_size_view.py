@@ -2,15 +2,17 @@ from typing import Mapping, Any
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.db import connection, transaction
+from django.db.models import Max
 from django.utils import timezone
 from django.views.decorators.http import require_http_methods
-from datetime import timedelta
+from datetime import datetime, timedelta
 from collections import defaultdict
 from django.apps import apps
 import json
 
 from core.models.database_size_history import DatabaseSizeHistory
 from core.utilities.base_render import base_render
+from core.utilities.sqlite_table_statistics import collect_table_statistics, with_percentages
 from core.views.generic.generic_500 import generic_500
 
 
@@ -19,81 +21,28 @@ def get_table_sizes() -> list[dict[str, Any]]:
     Query SQLite database to get table sizes, row counts, and index sizes.
     Returns a list of dictionaries with table statistics.
     """
-    with connection.cursor() as cursor:
-        # Get all table names
-        cursor.execute("""
-            SELECT name
-            FROM sqlite_master
-            WHERE type='table'
-            AND name NOT LIKE 'sqlite_%'
-            AND name NOT LIKE 'django_session'
-            ORDER BY name
-        """)
-        tables = [row[0] for row in cursor.fetchall()]
-
-        # Get page size once
-        cursor.execute("PRAGMA page_size")
-        page_size = cursor.fetchone()[0]
-
-        table_stats = []
-        total_size = 0
-
-        # Try to use dbstat if available, otherwise use a simpler approximation
-        try:
-            cursor.execute("SELECT 1 FROM dbstat LIMIT 1")
-            use_dbstat = True
-        except Exception:
-            use_dbstat = False
-
-        for table_name in tables:
-            # Get row count
-            cursor.execute(f"SELECT COUNT(*) FROM \"{table_name}\"")
-            row_count = cursor.fetchone()[0]
-
-            if use_dbstat:
-                # Get table size using dbstat
-                cursor.execute(
-                    "SELECT SUM(pgsize) FROM dbstat WHERE name = %s",
-                    [table_name]
-                )
-                result = cursor.fetchone()
-                table_size = result[0] if result and result[0] else 0
-
-                # Get index sizes
-                cursor.execute(
-                    """SELECT SUM(pgsize) FROM dbstat
-                       WHERE name IN (
-                           SELECT name FROM sqlite_master
-                           WHERE type='index' AND tbl_name = %s
-                       )""",
-                    [table_name]
-                )
-                result = cursor.fetchone()
-                index_size = result[0] if result and result[0] else 0
-            else:
-                # Estimate based on row count and average row size
-                # This is a rough estimate when dbstat is not available
-                table_size = row_count * 100  # Assume 100 bytes per row average
-                index_size = row_count * 20   # Assume 20 bytes per index entry
-
-            total_size += table_size + index_size
-
-            table_stats.append({
-                'table_name': table_name,
-                'row_count': row_count,
-                'size_bytes': table_size,
-                'index_size_bytes': index_size,
-                'total_bytes': table_size + index_size,
-            })
-
-        # Calculate percentages
-        for stat in table_stats:
-            stat['percentage'] = (stat['total_bytes'] / total_size * 100) if total_size > 0 else 0
+    return collect_table_statistics()
 
-        # Sort by total size descending
-        table_stats.sort(key=lambda x: x['total_bytes'], reverse=True)
 
-    return table_stats
+def get_latest_snapshot() -> tuple[datetime | None, list[dict[str, Any]]]:
+    """
+    Table statistics of the most recent snapshot, without scanning the database.
+    Returns (recorded_at, table statistics); (None, []) before the first snapshot.
+    """
+    recorded_at = DatabaseSizeHistory.objects.aggregate(latest=Max('recorded_at'))['latest']
+    if recorded_at is None:
+        return None, []
+    table_stats = [
+        {
+            'table_name': record.table_name,
+            'row_count': record.row_count or 0,
+            'size_bytes': record.size_bytes,
+            'index_size_bytes': record.index_size_bytes,
+            'total_bytes': record.size_bytes + record.index_size_bytes,
+        }
+        for record in DatabaseSizeHistory.objects.filter(recorded_at=recorded_at)
+    ]
+    return recorded_at, with_percentages(table_stats)
 
 
 def get_historical_data(days: int = 30) -> dict[str, list[dict[str, Any]]]:
@@ -126,25 +75,30 @@ def record_snapshot() -> int:
     Returns the number of records created.
     """
     table_stats = get_table_sizes()
-    created_count = 0
+    recorded_at = timezone.now()
 
-    for stat in table_stats:
-        DatabaseSizeHistory.objects.create(
+    DatabaseSizeHistory.objects.bulk_create([
+        DatabaseSizeHistory(
             table_name=stat['table_name'],
             size_bytes=stat['size_bytes'],
             index_size_bytes=stat['index_size_bytes'],
             row_count=stat['row_count'],
+            recorded_at=recorded_at,
         )
-        created_count += 1
+        for stat in table_stats
+    ])
 
-    return created_count
+    return len(table_stats)
 
 
-def get_historical_models() -> list[dict[str, Any]]:
+def get_historical_models(table_stats: list[dict[str, Any]] | None = None) -> list[dict[str, Any]]:
     """
     Get all historical models (from django-simple-history).
+    Record counts are taken from the given table statistics (0 when absent),
+    so no table is counted here.
     Returns a list of dicts with model info.
     """
+    row_counts = {stat['table_name']: stat['row_count'] for stat in table_stats or []}
     historical_models = []
 
     for model in apps.get_models():
@@ -154,16 +108,10 @@ def get_historical_models() -> list[dict[str, Any]]:
             # Get the table name
             table_name = model._meta.db_table
 
-            # Get count of records
-            try:
-                count = model.objects.count()
-            except Exception:
-                count = 0
-
             historical_models.append({
                 'model_name': model_name,
                 'table_name': table_name,
-                'record_count': count,
+                'record_count': row_counts.get(table_name, 0),
                 'app_label': model._meta.app_label,
             })
 
@@ -240,14 +188,16 @@ def database_size_view(request: HttpRequest) -> HttpResponse:
     if not request.user.is_superuser:
         return generic_500(request=request)
 
-    # Get current table sizes
-    table_stats = get_table_sizes()
+    # Table sizes as of the latest snapshot; only scan the database before the first one
+    snapshot_recorded_at, table_stats = get_latest_snapshot()
+    if snapshot_recorded_at is None:
+        table_stats = get_table_sizes()
 
     # Get historical data for trends
     historical_data = get_historical_data(days=30)
 
     # Get historical models info
-    historical_models = get_historical_models()
+    historical_models = get_historical_models(table_stats=table_stats)
 
     # Calculate total database size
     total_size = sum(stat['total_bytes'] for stat in table_stats)
@@ -268,6 +218,7 @@ def database_size_view(request: HttpRequest) -> HttpResponse:
         'historical_models_json': json.dumps(historical_models),
         'total_size': total_size,
         'db_file_size': db_file_size,
+        'snapshot_recorded_at': snapshot_recorded_at,
     }
 
     return base_render(
@@ -1,9 +1,21 @@
-from django.http import FileResponse, Http404
+from botocore.exceptions import ClientError
 from django.contrib.auth.decorators import login_required
+from django.http import FileResponse, Http404, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+
 from core.models.document import Document
-import boto3
-from django.conf import settings
+from core.utilities.minio_object_storage import (
+    get_object,
+    get_object_size,
+    is_invalid_range_error,
+    is_missing_object_error,
+    object_etag,
+    parse_range_header,
+)
+
+# Chunk size for streaming objects from MinIO to the client
+STREAM_BLOCK_SIZE = 64 * 1024
 
 
 @login_required
@@ -14,26 +26,41 @@ def document_file_view(request, model_id):
     if not document.has_file:
         raise Http404("Document file not found")
 
-    # Get file from MinIO using boto3 with server credentials
-    s3_client = boto3.client(
-        's3',
-        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME,
-    )
+    # The SHA-256 identifies the stored bytes; unset until the derivative worker has run
+    etag = object_etag(document.file_hash) if document.file_hash else None
+    if etag:
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            return response
 
-    # Get file object from MinIO
-    file_obj = s3_client.get_object(
-        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-        Key=document.file.name
-    )
+    byte_range = parse_range_header(request.headers.get('Range'))
+    if byte_range and request.headers.get('If-Range', etag) != etag:
+        byte_range = None
+
+    # Get file object (or the requested range) from MinIO through the shared client
+    try:
+        file_obj = get_object(document.file.name, byte_range)
+    except ClientError as e:
+        if is_missing_object_error(e):
+            raise Http404("Document file not found")
+        if is_invalid_range_error(e):
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{get_object_size(document.file.name)}'
+            return response
+        raise
 
     # Stream file to response
     response = FileResponse(
         file_obj['Body'],
         content_type=file_obj.get('ContentType', 'application/octet-stream')
     )
+    response.block_size = STREAM_BLOCK_SIZE
+    if byte_range and file_obj.get('ContentRange'):
+        response.status_code = 206
+        response['Content-Range'] = file_obj['ContentRange']
+    response['Content-Length'] = file_obj['ContentLength']
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag or file_obj['ETag']
     response['Content-Disposition'] = f'inline; filename="{document.get_filename()}"'
 
     return response
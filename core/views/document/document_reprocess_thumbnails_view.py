@@ -1,103 +1,59 @@
-import json
-import logging
-
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.db.models import Count, Q
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect
 from django.views.decorators.http import require_http_methods
 
+from core.models.common.enums.document_derivative_status_choices import (
+    DOCUMENT_DERIVATIVE_STATUS_DONE,
+    DOCUMENT_DERIVATIVE_STATUS_FAILED,
+    DOCUMENT_DERIVATIVE_STATUS_PENDING,
+    DOCUMENT_DERIVATIVE_STATUS_PROCESSING,
+)
 from core.models.document import Document
-from core.utilities.thumbnail_generator import generate_thumbnail
+from core.utilities.document_derivatives import queue_document_derivatives
 
-logger = logging.getLogger(__name__)
+# Failed documents listed in the progress response
+MAX_REPORTED_ERRORS = 10
 
 
 @login_required
 @require_http_methods(["GET", "POST"])
 def document_reprocess_thumbnails_view(request: HttpRequest) -> HttpResponse:
-    """Regenerate thumbnails for documents."""
+    """Queue every document for derivative regeneration and report the worker's progress."""
     is_ajax = request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+    documents = Document.objects.filter(file__isnull=False).exclude(file='')
 
-    # GET request returns list of document IDs for processing
+    # GET request returns derivative progress across all documents
     if request.method == 'GET' and is_ajax:
-        doc_ids = list(
-            Document.objects.filter(file__isnull=False)
-            .exclude(file='')
-            .values_list('id', flat=True)
+        done = Q(derivative_status=DOCUMENT_DERIVATIVE_STATUS_DONE)
+        has_thumbnail = Q(thumbnail__isnull=False) & ~Q(thumbnail='')
+        counts = documents.aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(derivative_status__in=[
+                DOCUMENT_DERIVATIVE_STATUS_PENDING, DOCUMENT_DERIVATIVE_STATUS_PROCESSING
+            ])),
+            generated=Count('id', filter=done & has_thumbnail),
+            skipped=Count('id', filter=done & ~has_thumbnail),
+            failed=Count('id', filter=Q(derivative_status=DOCUMENT_DERIVATIVE_STATUS_FAILED)),
         )
-        return JsonResponse({'document_ids': doc_ids, 'total': len(doc_ids)})
+        failed_documents = documents.filter(
+            derivative_status=DOCUMENT_DERIVATIVE_STATUS_FAILED
+        ).order_by('-uploaded_at').values_list('id', 'name', 'derivative_error')[:MAX_REPORTED_ERRORS]
+        counts['errors'] = [
+            f"{name or f'Document #{doc_id}'}: {error}" for doc_id, name, error in failed_documents
+        ]
+        return JsonResponse(counts)
 
-    # POST processes a single document by ID (AJAX) or all documents (form)
     if request.method != 'POST':
         return redirect('document')
 
-    # AJAX: Process single document
-    if is_ajax:
-        try:
-            data = json.loads(request.body)
-            doc_id = data.get('document_id')
-        except (json.JSONDecodeError, KeyError):
-            return JsonResponse({'error': 'Invalid request'}, status=400)
-
-        try:
-            doc = Document.objects.get(pk=doc_id)
-            doc_name = doc.name or f'Document #{doc.pk}'
-
-            if doc.file:
-                doc.file.seek(0)
-                thumb = generate_thumbnail(doc.file, doc.file.name)
-                if thumb:
-                    doc.thumbnail = thumb
-                    doc.save(update_fields=['thumbnail'])
-                    return JsonResponse({
-                        'success': True,
-                        'status': 'generated',
-                        'name': doc_name
-                    })
-                else:
-                    return JsonResponse({
-                        'success': True,
-                        'status': 'skipped',
-                        'name': doc_name
-                    })
-        except Document.DoesNotExist:
-            return JsonResponse({
-                'success': False,
-                'status': 'error',
-                'name': f'Document #{doc_id}',
-                'error': f'Document {doc_id} not found'
-            })
-        except Exception as e:
-            error_msg = str(e)
-            logger.warning(f"Thumbnail generation failed for doc {doc_id}: {error_msg}")
-            return JsonResponse({
-                'success': False,
-                'status': 'error',
-                'name': doc_name if 'doc_name' in dir() else f'Document #{doc_id}',
-                'error': error_msg
-            })
+    # The derivative worker picks the queued documents up across all its processes
+    queued = queue_document_derivatives(documents)
 
-    # Non-AJAX fallback: batch process all documents
-    documents = Document.objects.filter(file__isnull=False).exclude(file='')
-    generated = 0
-    errors = 0
-
-    for doc in documents:
-        try:
-            if doc.file:
-                doc.file.seek(0)
-                thumb = generate_thumbnail(doc.file, doc.file.name)
-                if thumb:
-                    doc.thumbnail = thumb
-                    doc.save(update_fields=['thumbnail'])
-                    generated += 1
-        except Exception:
-            errors += 1
-
-    if errors:
-        messages.warning(request, f"Generated {generated} thumbnail(s), {errors} error(s).")
-    else:
-        messages.success(request, f"Generated {generated} thumbnail(s).")
+    if is_ajax:
+        return JsonResponse({'success': True, 'queued': queued})
 
+    messages.success(request, f"Queued {queued} document(s) for thumbnail and hash regeneration.")
     return redirect('document')
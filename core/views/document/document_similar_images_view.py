@@ -4,55 +4,60 @@ from django.http import HttpRequest, HttpResponse
 
 from core.models.document import Document
 from core.utilities.base_render import base_render
-from core.utilities.image_similarity import hamming_distance, similarity_percentage
+from core.utilities.image_hash_index import document_image_hash_index
+from core.utilities.image_similarity import similarity_from_distance
 
 
 def document_similar_images_view(request: HttpRequest) -> HttpResponse:
     """Show groups of similar images based on perceptual hash."""
     threshold = int(request.GET.get('threshold', 25))  # Default threshold
 
-    # Get all images with hashes
-    images = list(Document.objects.filter(
+    # Pairs within the threshold come from the hash index; the view only walks them
+    neighbors = document_image_hash_index.neighbors(threshold)
+    image_ids = Document.objects.filter(
         image_hash__isnull=False
-    ).exclude(image_hash='').order_by('-uploaded_at'))
+    ).exclude(image_hash='').order_by('-uploaded_at').values_list('id', flat=True)
 
     # Find similar image groups
     processed_ids = set()
-    similar_groups = []
+    id_groups = []
 
-    for img in images:
-        if img.id in processed_ids:
+    for image_id in image_ids:
+        if image_id in processed_ids or image_id not in neighbors:
             continue
 
         # Find all images similar to this one
-        group = [{
-            'document': img,
-            'distance': 0,
-            'similarity': 100.0,
-        }]
-        processed_ids.add(img.id)
+        group = [(image_id, 0)]
+        processed_ids.add(image_id)
 
-        for other in images:
-            if other.id in processed_ids:
+        for other_id, distance in neighbors[image_id]:
+            if other_id in processed_ids:
                 continue
-
-            distance = hamming_distance(img.image_hash, other.image_hash)
-            if 0 <= distance <= threshold:
-                similarity = similarity_percentage(img.image_hash, other.image_hash)
-                group.append({
-                    'document': other,
-                    'distance': distance,
-                    'similarity': similarity,
-                })
-                processed_ids.add(other.id)
+            group.append((other_id, distance))
+            processed_ids.add(other_id)
 
         # Only include groups with more than one image
         if len(group) > 1:
+            id_groups.append(group)
+
+    documents = Document.objects.in_bulk([doc_id for group in id_groups for doc_id, _ in group])
+    similar_groups = []
+    for group in id_groups:
+        images = [
+            {
+                'document': documents[doc_id],
+                'distance': distance,
+                'similarity': similarity_from_distance(distance),
+            }
+            for doc_id, distance in group
+            if doc_id in documents
+        ]
+        if len(images) > 1:
             # Sort by distance (most similar first)
-            group.sort(key=lambda x: x['distance'])
+            images.sort(key=lambda x: x['distance'])
             similar_groups.append({
-                'images': group,
-                'count': len(group),
+                'images': images,
+                'count': len(images),
             })
 
     # Sort groups by size (largest first)
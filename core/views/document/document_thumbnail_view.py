@@ -1,9 +1,15 @@
-from django.http import FileResponse, Http404
+from botocore.exceptions import ClientError
 from django.contrib.auth.decorators import login_required
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+
 from core.models.document import Document
-import boto3
-from django.conf import settings
+from core.utilities.minio_object_storage import get_object, is_missing_object_error, object_etag
+from core.utilities.thumbnail_cache import thumbnail_cache
+
+# Thumbnails don't change: a new thumbnail is stored under a new key
+THUMBNAIL_CACHE_CONTROL = 'public, max-age=31536000, immutable'
 
 
 @login_required
@@ -14,26 +20,24 @@ def document_thumbnail_view(request, model_id):
     if not document.has_thumbnail:
         raise Http404("Thumbnail not found")
 
-    # Get file from MinIO using boto3 with server credentials
-    s3_client = boto3.client(
-        's3',
-        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        region_name=settings.AWS_S3_REGION_NAME,
-    )
-
-    # Get thumbnail from MinIO
-    file_obj = s3_client.get_object(
-        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-        Key=document.thumbnail.name
-    )
-
-    # Stream file to response with long cache (thumbnails don't change)
-    response = FileResponse(
-        file_obj['Body'],
-        content_type='image/avif'
-    )
-    response['Cache-Control'] = 'public, max-age=31536000'
+    key = document.thumbnail.name
+    etag = object_etag(key)
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        content = thumbnail_cache.get(key, etag)
+        if content is None:
+            # Get thumbnail from MinIO through the shared client
+            try:
+                content = get_object(key)['Body'].read()
+            except ClientError as e:
+                if is_missing_object_error(e):
+                    raise Http404("Thumbnail not found")
+                raise
+            thumbnail_cache.set(key, etag, content)
+        response = HttpResponse(content, content_type='image/avif')
+
+    response['ETag'] = etag
+    response['Cache-Control'] = THUMBNAIL_CACHE_CONTROL
 
     return response
@@ -1,6 +1,5 @@
 from typing import Mapping, Any
 from collections import OrderedDict
-from decimal import Decimal
 from django.http import HttpRequest, HttpResponse
 
 from core.models.estimation import Estimation
@@ -49,18 +48,9 @@ def estimation_detail_view(request: HttpRequest, model_id: int) -> HttpResponse:
         if group_name not in grouped_items:
             grouped_items[group_name] = {'items': group_items, 'subtotals': {}}
 
-    # Calculate subtotals for each group
+    # Subtotals for each group come from the estimation's rollup
     for group_name, group_data in grouped_items.items():
-        group_items_list = group_data['items']
-        subtotals = {
-            'story_points': sum(item.story_points or Decimal('0') for item in group_items_list),
-            'junior_with_uncertainty': sum(item.get_junior_hours_with_uncertainty() for item in group_items_list),
-            'mid_with_uncertainty': sum(item.get_mid_hours_with_uncertainty() for item in group_items_list),
-            'senior_with_uncertainty': sum(item.get_senior_hours_with_uncertainty() for item in group_items_list),
-            'lead_with_uncertainty': sum(item.get_lead_hours_with_uncertainty() for item in group_items_list),
-            'reviewer_hours': sum(item.get_reviewer_hours() for item in group_items_list),
-        }
-        group_data['subtotals'] = subtotals
+        group_data['subtotals'] = estimation.rollup['groups'][group_name]
 
     # Get created and updated history records
     created_record = estimation.history.order_by('history_date').first()
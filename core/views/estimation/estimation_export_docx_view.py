@@ -1,7 +1,6 @@
 from datetime import datetime, timezone
 from io import BytesIO
 from collections import OrderedDict
-from decimal import Decimal
 import re
 
 from django.http import HttpRequest, HttpResponse
@@ -715,18 +714,9 @@ def estimation_export_docx_view(request: HttpRequest, model_id: int) -> HttpResp
         if group_name not in grouped_items:
             grouped_items[group_name] = groups_dict[group_name]
 
-    # Calculate subtotals for each group
+    # Subtotals for each group come from the estimation's rollup
     for group_name, group_data in grouped_items.items():
-        group_items_list = group_data['items']
-        subtotals = {
-            'story_points': sum(item.story_points or Decimal('0') for item in group_items_list),
-            'junior_with_uncertainty': sum(item.get_junior_hours_with_uncertainty() for item in group_items_list),
-            'mid_with_uncertainty': sum(item.get_mid_hours_with_uncertainty() for item in group_items_list),
-            'senior_with_uncertainty': sum(item.get_senior_hours_with_uncertainty() for item in group_items_list),
-            'lead_with_uncertainty': sum(item.get_lead_hours_with_uncertainty() for item in group_items_list),
-            'reviewer_hours': sum(item.get_reviewer_hours() for item in group_items_list),
-        }
-        group_data['subtotals'] = subtotals
+        group_data['subtotals'] = estimation.rollup['groups'][group_name]
 
     if items:
         # Create table for items (hours with uncertainty applied)
@@ -4,6 +4,7 @@ from django.shortcuts import redirect
 
 from core.models.estimation import Estimation
 from core.models.estimation_item import EstimationItem
+from core.utilities.estimation_item_bulk_writes import reorder_estimation_items
 from core.views.generic.generic_500 import generic_500
 
 
@@ -17,13 +18,11 @@ def estimation_fix_item_order_view(request: HttpRequest, model_id: int) -> HttpR
         estimation = Estimation.objects.get(id=model_id)
 
         # Get all items, ordering by current order (NULL values handled), then ID
-        items = EstimationItem.objects.filter(estimation=estimation).order_by('order', 'id')
+        item_ids = EstimationItem.objects.filter(estimation=estimation).order_by('order', 'id').values_list('id', flat=True)
 
-        # Reassign order values sequentially
+        # Reassign order values sequentially, writing only the items that move
         with transaction.atomic():
-            for index, item in enumerate(items, start=1):
-                item.order = index
-                item.save(update_fields=['order'])
+            reorder_estimation_items(estimation_id=estimation.id, item_ids=list(item_ids))
 
     except Estimation.DoesNotExist:
         return generic_500(request=request)
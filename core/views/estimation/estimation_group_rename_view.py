@@ -67,6 +67,7 @@ def estimation_group_rename_view(request: HttpRequest, estimation_id: int) -> Js
             )
 
             updated_count = items.update(group=new_group_name)
+            Estimation.clear_rollup_snapshot(estimation_id=estimation.id)
 
             # Update the group_order to replace old name with new name
             if estimation.group_order:
@@ -7,7 +7,7 @@ from django.http import HttpRequest, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
-from core.models.estimation_item import EstimationItem
+from core.utilities.estimation_item_bulk_writes import reorder_estimation_items
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +19,7 @@ def estimation_item_reorder_view(request: HttpRequest) -> JsonResponse:
     """
     Handle drag-and-drop reordering of estimation items.
     Expects a JSON payload with:
+    - 'estimation_id': estimation the items belong to; items of other estimations are left alone
     - 'item_ids': array of item IDs in the new order
     - 'item_id' (optional): specific item being moved
     - 'new_group' (optional): new group name for the moved item (null for Ungrouped)
@@ -26,6 +27,7 @@ def estimation_item_reorder_view(request: HttpRequest) -> JsonResponse:
     try:
         logger.info(f"Reorder request received. Body: {request.body}")
         data = json.loads(request.body)
+        estimation_id = data.get('estimation_id')
         item_ids = data.get('item_ids', [])
         moved_item_id = data.get('item_id')
         new_group = data.get('new_group')
@@ -34,20 +36,23 @@ def estimation_item_reorder_view(request: HttpRequest) -> JsonResponse:
             logger.warning("No item IDs provided in reorder request")
             return JsonResponse({'success': False, 'error': 'No item IDs provided'}, status=400)
 
+        if estimation_id is None:
+            logger.warning("No estimation ID provided in reorder request")
+            return JsonResponse({'success': False, 'error': 'No estimation ID provided'}, status=400)
+
         logger.info(f"Reordering items: {item_ids}, moved item: {moved_item_id}, new group: {new_group}")
 
-        # Update order and optionally group for items
+        # Update order and optionally group for items, writing only the items that change
         with transaction.atomic():
-            # If a specific item was moved to a new group, update its group
-            if moved_item_id is not None and 'new_group' in data:
-                EstimationItem.objects.filter(id=moved_item_id).update(group=new_group)
-                logger.info(f"Updated item {moved_item_id} to group: {new_group}")
-
-            # Update order for all items
-            for index, item_id in enumerate(item_ids, start=1):
-                EstimationItem.objects.filter(id=item_id).update(order=index)
-
-        logger.info(f"Successfully reordered {len(item_ids)} items")
+            updated_count: int = reorder_estimation_items(
+                estimation_id=estimation_id,
+                item_ids=item_ids,
+                moved_item_id=moved_item_id,
+                new_group=new_group,
+                change_group=moved_item_id is not None and 'new_group' in data,
+            )
+
+        logger.info(f"Successfully reordered {len(item_ids)} items, {updated_count} updated")
         return JsonResponse({'success': True})
 
     except json.JSONDecodeError as e:
@@ -18,6 +18,7 @@ from core.views.this_api.this_api_sync_git_lab_view.common.indicator_map import
     create_initial_indicator_map
 from core.views.this_api.this_api_sync_git_lab_view.common.indicator_map_to_kpi_instances import \
     indicator_map_to_kpi_instances, KpiInstanceStats
+from kpi.utilities.materialize_sprint_metrics import materialize_closed_sprint_metrics
 
 
 def this_api_sync_git_lab_view(request: HttpRequest) -> HttpResponse:
@@ -56,13 +57,16 @@ def this_api_sync_git_lab_view(request: HttpRequest) -> HttpResponse:
         current_sprint=current_sprint,
         indicator_map=indicator_map,
     )
+    # Sprints that closed since the last sync keep their final metrics in the cached columns
+    total_number_of_sprints_materialized: int = materialize_closed_sprint_metrics()
     end_time: float = time()
     execution_time_in_seconds: float = end_time - start_time
     return base_render(
         context={
             "execution_time_in_seconds": execution_time_in_seconds,
             "payload": {
-                **stats
+                **stats,
+                "total_number_of_sprints_materialized": total_number_of_sprints_materialized,
             },
         },
         request=request,
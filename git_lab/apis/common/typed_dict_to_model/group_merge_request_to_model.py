@@ -1,6 +1,7 @@
 from typing import cast, TypedDict
 
 from core.utilities.convert_and_enforce_utc_timezone import convert_and_enforce_utc_timezone
+from core.utilities.sprint_interval_index import get_sprint_interval_index
 from git_lab.apis.common.typed_dict_to_model.assignees_to_model import assignees_to_model
 from git_lab.apis.common.typed_dict_to_model.author_to_model import author_to_model
 from git_lab.apis.common.typed_dict_to_model.closed_by_to_model import closed_by_to_model
@@ -69,12 +70,9 @@ def group_merge_request_to_model(
         instance.project = project
         instance.group = project.group
     if instance.merged_at is not None:
-        scrum_sprint: ScrumSprint | None = ScrumSprint.objects.filter(
-            date_start__lte=instance.merged_at,
-            date_end__gte=instance.merged_at,
-        ).first()
-        if scrum_sprint is not None:
-            instance.scrum_sprint = scrum_sprint
+        scrum_sprint_id: int | None = get_sprint_interval_index(model=ScrumSprint).resolve(instance.merged_at)
+        if scrum_sprint_id is not None:
+            instance.scrum_sprint_id = scrum_sprint_id
     instance = generic_user_to_model(
         model=instance,
         typed_dict=cast(
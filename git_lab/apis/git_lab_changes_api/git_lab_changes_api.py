@@ -0,0 +1,116 @@
+from time import time
+from typing import cast
+
+from django.db.models import QuerySet
+from django.http import HttpRequest, JsonResponse, HttpResponse
+from gitlab import Gitlab, GitlabAuthenticationError, GitlabGetError, GitlabListError
+from gitlab.v4.objects import ProjectMergeRequest, Project
+
+from core.models.this_server_configuration import ThisServerConfiguration
+from core.utilities.cast_query_set import cast_query_set
+from core.utilities.git_lab.get_git_lab_client import get_git_lab_client
+from core.utilities.sprint_interval_index import SprintIntervalIndex, get_sprint_interval_index
+from core.views.generic.generic_500 import generic_500
+from git_lab.apis.common.get_common_query_parameters import GitLabApiCommonQueryParameters, get_common_query_parameters
+from git_lab.apis.git_lab_changes_api.git_lab_changes_api_payload import GitLabChangesApiPayload, \
+    get_initial_git_lab_changes_api_payload
+from git_lab.apis.git_lab_changes_api.git_lab_changes_api_save_change import git_lab_changes_api_save_change
+from git_lab.apis.git_lab_changes_api.git_lab_changes_api_summarize_changes import GitLabChangesSummary, \
+    git_lab_changes_api_summarize_changes
+from git_lab.models.common.typed_dicts.git_lab_change_typed_dict import GitLabChangeTypedDict
+from git_lab.models.common.typed_dicts.git_lab_merge_request_changes_typed_dict import \
+    GitLabMergeRequestChangesTypedDict
+from git_lab.models.git_lab_project import GitLabProject
+from git_lab.models.git_lab_user import GitLabUser
+from gitlab_sync.utilities.fetch_concurrently import fetch_concurrently
+from scrum.models.scrum_sprint import ScrumSprint
+
+
+def git_lab_changes_api(
+        request: HttpRequest,
+) -> JsonResponse | HttpResponse:
+    """
+    Sync the changes of every project's merge requests as GitLabChange aggregates.
+
+    The changes of several merge requests are fetched concurrently. Each
+    worker counts the files and diff lines of its merge request as soon as
+    the response arrives and drops the diffs, so only the aggregates reach
+    this thread, which stores them and answers with a summary.
+    """
+    start_time: float = time()
+    query_parameters: GitLabApiCommonQueryParameters = get_common_query_parameters(request=request)
+    git_lab_client: Gitlab | None = get_git_lab_client()
+    if git_lab_client is None:
+        return generic_500(request=request)
+    git_lab_projects: QuerySet[GitLabProject] = cast_query_set(
+        typ=GitLabProject,
+        val=GitLabProject.objects.all()
+    )
+    payload: GitLabChangesApiPayload = get_initial_git_lab_changes_api_payload()
+    all_project_merge_requests: list[ProjectMergeRequest] = []
+    for git_lab_project in git_lab_projects:
+        try:
+            project_id: int = git_lab_project.id
+            project: Project | None = git_lab_client.projects.get(id=project_id, lazy=True)
+            if project is None:
+                continue
+            project_merge_requests: list[ProjectMergeRequest] = cast(
+                typ=list[ProjectMergeRequest],
+                val=project.mergerequests.list(**query_parameters)
+            )
+        except GitlabListError as error:
+            print(f"GitLabListError on {git_lab_project.name_with_namespace}: {error.error_message}")
+            payload["total_number_of_projects_denied_access"] += 1
+            continue
+        all_project_merge_requests.extend(project_merge_requests)
+    projects: dict[int, GitLabProject] = GitLabProject.objects.in_bulk()
+    scrum_sprint_index: SprintIntervalIndex = get_sprint_interval_index(model=ScrumSprint)
+    user_ids: set[int] = set(GitLabUser.objects.values_list("id", flat=True))
+    for _, fetched in fetch_concurrently(
+        items=all_project_merge_requests,
+        fetch=_fetch_change_aggregate,
+        max_workers=ThisServerConfiguration.current().coerced_gitlab_sync_fetch_concurrency,
+    ):
+        payload["total_number_of_merge_requests"] += 1
+        if fetched is None:
+            payload["total_number_of_merge_requests_failed"] += 1
+            continue
+        change_dict, summary = fetched
+        if change_dict.get("id") is None:
+            continue
+        did_create: bool = git_lab_changes_api_save_change(
+            change_dict=change_dict,
+            projects=projects,
+            scrum_sprint_index=scrum_sprint_index,
+            summary=summary,
+            user_ids=user_ids,
+        )
+        payload["total_number_of_changes_created" if did_create else "total_number_of_changes_updated"] += 1
+        payload["total_number_of_files_changed"] += summary["total_files_changed"]
+        payload["total_number_of_lines_added"] += summary["total_lines_added"]
+        payload["total_number_of_lines_removed"] += summary["total_lines_removed"]
+    end_time: float = time()
+    execution_time_in_seconds: float = end_time - start_time
+    return JsonResponse(
+        data={
+            **payload,
+            "execution_time_in_seconds": execution_time_in_seconds,
+        },
+        safe=False
+    )
+
+
+def _fetch_change_aggregate(
+        project_merge_request: ProjectMergeRequest,
+) -> tuple[GitLabMergeRequestChangesTypedDict, GitLabChangesSummary] | None:
+    """Runs on a worker thread: fetches one merge request's changes and keeps only their counts."""
+    try:
+        change_dict: GitLabMergeRequestChangesTypedDict = project_merge_request.changes()
+    except (GitlabAuthenticationError, GitlabGetError) as error:
+        print(f"{type(error).__name__} on {project_merge_request.web_url}: {error.error_message}")
+        return None
+    changes: list[GitLabChangeTypedDict] | None = change_dict.pop("changes", None)
+    if changes is None:
+        return None
+    summary: GitLabChangesSummary = git_lab_changes_api_summarize_changes(changes=changes)
+    return change_dict, summary
@@ -0,0 +1,25 @@
+from typing import TypedDict, NotRequired
+
+
+class GitLabChangesApiPayload(TypedDict):
+    total_number_of_changes_created: NotRequired[int]
+    total_number_of_changes_updated: NotRequired[int]
+    total_number_of_files_changed: NotRequired[int]
+    total_number_of_lines_added: NotRequired[int]
+    total_number_of_lines_removed: NotRequired[int]
+    total_number_of_merge_requests: NotRequired[int]
+    total_number_of_merge_requests_failed: NotRequired[int]
+    total_number_of_projects_denied_access: NotRequired[int]
+
+
+def get_initial_git_lab_changes_api_payload() -> GitLabChangesApiPayload:
+    return {
+        "total_number_of_changes_created": 0,
+        "total_number_of_changes_updated": 0,
+        "total_number_of_files_changed": 0,
+        "total_number_of_lines_added": 0,
+        "total_number_of_lines_removed": 0,
+        "total_number_of_merge_requests": 0,
+        "total_number_of_merge_requests_failed": 0,
+        "total_number_of_projects_denied_access": 0,
+    }
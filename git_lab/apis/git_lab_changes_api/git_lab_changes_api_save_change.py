@@ -0,0 +1,118 @@
+from core.utilities.convert_and_enforce_utc_timezone import convert_and_enforce_utc_timezone
+from core.utilities.sprint_interval_index import SprintIntervalIndex
+from git_lab.apis.git_lab_changes_api.git_lab_changes_api_summarize_changes import GitLabChangesSummary
+from git_lab.models.common.typed_dicts.git_lab_merge_request_change_diff_refs_typed_dict import \
+    GitLabMergeRequestChangeDiffRefsTypedDict
+from git_lab.models.common.typed_dicts.git_lab_merge_request_changes_typed_dict import \
+    GitLabMergeRequestChangesTypedDict
+from git_lab.models.common.typed_dicts.git_lab_references_typed_dict import GitLabReferencesTypedDict
+from git_lab.models.common.typed_dicts.git_lab_task_completion_status_typed_dict import \
+    GitLabTaskCompletionStatusTypedDict
+from git_lab.models.common.typed_dicts.git_lab_time_stats_typed_dict import GitLabTimeStatsTypedDict
+from git_lab.models.common.typed_dicts.git_lab_user_reference_typed_dict import GitLabUserReferenceTypedDict
+from git_lab.models.git_lab_change import GitLabChange
+from git_lab.models.git_lab_project import GitLabProject
+
+
+def git_lab_changes_api_save_change(
+        change_dict: GitLabMergeRequestChangesTypedDict,
+        projects: dict[int, GitLabProject],
+        scrum_sprint_index: SprintIntervalIndex,
+        summary: GitLabChangesSummary,
+        user_ids: set[int],
+) -> bool:
+    """
+    Store a merge request's changes as GitLabChange aggregates.
+
+    ``change_dict`` is the merge request without its diffs; ``summary`` holds
+    what was counted from them. Users, projects and sprints are resolved from
+    the maps loaded once per API call.
+
+    Returns:
+        Whether the change was created
+    """
+    change_id: int = change_dict.get("id")
+    git_lab_change: GitLabChange | None = GitLabChange.objects.filter(id=change_id).first()
+    did_create: bool = git_lab_change is None
+    if git_lab_change is None:
+        git_lab_change: GitLabChange = GitLabChange(id=change_id)
+    git_lab_change.changes_count = change_dict.get("changes_count") or 0
+    git_lab_change.description = change_dict.get("description")
+    git_lab_change.draft = change_dict.get("draft") or False
+    git_lab_change.has_conflicts = change_dict.get("has_conflicts") or False
+    git_lab_change.iid = change_dict.get("iid")
+    git_lab_change.merge_commit_sha = change_dict.get("merge_commit_sha")
+    git_lab_change.sha = change_dict.get("sha")
+    git_lab_change.squash_commit_sha = change_dict.get("squash_commit_sha")
+    git_lab_change.state = change_dict.get("state")
+    git_lab_change.title = change_dict.get("title")
+    git_lab_change.total_files_added = summary["total_files_created"]
+    git_lab_change.total_files_changed = summary["total_files_changed"]
+    git_lab_change.total_files_deleted = summary["total_files_deleted"]
+    git_lab_change.total_files_generated = summary["total_files_generated"]
+    git_lab_change.total_files_renamed = summary["total_files_renamed"]
+    git_lab_change.total_files_updated = summary["total_files_updated"]
+    git_lab_change.total_lines_added = summary["total_lines_added"]
+    git_lab_change.total_lines_removed = summary["total_lines_removed"]
+    git_lab_change.web_url = change_dict.get("web_url")
+    git_lab_change.created_at = convert_and_enforce_utc_timezone(
+        datetime_string=change_dict.get("created_at")
+    )
+    git_lab_change.updated_at = convert_and_enforce_utc_timezone(
+        datetime_string=change_dict.get("updated_at")
+    )
+    git_lab_change.latest_build_finished_at = convert_and_enforce_utc_timezone(
+        datetime_string=change_dict.get("latest_build_finished_at")
+    )
+    git_lab_change.latest_build_started_at = convert_and_enforce_utc_timezone(
+        datetime_string=change_dict.get("latest_build_started_at")
+    )
+    git_lab_change.merged_at = convert_and_enforce_utc_timezone(
+        datetime_string=change_dict.get("merged_at")
+    )
+    git_lab_change.prepared_at = convert_and_enforce_utc_timezone(
+        datetime_string=change_dict.get("prepared_at")
+    )
+    references: GitLabReferencesTypedDict | None = change_dict.get("references")
+    task_completion_status: GitLabTaskCompletionStatusTypedDict | None = change_dict.get("task_completion_status")
+    time_stats: GitLabTimeStatsTypedDict | None = change_dict.get("time_stats")
+    if references is not None:
+        git_lab_change.references_short = references.get("short")
+        git_lab_change.references_long = references.get("full")
+        git_lab_change.references_relative = references.get("relative")
+    if task_completion_status is not None:
+        git_lab_change.task_completion_status_completed_count = task_completion_status.get("completed_count")
+        git_lab_change.task_completion_status_count = task_completion_status.get("count")
+    if time_stats is not None:
+        git_lab_change.time_stats_human_time_estimate = time_stats.get("human_time_estimate")
+        git_lab_change.time_stats_human_total_time_spent = time_stats.get("human_total_time_spent")
+        git_lab_change.time_stats_time_estimate = time_stats.get("time_estimate")
+        git_lab_change.time_stats_total_time_spent = time_stats.get("total_time_spent")
+    merged_by: GitLabUserReferenceTypedDict | None = change_dict.get("merged_by")
+    if merged_by is not None:
+        git_lab_change.merged_by_id = merged_by.get("id") if merged_by.get("id") in user_ids else None
+    closed_by: GitLabUserReferenceTypedDict | None = change_dict.get("closed_by")
+    if closed_by is not None:
+        git_lab_change.closed_by_id = closed_by.get("id") if closed_by.get("id") in user_ids else None
+    author: GitLabUserReferenceTypedDict | None = change_dict.get("author")
+    if author is not None:
+        git_lab_change.author_id = author.get("id") if author.get("id") in user_ids else None
+    project: GitLabProject | None = projects.get(change_dict.get("project_id"))
+    if project is not None:
+        git_lab_change.project = project
+        git_lab_change.group_id = project.group_id
+    diff_refs: GitLabMergeRequestChangeDiffRefsTypedDict | None = change_dict.get("diff_refs")
+    if diff_refs is not None:
+        git_lab_change.head_sha = diff_refs.get("head_sha")
+        git_lab_change.base_sha = diff_refs.get("base_sha")
+        git_lab_change.start_sha = diff_refs.get("start_sha")
+    scrum_sprint_id: int | None = scrum_sprint_index.resolve(git_lab_change.created_at)
+    if scrum_sprint_id is not None:
+        git_lab_change.scrum_sprint_id = scrum_sprint_id
+    git_lab_change.save()
+    assignees: list[GitLabUserReferenceTypedDict] | None = change_dict.get("assignees")
+    if assignees is not None:
+        assignee_ids: set[int] = {assignee.get("id") for assignee in assignees} & user_ids
+        if assignee_ids:
+            git_lab_change.assignees.add(*assignee_ids)
+    return did_create
@@ -0,0 +1,66 @@
+from typing import TypedDict
+
+from git_lab.models.common.typed_dicts.git_lab_change_typed_dict import GitLabChangeTypedDict
+
+
+class GitLabChangesSummary(TypedDict):
+    total_files_changed: int
+    total_files_created: int
+    total_files_deleted: int
+    total_files_generated: int
+    total_files_renamed: int
+    total_files_updated: int
+    total_lines_added: int
+    total_lines_removed: int
+
+
+def count_diff_lines(diff: str | None) -> tuple[int, int]:
+    """
+    Number of added and removed lines of a unified diff.
+
+    Counts line starts with ``str.count`` on the diff itself, so no list of
+    lines (or any other copy of a possibly huge diff) is built.
+
+    Returns:
+        (lines added, lines removed)
+    """
+    if not diff:
+        return 0, 0
+    lines_added: int = diff.count("\n+") + (1 if diff[0] == "+" else 0)
+    lines_removed: int = diff.count("\n-") + (1 if diff[0] == "-" else 0)
+    return lines_added, lines_removed
+
+
+def git_lab_changes_api_summarize_changes(
+        changes: list[GitLabChangeTypedDict],
+) -> GitLabChangesSummary:
+    summary: GitLabChangesSummary = {
+        "total_files_changed": len(changes),
+        "total_files_created": 0,
+        "total_files_deleted": 0,
+        "total_files_generated": 0,
+        "total_files_renamed": 0,
+        "total_files_updated": 0,
+        "total_lines_added": 0,
+        "total_lines_removed": 0,
+    }
+    for change in changes:
+        if change.get("deleted_file") is True:
+            summary["total_files_deleted"] += 1
+        if change.get("generated_file") is True:
+            summary["total_files_generated"] += 1
+        if change.get("new_file") is True:
+            summary["total_files_created"] += 1
+        if change.get("renamed_file") is True:
+            summary["total_files_renamed"] += 1
+        if (
+                change.get("deleted_file") is False
+                and change.get("generated_file") is False
+                and change.get("new_file") is False
+                and change.get("renamed_file") is False
+        ):
+            summary["total_files_updated"] += 1
+        lines_added, lines_removed = count_diff_lines(diff=change.get("diff"))
+        summary["total_lines_added"] += lines_added
+        summary["total_lines_removed"] += lines_removed
+    return summary
@@ -1,5 +1,5 @@
 from datetime import datetime
-from time import time
+from time import perf_counter, time
 
 from dateutil.relativedelta import relativedelta
 from django.db.models import QuerySet, Q
@@ -9,8 +9,10 @@ from gitlab import Gitlab
 from core.utilities.cast_query_set import cast_query_set
 from core.utilities.git_lab.get_git_lab_client import get_git_lab_client
 from core.views.generic.generic_500 import generic_500
+from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_lookups import GitLabDiscussionsApiLookups, \
+    load_git_lab_discussions_api_lookups
 from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_payload import GitLabDiscussionsApiPayload, \
-    initial_git_lab_discussions_api_payload
+    get_initial_git_lab_discussions_api_payload
 from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_process_project import \
     git_lab_discussions_api_process_project
 from git_lab.models.git_lab_project import GitLabProject
@@ -31,11 +33,15 @@ def git_lab_discussions_api(
         typ=GitLabProject,
         val=GitLabProject.objects.filter(~Q(should_skip=True))
     )
-    payload: GitLabDiscussionsApiPayload = initial_git_lab_discussions_api_payload
+    payload: GitLabDiscussionsApiPayload = get_initial_git_lab_discussions_api_payload()
+    lookups_started_at: float = perf_counter()
+    lookups: GitLabDiscussionsApiLookups = load_git_lab_discussions_api_lookups()
+    payload["timings"]["seconds_loading_lookups"] = perf_counter() - lookups_started_at
     for model_project in iter(model_projects.all()):
         payload: GitLabDiscussionsApiPayload = git_lab_discussions_api_process_project(
             created_after=created_after,
             git_lab_client=git_lab_client,
+            lookups=lookups,
             model_project=model_project,
             payload=payload,
         )
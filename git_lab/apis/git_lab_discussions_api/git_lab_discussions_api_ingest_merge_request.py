@@ -0,0 +1,197 @@
+from datetime import datetime
+from time import perf_counter
+
+from django.db import transaction
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
+
+from core.settings.common.developer import DEBUG
+from core.utilities.convert_and_enforce_utc_timezone import convert_and_enforce_utc_timezone
+from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_lookups import GitLabDiscussionsApiLookups
+from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_payload import GitLabDiscussionsApiPayload, \
+    get_initial_git_lab_discussions_api_payload
+from git_lab.models.common.typed_dicts.git_lab_discussion_typed_dict import GitLabDiscussionTypedDict
+from git_lab.models.common.typed_dicts.git_lab_note_typed_dict import GitLabNoteTypedDict
+from git_lab.models.common.typed_dicts.git_lab_user_reference_typed_dict import GitLabUserReferenceTypedDict
+from git_lab.models.git_lab_discussion import GitLabDiscussion
+from git_lab.models.git_lab_merge_request import GitLabMergeRequest
+from git_lab.models.git_lab_note import GitLabNote
+from git_lab.models.git_lab_project import GitLabProject
+
+GIT_LAB_DISCUSSION_UPDATE_FIELDS: list[str] = [
+    "created_at",
+    "group",
+    "individual_note",
+    "project",
+    "scrum_sprint",
+    "started_by",
+    "updated_at",
+]
+GIT_LAB_NOTE_UPDATE_FIELDS: list[str] = [
+    "author",
+    "body",
+    "created_at",
+    "discussion",
+    "group",
+    "noteable_id",
+    "noteable_iid",
+    "noteable_type",
+    "project",
+    "scrum_sprint",
+    "system",
+    "title",
+    "type",
+    "updated_at",
+    "web_url",
+]
+BULK_BATCH_SIZE: int = 500
+
+
+def git_lab_discussions_api_ingest_merge_request(
+        discussion_dicts: list[GitLabDiscussionTypedDict],
+        lookups: GitLabDiscussionsApiLookups,
+        model_merge_request: GitLabMergeRequest,
+        payload: GitLabDiscussionsApiPayload | None = None,
+) -> GitLabDiscussionsApiPayload:
+    """
+    Upsert all discussions and notes of one merge request in a fixed number of queries.
+
+    Every note is resolved against ``lookups`` in memory first, the sprints of
+    the whole merge request in one batch. Each discussion takes its fields
+    from its non-system notes the way the former per-note saves left it: the
+    latest note sets group, project, sprint and updated_at, a non-system first
+    note sets created_at and started_by. Existing rows are
+    then loaded with one query per model and everything is written with bulk
+    creates and updates that keep the history tables in step.
+    """
+    if payload is None:
+        payload: GitLabDiscussionsApiPayload = get_initial_git_lab_discussions_api_payload()
+    started_at: float = perf_counter()
+    pending: list[tuple[GitLabDiscussionTypedDict, int, GitLabNoteTypedDict]] = []
+    for discussion_dict in discussion_dicts:
+        if discussion_dict.get("id") is None or not discussion_dict.get("notes"):
+            continue
+        for index, note_dict in enumerate(discussion_dict.get("notes")):
+            if note_dict.get("id") is None:
+                continue
+            if note_dict.get("system") is True:
+                payload["total_number_of_system_notes_skipped"] += 1
+                continue
+            pending.append((discussion_dict, index, note_dict))
+    created_at_datetimes: list[datetime | None] = [
+        convert_and_enforce_utc_timezone(datetime_string=note_dict.get("created_at")) for _, _, note_dict in pending
+    ]
+    scrum_sprint_ids: list[int | None] = lookups.scrum_sprint_index.resolve_many(created_at_datetimes)
+
+    discussion_values: dict[str, dict] = {}
+    note_values: dict[int, dict] = {}
+    for (discussion_dict, index, note_dict), created_at_datetime, scrum_sprint_id in zip(
+            pending, created_at_datetimes, scrum_sprint_ids,
+    ):
+        discussion_id: str = discussion_dict.get("id")
+        values: dict = _resolve_note(
+            created_at_datetime=created_at_datetime,
+            discussion_id=discussion_id,
+            lookups=lookups,
+            model_merge_request=model_merge_request,
+            note_dict=note_dict,
+            scrum_sprint_id=scrum_sprint_id,
+        )
+        note_values[note_dict.get("id")] = values
+        discussion: dict = discussion_values.setdefault(discussion_id, {})
+        discussion.update(
+            group_id=values["group_id"],
+            individual_note=discussion_dict.get("individual_note"),
+            project_id=values["project_id"],
+            scrum_sprint_id=scrum_sprint_id,
+            updated_at=values["updated_at"],
+        )
+        if index == 0:
+            discussion.update(created_at=created_at_datetime, started_by_id=values["author_id"])
+    resolved_at: float = perf_counter()
+    if discussion_values:
+        _write(discussion_values=discussion_values, note_values=note_values, payload=payload)
+    payload["timings"]["seconds_resolving_notes"] += resolved_at - started_at
+    payload["timings"]["seconds_writing"] += perf_counter() - resolved_at
+    return payload
+
+
+def _resolve_note(
+        created_at_datetime: datetime | None,
+        discussion_id: str,
+        lookups: GitLabDiscussionsApiLookups,
+        model_merge_request: GitLabMergeRequest,
+        note_dict: GitLabNoteTypedDict,
+        scrum_sprint_id: int | None,
+) -> dict:
+    author: GitLabUserReferenceTypedDict | None = note_dict.get("author")
+    author_id: int | None = author.get("id") if author is not None else None
+    model_project: GitLabProject | None = lookups.projects.get(note_dict.get("project_id"))
+    web_url: str = f"{model_merge_request.web_url}#note_{note_dict.get('id')}"
+    if DEBUG is True:
+        print(f"------------N: {web_url}")
+    return {
+        "author_id": author_id if author_id in lookups.user_ids else None,
+        "body": note_dict.get("body"),
+        "created_at": created_at_datetime,
+        "discussion_id": discussion_id,
+        "group_id": model_project.group_id if model_project is not None else None,
+        "noteable_id": note_dict.get("noteable_id"),
+        "noteable_iid": note_dict.get("noteable_iid"),
+        "noteable_type": note_dict.get("noteable_type"),
+        "project_id": model_project.id if model_project is not None else None,
+        "scrum_sprint_id": scrum_sprint_id,
+        "system": note_dict.get("system"),
+        "title": f"{author.get('username') if author is not None else None} on {model_merge_request.title} for {model_project}",
+        "type": note_dict.get("type"),
+        "updated_at": convert_and_enforce_utc_timezone(datetime_string=note_dict.get("updated_at")),
+        "web_url": web_url,
+    }
+
+
+def _write(
+        discussion_values: dict[str, dict],
+        note_values: dict[int, dict],
+        payload: GitLabDiscussionsApiPayload,
+) -> None:
+    with transaction.atomic():
+        existing_discussions: dict[str, GitLabDiscussion] = GitLabDiscussion.objects.in_bulk(list(discussion_values))
+        existing_notes: dict[int, GitLabNote] = GitLabNote.objects.in_bulk(list(note_values))
+
+        discussions_to_create: list[GitLabDiscussion] = []
+        discussions_to_update: list[GitLabDiscussion] = []
+        for discussion_id, values in discussion_values.items():
+            model_discussion: GitLabDiscussion | None = existing_discussions.get(discussion_id)
+            if model_discussion is None:
+                discussions_to_create.append(GitLabDiscussion(id=discussion_id, **values))
+                continue
+            for field_name, value in values.items():
+                setattr(model_discussion, field_name, value)
+            discussions_to_update.append(model_discussion)
+
+        notes_to_create: list[GitLabNote] = []
+        notes_to_update: list[GitLabNote] = []
+        for note_id, values in note_values.items():
+            model_note: GitLabNote | None = existing_notes.get(note_id)
+            if model_note is None:
+                notes_to_create.append(GitLabNote(id=note_id, **values))
+                continue
+            for field_name, value in values.items():
+                setattr(model_note, field_name, value)
+            notes_to_update.append(model_note)
+
+        # Discussions first: new notes point at them
+        if discussions_to_create:
+            bulk_create_with_history(discussions_to_create, GitLabDiscussion, batch_size=BULK_BATCH_SIZE)
+        if discussions_to_update:
+            bulk_update_with_history(
+                discussions_to_update, GitLabDiscussion, GIT_LAB_DISCUSSION_UPDATE_FIELDS, batch_size=BULK_BATCH_SIZE
+            )
+        if notes_to_create:
+            bulk_create_with_history(notes_to_create, GitLabNote, batch_size=BULK_BATCH_SIZE)
+        if notes_to_update:
+            bulk_update_with_history(notes_to_update, GitLabNote, GIT_LAB_NOTE_UPDATE_FIELDS, batch_size=BULK_BATCH_SIZE)
+
+    payload["total_number_of_discussions_created"] += len(discussions_to_create)
+    payload["total_number_of_discussions_updated"] += len(discussions_to_update)
+    payload["total_number_of_notes_created"] += len(notes_to_create)
+    payload["total_number_of_notes_updated"] += len(notes_to_update)
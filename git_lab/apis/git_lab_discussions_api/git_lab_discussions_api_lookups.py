@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+from core.utilities.sprint_interval_index import SprintIntervalIndex, get_sprint_interval_index
+from git_lab.models.git_lab_project import GitLabProject
+from git_lab.models.git_lab_user import GitLabUser
+from scrum.models.scrum_sprint import ScrumSprint
+
+
+@dataclass
+class GitLabDiscussionsApiLookups:
+    """
+    Everything a note needs resolved, loaded once per API call.
+
+    Notes only reference users, projects and sprints, so the ingester resolves
+    them from these maps instead of querying per note.
+    """
+    projects: dict[int, GitLabProject]
+    scrum_sprint_index: SprintIntervalIndex
+    user_ids: set[int]
+
+
+def load_git_lab_discussions_api_lookups() -> GitLabDiscussionsApiLookups:
+    return GitLabDiscussionsApiLookups(
+        projects=GitLabProject.objects.in_bulk(),
+        scrum_sprint_index=get_sprint_interval_index(model=ScrumSprint),
+        user_ids=set(GitLabUser.objects.values_list("id", flat=True)),
+    )
@@ -1,7 +1,16 @@
 from typing import TypedDict, NotRequired
 
 
+class GitLabDiscussionsApiTimings(TypedDict):
+    seconds_fetching_discussions: float  # Summed over the concurrent fetches
+    seconds_listing_merge_requests: float
+    seconds_loading_lookups: float
+    seconds_resolving_notes: float
+    seconds_writing: float
+
+
 class GitLabDiscussionsApiPayload(TypedDict):
+    timings: NotRequired[GitLabDiscussionsApiTimings]
     total_number_of_discussions_created: NotRequired[int | None]
     total_number_of_discussions_updated: NotRequired[int | None]
     total_number_of_merge_requests_not_synchronized: NotRequired[int | None]
@@ -20,3 +29,17 @@ initial_git_lab_discussions_api_payload: GitLabDiscussionsApiPayload = {
     "total_number_of_projects_denied_access": 0,
     "total_number_of_system_notes_skipped": 0,
 }
+
+
+def get_initial_git_lab_discussions_api_payload() -> GitLabDiscussionsApiPayload:
+    """A fresh payload; the module-level one must not accumulate counts across calls."""
+    return {
+        **initial_git_lab_discussions_api_payload,
+        "timings": {
+            "seconds_fetching_discussions": 0.0,
+            "seconds_listing_merge_requests": 0.0,
+            "seconds_loading_lookups": 0.0,
+            "seconds_resolving_notes": 0.0,
+            "seconds_writing": 0.0,
+        },
+    }
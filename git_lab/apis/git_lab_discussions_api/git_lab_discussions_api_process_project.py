@@ -1,31 +1,53 @@
 from datetime import datetime
+from itertools import islice
+from time import perf_counter
 
 from gitlab import Gitlab, GitlabListError, GitlabAuthenticationError
-from gitlab.base import RESTObjectList
+from gitlab.base import RESTObject, RESTObjectList
 from gitlab.v4.objects import Project
 
+from core.models.this_server_configuration import ThisServerConfiguration
 from core.settings.common.developer import DEBUG
+from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_ingest_merge_request import \
+    git_lab_discussions_api_ingest_merge_request
+from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_lookups import GitLabDiscussionsApiLookups, \
+    load_git_lab_discussions_api_lookups
 from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_payload import GitLabDiscussionsApiPayload, \
-    initial_git_lab_discussions_api_payload
-from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api_process_merge_request import \
-    git_lab_discussions_api_process_merge_request
+    get_initial_git_lab_discussions_api_payload
+from git_lab.models.common.typed_dicts.git_lab_discussion_typed_dict import GitLabDiscussionTypedDict
+from git_lab.models.git_lab_merge_request import GitLabMergeRequest
 from git_lab.models.git_lab_project import GitLabProject
+from gitlab_sync.utilities.fetch_concurrently import fetch_concurrently
+
+# Merge requests matched against the database per query
+MERGE_REQUEST_CHUNK_SIZE: int = 50
 
 
 def git_lab_discussions_api_process_project(
         created_after: datetime | None = None,
         git_lab_client: Gitlab | None = None,
+        lookups: GitLabDiscussionsApiLookups | None = None,
         model_project: GitLabProject | None = None,
         payload: GitLabDiscussionsApiPayload | None = None,
 ) -> GitLabDiscussionsApiPayload:
+    """
+    Sync the discussions of a project's recent merge requests.
+
+    Merge requests are matched against the database in chunks; the discussions
+    of the known ones are fetched on a bounded thread pool while this thread
+    ingests them one merge request at a time.
+    """
     if payload is None:
-        payload: GitLabDiscussionsApiPayload = initial_git_lab_discussions_api_payload
+        payload: GitLabDiscussionsApiPayload = get_initial_git_lab_discussions_api_payload()
     if git_lab_client is None:
         return payload
     if model_project is None:
         return payload
+    if lookups is None:
+        lookups: GitLabDiscussionsApiLookups = load_git_lab_discussions_api_lookups()
     if DEBUG is True:
         print(f"Processing PROJECT: {model_project.web_url}")
+    listing_started_at: float = perf_counter()
     project_id: int = model_project.id
     rest_object_project: Project | None = git_lab_client.projects.get(id=project_id, lazy=False)
     if rest_object_project is None:
@@ -46,9 +68,51 @@ def git_lab_discussions_api_process_project(
         print(f"GitlabAuthenticationError on {model_project.name_with_namespace}: {error.error_message}")
         payload["total_number_of_projects_denied_access"] += 1
         return payload
-    for project_merge_request_rest_object in generator_merge_requests:
-        payload: GitLabDiscussionsApiPayload = git_lab_discussions_api_process_merge_request(
-            project_merge_request_rest_object=project_merge_request_rest_object,
-            payload=payload,
-        )
-    return payload
+    payload["timings"]["seconds_listing_merge_requests"] += perf_counter() - listing_started_at
+    max_workers: int = ThisServerConfiguration.current().coerced_gitlab_sync_fetch_concurrency
+    while True:
+        listing_started_at: float = perf_counter()
+        chunk: list[RESTObject] = list(islice(generator_merge_requests, MERGE_REQUEST_CHUNK_SIZE))
+        payload["timings"]["seconds_listing_merge_requests"] += perf_counter() - listing_started_at
+        if not chunk:
+            return payload
+        model_merge_requests: dict[int, GitLabMergeRequest] = GitLabMergeRequest.objects.only(
+            "id", "title", "web_url",
+        ).in_bulk([rest_object.get_id() for rest_object in chunk])
+        known: list[RESTObject] = [rest_object for rest_object in chunk if rest_object.get_id() in model_merge_requests]
+        payload["total_number_of_merge_requests_not_synchronized"] += len(chunk) - len(known)
+        for rest_object, (discussion_dicts, seconds) in fetch_concurrently(
+            items=known,
+            fetch=_fetch_discussion_dicts,
+            max_workers=max_workers,
+        ):
+            payload["timings"]["seconds_fetching_discussions"] += seconds
+            if discussion_dicts is None:
+                continue
+            payload: GitLabDiscussionsApiPayload = git_lab_discussions_api_ingest_merge_request(
+                discussion_dicts=discussion_dicts,
+                lookups=lookups,
+                model_merge_request=model_merge_requests[rest_object.get_id()],
+                payload=payload,
+            )
+
+
+def _fetch_discussion_dicts(
+        project_merge_request_rest_object: RESTObject,
+) -> tuple[list[GitLabDiscussionTypedDict] | None, float]:
+    """Runs on a worker thread: talks to GitLab only. Returns the discussions (None on error) and the time taken."""
+    started_at: float = perf_counter()
+    web_url: str | None = project_merge_request_rest_object.asdict().get("web_url")
+    if DEBUG is True:
+        print(f"----M: {web_url}")
+    try:
+        discussion_dicts: list[GitLabDiscussionTypedDict] | None = [
+            discussion.asdict() for discussion in project_merge_request_rest_object.discussions.list(iterator=True)
+        ]
+    except GitlabListError as error:
+        print(f"GitLabListError on {web_url}: {error.error_message}")
+        discussion_dicts = None
+    except GitlabAuthenticationError as error:
+        print(f"GitlabAuthenticationError on {web_url}: {error.error_message}")
+        discussion_dicts = None
+    return discussion_dicts, perf_counter() - started_at
@@ -1,6 +1,6 @@
 from django.urls import URLPattern, URLResolver, path
 
-from git_lab.apis.git_lab_changes_api import git_lab_changes_api
+from git_lab.apis.git_lab_changes_api.git_lab_changes_api import git_lab_changes_api
 from git_lab.apis.git_lab_discussions_api.git_lab_discussions_api import git_lab_discussions_api
 from git_lab.apis.git_lab_groups_api import git_lab_groups_api
 from git_lab.apis.git_lab_issues_api import git_lab_issues_api
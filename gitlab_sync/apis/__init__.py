@@ -3,6 +3,7 @@ from gitlab_sync.apis.gitlab_sync_cancel_job_api import gitlab_sync_cancel_job_a
 from gitlab_sync.apis.gitlab_sync_commits_api import gitlab_sync_commits_api
 from gitlab_sync.apis.gitlab_sync_epics_api import gitlab_sync_epics_api
 from gitlab_sync.apis.gitlab_sync_events_api import gitlab_sync_events_api
+from gitlab_sync.apis.gitlab_sync_full_sync_api import gitlab_sync_full_sync_api
 from gitlab_sync.apis.gitlab_sync_groups_api import gitlab_sync_groups_api
 from gitlab_sync.apis.gitlab_sync_issues_api import gitlab_sync_issues_api
 from gitlab_sync.apis.gitlab_sync_iterations_api import gitlab_sync_iterations_api
@@ -30,6 +31,7 @@ __all__ = [
     "gitlab_sync_commits_api",
     "gitlab_sync_epics_api",
     "gitlab_sync_events_api",
+    "gitlab_sync_full_sync_api",
     "gitlab_sync_groups_api",
     "gitlab_sync_issues_api",
     "gitlab_sync_iterations_api",
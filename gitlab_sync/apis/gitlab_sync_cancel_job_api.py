@@ -10,11 +10,11 @@ from gitlab_sync.models import GitLabSyncJobTracker
 @require_http_methods(["POST"])
 def gitlab_sync_cancel_job_api(request: HttpRequest, job_id: int) -> JsonResponse:
     """
-    Cancel a running sync job.
+    Cancel a queued or running sync job.
 
-    Marks the job as cancelled. Note: This won't stop the actual thread
-    execution immediately, but the job status will be marked as cancelled
-    and polling will stop on the frontend.
+    Marks the job as cancelled. A queued job is never picked up by a sync
+    worker; a running job stops at its next cancellation check, and polling
+    stops on the frontend.
 
     Args:
         request: HTTP request
@@ -31,28 +31,25 @@ def gitlab_sync_cancel_job_api(request: HttpRequest, job_id: int) -> JsonRespons
                 data={"success": False, "error": "Job not found"}, status=404
             )
 
-        if job_tracker.status != "running":
+        # Conditional update so a worker claiming the job at the same time can't revive it
+        cancelled = GitLabSyncJobTracker.objects.filter(
+            id=job_id, status__in=["pending", "running"]
+        ).update(status="cancelled", end_time=timezone.now())
+
+        if not cancelled:
             return JsonResponse(
                 data={
                     "success": False,
-                    "error": f"Job is not running (status: {job_tracker.status})",
+                    "error": f"Job is not queued or running (status: {job_tracker.status})",
                 },
                 status=400,
             )
 
-        # Mark as cancelled
-        job_tracker.status = "cancelled"
-        job_tracker.end_time = timezone.now()
-
         # Add cancellation log
-        if not job_tracker.detailed_logs:
-            job_tracker.detailed_logs = []
-        job_tracker.detailed_logs.append(
-            f"[{timezone.now().strftime('%H:%M:%S')}] ⚠️ Job cancelled by user"
+        job_tracker.append_logs(
+            [f"[{timezone.now().strftime('%H:%M:%S')}] ⚠️ Job cancelled by user"]
         )
 
-        job_tracker.save()
-
         return JsonResponse(
             data={
                 "success": True,
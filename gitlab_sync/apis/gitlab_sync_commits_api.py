@@ -19,10 +19,11 @@ from gitlab_sync.models import (
     GitLabSyncUser,
 )
 from gitlab_sync.utilities import (
+    GitLabPageStream,
     SyncResult,
     check_job_cancelled,
-    handle_gitlab_api_errors,
-    run_sync_in_background,
+    enqueue_sync_job,
+    fetch_concurrently,
 )
 
 
@@ -56,10 +57,28 @@ def _sync_commits_background(
 
     project_count = projects.count()
     sync_result.add_log(
-        f"Syncing commits from {project_count} projects incrementally (last {days_back} days)..."
+        f"Syncing commits from {project_count} projects (last {days_back} days, known commits skipped)..."
     )
 
-    for proj_idx, project in enumerate(projects, 1):
+    def fetch_commits(project: GitLabSyncProject) -> tuple[GitLabPageStream | None, str | None]:
+        # `since` filters on committed_date, which does not grow with push order: a rebased or
+        # long-lived branch merged today can bring commits dated days ago. No cursor on that date
+        # is safe, so the whole days-back window is listed every run and known SHAs are skipped.
+        # Only the first page is fetched here; later pages stream in as they are written
+        return GitLabPageStream.open(
+            list_objects=git_lab_client.projects.get(id=project.id, lazy=True).commits.list,
+            entity_name=f"Commits for project {project.path_with_namespace}",
+            since=cutoff_date.isoformat(),
+        )
+
+    for proj_idx, (project, (commit_pages, error)) in enumerate(
+        fetch_concurrently(
+            items=projects,
+            fetch=fetch_commits,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         # Check if job was cancelled
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
@@ -71,17 +90,7 @@ def _sync_commits_background(
         sync_result.update_progress(
             proj_idx - 1,
             project_count,
-            f"📥 About to fetch commits from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
-        )
-
-        commits, error = handle_gitlab_api_errors(
-            func=lambda: [
-                c.asdict()
-                for c in git_lab_client.projects.get(id=project.id, lazy=True)
-                .commits.list(since=cutoff_date.isoformat(), get_all=True)
-            ],
-            entity_name=f"Commits for project {project.path_with_namespace}",
-            max_retries=3,
+            f"📥 Fetched commits from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
         )
 
         if error:
@@ -105,12 +114,11 @@ def _sync_commits_background(
             sync_result.add_failure(error)
             continue
 
-        if not commits:
+        # The first page was fetched with the stream, so an empty one means no rows
+        if commit_pages.item_count == 0:
             sync_result.add_log(f"⊘ No commits found in project {project.path_with_namespace}")
             continue
 
-        sync_result.add_log(f"✓ Fetched {len(commits)} commits from {project.path_with_namespace}, about to process...")
-
         # Get or create repository for this project
         repository = None
         try:
@@ -121,86 +129,109 @@ def _sync_commits_background(
         except Exception as repo_error:
             sync_result.add_log(f"⚠️ Could not create repository for project {project.id}: {repo_error}")
 
-        # Process each commit immediately
-        for commit_dict in commits:
-            # Check if job was cancelled
-            if check_job_cancelled(sync_result.job_tracker_id):
-                sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
-                sync_result.finish()
-                print(f"[GitLabSync] {sync_result}")
-                return
-
-            commit_sha: str | None = commit_dict.get("id")
-
-            if commit_sha is None:
-                sync_result.add_skip()
-                continue
-
-            try:
-                sync_result.add_log(f"💾 About to get_or_create commit {commit_sha[:8]} in database...")
-                commit, created = GitLabSyncCommit.objects.get_or_create(
-                    sha=commit_sha,
-                    defaults={"project": project}
-                )
-                sync_result.add_log(f"✓ Database get_or_create succeeded for commit {commit_sha[:8]} (created={created})")
+        # One query instead of a get_or_create per already synced commit
+        known_shas: set[str] = set(
+            GitLabSyncCommit.objects.filter(project=project, committed_date__gte=cutoff_date).values_list("sha", flat=True)
+        )
+        for commits in commit_pages.pages(sync_result=sync_result):
+            # Process each commit of the page immediately
+            for commit_dict in commits:
+                # Check if job was cancelled
+                if check_job_cancelled(sync_result.job_tracker_id):
+                    sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
+                    sync_result.finish()
+                    print(f"[GitLabSync] {sync_result}")
+                    return
+
+                commit_sha: str | None = commit_dict.get("id")
+
+                if commit_sha is None:
+                    sync_result.add_skip()
+                    continue
 
-                # Commits don't change once created, so skip if already exists
-                if not created:
+                # Commits don't change once created, so skip if already synced
+                if commit_sha in known_shas:
                     sync_result.add_skip()
-                    sync_result.add_log(f"⊘ Skipped existing commit {commit_sha[:8]}")
                     continue
 
-                # Update commit fields
-                commit.project = project
-                if repository:
-                    commit.repository = repository
-
-                commit.sha = commit_sha
-                commit.short_id = commit_dict.get("short_id")
-                commit.title = commit_dict.get("title")
-                commit.message = commit_dict.get("message")
-                commit.author_name = commit_dict.get("author_name")
-                commit.author_email = commit_dict.get("author_email")
-                commit.committer_name = commit_dict.get("committer_name")
-                commit.committer_email = commit_dict.get("committer_email")
-                commit.web_url = commit_dict.get("web_url")
-
-                # Handle parent IDs
-                parent_ids = commit_dict.get("parent_ids", [])
-                if parent_ids:
-                    commit.parent_ids = ",".join(parent_ids)
-
-                # Handle stats
-                stats = commit_dict.get("stats", {})
-                if stats:
-                    commit.additions = stats.get("additions")
-                    commit.deletions = stats.get("deletions")
-                    commit.total_changes = stats.get("total")
-
-                commit.created_at = convert_and_enforce_utc_timezone(
-                    datetime_string=commit_dict.get("created_at")
-                )
-                commit.authored_date = convert_and_enforce_utc_timezone(
-                    datetime_string=commit_dict.get("authored_date")
-                )
-                commit.committed_date = convert_and_enforce_utc_timezone(
-                    datetime_string=commit_dict.get("committed_date")
-                )
+                try:
+                    sync_result.add_log(f"💾 About to get_or_create commit {commit_sha[:8]} in database...")
+                    commit, created = GitLabSyncCommit.objects.get_or_create(
+                        sha=commit_sha,
+                        defaults={"project": project}
+                    )
+                    sync_result.add_log(f"✓ Database get_or_create succeeded for commit {commit_sha[:8]} (created={created})")
+
+                    # Commits don't change once created, so skip if already exists
+                    if not created:
+                        sync_result.add_skip()
+                        sync_result.add_log(f"⊘ Skipped existing commit {commit_sha[:8]}")
+                        continue
+
+                    # Update commit fields
+                    commit.project = project
+                    if repository:
+                        commit.repository = repository
+
+                    commit.sha = commit_sha
+                    commit.short_id = commit_dict.get("short_id")
+                    commit.title = commit_dict.get("title")
+                    commit.message = commit_dict.get("message")
+                    commit.author_name = commit_dict.get("author_name")
+                    commit.author_email = commit_dict.get("author_email")
+                    commit.committer_name = commit_dict.get("committer_name")
+                    commit.committer_email = commit_dict.get("committer_email")
+                    commit.web_url = commit_dict.get("web_url")
+
+                    # Handle parent IDs
+                    parent_ids = commit_dict.get("parent_ids", [])
+                    if parent_ids:
+                        commit.parent_ids = ",".join(parent_ids)
+
+                    # Handle stats
+                    stats = commit_dict.get("stats", {})
+                    if stats:
+                        commit.additions = stats.get("additions")
+                        commit.deletions = stats.get("deletions")
+                        commit.total_changes = stats.get("total")
+
+                    commit.created_at = convert_and_enforce_utc_timezone(
+                        datetime_string=commit_dict.get("created_at")
+                    )
+                    commit.authored_date = convert_and_enforce_utc_timezone(
+                        datetime_string=commit_dict.get("authored_date")
+                    )
+                    commit.committed_date = convert_and_enforce_utc_timezone(
+                        datetime_string=commit_dict.get("committed_date")
+                    )
+
+                    sync_result.add_log(f"💾 About to save commit {commit_sha[:8]} to database...")
+                    commit.save()
+                    sync_result.add_log(f"✓ Database save succeeded for commit {commit_sha[:8]}")
+                    sync_result.add_success()
+
+                except Exception as error:
+                    import traceback
+                    error_trace = traceback.format_exc()
+                    error_msg = f"Failed to save commit {commit_sha[:8] if commit_sha else 'unknown'}: {str(error)}"
+                    sync_result.add_failure(error_msg)
+                    sync_result.add_log(f"❌ {error_msg}")
+                    print(f"[GitLabSync] {error_msg}")
+                    print(f"[GitLabSync] Stack trace:\n{error_trace}")
+                    continue
 
-                sync_result.add_log(f"💾 About to save commit {commit_sha[:8]} to database...")
-                commit.save()
-                sync_result.add_log(f"✓ Database save succeeded for commit {commit_sha[:8]}")
-                sync_result.add_success()
-
-            except Exception as error:
-                import traceback
-                error_trace = traceback.format_exc()
-                error_msg = f"Failed to save commit {commit_sha[:8] if commit_sha else 'unknown'}: {str(error)}"
-                sync_result.add_failure(error_msg)
-                sync_result.add_log(f"❌ {error_msg}")
-                print(f"[GitLabSync] {error_msg}")
-                print(f"[GitLabSync] Stack trace:\n{error_trace}")
-                continue
+        if commit_pages.error:
+            sync_result.add_log(
+                f"❌ Error fetching commits for {project.path_with_namespace} "
+                f"after page {commit_pages.page_number}: {commit_pages.error}"
+            )
+            sync_result.add_failure(commit_pages.error)
+            continue
+
+        sync_result.add_log(
+            f"✓ Processed {commit_pages.item_count} commits from {project.path_with_namespace} "
+            f"in {commit_pages.page_number} pages"
+        )
 
     # Final progress update
     sync_result.update_progress(project_count, project_count, None)
@@ -222,9 +253,10 @@ def gitlab_sync_commits_api(
     New functionality not present in the original git_lab app.
     Tracks individual commits and code changes.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("commits", _sync_commits_background, request)
+    job_tracker = enqueue_sync_job("commits", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "commits"}
@@ -3,6 +3,7 @@ from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.utils import timezone
 from gitlab import Gitlab
 
+from core.models.this_server_configuration import ThisServerConfiguration
 from core.utilities.cast_query_set import cast_query_set
 from core.utilities.convert_and_enforce_utc_timezone import (
     convert_and_enforce_utc_timezone,
@@ -17,8 +18,9 @@ from gitlab_sync.models import (
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -39,6 +41,8 @@ def _sync_epics_background(
         print(f"[GitLabSync] {sync_result}")
         return
 
+    config = ThisServerConfiguration.current()
+
     groups: QuerySet[GitLabSyncGroup] = cast_query_set(
         typ=GitLabSyncGroup,
         val=GitLabSyncGroup.objects.all(),
@@ -49,7 +53,25 @@ def _sync_epics_background(
         f"Syncing epics from {group_count} groups incrementally..."
     )
 
-    for group_idx, group in enumerate(groups, 1):
+    def fetch_epics(group: GitLabSyncGroup) -> tuple[list[dict] | None, str | None]:
+        return handle_gitlab_api_errors(
+            func=lambda: [
+                e.asdict()
+                for e in git_lab_client.groups.get(id=group.id, lazy=True)
+                .epics.list(get_all=True)
+            ],
+            entity_name=f"Epics for group {group.full_path}",
+            max_retries=3,
+        )
+
+    for group_idx, (group, (epics, error)) in enumerate(
+        fetch_concurrently(
+            items=groups,
+            fetch=fetch_epics,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         # Check if job was cancelled
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
@@ -61,17 +83,7 @@ def _sync_epics_background(
         sync_result.update_progress(
             group_idx - 1,
             group_count,
-            f"📥 About to fetch epics from group {group.full_path} (group {group_idx}/{group_count})...",
-        )
-
-        epics, error = handle_gitlab_api_errors(
-            func=lambda: [
-                e.asdict()
-                for e in git_lab_client.groups.get(id=group.id, lazy=True)
-                .epics.list(get_all=True)
-            ],
-            entity_name=f"Epics for group {group.full_path}",
-            max_retries=3,
+            f"📥 Fetched epics from group {group.full_path} (group {group_idx}/{group_count})...",
         )
 
         if error:
@@ -242,9 +254,10 @@ def gitlab_sync_epics_api(
     New functionality not present in the original git_lab app.
     Tracks epics (GitLab EE Premium/Ultimate feature) for high-level organization.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("epics", _sync_epics_background, request)
+    job_tracker = enqueue_sync_job("epics", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "epics"}
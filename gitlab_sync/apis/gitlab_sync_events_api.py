@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from gitlab import Gitlab
@@ -15,10 +17,13 @@ from gitlab_sync.models import (
     GitLabSyncUser,
 )
 from gitlab_sync.utilities import (
+    SyncCursors,
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
+    is_full_resync_requested,
 )
 
 
@@ -52,21 +57,17 @@ def _sync_events_background(
         f"Syncing events from {project_count} projects (max {max_events} per project)..."
     )
 
-    for proj_idx, project in enumerate(projects, 1):
-        # Check if job was cancelled
-        if check_job_cancelled(sync_result.job_tracker_id):
-            sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
-            sync_result.finish()
-            print(f"[GitLabSync] {sync_result}")
-            return
-
-        # Update progress at project level
-        sync_result.update_progress(
-            proj_idx - 1,
-            project_count,
-            f"📥 About to fetch events from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
+    cursors = SyncCursors.load(
+        entity_type="events", full_resync=is_full_resync_requested(request)
+    )
+    if cursors.full_resync:
+        sync_result.add_log("🔄 Full resync requested - ignoring stored cursors")
+    else:
+        sync_result.add_log(
+            f"🔖 Fetching only changes since the last sync for {cursors.stored_count} projects"
         )
 
+    def fetch_events(project: GitLabSyncProject) -> tuple[list[dict] | None, str | None]:
         # Calculate pagination: if max_events < 100, use max_events as per_page
         # Otherwise use 100 per page and calculate max_pages
         if max_events <= 100:
@@ -76,16 +77,48 @@ def _sync_events_background(
             per_page = 100
             max_pages = (max_events + 99) // 100  # Ceiling division
 
-        events, error = handle_gitlab_api_errors(
+        # Events only filter by day and "after" is exclusive, so step back one day;
+        # already stored events are skipped by gitlab_id when processed
+        query_parameters = {}
+        created_after = cursors.updated_after(project.id)
+        if created_after is not None:
+            query_parameters = {
+                "after": (created_after - timedelta(days=1)).date().isoformat(),
+                "sort": "asc",
+            }
+
+        return handle_gitlab_api_errors(
             func=lambda: [
                 e.asdict()
                 for e in git_lab_client.projects.get(id=project.id, lazy=True)
-                .events.list(per_page=per_page, max_pages=max_pages)
+                .events.list(per_page=per_page, max_pages=max_pages, **query_parameters)
             ][:max_events],  # Slice to exact limit
             entity_name=f"Events for project {project.path_with_namespace}",
             max_retries=3,
         )
 
+    for proj_idx, (project, (events, error)) in enumerate(
+        fetch_concurrently(
+            items=projects,
+            fetch=fetch_events,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
+        # Check if job was cancelled
+        if check_job_cancelled(sync_result.job_tracker_id):
+            sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
+            sync_result.finish()
+            print(f"[GitLabSync] {sync_result}")
+            return
+
+        # Update progress at project level
+        sync_result.update_progress(
+            proj_idx - 1,
+            project_count,
+            f"📥 Fetched events from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
+        )
+
         if error:
             # Check if this is a 403 Forbidden error - if so, just log and continue without failing
             error_str = str(error).lower()
@@ -114,6 +147,7 @@ def _sync_events_background(
         sync_result.add_log(f"✓ Fetched {len(events)} events from {project.path_with_namespace}, about to process...")
 
         # Process each event immediately
+        project_had_failures = False
         for event_dict in events:
             # Check if job was cancelled
             if check_job_cancelled(sync_result.job_tracker_id):
@@ -189,8 +223,16 @@ def _sync_events_background(
                 sync_result.add_log(f"❌ {error_msg}")
                 print(f"[GitLabSync] {error_msg}")
                 print(f"[GitLabSync] Stack trace:\n{error_trace}")
+                project_had_failures = True
                 continue
 
+        # Only move the cursor once every event in the page was written
+        if not project_had_failures:
+            cursors.advance(
+                project_id=project.id,
+                timestamps=(e.get("created_at") for e in events),
+            )
+
     # Final progress update
     sync_result.update_progress(project_count, project_count, None)
 
@@ -210,9 +252,10 @@ def gitlab_sync_events_api(
 
     Tracks project activity events like pushes, issues, merge requests, etc.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("events", _sync_events_background, request)
+    job_tracker = enqueue_sync_job("events", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "events"}
@@ -0,0 +1,281 @@
+import traceback
+
+from django.db import connection
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils import timezone
+
+from gitlab_sync.models import GitLabSyncJobTracker
+from gitlab_sync.utilities import (
+    SyncResult,
+    check_job_cancelled,
+    enqueue_sync_job,
+    run_dependency_stages,
+    run_sync_job,
+)
+
+# Entity sync -> entity syncs whose rows it links to (FK / M2M lookups by GitLab ID).
+# A stage only starts once everything it links to has been synced in this run.
+FULL_SYNC_STAGES: dict[str, tuple[str, ...]] = {
+    "groups": (),
+    "projects": ("groups",),
+    "users": ("groups",),
+    "iterations": ("groups",),
+    "milestones": ("groups", "projects"),
+    "epics": ("groups", "users"),
+    "repositories": ("projects",),
+    "branches": ("repositories",),
+    "tags": ("repositories",),
+    "commits": ("repositories", "users"),
+    "pipelines": ("projects", "users"),
+    "jobs": ("pipelines", "users"),
+    "events": ("projects", "users"),
+    "snippets": ("projects", "users"),
+    "vulnerabilities": ("projects", "users"),
+    "merge-requests": ("projects", "users", "pipelines", "milestones", "iterations"),
+    "issues": ("projects", "users", "milestones", "iterations", "epics"),
+}
+
+# Stages write concurrently, so keep the fan-out small
+FULL_SYNC_MAX_PARALLEL_STAGES = 2
+
+_FINISHED_STAGE_STATUSES = ("completed", "completed_with_errors")
+
+
+def _full_sync_max_parallel_stages() -> int:
+    """
+    How many stages may run at once on the configured database.
+
+    SQLite allows a single writer: a second stage thread writing at the same
+    time fails with "database is locked" once the busy timeout runs out, so
+    stages run one after another there. Each stage still fetches from GitLab
+    concurrently.
+    """
+    if connection.vendor == "sqlite":
+        return 1
+    return FULL_SYNC_MAX_PARALLEL_STAGES
+
+
+def _select_full_sync_stages(stages_parameter: str | None) -> dict[str, tuple[str, ...]]:
+    """
+    Pick the stages to run from a comma separated ``?stages=`` value.
+
+    Each requested stage is run together with every stage downstream of it, since
+    their inputs changed; upstream stages are assumed to be up to date.
+    """
+    if not stages_parameter:
+        return dict(FULL_SYNC_STAGES)
+
+    selected = {name.strip() for name in stages_parameter.split(",")} & FULL_SYNC_STAGES.keys()
+    added = True
+    while added:
+        dependents = {
+            stage
+            for stage, dependencies in FULL_SYNC_STAGES.items()
+            if selected.intersection(dependencies)
+        }
+        added = not dependents <= selected
+        selected |= dependents
+
+    return {stage: FULL_SYNC_STAGES[stage] for stage in FULL_SYNC_STAGES if stage in selected}
+
+
+def _sync_full_background(
+    request: HttpRequest, job_tracker: GitLabSyncJobTracker
+) -> None:
+    """Background function running every entity sync in dependency order."""
+    sync_result = SyncResult(entity_type="FullSync", job_tracker_id=job_tracker.id)
+    sync_result.add_log("Starting full sync...")
+
+    stages = _select_full_sync_stages(request.GET.get("stages"))
+    if not stages:
+        sync_result.add_log(f"❌ No known stages in: {request.GET.get('stages')}")
+        sync_result.add_failure("No known stages selected")
+        sync_result.finish()
+        print(f"[GitLabSync] {sync_result}")
+        return
+
+    # Results from an earlier lease of this job (worker restart) - finished stages are not rerun
+    stage_results: dict[str, dict] = dict(job_tracker.stage_results or {})
+    already_finished = {
+        stage
+        for stage, result in stage_results.items()
+        if stage in stages and result.get("status") in _FINISHED_STAGE_STATUSES
+    }
+    stage_query = {
+        key: value
+        for key, value in (job_tracker.parameters or {}).get("query", {}).items()
+        if key != "stages"
+    }
+
+    max_parallel_stages = _full_sync_max_parallel_stages()
+    sync_result.add_log(
+        f"Running {len(stages)} stages ({len(already_finished)} already finished), "
+        f"up to {max_parallel_stages} at a time: {', '.join(stages)}"
+    )
+
+    # Stage -> job tracker id created in this attempt (written from stage threads)
+    stage_job_ids: dict[str, int] = {}
+
+    def run_stage(stage: str) -> bool:
+        # Stages queued before a cancellation must not start
+        if check_job_cancelled(job_tracker.id):
+            return False
+
+        now = timezone.now()
+        lease_owner, lease_expires_at = (
+            GitLabSyncJobTracker.objects.filter(id=job_tracker.id)
+            .values_list("lease_owner", "lease_expires_at")
+            .first()
+        ) or (None, None)
+        # Shares the parent's lease, so the worker heartbeat keeps stage jobs alive too
+        stage_tracker = GitLabSyncJobTracker.objects.create(
+            job_type=stage,
+            status="running",
+            parent_id=job_tracker.id,
+            progress_percent=0,
+            current_count=0,
+            total_count=0,
+            parameters={"query": stage_query},
+            queued_at=now,
+            start_time=now,
+            attempts=1,
+            lease_owner=lease_owner,
+            lease_expires_at=lease_expires_at,
+            heartbeat_at=now,
+            user_id=job_tracker.user_id,
+        )
+        stage_job_ids[stage] = stage_tracker.id
+        run_sync_job(stage_tracker)
+
+        try:
+            stage_tracker.refresh_from_db()
+            # A stage that reached the end with some per-row errors still leaves its
+            # rows in place for dependents; only an aborted stage blocks them
+            return stage_tracker.status == "completed" or (
+                stage_tracker.status == "failed" and stage_tracker.progress_percent == 100
+            )
+        finally:
+            connection.close()
+
+    def full_sync_cancelled() -> bool:
+        if not check_job_cancelled(job_tracker.id):
+            return False
+        GitLabSyncJobTracker.objects.filter(
+            parent_id=job_tracker.id, status__in=["pending", "running"]
+        ).update(status="cancelled", end_time=timezone.now())
+        return True
+
+    # Stage -> exception a stage raised instead of finishing its job tracker
+    stage_errors: dict[str, str] = {}
+
+    def record_stage_error(stage: str, error: Exception) -> None:
+        stage_errors[stage] = f"{type(error).__name__}: {error}"
+        sync_result.add_log(
+            f"❌ Stage {stage} raised {stage_errors[stage]}\n"
+            + "".join(traceback.format_exception(error)).rstrip()
+        )
+
+    finished_count = len(already_finished)
+    for stage, outcome in run_dependency_stages(
+        stages=stages,
+        run_stage=run_stage,
+        max_workers=max_parallel_stages,
+        completed=already_finished,
+        should_stop=full_sync_cancelled,
+        on_stage_error=record_stage_error,
+    ):
+        if outcome == "skipped":
+            sync_result.add_log(f"⊘ Stage {stage} already finished in an earlier attempt")
+            continue
+
+        finished_count += 1
+        stage_result: dict = {"status": outcome}
+        if stage in stage_errors:
+            stage_result["error"] = stage_errors[stage]
+        stage_tracker = (
+            GitLabSyncJobTracker.objects.filter(id=stage_job_ids[stage]).first()
+            if stage in stage_job_ids
+            else None
+        )
+        if stage_tracker is not None:
+            if outcome == "completed" and stage_tracker.status == "failed":
+                stage_result["status"] = "completed_with_errors"
+            elif outcome == "failed" and stage_tracker.status == "cancelled":
+                stage_result["status"] = "cancelled"
+            stage_result.update(
+                job_id=stage_tracker.id,
+                started_at=stage_tracker.start_time.isoformat() if stage_tracker.start_time else None,
+                finished_at=stage_tracker.end_time.isoformat() if stage_tracker.end_time else None,
+                duration_seconds=stage_tracker.duration_seconds,
+                error_count=len(stage_tracker.error_messages or []),
+            )
+
+        stage_results[stage] = stage_result
+        GitLabSyncJobTracker.objects.filter(id=job_tracker.id).update(stage_results=stage_results)
+
+        duration = stage_result.get("duration_seconds")
+        duration_text = f" in {duration:.1f}s" if duration is not None else ""
+        if stage_result["status"] == "completed":
+            sync_result.add_success()
+            message = f"✓ Stage {stage} completed{duration_text}"
+        elif stage_result["status"] == "completed_with_errors":
+            sync_result.add_success()
+            message = (
+                f"⚠️ Stage {stage} completed with {stage_result['error_count']} errors{duration_text} "
+                f"(job #{stage_result['job_id']})"
+            )
+        elif stage_result["status"] == "blocked":
+            sync_result.add_skip()
+            message = f"⊘ Stage {stage} not run - a stage it depends on failed"
+        else:
+            sync_result.add_failure(
+                f"Stage {stage} {stage_result['status']}"
+                + (f": {stage_result['error']}" if "error" in stage_result else "")
+            )
+            message = f"❌ Stage {stage} {stage_result['status']}{duration_text}"
+
+        sync_result.update_progress(finished_count, len(stages), message)
+
+    if check_job_cancelled(job_tracker.id):
+        sync_result.add_log("⚠️ Job cancelled by user, remaining stages were not started")
+        sync_result.finish()
+        print(f"[GitLabSync] {sync_result}")
+        return
+
+    sync_result.update_progress(len(stages), len(stages), None)
+
+    sync_result.add_log("Stage timings:")
+    for stage in stages:
+        result = stage_results.get(stage, {})
+        duration = result.get("duration_seconds")
+        sync_result.add_log(
+            f"  {stage}: {result.get('status', 'not run')}"
+            + (f" ({duration:.1f}s)" if duration is not None else "")
+        )
+
+    sync_result.add_log(
+        f"✓ Full sync complete: {sync_result.synced_count} stages finished, "
+        f"{sync_result.skipped_count} blocked, {sync_result.failed_count} failed"
+    )
+    sync_result.finish()
+    print(f"[GitLabSync] {sync_result}")
+
+
+def gitlab_sync_full_sync_api(
+    request: HttpRequest,
+) -> JsonResponse | HttpResponse:
+    """
+    Sync every GitLab entity in dependency order with one parent job.
+
+    Independent stages run concurrently; each stage gets its own job tracker and
+    the parent records per-stage timings. ``?stages=users,pipelines`` reruns only
+    those stages and everything downstream of them.
+
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
+    """
+    job_tracker = enqueue_sync_job("full-sync", request)
+
+    return JsonResponse(
+        data={"success": True, "job_id": job_tracker.id, "job_type": "full-sync"}
+    )
@@ -19,8 +19,8 @@ from gitlab_sync.models import GitLabSyncGroup, GitLabSyncJobTracker
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -345,9 +345,10 @@ def gitlab_sync_groups_api(
     This is the FIRST endpoint to call - it syncs the top-level group and all
     subgroups. Projects sync depends on groups existing first.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("groups", _sync_groups_background, request)
+    job_tracker = enqueue_sync_job("groups", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "groups"}
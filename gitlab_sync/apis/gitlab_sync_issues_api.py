@@ -1,6 +1,5 @@
 from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, JsonResponse
-from django.utils import timezone
 from gitlab import Gitlab
 
 from core.models.this_server_configuration import ThisServerConfiguration
@@ -19,10 +18,78 @@ from gitlab_sync.models import (
     GitLabSyncUser,
 )
 from gitlab_sync.utilities import (
+    BulkUpsertPipeline,
+    ForeignKeyReference,
+    ManyToManyReference,
+    SyncCursors,
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
+    is_full_resync_requested,
+)
+
+
+def _build_issue_fields(issue_dict: dict) -> dict:
+    """Map a GitLab issue payload to GitLabSyncIssue column values."""
+    references = issue_dict.get("references") or {}
+    task_completion_status = issue_dict.get("task_completion_status") or {}
+    time_stats = issue_dict.get("time_stats") or {}
+    return {
+        "iid": issue_dict.get("iid"),
+        "title": issue_dict.get("title"),
+        "description": issue_dict.get("description"),
+        "state": issue_dict.get("state"),
+        "web_url": issue_dict.get("web_url"),
+        "references_short": references.get("short"),
+        "references_relative": references.get("relative"),
+        "references_long": references.get("full"),
+        "has_tasks": issue_dict.get("has_tasks"),
+        "task_completion_status_count": task_completion_status.get("count"),
+        "task_completion_status_completed_count": task_completion_status.get("completed_count"),
+        "time_stats_time_estimate": time_stats.get("time_estimate"),
+        "time_stats_total_time_spent": time_stats.get("total_time_spent"),
+        "time_stats_human_time_estimate": time_stats.get("human_time_estimate"),
+        "time_stats_human_total_time_spent": time_stats.get("human_total_time_spent"),
+        "blocking_issues_count": issue_dict.get("blocking_issues_count"),
+        "issue_type": issue_dict.get("issue_type"),
+        "type": issue_dict.get("type"),
+        "user_notes_count": issue_dict.get("user_notes_count"),
+        "weight": issue_dict.get("weight"),
+        "severity": issue_dict.get("severity"),
+        "due_date": issue_dict.get("due_date"),
+        "confidential": issue_dict.get("confidential"),
+        "created_at": convert_and_enforce_utc_timezone(
+            datetime_string=issue_dict.get("created_at")
+        ),
+        "updated_at": convert_and_enforce_utc_timezone(
+            datetime_string=issue_dict.get("updated_at")
+        ),
+        "closed_at": convert_and_enforce_utc_timezone(
+            datetime_string=issue_dict.get("closed_at")
+        ),
+    }
+
+
+ISSUE_UPSERT_PIPELINE = BulkUpsertPipeline(
+    model=GitLabSyncIssue,
+    entity_label="issue",
+    build_fields=_build_issue_fields,
+    foreign_keys=[
+        ForeignKeyReference(field="author", model=GitLabSyncUser, source_key="author"),
+        ForeignKeyReference(field="closed_by", model=GitLabSyncUser, source_key="closed_by"),
+        ForeignKeyReference(field="epic", model=GitLabSyncEpic, source_key="epic"),
+        ForeignKeyReference(
+            field="milestone", model=GitLabSyncMilestone, source_key="milestone", lookup_field="gitlab_id"
+        ),
+        ForeignKeyReference(
+            field="iteration", model=GitLabSyncIteration, source_key="iteration", lookup_field="gitlab_id"
+        ),
+    ],
+    many_to_many=[
+        ManyToManyReference(field="assignees", model=GitLabSyncUser, source_key="assignees"),
+    ],
 )
 
 
@@ -56,7 +123,40 @@ def _sync_issues_background(
         f"Syncing issues from {project_count} projects (max {max_issues} per project)..."
     )
 
-    for proj_idx, project in enumerate(projects, 1):
+    cursors = SyncCursors.load(
+        entity_type="issues", full_resync=is_full_resync_requested(request)
+    )
+    if cursors.full_resync:
+        sync_result.add_log("🔄 Full resync requested - ignoring stored cursors")
+    else:
+        sync_result.add_log(
+            f"🔖 Fetching only changes since the last sync for {cursors.stored_count} projects"
+        )
+
+    def fetch_issues(project: GitLabSyncProject) -> tuple[list[dict] | None, str | None]:
+        return handle_gitlab_api_errors(
+            func=lambda: [
+                i.asdict()
+                for i in git_lab_client.projects.get(id=project.id, lazy=True)
+                .issues.list(
+                    per_page=100,
+                    page=1,
+                    max_pages=max(1, max_issues // 100),
+                    **cursors.updated_after_parameters(project.id),
+                )
+            ],
+            entity_name=f"Issues for project {project.path_with_namespace}",
+            max_retries=3,
+        )
+
+    for proj_idx, (project, (issues, error)) in enumerate(
+        fetch_concurrently(
+            items=projects,
+            fetch=fetch_issues,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         # Check if job was cancelled
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
@@ -68,17 +168,7 @@ def _sync_issues_background(
         sync_result.update_progress(
             proj_idx - 1,
             project_count,
-            f"📥 About to fetch issues from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
-        )
-
-        issues, error = handle_gitlab_api_errors(
-            func=lambda: [
-                i.asdict()
-                for i in git_lab_client.projects.get(id=project.id, lazy=True)
-                .issues.list(per_page=100, page=1, max_pages=max(1, max_issues // 100))
-            ],
-            entity_name=f"Issues for project {project.path_with_namespace}",
-            max_retries=3,
+            f"📥 Fetched issues from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
         )
 
         if error:
@@ -108,141 +198,31 @@ def _sync_issues_background(
 
         sync_result.add_log(f"✓ Fetched {len(issues)} issues from {project.path_with_namespace}, about to process...")
 
-        # Process each issue immediately
-        for issue_dict in issues:
-            # Check if job was cancelled
-            if check_job_cancelled(sync_result.job_tracker_id):
-                sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
-                sync_result.finish()
-                print(f"[GitLabSync] {sync_result}")
-                return
-
-            issue_id: int | None = issue_dict.get("id")
-
-            if issue_id is None:
-                sync_result.add_skip()
-                continue
-
-            try:
-                sync_result.add_log(f"💾 About to get_or_create issue {issue_id} in database...")
-                issue, created = GitLabSyncIssue.objects.get_or_create(
-                    id=issue_id
-                )
-                sync_result.add_log(f"✓ Database get_or_create succeeded for issue {issue_id} (created={created})")
-
-                # Check if we need to update (compare updated_at from GitLab with our stored updated_at)
-                issue_updated_at = convert_and_enforce_utc_timezone(
-                    datetime_string=issue_dict.get("updated_at")
-                )
-
-                needs_update = created or (
-                    issue.updated_at is None
-                    or (
-                        issue_updated_at
-                        and issue_updated_at > issue.updated_at
-                    )
-                )
-
-                if not needs_update:
-                    sync_result.add_skip()
-                    sync_result.add_log(f"⊘ Skipped unchanged issue #{issue_id}")
-                    continue
-
-                # Update issue fields
-                issue.project = GitLabSyncProject.objects.filter(
-                    id=project.id
-                ).first()
-
-                # Handle author
-                author_dict = issue_dict.get("author")
-                if author_dict:
-                    user = GitLabSyncUser.objects.filter(id=author_dict.get("id")).first()
-                    if user:
-                        issue.author = user
-
-                # Handle closed_by
-                closed_by_dict = issue_dict.get("closed_by")
-                if closed_by_dict:
-                    user = GitLabSyncUser.objects.filter(id=closed_by_dict.get("id")).first()
-                    if user:
-                        issue.closed_by = user
-
-                # Handle epic
-                epic_dict = issue_dict.get("epic")
-                if epic_dict:
-                    epic = GitLabSyncEpic.objects.filter(id=epic_dict.get("id")).first()
-                    if epic:
-                        issue.epic = epic
-
-                # Handle milestone
-                milestone_dict = issue_dict.get("milestone")
-                if milestone_dict:
-                    milestone = GitLabSyncMilestone.objects.filter(id=milestone_dict.get("id")).first()
-                    if milestone:
-                        issue.milestone = milestone
-
-                # Handle iteration
-                iteration_dict = issue_dict.get("iteration")
-                if iteration_dict:
-                    iteration = GitLabSyncIteration.objects.filter(id=iteration_dict.get("id")).first()
-                    if iteration:
-                        issue.iteration = iteration
-
-                issue.iid = issue_dict.get("iid")
-                issue.title = issue_dict.get("title")
-                issue.description = issue_dict.get("description")
-                issue.state = issue_dict.get("state")
-                issue.web_url = issue_dict.get("web_url")
-                issue.references_short = issue_dict.get("references", {}).get("short")
-                issue.references_relative = issue_dict.get("references", {}).get("relative")
-                issue.references_full = issue_dict.get("references", {}).get("full")
-                issue.has_tasks = issue_dict.get("has_tasks")
-                issue.task_status = issue_dict.get("task_status")
-                issue.task_completion_status_count = issue_dict.get("task_completion_status", {}).get("count")
-                issue.task_completion_status_completed_count = issue_dict.get("task_completion_status", {}).get("completed_count")
-                issue.time_stats_time_estimate = issue_dict.get("time_stats", {}).get("time_estimate")
-                issue.time_stats_total_time_spent = issue_dict.get("time_stats", {}).get("total_time_spent")
-                issue.time_stats_human_time_estimate = issue_dict.get("time_stats", {}).get("human_time_estimate")
-                issue.time_stats_human_total_time_spent = issue_dict.get("time_stats", {}).get("human_total_time_spent")
-                issue.blocking_issues_count = issue_dict.get("blocking_issues_count")
-                issue.issue_type = issue_dict.get("issue_type")
-                issue.type = issue_dict.get("type")
-                issue.user_notes_count = issue_dict.get("user_notes_count")
-                issue.weight = issue_dict.get("weight")
-                issue.severity = issue_dict.get("severity")
-                issue.due_date = issue_dict.get("due_date")
-                issue.confidential = issue_dict.get("confidential")
-
-                issue.created_at = convert_and_enforce_utc_timezone(
-                    datetime_string=issue_dict.get("created_at")
-                )
-                issue.updated_at = issue_updated_at
-                issue.closed_at = convert_and_enforce_utc_timezone(
-                    datetime_string=issue_dict.get("closed_at")
-                )
-
-                sync_result.add_log(f"💾 About to save issue {issue_id} to database...")
-                issue.save()
-                sync_result.add_log(f"✓ Database save succeeded for issue {issue_id}")
-
-                # Handle many-to-many assignees
-                assignees_data = issue_dict.get("assignees", [])
-                if assignees_data:
-                    assignee_ids = [a.get("id") for a in assignees_data if a.get("id")]
-                    assignees = GitLabSyncUser.objects.filter(id__in=assignee_ids)
-                    issue.assignees.set(assignees)
+        # Check if job was cancelled
+        if check_job_cancelled(sync_result.job_tracker_id):
+            sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
+            sync_result.finish()
+            print(f"[GitLabSync] {sync_result}")
+            return
 
-                sync_result.add_success()
+        # Write the whole page with a fixed number of queries
+        page_result = ISSUE_UPSERT_PIPELINE.upsert_page(
+            entity_dicts=issues,
+            sync_result=sync_result,
+            extra_fields={"project": project},
+        )
+        sync_result.add_log(
+            f"💾 Saved issues for {project.path_with_namespace}: "
+            f"{page_result.created_count} created, {page_result.updated_count} updated, "
+            f"{page_result.skipped_count} unchanged, {page_result.failed_count} failed"
+        )
 
-            except Exception as error:
-                import traceback
-                error_trace = traceback.format_exc()
-                error_msg = f"Failed to save issue {issue_id}: {str(error)}"
-                sync_result.add_failure(error_msg)
-                sync_result.add_log(f"❌ {error_msg}")
-                print(f"[GitLabSync] {error_msg}")
-                print(f"[GitLabSync] Stack trace:\n{error_trace}")
-                continue
+        # Only move the cursor once every row in the page was written
+        if page_result.failed_count == 0:
+            cursors.advance(
+                project_id=project.id,
+                timestamps=(i.get("updated_at") for i in issues),
+            )
 
     # Final progress update
     sync_result.update_progress(project_count, project_count, None)
@@ -264,9 +244,10 @@ def gitlab_sync_issues_api(
     New functionality not present in the original git_lab app.
     Tracks issues for project management and tracking.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("issues", _sync_issues_background, request)
+    job_tracker = enqueue_sync_job("issues", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "issues"}
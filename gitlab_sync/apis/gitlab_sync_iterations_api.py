@@ -2,6 +2,7 @@ from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from gitlab import Gitlab
 
+from core.models.this_server_configuration import ThisServerConfiguration
 from core.utilities.cast_query_set import cast_query_set
 from core.utilities.convert_and_enforce_utc_timezone import (
     convert_and_enforce_utc_timezone,
@@ -15,8 +16,9 @@ from gitlab_sync.models import (
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -37,6 +39,8 @@ def _sync_iterations_background(
         print(f"[GitLabSync] {sync_result}")
         return
 
+    config = ThisServerConfiguration.current()
+
     groups: QuerySet[GitLabSyncGroup] = cast_query_set(
         typ=GitLabSyncGroup,
         val=GitLabSyncGroup.objects.all(),
@@ -45,7 +49,25 @@ def _sync_iterations_background(
     group_count = groups.count()
     sync_result.add_log(f"Syncing iterations from {group_count} groups...")
 
-    for grp_idx, group in enumerate(groups, 1):
+    def fetch_iterations(group: GitLabSyncGroup) -> tuple[list[dict] | None, str | None]:
+        return handle_gitlab_api_errors(
+            func=lambda: [
+                i.asdict()
+                for i in git_lab_client.groups.get(id=group.id, lazy=True)
+                .iterations.list(get_all=True)
+            ],
+            entity_name=f"Iterations for group {group.path}",
+            max_retries=3,
+        )
+
+    for grp_idx, (group, (iterations, error)) in enumerate(
+        fetch_concurrently(
+            items=groups,
+            fetch=fetch_iterations,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
             sync_result.finish()
@@ -55,17 +77,7 @@ def _sync_iterations_background(
         sync_result.update_progress(
             grp_idx - 1,
             group_count,
-            f"📥 Fetching iterations from group {group.path} ({grp_idx}/{group_count})...",
-        )
-
-        iterations, error = handle_gitlab_api_errors(
-            func=lambda: [
-                i.asdict()
-                for i in git_lab_client.groups.get(id=group.id, lazy=True)
-                .iterations.list(get_all=True)
-            ],
-            entity_name=f"Iterations for group {group.path}",
-            max_retries=3,
+            f"📥 Fetched iterations from group {group.path} ({grp_idx}/{group_count})...",
         )
 
         if error:
@@ -145,11 +157,10 @@ def gitlab_sync_iterations_api(
 
     Iterations are group-level time-boxed periods for agile planning.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background(
-        "iterations", _sync_iterations_background, request
-    )
+    job_tracker = enqueue_sync_job("iterations", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "iterations"}
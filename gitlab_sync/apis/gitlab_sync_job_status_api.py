@@ -1,5 +1,6 @@
 from django.http import HttpRequest, JsonResponse
 
+from core.utilities.coerce_integer import coerce_integer
 from gitlab_sync.models import GitLabSyncJobTracker
 
 
@@ -9,6 +10,9 @@ def gitlab_sync_job_status_api(request: HttpRequest, job_id: int) -> JsonRespons
 
     Polled by frontend to display real-time progress updates.
 
+    Pass ``?log_offset=N`` to receive only log lines after the first N; the
+    response's ``log_count`` is the offset to send on the next poll.
+
     Args:
         request: HTTP request
         job_id: ID of the job tracker to query
@@ -21,6 +25,9 @@ def gitlab_sync_job_status_api(request: HttpRequest, job_id: int) -> JsonRespons
     if not job_tracker:
         return JsonResponse(data={"success": False, "error": "Job not found"}, status=404)
 
+    log_offset = coerce_integer(request.GET.get("log_offset"))
+    detailed_logs = job_tracker.get_log_lines(offset=log_offset)
+
     return JsonResponse(
         data={
             "success": True,
@@ -38,11 +45,23 @@ def gitlab_sync_job_status_api(request: HttpRequest, job_id: int) -> JsonRespons
             ),
             "duration_seconds": job_tracker.duration_seconds,
             "error_messages": job_tracker.error_messages or [],
-            "detailed_logs": job_tracker.detailed_logs or [],
+            "detailed_logs": detailed_logs,
+            "log_offset": log_offset,
+            "log_count": log_offset + len(detailed_logs),
+            "is_pending": job_tracker.is_pending,
             "is_running": job_tracker.is_running,
             "is_completed": job_tracker.is_completed,
             "is_failed": job_tracker.is_failed,
             "is_cancelled": job_tracker.is_cancelled,
+            "priority": job_tracker.priority,
+            "attempts": job_tracker.attempts,
+            "lease_owner": job_tracker.lease_owner,
+            "heartbeat_at": (
+                job_tracker.heartbeat_at.isoformat() if job_tracker.heartbeat_at else None
+            ),
+            "parent_job_id": job_tracker.parent_id,
+            "stage_results": job_tracker.stage_results or {},
+            "request_metrics": job_tracker.request_metrics or {},
             "user_username": job_tracker.user.username if job_tracker.user else None,
         }
     )
@@ -18,8 +18,8 @@ from gitlab_sync.models import (
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -219,9 +219,10 @@ def gitlab_sync_jobs_api(
     New functionality not present in the original git_lab app.
     Tracks individual build/test/deploy jobs within pipelines.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("jobs", _sync_jobs_background, request)
+    job_tracker = enqueue_sync_job("jobs", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "jobs"}
@@ -1,6 +1,5 @@
 from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, JsonResponse
-from django.utils import timezone
 from gitlab import Gitlab
 
 from core.models.this_server_configuration import ThisServerConfiguration
@@ -19,10 +18,93 @@ from gitlab_sync.models import (
     GitLabSyncUser,
 )
 from gitlab_sync.utilities import (
+    BulkUpsertPipeline,
+    ForeignKeyReference,
+    GitLabPageStream,
+    ManyToManyReference,
+    SyncCursors,
     SyncResult,
     check_job_cancelled,
-    handle_gitlab_api_errors,
-    run_sync_in_background,
+    enqueue_sync_job,
+    fetch_concurrently,
+    is_full_resync_requested,
+)
+
+
+def _build_merge_request_fields(mr_dict: dict) -> dict:
+    """Map a GitLab merge request payload to GitLabSyncMergeRequest column values."""
+    references = mr_dict.get("references") or {}
+    task_completion_status = mr_dict.get("task_completion_status") or {}
+    time_stats = mr_dict.get("time_stats") or {}
+    diff_refs = mr_dict.get("diff_refs") or {}
+    return {
+        "iid": mr_dict.get("iid"),
+        "title": mr_dict.get("title"),
+        "description": mr_dict.get("description"),
+        "state": mr_dict.get("state"),
+        "web_url": mr_dict.get("web_url"),
+        "references_short": references.get("short"),
+        "references_relative": references.get("relative"),
+        "references_long": references.get("full"),
+        "task_completion_status_count": task_completion_status.get("count"),
+        "task_completion_status_completed_count": task_completion_status.get("completed_count"),
+        "time_stats_time_estimate": time_stats.get("time_estimate"),
+        "time_stats_total_time_spent": time_stats.get("total_time_spent"),
+        "time_stats_human_time_estimate": time_stats.get("human_time_estimate"),
+        "time_stats_human_total_time_spent": time_stats.get("human_total_time_spent"),
+        "blocking_discussions_resolved": mr_dict.get("blocking_discussions_resolved"),
+        "draft": mr_dict.get("draft"),
+        "has_conflicts": mr_dict.get("has_conflicts"),
+        "sha": mr_dict.get("sha"),
+        "source_branch": mr_dict.get("source_branch"),
+        "target_branch": mr_dict.get("target_branch"),
+        "squash": mr_dict.get("squash"),
+        "squash_commit_sha": mr_dict.get("squash_commit_sha"),
+        "merge_status": mr_dict.get("merge_status"),
+        "user_notes_count": mr_dict.get("user_notes_count"),
+        "upvotes": mr_dict.get("upvotes"),
+        "downvotes": mr_dict.get("downvotes"),
+        "created_at": convert_and_enforce_utc_timezone(
+            datetime_string=mr_dict.get("created_at")
+        ),
+        "updated_at": convert_and_enforce_utc_timezone(
+            datetime_string=mr_dict.get("updated_at")
+        ),
+        "closed_at": convert_and_enforce_utc_timezone(
+            datetime_string=mr_dict.get("closed_at")
+        ),
+        "merged_at": convert_and_enforce_utc_timezone(
+            datetime_string=mr_dict.get("merged_at")
+        ),
+        "prepared_at": convert_and_enforce_utc_timezone(
+            datetime_string=mr_dict.get("prepared_at")
+        ),
+        "diff_refs_base_sha": diff_refs.get("base_sha"),
+        "diff_refs_head_sha": diff_refs.get("head_sha"),
+        "diff_refs_start_sha": diff_refs.get("start_sha"),
+    }
+
+
+MERGE_REQUEST_UPSERT_PIPELINE = BulkUpsertPipeline(
+    model=GitLabSyncMergeRequest,
+    entity_label="merge request",
+    build_fields=_build_merge_request_fields,
+    foreign_keys=[
+        ForeignKeyReference(field="author", model=GitLabSyncUser, source_key="author"),
+        ForeignKeyReference(field="closed_by", model=GitLabSyncUser, source_key="closed_by"),
+        ForeignKeyReference(field="merged_by", model=GitLabSyncUser, source_key="merged_by"),
+        ForeignKeyReference(field="head_pipeline", model=GitLabSyncPipeline, source_key="head_pipeline"),
+        ForeignKeyReference(
+            field="milestone", model=GitLabSyncMilestone, source_key="milestone", lookup_field="gitlab_id"
+        ),
+        ForeignKeyReference(
+            field="iteration", model=GitLabSyncIteration, source_key="iteration", lookup_field="gitlab_id"
+        ),
+    ],
+    many_to_many=[
+        ManyToManyReference(field="assignees", model=GitLabSyncUser, source_key="assignees"),
+        ManyToManyReference(field="reviewers", model=GitLabSyncUser, source_key="reviewers"),
+    ],
 )
 
 
@@ -56,7 +138,35 @@ def _sync_merge_requests_background(
         f"Syncing merge requests from {project_count} projects (max {max_merge_requests} per project)..."
     )
 
-    for proj_idx, project in enumerate(projects, 1):
+    cursors = SyncCursors.load(
+        entity_type="merge-requests", full_resync=is_full_resync_requested(request)
+    )
+    if cursors.full_resync:
+        sync_result.add_log("🔄 Full resync requested - ignoring stored cursors")
+    else:
+        sync_result.add_log(
+            f"🔖 Fetching only changes since the last sync for {cursors.stored_count} projects"
+        )
+
+    def fetch_merge_requests(
+        project: GitLabSyncProject,
+    ) -> tuple[GitLabPageStream | None, str | None]:
+        # Only the first page is fetched here; later pages stream in as they are written
+        return GitLabPageStream.open(
+            list_objects=git_lab_client.projects.get(id=project.id, lazy=True).mergerequests.list,
+            entity_name=f"Merge requests for project {project.path_with_namespace}",
+            max_items=max_merge_requests,
+            **cursors.updated_after_parameters(project.id),
+        )
+
+    for proj_idx, (project, (merge_request_pages, error)) in enumerate(
+        fetch_concurrently(
+            items=projects,
+            fetch=fetch_merge_requests,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         # Check if job was cancelled
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
@@ -68,17 +178,7 @@ def _sync_merge_requests_background(
         sync_result.update_progress(
             proj_idx - 1,
             project_count,
-            f"📥 About to fetch merge requests from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
-        )
-
-        merge_requests, error = handle_gitlab_api_errors(
-            func=lambda: [
-                mr.asdict()
-                for mr in git_lab_client.projects.get(id=project.id, lazy=True)
-                .mergerequests.list(per_page=100, page=1, max_pages=max(1, max_merge_requests // 100))
-            ],
-            entity_name=f"Merge requests for project {project.path_with_namespace}",
-            max_retries=3,
+            f"📥 Fetched merge requests from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
         )
 
         if error:
@@ -102,14 +202,14 @@ def _sync_merge_requests_background(
             sync_result.add_failure(error)
             continue
 
-        if not merge_requests:
+        # The first page was fetched with the stream, so an empty one means no rows
+        if merge_request_pages.item_count == 0:
             sync_result.add_log(f"⊘ No merge requests found in project {project.path_with_namespace}")
             continue
 
-        sync_result.add_log(f"✓ Fetched {len(merge_requests)} merge requests from {project.path_with_namespace}, about to process...")
-
-        # Process each merge request immediately
-        for mr_dict in merge_requests:
+        project_had_failures = False
+        updated_at_values: list[str | None] = []
+        for merge_requests in merge_request_pages.pages(sync_result=sync_result):
             # Check if job was cancelled
             if check_job_cancelled(sync_result.job_tracker_id):
                 sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
@@ -117,163 +217,37 @@ def _sync_merge_requests_background(
                 print(f"[GitLabSync] {sync_result}")
                 return
 
-            mr_id: int | None = mr_dict.get("id")
-
-            if mr_id is None:
-                sync_result.add_skip()
-                continue
-
-            try:
-                sync_result.add_log(f"💾 About to get_or_create merge request {mr_id} in database...")
-                merge_request, created = GitLabSyncMergeRequest.objects.get_or_create(
-                    id=mr_id
-                )
-                sync_result.add_log(f"✓ Database get_or_create succeeded for merge request {mr_id} (created={created})")
-
-                # Check if we need to update (compare updated_at from GitLab with our stored updated_at)
-                mr_updated_at = convert_and_enforce_utc_timezone(
-                    datetime_string=mr_dict.get("updated_at")
-                )
-
-                needs_update = created or (
-                    merge_request.updated_at is None
-                    or (
-                        mr_updated_at
-                        and mr_updated_at > merge_request.updated_at
-                    )
-                )
-
-                if not needs_update:
-                    sync_result.add_skip()
-                    sync_result.add_log(f"⊘ Skipped unchanged merge request #{mr_id}")
-                    continue
-
-                # Update merge request fields
-                merge_request.project = GitLabSyncProject.objects.filter(
-                    id=project.id
-                ).first()
-
-                # Handle author
-                author_dict = mr_dict.get("author")
-                if author_dict:
-                    user = GitLabSyncUser.objects.filter(id=author_dict.get("id")).first()
-                    if user:
-                        merge_request.author = user
-
-                # Handle closed_by
-                closed_by_dict = mr_dict.get("closed_by")
-                if closed_by_dict:
-                    user = GitLabSyncUser.objects.filter(id=closed_by_dict.get("id")).first()
-                    if user:
-                        merge_request.closed_by = user
-
-                # Handle merged_by
-                merged_by_dict = mr_dict.get("merged_by")
-                if merged_by_dict:
-                    user = GitLabSyncUser.objects.filter(id=merged_by_dict.get("id")).first()
-                    if user:
-                        merge_request.merged_by = user
-
-                # Handle head_pipeline
-                head_pipeline_dict = mr_dict.get("head_pipeline")
-                if head_pipeline_dict:
-                    pipeline = GitLabSyncPipeline.objects.filter(id=head_pipeline_dict.get("id")).first()
-                    if pipeline:
-                        merge_request.head_pipeline = pipeline
-
-                # Handle milestone
-                milestone_dict = mr_dict.get("milestone")
-                if milestone_dict:
-                    milestone = GitLabSyncMilestone.objects.filter(id=milestone_dict.get("id")).first()
-                    if milestone:
-                        merge_request.milestone = milestone
-
-                # Handle iteration
-                iteration_dict = mr_dict.get("iteration")
-                if iteration_dict:
-                    iteration = GitLabSyncIteration.objects.filter(id=iteration_dict.get("id")).first()
-                    if iteration:
-                        merge_request.iteration = iteration
-
-                merge_request.iid = mr_dict.get("iid")
-                merge_request.title = mr_dict.get("title")
-                merge_request.description = mr_dict.get("description")
-                merge_request.state = mr_dict.get("state")
-                merge_request.web_url = mr_dict.get("web_url")
-                merge_request.references_short = mr_dict.get("references", {}).get("short")
-                merge_request.references_relative = mr_dict.get("references", {}).get("relative")
-                merge_request.references_full = mr_dict.get("references", {}).get("full")
-                merge_request.has_tasks = mr_dict.get("has_tasks")
-                merge_request.task_status = mr_dict.get("task_status")
-                merge_request.task_completion_status_count = mr_dict.get("task_completion_status", {}).get("count")
-                merge_request.task_completion_status_completed_count = mr_dict.get("task_completion_status", {}).get("completed_count")
-                merge_request.time_stats_time_estimate = mr_dict.get("time_stats", {}).get("time_estimate")
-                merge_request.time_stats_total_time_spent = mr_dict.get("time_stats", {}).get("total_time_spent")
-                merge_request.time_stats_human_time_estimate = mr_dict.get("time_stats", {}).get("human_time_estimate")
-                merge_request.time_stats_human_total_time_spent = mr_dict.get("time_stats", {}).get("human_total_time_spent")
-                merge_request.blocking_discussions_resolved = mr_dict.get("blocking_discussions_resolved")
-                merge_request.draft = mr_dict.get("draft")
-                merge_request.has_conflicts = mr_dict.get("has_conflicts")
-                merge_request.sha = mr_dict.get("sha")
-                merge_request.source_branch = mr_dict.get("source_branch")
-                merge_request.target_branch = mr_dict.get("target_branch")
-                merge_request.squash = mr_dict.get("squash")
-                merge_request.squash_commit_sha = mr_dict.get("squash_commit_sha")
-                merge_request.merge_status = mr_dict.get("merge_status")
-                merge_request.user_notes_count = mr_dict.get("user_notes_count")
-                merge_request.upvotes = mr_dict.get("upvotes")
-                merge_request.downvotes = mr_dict.get("downvotes")
-
-                # Handle diff_refs
-                diff_refs = mr_dict.get("diff_refs", {})
-                if diff_refs:
-                    merge_request.diff_refs_base_sha = diff_refs.get("base_sha")
-                    merge_request.diff_refs_head_sha = diff_refs.get("head_sha")
-                    merge_request.diff_refs_start_sha = diff_refs.get("start_sha")
-
-                merge_request.created_at = convert_and_enforce_utc_timezone(
-                    datetime_string=mr_dict.get("created_at")
-                )
-                merge_request.updated_at = mr_updated_at
-                merge_request.closed_at = convert_and_enforce_utc_timezone(
-                    datetime_string=mr_dict.get("closed_at")
-                )
-                merge_request.merged_at = convert_and_enforce_utc_timezone(
-                    datetime_string=mr_dict.get("merged_at")
-                )
-                merge_request.prepared_at = convert_and_enforce_utc_timezone(
-                    datetime_string=mr_dict.get("prepared_at")
-                )
-
-                sync_result.add_log(f"💾 About to save merge request {mr_id} to database...")
-                merge_request.save()
-                sync_result.add_log(f"✓ Database save succeeded for merge request {mr_id}")
-
-                # Handle many-to-many assignees
-                assignees_data = mr_dict.get("assignees", [])
-                if assignees_data:
-                    assignee_ids = [a.get("id") for a in assignees_data if a.get("id")]
-                    assignees = GitLabSyncUser.objects.filter(id__in=assignee_ids)
-                    merge_request.assignees.set(assignees)
+            # Write the whole page with a fixed number of queries
+            page_result = MERGE_REQUEST_UPSERT_PIPELINE.upsert_page(
+                entity_dicts=merge_requests,
+                sync_result=sync_result,
+                extra_fields={"project": project},
+            )
+            sync_result.add_log(
+                f"💾 Saved merge requests for {project.path_with_namespace} "
+                f"(page {merge_request_pages.page_number}): "
+                f"{page_result.created_count} created, {page_result.updated_count} updated, "
+                f"{page_result.skipped_count} unchanged, {page_result.failed_count} failed"
+            )
+            project_had_failures = project_had_failures or page_result.failed_count > 0
+            updated_at_values.extend(mr.get("updated_at") for mr in merge_requests)
 
-                # Handle many-to-many reviewers
-                reviewers_data = mr_dict.get("reviewers", [])
-                if reviewers_data:
-                    reviewer_ids = [r.get("id") for r in reviewers_data if r.get("id")]
-                    reviewers = GitLabSyncUser.objects.filter(id__in=reviewer_ids)
-                    merge_request.reviewers.set(reviewers)
+        if merge_request_pages.error:
+            sync_result.add_log(
+                f"❌ Error fetching merge requests for {project.path_with_namespace} "
+                f"after page {merge_request_pages.page_number}: {merge_request_pages.error}"
+            )
+            sync_result.add_failure(merge_request_pages.error)
+            continue
 
-                sync_result.add_success()
+        sync_result.add_log(
+            f"✓ Synced {merge_request_pages.item_count} merge requests from {project.path_with_namespace} "
+            f"in {merge_request_pages.page_number} pages"
+        )
 
-            except Exception as error:
-                import traceback
-                error_trace = traceback.format_exc()
-                error_msg = f"Failed to save merge request {mr_id}: {str(error)}"
-                sync_result.add_failure(error_msg)
-                sync_result.add_log(f"❌ {error_msg}")
-                print(f"[GitLabSync] {error_msg}")
-                print(f"[GitLabSync] Stack trace:\n{error_trace}")
-                continue
+        # Only move the cursor once every row of every page was written
+        if not project_had_failures:
+            cursors.advance(project_id=project.id, timestamps=updated_at_values)
 
     # Final progress update
     sync_result.update_progress(project_count, project_count, None)
@@ -295,9 +269,10 @@ def gitlab_sync_merge_requests_api(
     New functionality not present in the original git_lab app.
     Tracks merge requests for code review and deployment.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("merge-requests", _sync_merge_requests_background, request)
+    job_tracker = enqueue_sync_job("merge-requests", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "merge-requests"}
@@ -2,6 +2,7 @@ from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from gitlab import Gitlab
 
+from core.models.this_server_configuration import ThisServerConfiguration
 from core.utilities.cast_query_set import cast_query_set
 from core.utilities.convert_and_enforce_utc_timezone import (
     convert_and_enforce_utc_timezone,
@@ -16,8 +17,9 @@ from gitlab_sync.models import (
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -38,6 +40,8 @@ def _sync_milestones_background(
         print(f"[GitLabSync] {sync_result}")
         return
 
+    config = ThisServerConfiguration.current()
+
     # Sync project milestones
     projects: QuerySet[GitLabSyncProject] = cast_query_set(
         typ=GitLabSyncProject,
@@ -47,7 +51,25 @@ def _sync_milestones_background(
     project_count = projects.count()
     sync_result.add_log(f"Syncing milestones from {project_count} projects...")
 
-    for proj_idx, project in enumerate(projects, 1):
+    def fetch_project_milestones(project: GitLabSyncProject) -> tuple[list[dict] | None, str | None]:
+        return handle_gitlab_api_errors(
+            func=lambda: [
+                m.asdict()
+                for m in git_lab_client.projects.get(id=project.id, lazy=True)
+                .milestones.list(get_all=True)
+            ],
+            entity_name=f"Milestones for project {project.path_with_namespace}",
+            max_retries=3,
+        )
+
+    for proj_idx, (project, (milestones, error)) in enumerate(
+        fetch_concurrently(
+            items=projects,
+            fetch=fetch_project_milestones,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
             sync_result.finish()
@@ -57,17 +79,7 @@ def _sync_milestones_background(
         sync_result.update_progress(
             proj_idx - 1,
             project_count + 1,
-            f"📥 Fetching milestones from project {project.path_with_namespace} ({proj_idx}/{project_count})...",
-        )
-
-        milestones, error = handle_gitlab_api_errors(
-            func=lambda: [
-                m.asdict()
-                for m in git_lab_client.projects.get(id=project.id, lazy=True)
-                .milestones.list(get_all=True)
-            ],
-            entity_name=f"Milestones for project {project.path_with_namespace}",
-            max_retries=3,
+            f"📥 Fetched milestones from project {project.path_with_namespace} ({proj_idx}/{project_count})...",
         )
 
         if error:
@@ -143,7 +155,25 @@ def _sync_milestones_background(
     group_count = groups.count()
     sync_result.add_log(f"Syncing milestones from {group_count} groups...")
 
-    for grp_idx, group in enumerate(groups, 1):
+    def fetch_group_milestones(group: GitLabSyncGroup) -> tuple[list[dict] | None, str | None]:
+        return handle_gitlab_api_errors(
+            func=lambda: [
+                m.asdict()
+                for m in git_lab_client.groups.get(id=group.id, lazy=True)
+                .milestones.list(get_all=True)
+            ],
+            entity_name=f"Milestones for group {group.path}",
+            max_retries=3,
+        )
+
+    for grp_idx, (group, (milestones, error)) in enumerate(
+        fetch_concurrently(
+            items=groups,
+            fetch=fetch_group_milestones,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
             sync_result.finish()
@@ -153,17 +183,7 @@ def _sync_milestones_background(
         sync_result.update_progress(
             project_count + grp_idx - 1,
             project_count + group_count,
-            f"📥 Fetching milestones from group {group.path} ({grp_idx}/{group_count})...",
-        )
-
-        milestones, error = handle_gitlab_api_errors(
-            func=lambda: [
-                m.asdict()
-                for m in git_lab_client.groups.get(id=group.id, lazy=True)
-                .milestones.list(get_all=True)
-            ],
-            entity_name=f"Milestones for group {group.path}",
-            max_retries=3,
+            f"📥 Fetched milestones from group {group.path} ({grp_idx}/{group_count})...",
         )
 
         if error:
@@ -244,11 +264,10 @@ def gitlab_sync_milestones_api(
 
     New functionality for tracking project and group milestones.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background(
-        "milestones", _sync_milestones_background, request
-    )
+    job_tracker = enqueue_sync_job("milestones", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "milestones"}
@@ -20,10 +20,13 @@ from gitlab_sync.models import (
     GitLabSyncUser,
 )
 from gitlab_sync.utilities import (
+    SyncCursors,
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
+    is_full_resync_requested,
 )
 
 
@@ -63,6 +66,16 @@ def _sync_pipelines_background(
         f"(max {max_pipelines_per_project} per project, last {days_back} days)..."
     )
 
+    cursors = SyncCursors.load(
+        entity_type="pipelines", full_resync=is_full_resync_requested(request)
+    )
+    if cursors.full_resync:
+        sync_result.add_log("🔄 Full resync requested - ignoring stored cursors")
+    else:
+        sync_result.add_log(
+            f"🔖 Fetching only changes since the last sync for {cursors.stored_count} projects"
+        )
+
     # CRITICAL: Set all=False to only fetch first page, not all pages!
     # The all=True from get_common_query_parameters() causes it to fetch ALL pipelines
     limited_query_parameters = {
@@ -72,7 +85,34 @@ def _sync_pipelines_background(
         "get_all": False,  # Don't auto-paginate
     }
 
-    for proj_idx, project in enumerate(projects, 1):
+    def fetch_pipelines(project: GitLabSyncProject) -> tuple[list[dict] | None, str | None]:
+        query_parameters = dict(limited_query_parameters)
+        # The days-back window still applies when the cursor is older than it
+        updated_after = cursors.updated_after(project.id)
+        if updated_after is not None and updated_after > cutoff_date:
+            query_parameters.update(cursors.updated_after_parameters(project.id))
+
+        return handle_gitlab_api_errors(
+            func=lambda: [
+                p.asdict()
+                for p in cast(
+                    list[ProjectPipeline],
+                    git_lab_client.projects.get(id=project.id, lazy=True)
+                    .pipelines.list(**query_parameters),
+                )
+            ],
+            entity_name=f"Pipelines for project {project.path_with_namespace}",
+            max_retries=3,
+        )
+
+    for proj_idx, (project, (pipelines, error)) in enumerate(
+        fetch_concurrently(
+            items=projects,
+            fetch=fetch_pipelines,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         # Check if job was cancelled
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
@@ -84,20 +124,7 @@ def _sync_pipelines_background(
         sync_result.update_progress(
             proj_idx - 1,
             project_count,
-            f"📥 About to fetch pipelines from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
-        )
-
-        pipelines, error = handle_gitlab_api_errors(
-            func=lambda: [
-                p.asdict()
-                for p in cast(
-                    list[ProjectPipeline],
-                    git_lab_client.projects.get(id=project.id, lazy=True)
-                    .pipelines.list(**limited_query_parameters),
-                )
-            ],
-            entity_name=f"Pipelines for project {project.path_with_namespace}",
-            max_retries=3,
+            f"📥 Fetched pipelines from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
         )
 
         if error:
@@ -128,6 +155,7 @@ def _sync_pipelines_background(
         sync_result.add_log(f"✓ Fetched {len(pipelines)} pipelines from {project.path_with_namespace}, about to process...")
 
         # Process each pipeline immediately
+        project_had_failures = False
         for pipeline_dict in pipelines:
             # Check if job was cancelled
             if check_job_cancelled(sync_result.job_tracker_id):
@@ -214,8 +242,16 @@ def _sync_pipelines_background(
                 sync_result.add_log(f"❌ {error_msg}")
                 print(f"[GitLabSync] {error_msg}")
                 print(f"[GitLabSync] Stack trace:\n{error_trace}")
+                project_had_failures = True
                 continue
 
+        # Only move the cursor once every pipeline in the page was written
+        if not project_had_failures:
+            cursors.advance(
+                project_id=project.id,
+                timestamps=(p.get("updated_at") for p in pipelines),
+            )
+
     # Final progress update
     sync_result.update_progress(project_count, project_count, None)
 
@@ -236,9 +272,10 @@ def gitlab_sync_pipelines_api(
     New functionality not present in the original git_lab app.
     Tracks pipeline executions for build/test/deploy monitoring.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("pipelines", _sync_pipelines_background, request)
+    job_tracker = enqueue_sync_job("pipelines", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "pipelines"}
@@ -16,8 +16,9 @@ from gitlab_sync.models import GitLabSyncGroup, GitLabSyncJobTracker, GitLabSync
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -79,37 +80,48 @@ def _sync_projects_background(
         "get_all": False,  # Don't auto-paginate
     }
 
-    for group_idx, git_lab_group in enumerate(git_lab_groups, 1):
-        # Check if job was cancelled
-        if check_job_cancelled(sync_result.job_tracker_id):
-            sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
-            sync_result.finish()
-            print(f"[GitLabSync] {sync_result}")
-            return
+    def fetch_projects(git_lab_group: GitLabSyncGroup) -> tuple[list[GroupProject] | None, str | None]:
+        return handle_gitlab_api_errors(
+            func=lambda: cast(
+                list[GroupProject],
+                git_lab_client.groups.get(id=git_lab_group.id, lazy=True).projects.list(
+                    **limited_query_parameters
+                ),
+            ),
+            entity_name=f"Projects for group {git_lab_group.full_path}",
+            max_retries=3,
+        )
 
-        # Skip groups in the skip list
+    # Skip groups in the skip list before any of them are fetched
+    groups_to_fetch: list[GitLabSyncGroup] = []
+    for git_lab_group in git_lab_groups:
         if git_lab_group.id in skip_group_ids:
             sync_result.add_log(
                 f"⊘ Skipping group {git_lab_group.full_path} (ID: {git_lab_group.id}) - in skip list"
             )
             continue
+        groups_to_fetch.append(git_lab_group)
+
+    for group_idx, (git_lab_group, (projects, error)) in enumerate(
+        fetch_concurrently(
+            items=groups_to_fetch,
+            fetch=fetch_projects,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
+        # Check if job was cancelled
+        if check_job_cancelled(sync_result.job_tracker_id):
+            sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
+            sync_result.finish()
+            print(f"[GitLabSync] {sync_result}")
+            return
 
         # Update progress at group level (more accurate than project level)
         sync_result.update_progress(
             group_idx - 1,
-            group_count,
-            f"📥 About to fetch projects from group {git_lab_group.full_path} (group {group_idx}/{group_count})...",
-        )
-
-        projects, error = handle_gitlab_api_errors(
-            func=lambda: cast(
-                list[GroupProject],
-                git_lab_client.groups.get(id=git_lab_group.id, lazy=True).projects.list(
-                    **limited_query_parameters
-                ),
-            ),
-            entity_name=f"Projects for group {git_lab_group.full_path}",
-            max_retries=3,
+            len(groups_to_fetch),
+            f"📥 Fetched projects from group {git_lab_group.full_path} (group {group_idx}/{len(groups_to_fetch)})...",
         )
 
         if error:
@@ -251,9 +263,10 @@ def gitlab_sync_projects_api(
     This API endpoint fetches projects from all GitLab groups and syncs them
     to the local database with enhanced error handling and retry logic.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("projects", _sync_projects_background, request)
+    job_tracker = enqueue_sync_job("projects", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "projects"}
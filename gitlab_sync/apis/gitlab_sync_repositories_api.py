@@ -2,6 +2,7 @@ from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from gitlab import Gitlab
 
+from core.models.this_server_configuration import ThisServerConfiguration
 from core.utilities.cast_query_set import cast_query_set
 from core.utilities.git_lab.get_git_lab_client import get_git_lab_client
 from gitlab_sync.models import (
@@ -12,8 +13,9 @@ from gitlab_sync.models import (
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -34,6 +36,8 @@ def _sync_repositories_background(
         print(f"[GitLabSync] {sync_result}")
         return
 
+    config = ThisServerConfiguration.current()
+
     projects: QuerySet[GitLabSyncProject] = cast_query_set(
         typ=GitLabSyncProject,
         val=GitLabSyncProject.objects.all(),
@@ -44,7 +48,22 @@ def _sync_repositories_background(
         f"Syncing repositories from {project_count} projects..."
     )
 
-    for proj_idx, project in enumerate(projects, 1):
+    def fetch_repository(project: GitLabSyncProject) -> tuple[dict | None, str | None]:
+        # Fetch project with statistics
+        return handle_gitlab_api_errors(
+            func=lambda: git_lab_client.projects.get(id=project.id, statistics=True).asdict(),
+            entity_name=f"Repository for project {project.path_with_namespace}",
+            max_retries=3,
+        )
+
+    for proj_idx, (project, (project_data, error)) in enumerate(
+        fetch_concurrently(
+            items=projects,
+            fetch=fetch_repository,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         # Check if job was cancelled
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
@@ -56,14 +75,7 @@ def _sync_repositories_background(
         sync_result.update_progress(
             proj_idx - 1,
             project_count,
-            f"📥 About to fetch repository from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
-        )
-
-        # Fetch project with statistics
-        project_data, error = handle_gitlab_api_errors(
-            func=lambda: git_lab_client.projects.get(id=project.id, statistics=True).asdict(),
-            entity_name=f"Repository for project {project.path_with_namespace}",
-            max_retries=3,
+            f"📥 Fetched repository from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
         )
 
         if error:
@@ -148,9 +160,10 @@ def gitlab_sync_repositories_api(
     New functionality not present in the original git_lab app.
     Tracks repository metadata and storage statistics.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("repositories", _sync_repositories_background, request)
+    job_tracker = enqueue_sync_job("repositories", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "repositories"}
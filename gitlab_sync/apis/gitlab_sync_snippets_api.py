@@ -2,6 +2,7 @@ from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from gitlab import Gitlab
 
+from core.models.this_server_configuration import ThisServerConfiguration
 from core.utilities.cast_query_set import cast_query_set
 from core.utilities.convert_and_enforce_utc_timezone import (
     convert_and_enforce_utc_timezone,
@@ -16,8 +17,9 @@ from gitlab_sync.models import (
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -38,6 +40,8 @@ def _sync_snippets_background(
         print(f"[GitLabSync] {sync_result}")
         return
 
+    config = ThisServerConfiguration.current()
+
     projects: QuerySet[GitLabSyncProject] = cast_query_set(
         typ=GitLabSyncProject,
         val=GitLabSyncProject.objects.all(),
@@ -46,7 +50,25 @@ def _sync_snippets_background(
     project_count = projects.count()
     sync_result.add_log(f"Syncing snippets from {project_count} projects...")
 
-    for proj_idx, project in enumerate(projects, 1):
+    def fetch_snippets(project: GitLabSyncProject) -> tuple[list[dict] | None, str | None]:
+        return handle_gitlab_api_errors(
+            func=lambda: [
+                s.asdict()
+                for s in git_lab_client.projects.get(id=project.id, lazy=True)
+                .snippets.list(get_all=True)
+            ],
+            entity_name=f"Snippets for project {project.path_with_namespace}",
+            max_retries=3,
+        )
+
+    for proj_idx, (project, (snippets, error)) in enumerate(
+        fetch_concurrently(
+            items=projects,
+            fetch=fetch_snippets,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
             sync_result.finish()
@@ -56,17 +78,7 @@ def _sync_snippets_background(
         sync_result.update_progress(
             proj_idx - 1,
             project_count,
-            f"📥 Fetching snippets from project {project.path_with_namespace} ({proj_idx}/{project_count})...",
-        )
-
-        snippets, error = handle_gitlab_api_errors(
-            func=lambda: [
-                s.asdict()
-                for s in git_lab_client.projects.get(id=project.id, lazy=True)
-                .snippets.list(get_all=True)
-            ],
-            entity_name=f"Snippets for project {project.path_with_namespace}",
-            max_retries=3,
+            f"📥 Fetched snippets from project {project.path_with_namespace} ({proj_idx}/{project_count})...",
         )
 
         if error:
@@ -158,9 +170,10 @@ def gitlab_sync_snippets_api(
 
     Snippets are code or text fragments stored in GitLab.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("snippets", _sync_snippets_background, request)
+    job_tracker = enqueue_sync_job("snippets", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "snippets"}
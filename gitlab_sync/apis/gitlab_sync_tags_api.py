@@ -2,6 +2,7 @@ from django.db.models import QuerySet
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from gitlab import Gitlab
 
+from core.models.this_server_configuration import ThisServerConfiguration
 from core.utilities.cast_query_set import cast_query_set
 from core.utilities.convert_and_enforce_utc_timezone import (
     convert_and_enforce_utc_timezone,
@@ -16,8 +17,9 @@ from gitlab_sync.models import (
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -38,6 +40,8 @@ def _sync_tags_background(
         print(f"[GitLabSync] {sync_result}")
         return
 
+    config = ThisServerConfiguration.current()
+
     projects: QuerySet[GitLabSyncProject] = cast_query_set(
         typ=GitLabSyncProject,
         val=GitLabSyncProject.objects.all(),
@@ -48,7 +52,25 @@ def _sync_tags_background(
         f"Syncing tags from {project_count} projects..."
     )
 
-    for proj_idx, project in enumerate(projects, 1):
+    def fetch_tags(project: GitLabSyncProject) -> tuple[list[dict] | None, str | None]:
+        return handle_gitlab_api_errors(
+            func=lambda: [
+                t.asdict()
+                for t in git_lab_client.projects.get(id=project.id, lazy=True)
+                .tags.list(get_all=True)
+            ],
+            entity_name=f"Tags for project {project.path_with_namespace}",
+            max_retries=3,
+        )
+
+    for proj_idx, (project, (tags, error)) in enumerate(
+        fetch_concurrently(
+            items=projects,
+            fetch=fetch_tags,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         # Check if job was cancelled
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
@@ -60,17 +82,7 @@ def _sync_tags_background(
         sync_result.update_progress(
             proj_idx - 1,
             project_count,
-            f"📥 About to fetch tags from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
-        )
-
-        tags, error = handle_gitlab_api_errors(
-            func=lambda: [
-                t.asdict()
-                for t in git_lab_client.projects.get(id=project.id, lazy=True)
-                .tags.list(get_all=True)
-            ],
-            entity_name=f"Tags for project {project.path_with_namespace}",
-            max_retries=3,
+            f"📥 Fetched tags from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
         )
 
         if error:
@@ -195,9 +207,10 @@ def gitlab_sync_tags_api(
     New functionality not present in the original git_lab app.
     Tracks Git tags (version releases).
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("tags", _sync_tags_background, request)
+    job_tracker = enqueue_sync_job("tags", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "tags"}
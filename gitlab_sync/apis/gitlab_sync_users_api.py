@@ -17,8 +17,9 @@ from gitlab_sync.models import GitLabSyncGroup, GitLabSyncJobTracker, GitLabSync
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -45,6 +46,8 @@ def _sync_users_background(
         print(f"[GitLabSync] {sync_result}")
         return
 
+    config = ThisServerConfiguration.current()
+
     git_lab_groups: QuerySet[GitLabSyncGroup] = cast_query_set(
         typ=GitLabSyncGroup,
         val=GitLabSyncGroup.objects.all(),
@@ -68,7 +71,26 @@ def _sync_users_background(
 
     seen_user_ids = set()  # Track users we've already processed to avoid duplicates
 
-    for group_idx, git_lab_group in enumerate(git_lab_groups, 1):
+    def fetch_members(git_lab_group: GitLabSyncGroup) -> tuple[list[GroupMember] | None, str | None]:
+        return handle_gitlab_api_errors(
+            func=lambda: cast(
+                list[GroupMember],
+                git_lab_client.groups.get(id=git_lab_group.id, lazy=True).members.list(
+                    **members_query_parameters
+                ),
+            ),
+            entity_name=f"Members for group {git_lab_group.full_path}",
+            max_retries=3,
+        )
+
+    for group_idx, (git_lab_group, (members, error)) in enumerate(
+        fetch_concurrently(
+            items=git_lab_groups,
+            fetch=fetch_members,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         # Check if job was cancelled
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
@@ -80,18 +102,7 @@ def _sync_users_background(
         sync_result.update_progress(
             group_idx - 1,
             group_count,
-            f"📥 About to fetch users from group {git_lab_group.full_path} (group {group_idx}/{group_count})...",
-        )
-
-        members, error = handle_gitlab_api_errors(
-            func=lambda: cast(
-                list[GroupMember],
-                git_lab_client.groups.get(id=git_lab_group.id, lazy=True).members.list(
-                    **members_query_parameters
-                ),
-            ),
-            entity_name=f"Members for group {git_lab_group.full_path}",
-            max_retries=3,
+            f"📥 Fetched users from group {git_lab_group.full_path} (group {group_idx}/{group_count})...",
         )
 
         if error:
@@ -216,9 +227,10 @@ def gitlab_sync_users_api(
     This API endpoint fetches users from all GitLab groups and syncs them
     to the local database with enhanced error handling and retry logic.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("users", _sync_users_background, request)
+    job_tracker = enqueue_sync_job("users", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "users"}
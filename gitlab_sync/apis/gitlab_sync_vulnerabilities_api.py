@@ -3,6 +3,7 @@ from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.utils import timezone
 from gitlab import Gitlab
 
+from core.models.this_server_configuration import ThisServerConfiguration
 from core.utilities.cast_query_set import cast_query_set
 from core.utilities.convert_and_enforce_utc_timezone import (
     convert_and_enforce_utc_timezone,
@@ -17,8 +18,9 @@ from gitlab_sync.models import (
 from gitlab_sync.utilities import (
     SyncResult,
     check_job_cancelled,
+    enqueue_sync_job,
+    fetch_concurrently,
     handle_gitlab_api_errors,
-    run_sync_in_background,
 )
 
 
@@ -39,6 +41,8 @@ def _sync_vulnerabilities_background(
         print(f"[GitLabSync] {sync_result}")
         return
 
+    config = ThisServerConfiguration.current()
+
     projects: QuerySet[GitLabSyncProject] = cast_query_set(
         typ=GitLabSyncProject,
         val=GitLabSyncProject.objects.all(),
@@ -49,7 +53,27 @@ def _sync_vulnerabilities_background(
         f"Syncing vulnerabilities from {project_count} projects incrementally..."
     )
 
-    for proj_idx, project in enumerate(projects, 1):
+    def fetch_vulnerabilities(project: GitLabSyncProject) -> tuple[list[dict] | None, str | None]:
+        # Try to fetch vulnerabilities using the project vulnerability_findings endpoint
+        # This is the correct endpoint for GitLab Ultimate
+        return handle_gitlab_api_errors(
+            func=lambda: [
+                v.asdict()
+                for v in git_lab_client.projects.get(id=project.id, lazy=False)
+                .vulnerability_findings.list(get_all=True)
+            ],
+            entity_name=f"Vulnerabilities for project {project.path_with_namespace}",
+            max_retries=3,
+        )
+
+    for proj_idx, (project, (vulnerabilities, error)) in enumerate(
+        fetch_concurrently(
+            items=projects,
+            fetch=fetch_vulnerabilities,
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ),
+        1,
+    ):
         # Check if job was cancelled
         if check_job_cancelled(sync_result.job_tracker_id):
             sync_result.add_log("⚠️ Job cancelled by user, stopping sync...")
@@ -61,19 +85,7 @@ def _sync_vulnerabilities_background(
         sync_result.update_progress(
             proj_idx - 1,
             project_count,
-            f"📥 About to fetch vulnerabilities from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
-        )
-
-        # Try to fetch vulnerabilities using the project vulnerability_findings endpoint
-        # This is the correct endpoint for GitLab Ultimate
-        vulnerabilities, error = handle_gitlab_api_errors(
-            func=lambda: [
-                v.asdict()
-                for v in git_lab_client.projects.get(id=project.id, lazy=False)
-                .vulnerability_findings.list(get_all=True)
-            ],
-            entity_name=f"Vulnerabilities for project {project.path_with_namespace}",
-            max_retries=3,
+            f"📥 Fetched vulnerabilities from project {project.path_with_namespace} (project {proj_idx}/{project_count})...",
         )
 
         if error:
@@ -260,9 +272,10 @@ def gitlab_sync_vulnerabilities_api(
     New functionality not present in the original git_lab app.
     Tracks security vulnerabilities (GitLab EE Ultimate feature) from security scans.
 
-    Returns immediately with job_id for progress tracking.
+    Queues the sync for the sync worker and returns immediately with job_id
+    for progress tracking.
     """
-    job_tracker = run_sync_in_background("vulnerabilities", _sync_vulnerabilities_background, request)
+    job_tracker = enqueue_sync_job("vulnerabilities", request)
 
     return JsonResponse(
         data={"success": True, "job_id": job_tracker.id, "job_type": "vulnerabilities"}
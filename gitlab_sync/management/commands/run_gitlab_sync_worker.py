@@ -0,0 +1,143 @@
+import os
+import signal
+import socket
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from gitlab_sync.utilities import (
+    claim_sync_job,
+    renew_sync_job_leases,
+    requeue_expired_sync_jobs,
+    run_sync_job,
+)
+
+# Jobs run at once when the database accepts concurrent writers
+DEFAULT_CONCURRENCY = 2
+
+
+def _default_concurrency() -> int:
+    """
+    How many jobs a worker runs at once unless --concurrency is given.
+
+    SQLite allows a single writer, so two jobs of different types writing at
+    the same time fail with "database is locked"; a worker runs one job at a
+    time there. Each job still fetches from GitLab concurrently.
+    """
+    if connection.vendor == "sqlite":
+        return 1
+    return DEFAULT_CONCURRENCY
+
+
+class Command(BaseCommand):
+    help = "Runs queued GitLab sync jobs (durable DB-backed queue, no broker required)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=None,
+            help=(
+                f"Maximum number of sync jobs this worker runs at once "
+                f"(default: 1 on SQLite, {DEFAULT_CONCURRENCY} otherwise)"
+            ),
+        )
+        parser.add_argument(
+            "--max-per-type",
+            type=int,
+            default=1,
+            help="Maximum running jobs per job type across all workers (default: 1)",
+        )
+        parser.add_argument(
+            "--lease-seconds",
+            type=int,
+            default=120,
+            help="Lease duration; jobs of a worker silent for this long are requeued (default: 120)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds between queue polls when idle (default: 2.0)",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=3,
+            help="Maximum leases per job before it is marked failed (default: 3)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is drained instead of polling forever",
+        )
+
+    def handle(self, *args, **options):
+        concurrency = options["concurrency"]
+        if concurrency is None:
+            concurrency = _default_concurrency()
+        concurrency = max(concurrency, 1)
+        lease_seconds = max(options["lease_seconds"], 10)
+        worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        stop_event = threading.Event()
+
+        def request_stop(signum, frame):
+            if stop_event.is_set():
+                # Abandoned jobs keep their lease until it expires, then get requeued
+                self.stdout.write(self.style.ERROR("Aborting running jobs"))
+                os._exit(1)
+            self.stdout.write(
+                self.style.WARNING("Stopping after running jobs finish (signal again to abort)...")
+            )
+            stop_event.set()
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+
+        heartbeat_stopped = threading.Event()
+
+        def heartbeat():
+            try:
+                while not heartbeat_stopped.wait(lease_seconds / 3):
+                    renew_sync_job_leases(worker_id=worker_id, lease_seconds=lease_seconds)
+            finally:
+                connection.close()
+
+        heartbeat_thread = threading.Thread(target=heartbeat, name="gitlab-sync-heartbeat", daemon=True)
+        heartbeat_thread.start()
+
+        self.stdout.write(
+            f"GitLab sync worker {worker_id} started "
+            f"(concurrency {concurrency}, max {options['max_per_type']} per job type)"
+        )
+
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="gitlab-sync-job")
+        active_jobs: set[Future] = set()
+        try:
+            while not stop_event.is_set():
+                requeue_expired_sync_jobs(max_attempts=options["max_attempts"])
+                active_jobs = {future for future in active_jobs if not future.done()}
+
+                while len(active_jobs) < concurrency:
+                    job_tracker = claim_sync_job(
+                        worker_id=worker_id,
+                        lease_seconds=lease_seconds,
+                        max_running_per_type=max(options["max_per_type"], 1),
+                    )
+                    if job_tracker is None:
+                        break
+                    self.stdout.write(f"  Leased job {job_tracker.id} ({job_tracker.job_type})")
+                    active_jobs.add(executor.submit(run_sync_job, job_tracker))
+
+                if options["once"] and not active_jobs:
+                    break
+                stop_event.wait(options["poll_interval"])
+        finally:
+            executor.shutdown(wait=True)
+            heartbeat_stopped.set()
+            heartbeat_thread.join()
+
+        self.stdout.write(self.style.SUCCESS(f"GitLab sync worker {worker_id} stopped"))
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.7 on 2026-10-18 18:52
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gitlab_sync', '0004_add_database_flavors'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GitLabSyncJobLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('enumeration_attack_uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('message', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('job_tracker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='log_entries', to='gitlab_sync.gitlabsyncjobtracker')),
+            ],
+            options={
+                'verbose_name': 'GitLab Sync Job Log',
+                'verbose_name_plural': 'GitLab Sync Job Logs',
+                'ordering': ['id'],
+            },
+        ),
+    ]
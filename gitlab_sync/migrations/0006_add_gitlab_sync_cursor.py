@@ -0,0 +1,31 @@
+# Generated by Django 5.1.7 on 2026-10-18 19:05
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gitlab_sync', '0005_add_gitlab_sync_job_log'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GitLabSyncCursor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('enumeration_attack_uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('entity_type', models.CharField(max_length=64)),
+                ('high_water_mark', models.DateTimeField(blank=True, null=True)),
+                ('last_synced_at', models.DateTimeField(blank=True, null=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sync_cursors', to='gitlab_sync.gitlabsyncproject')),
+            ],
+            options={
+                'verbose_name': 'GitLab Sync Cursor',
+                'verbose_name_plural': 'GitLab Sync Cursors',
+                'constraints': [models.UniqueConstraint(fields=('project', 'entity_type'), name='unique_gitlab_sync_cursor_per_project_entity_type')],
+            },
+        ),
+    ]
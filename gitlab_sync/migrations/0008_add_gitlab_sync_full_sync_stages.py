@@ -0,0 +1,24 @@
+# Generated by Django 5.1.7 on 2026-10-18 19:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gitlab_sync', '0007_add_gitlab_sync_job_queue'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gitlabsyncjobtracker',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='stage_jobs', to='gitlab_sync.gitlabsyncjobtracker'),
+        ),
+        migrations.AddField(
+            model_name='gitlabsyncjobtracker',
+            name='stage_results',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
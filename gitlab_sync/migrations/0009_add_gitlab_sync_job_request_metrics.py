@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-18 19:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gitlab_sync', '0008_add_gitlab_sync_full_sync_stages'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gitlabsyncjobtracker',
+            name='request_metrics',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
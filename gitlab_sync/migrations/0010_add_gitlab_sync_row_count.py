@@ -0,0 +1,28 @@
+# Generated by Django 5.1.7 on 2026-10-18 19:51
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gitlab_sync', '0009_add_gitlab_sync_job_request_metrics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GitLabSyncRowCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('enumeration_attack_uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('model_name', models.CharField(max_length=128, unique=True)),
+                ('row_count', models.BigIntegerField(default=0)),
+                ('counted_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'GitLab Sync Row Count',
+                'verbose_name_plural': 'GitLab Sync Row Counts',
+            },
+        ),
+    ]
@@ -26,7 +26,10 @@ from gitlab_sync.models.gitlab_sync_snippet import GitLabSyncSnippet
 from gitlab_sync.models.gitlab_sync_vulnerability import GitLabSyncVulnerability
 
 # Internal tracking
+from gitlab_sync.models.gitlab_sync_cursor import GitLabSyncCursor
+from gitlab_sync.models.gitlab_sync_job_log import GitLabSyncJobLog
 from gitlab_sync.models.gitlab_sync_job_tracker import GitLabSyncJobTracker
+from gitlab_sync.models.gitlab_sync_row_count import GitLabSyncRowCount
 
 __all__ = [
     # Core entities
@@ -53,5 +56,8 @@ __all__ = [
     "GitLabSyncSnippet",
     "GitLabSyncVulnerability",
     # Internal tracking
+    "GitLabSyncCursor",
+    "GitLabSyncJobLog",
     "GitLabSyncJobTracker",
+    "GitLabSyncRowCount",
 ]
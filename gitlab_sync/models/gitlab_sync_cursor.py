@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from django.db import models
+
+from core.models.common.abstract.abstract_base_model import AbstractBaseModel
+
+
+class GitLabSyncCursor(AbstractBaseModel):
+    """
+    Incremental sync position for one entity type within one project.
+
+    Stores the high-water timestamp of the newest GitLab change already written,
+    so the next sync only asks GitLab for deltas (``updated_after`` / ``since``).
+    """
+
+    _disable_history = True  # Operational bookkeeping - no audit trail needed
+
+    project = models.ForeignKey(
+        "gitlab_sync.GitLabSyncProject",
+        on_delete=models.CASCADE,
+        related_name="sync_cursors",
+    )
+    entity_type: str = models.CharField(max_length=64)
+    high_water_mark: datetime | None = models.DateTimeField(null=True, blank=True)
+    last_synced_at: datetime | None = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.entity_type} @ {self.high_water_mark} (project {self.project_id})"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["project", "entity_type"],
+                name="unique_gitlab_sync_cursor_per_project_entity_type",
+            ),
+        ]
+        verbose_name = "GitLab Sync Cursor"
+        verbose_name_plural = "GitLab Sync Cursors"
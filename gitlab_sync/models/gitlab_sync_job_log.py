@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from django.db import models
+
+from core.models.common.abstract.abstract_base_model import AbstractBaseModel
+
+
+class GitLabSyncJobLog(AbstractBaseModel):
+    """
+    A single progress log line written by a GitLab sync job.
+
+    Append-only child of GitLabSyncJobTracker. Sync jobs insert buffered batches
+    of these rows instead of rewriting the tracker's detailed_logs JSON blob.
+    """
+
+    _disable_history = True  # Append-only operational log - no audit trail needed
+
+    job_tracker = models.ForeignKey(
+        "gitlab_sync.GitLabSyncJobTracker",
+        on_delete=models.CASCADE,
+        related_name="log_entries",
+    )
+    message: str = models.TextField()
+    created_at: datetime | None = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return self.message
+
+    class Meta:
+        ordering = ["id"]
+        verbose_name = "GitLab Sync Job Log"
+        verbose_name_plural = "GitLab Sync Job Logs"
@@ -19,6 +19,7 @@ class GitLabSyncJobTracker(AbstractBaseModel):
 
     Allows users to monitor sync progress in real-time or navigate away
     and check back later without using Celery or external task queues.
+    Doubles as the durable job queue consumed by ``manage.py run_gitlab_sync_worker``.
     """
 
     _disable_history = True  # Synced from GitLab - authoritative history exists in external system
@@ -40,6 +41,24 @@ class GitLabSyncJobTracker(AbstractBaseModel):
         "core.User", on_delete=models.SET_NULL, null=True, blank=True, related_name="gitlab_sync_job_trackers"
     )
 
+    # Durable queue bookkeeping - jobs are "pending" until a sync worker leases them
+    priority: int = models.IntegerField(default=0)
+    parameters: dict = JSONField(default=dict, blank=True)
+    queued_at: datetime | None = models.DateTimeField(null=True, blank=True)
+    attempts: int = models.IntegerField(default=0)
+    lease_owner: str | None = models.CharField(max_length=255, null=True, blank=True)
+    lease_expires_at: datetime | None = models.DateTimeField(null=True, blank=True)
+    heartbeat_at: datetime | None = models.DateTimeField(null=True, blank=True)
+
+    # Full sync orchestration - stage jobs point at their parent "full-sync" job
+    parent: "GitLabSyncJobTracker | None" = models.ForeignKey(
+        "self", on_delete=models.CASCADE, null=True, blank=True, related_name="stage_jobs"
+    )
+    stage_results: dict = JSONField(default=dict, blank=True)
+
+    # GitLab API request counts, latency histogram and throttle time of the last run
+    request_metrics: dict = JSONField(default=dict, blank=True)
+
     @property
     def duration_seconds(self) -> float | None:
         """Calculate duration in seconds."""
@@ -48,6 +67,43 @@ class GitLabSyncJobTracker(AbstractBaseModel):
         end = self.end_time or datetime.now(self.start_time.tzinfo)
         return (end - self.start_time).total_seconds()
 
+    @property
+    def log_count(self) -> int:
+        """Total number of log lines (legacy JSON lines plus appended log rows)."""
+        return len(self.detailed_logs or []) + self.log_entries.count()
+
+    def get_log_lines(self, offset: int = 0) -> list[str]:
+        """
+        Get log lines starting at ``offset``.
+
+        Older jobs stored every line in the detailed_logs JSON list; newer jobs
+        append GitLabSyncJobLog rows. Both are exposed as one ordered sequence so
+        pollers can ask only for lines they have not seen yet.
+        """
+        legacy_logs: list[str] = self.detailed_logs or []
+        offset = max(offset, 0)
+        lines = legacy_logs[offset:]
+        entry_offset = max(offset - len(legacy_logs), 0)
+        lines.extend(
+            self.log_entries.order_by("id").values_list("message", flat=True)[entry_offset:]
+        )
+        return lines
+
+    def append_logs(self, messages: list[str]) -> None:
+        """Append log lines as GitLabSyncJobLog rows with a single INSERT."""
+        from gitlab_sync.models.gitlab_sync_job_log import GitLabSyncJobLog
+
+        if not messages:
+            return
+        GitLabSyncJobLog.objects.bulk_create(
+            [GitLabSyncJobLog(job_tracker_id=self.id, message=message) for message in messages]
+        )
+
+    @property
+    def is_pending(self) -> bool:
+        """Check if job is queued and waiting for a sync worker."""
+        return self.status == "pending"
+
     @property
     def is_running(self) -> bool:
         """Check if job is currently running."""
@@ -88,6 +144,9 @@ class GitLabSyncJobTracker(AbstractBaseModel):
         return f"{self.job_type} - {self.status} ({self.progress_percent}%)"
 
     class Meta:
+        indexes = [
+            models.Index(fields=["status", "job_type"], name="gitlab_sync_job_queue_idx"),
+        ]
         ordering = ["-start_time"]
         verbose_name = "GitLab Sync Job Tracker"
         verbose_name_plural = "GitLab Sync Job Trackers"
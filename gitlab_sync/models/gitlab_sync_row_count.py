@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from django.db import models
+
+from core.models.common.abstract.abstract_base_model import AbstractBaseModel
+
+
+class GitLabSyncRowCount(AbstractBaseModel):
+    """
+    Approximate row count of one synced GitLab table.
+
+    Bumped by the sync writers as they insert rows and recounted exactly when a
+    sync of that table finishes, so the dashboard never has to ``COUNT(*)``
+    tables with millions of rows on page load.
+    """
+
+    _disable_history = True  # Operational bookkeeping - no audit trail needed
+
+    model_name: str = models.CharField(max_length=128, unique=True)
+    row_count: int = models.BigIntegerField(default=0)
+    counted_at: datetime | None = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"{self.model_name}: {self.row_count}"
+
+    class Meta:
+        verbose_name = "GitLab Sync Row Count"
+        verbose_name_plural = "GitLab Sync Row Counts"
@@ -6,6 +6,7 @@ from gitlab_sync.apis import (
     gitlab_sync_commits_api,
     gitlab_sync_epics_api,
     gitlab_sync_events_api,
+    gitlab_sync_full_sync_api,
     gitlab_sync_groups_api,
     gitlab_sync_issues_api,
     gitlab_sync_iterations_api,
@@ -275,6 +276,11 @@ urlpatterns_gitlab_sync = [
 ]
 
 urlpatterns_gitlab_sync_api = [
+    path(
+        name="gitlab_sync_api_full_sync",
+        route="full-sync/",
+        view=gitlab_sync_full_sync_api,
+    ),
     path(
         name="gitlab_sync_api_branches",
         route="branch/",
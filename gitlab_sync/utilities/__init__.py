@@ -1,13 +1,51 @@
+from gitlab_sync.utilities.bulk_upsert_pipeline import (
+    BulkUpsertPageResult,
+    BulkUpsertPipeline,
+    ForeignKeyReference,
+    ManyToManyReference,
+)
 from gitlab_sync.utilities.check_job_cancelled import check_job_cancelled
+from gitlab_sync.utilities.claim_sync_job import claim_sync_job
 from gitlab_sync.utilities.cleanup_stale_jobs import cleanup_stale_jobs
+from gitlab_sync.utilities.enqueue_sync_job import enqueue_sync_job
+from gitlab_sync.utilities.fetch_concurrently import fetch_concurrently
+from gitlab_sync.utilities.get_gitlab_sync_dashboard_stats import get_gitlab_sync_dashboard_stats
+from gitlab_sync.utilities.get_sync_job_function import get_sync_job_function
+from gitlab_sync.utilities.get_sync_row_counts import get_sync_row_counts
+from gitlab_sync.utilities.gitlab_page_stream import GitLabPageStream
 from gitlab_sync.utilities.handle_gitlab_api_errors import handle_gitlab_api_errors
-from gitlab_sync.utilities.run_sync_in_background import run_sync_in_background
+from gitlab_sync.utilities.increment_sync_row_count import increment_sync_row_count
+from gitlab_sync.utilities.is_full_resync_requested import is_full_resync_requested
+from gitlab_sync.utilities.refresh_sync_row_count import refresh_sync_row_count
+from gitlab_sync.utilities.renew_sync_job_leases import renew_sync_job_leases
+from gitlab_sync.utilities.requeue_expired_sync_jobs import requeue_expired_sync_jobs
+from gitlab_sync.utilities.run_dependency_stages import run_dependency_stages
+from gitlab_sync.utilities.run_sync_job import run_sync_job
+from gitlab_sync.utilities.sync_cursors import SyncCursors
 from gitlab_sync.utilities.sync_result import SyncResult
 
 __all__ = [
+    "BulkUpsertPageResult",
+    "BulkUpsertPipeline",
     "check_job_cancelled",
+    "claim_sync_job",
     "cleanup_stale_jobs",
+    "enqueue_sync_job",
+    "fetch_concurrently",
+    "ForeignKeyReference",
+    "get_gitlab_sync_dashboard_stats",
+    "get_sync_job_function",
+    "get_sync_row_counts",
+    "GitLabPageStream",
     "handle_gitlab_api_errors",
-    "run_sync_in_background",
+    "increment_sync_row_count",
+    "is_full_resync_requested",
+    "ManyToManyReference",
+    "refresh_sync_row_count",
+    "renew_sync_job_leases",
+    "requeue_expired_sync_jobs",
+    "run_dependency_stages",
+    "run_sync_job",
+    "SyncCursors",
     "SyncResult",
 ]
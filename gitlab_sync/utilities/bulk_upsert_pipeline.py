@@ -0,0 +1,410 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable
+
+from django.db import models, transaction
+
+from core.utilities.convert_and_enforce_utc_timezone import (
+    convert_and_enforce_utc_timezone,
+)
+from gitlab_sync.utilities.increment_sync_row_count import increment_sync_row_count
+from gitlab_sync.utilities.sync_result import SyncResult
+
+
+def _extract_reference_id(value: Any) -> Any:
+    """Return the GitLab ID from a nested ``{"id": ...}`` dict or a raw ID value."""
+    if isinstance(value, dict):
+        return value.get("id")
+    return value
+
+
+@dataclass
+class ForeignKeyReference:
+    """
+    Describes a foreign key populated from a GitLab API payload.
+
+    Attributes:
+        field: Name of the ForeignKey field on the synced model (e.g. "author")
+        model: Model the foreign key points at (e.g. GitLabSyncUser)
+        source_key: Key in the GitLab dict holding either a nested object with an
+            "id" (e.g. "author") or a raw ID (e.g. "author_id")
+        lookup_field: Field on the target model that stores the GitLab ID
+            ("id" for GitLab-keyed models, "gitlab_id" for milestones/iterations)
+    """
+
+    field: str
+    model: type[models.Model]
+    source_key: str
+    lookup_field: str = "id"
+
+
+@dataclass
+class ManyToManyReference:
+    """
+    Describes a many-to-many relation populated from a list in a GitLab API payload.
+
+    Attributes:
+        field: Name of the ManyToManyField on the synced model (e.g. "assignees")
+        model: Model on the other side of the relation (e.g. GitLabSyncUser)
+        source_key: Key in the GitLab dict holding a list of nested objects with an "id"
+        lookup_field: Field on the target model that stores the GitLab ID
+    """
+
+    field: str
+    model: type[models.Model]
+    source_key: str
+    lookup_field: str = "id"
+
+
+@dataclass
+class BulkUpsertPageResult:
+    """Counts produced by a single ``BulkUpsertPipeline.upsert_page`` call."""
+
+    created_count: int = 0
+    updated_count: int = 0
+    skipped_count: int = 0
+    failed_count: int = 0
+
+    @property
+    def written_count(self) -> int:
+        """Rows inserted or updated."""
+        return self.created_count + self.updated_count
+
+
+@dataclass
+class BulkUpsertPipeline:
+    """
+    Batched ingestion stage for GitLab sync entities.
+
+    Replaces the per-entity ``get_or_create`` / ``.filter().first()`` / ``save()`` /
+    ``.set()`` pattern with a fixed number of queries per page:
+
+    1. One query loading the existing rows' change-tracking column and foreign keys
+    2. One ``<lookup_field>__in`` query per referenced model (users, pipelines, ...)
+    3. One ``bulk_create`` (upsert when the key column is unique) plus one
+       ``bulk_update`` for models keyed by a non-unique GitLab ID column
+    4. One delete plus one ``bulk_create`` per many-to-many through table
+
+    Rows whose incoming change timestamp is not newer than the stored one are
+    skipped without being written. If a page fails to write, its rows are retried
+    one at a time so a single bad payload cannot fail the whole page.
+
+    Example:
+        pipeline = BulkUpsertPipeline(
+            model=GitLabSyncIssue,
+            entity_label="issue",
+            build_fields=_build_issue_fields,
+            foreign_keys=[
+                ForeignKeyReference(field="author", model=GitLabSyncUser, source_key="author"),
+            ],
+            many_to_many=[
+                ManyToManyReference(field="assignees", model=GitLabSyncUser, source_key="assignees"),
+            ],
+        )
+        pipeline.upsert_page(
+            entity_dicts=issues,
+            sync_result=sync_result,
+            extra_fields={"project": project},
+        )
+
+    Attributes:
+        model: The GitLab sync model being written
+        entity_label: Human-readable singular name used in log messages
+        build_fields: Maps one GitLab dict to a dict of concrete (non-relation) field values
+        foreign_keys: Foreign keys resolved from the payload via prefetched ID maps
+        many_to_many: Many-to-many relations written through the through table in bulk
+        unique_field: Model field holding the GitLab identity of a row
+        source_key: Key in the GitLab dict holding the identity value
+        change_field: Model field compared against the incoming change timestamp.
+            None means rows are immutable once created (e.g. commits)
+        change_source_key: Key in the GitLab dict holding the change timestamp
+        batch_size: Rows per INSERT/UPDATE statement
+    """
+
+    model: type[models.Model]
+    entity_label: str
+    build_fields: Callable[[dict], dict[str, Any]]
+    foreign_keys: list[ForeignKeyReference] = field(default_factory=list)
+    many_to_many: list[ManyToManyReference] = field(default_factory=list)
+    unique_field: str = "id"
+    source_key: str = "id"
+    change_field: str | None = "updated_at"
+    change_source_key: str = "updated_at"
+    batch_size: int = 500
+
+    def upsert_page(
+        self,
+        entity_dicts: list[dict],
+        sync_result: SyncResult,
+        extra_fields: dict[str, Any] | None = None,
+    ) -> BulkUpsertPageResult:
+        """
+        Write one page of GitLab API dicts and record the outcome on ``sync_result``.
+
+        Args:
+            entity_dicts: Raw dicts from the GitLab API (``obj.asdict()``)
+            sync_result: Sync result tracker to record successes, skips and failures on
+            extra_fields: Field values shared by every row in the page (e.g. the project)
+
+        Returns:
+            BulkUpsertPageResult with created/updated/skipped/failed counts
+        """
+        page_result = BulkUpsertPageResult()
+
+        keyed_dicts: dict[Any, dict] = {}
+        for entity_dict in entity_dicts:
+            key = entity_dict.get(self.source_key)
+            if key is None:
+                page_result.skipped_count += 1
+                sync_result.add_skip()
+                continue
+            # Later duplicates in the same page win, matching the old per-row behavior
+            keyed_dicts[key] = entity_dict
+
+        if not keyed_dicts:
+            return page_result
+
+        existing_rows = self._load_existing_rows(keys=list(keyed_dicts.keys()))
+
+        pending: dict[Any, dict] = {}
+        for key, entity_dict in keyed_dicts.items():
+            if self._needs_write(existing_row=existing_rows.get(key), entity_dict=entity_dict):
+                pending[key] = entity_dict
+            else:
+                page_result.skipped_count += 1
+                sync_result.add_skip()
+
+        if not pending:
+            return page_result
+
+        try:
+            self._write(
+                pending=pending,
+                existing_rows=existing_rows,
+                extra_fields=extra_fields or {},
+            )
+            for key in pending:
+                if key in existing_rows:
+                    page_result.updated_count += 1
+                else:
+                    page_result.created_count += 1
+                sync_result.add_success()
+            increment_sync_row_count(self.model, page_result.created_count)
+            return page_result
+        except Exception as error:
+            print(
+                f"[BulkUpsert] Batch write of {len(pending)} {self.entity_label} rows failed, "
+                f"retrying one at a time: {error}"
+            )
+
+        for key, entity_dict in pending.items():
+            try:
+                self._write(
+                    pending={key: entity_dict},
+                    existing_rows=existing_rows,
+                    extra_fields=extra_fields or {},
+                )
+                if key in existing_rows:
+                    page_result.updated_count += 1
+                else:
+                    page_result.created_count += 1
+                sync_result.add_success()
+            except Exception as error:
+                import traceback
+
+                error_trace = traceback.format_exc()
+                error_msg = f"Failed to save {self.entity_label} {key}: {str(error)}"
+                page_result.failed_count += 1
+                sync_result.add_failure(error_msg)
+                sync_result.add_log(f"❌ {error_msg}")
+                print(f"[GitLabSync] {error_msg}")
+                print(f"[GitLabSync] Stack trace:\n{error_trace}")
+
+        increment_sync_row_count(self.model, page_result.created_count)
+        return page_result
+
+    @property
+    def _uses_native_upsert(self) -> bool:
+        """Whether the identity column carries a unique constraint usable by ON CONFLICT."""
+        model_field = self.model._meta.get_field(self.unique_field)
+        return bool(model_field.primary_key or model_field.unique)
+
+    def _foreign_key_attnames(self) -> list[str]:
+        return [
+            self.model._meta.get_field(reference.field).attname
+            for reference in self.foreign_keys
+        ]
+
+    def _load_existing_rows(self, keys: list[Any]) -> dict[Any, dict]:
+        """Load identity, pk, change timestamp and foreign key IDs for rows already stored."""
+        columns = {self.unique_field, "pk", *self._foreign_key_attnames()}
+        if self.change_field:
+            columns.add(self.change_field)
+
+        existing_rows: dict[Any, dict] = {}
+        for row in self.model.objects.filter(
+            **{f"{self.unique_field}__in": keys}
+        ).values(*columns):
+            existing_rows[row[self.unique_field]] = row
+        return existing_rows
+
+    def _needs_write(self, existing_row: dict | None, entity_dict: dict) -> bool:
+        if existing_row is None:
+            return True
+        if self.change_field is None:
+            return False
+
+        stored_change: datetime | None = existing_row.get(self.change_field)
+        if stored_change is None:
+            return True
+
+        incoming_change = convert_and_enforce_utc_timezone(
+            datetime_string=entity_dict.get(self.change_source_key)
+        )
+        return bool(incoming_change and incoming_change > stored_change)
+
+    def _resolve_references(
+        self, lookup_model: type[models.Model], lookup_field: str, gitlab_ids: set[Any]
+    ) -> dict[Any, Any]:
+        """Map GitLab IDs to local primary keys with a single ``__in`` query."""
+        if not gitlab_ids:
+            return {}
+        return dict(
+            lookup_model.objects.filter(
+                **{f"{lookup_field}__in": gitlab_ids}
+            ).values_list(lookup_field, "pk")
+        )
+
+    def _write(
+        self,
+        pending: dict[Any, dict],
+        existing_rows: dict[Any, dict],
+        extra_fields: dict[str, Any],
+    ) -> None:
+        foreign_key_maps: list[tuple[ForeignKeyReference, str, dict[Any, Any]]] = []
+        for reference in self.foreign_keys:
+            gitlab_ids = {
+                _extract_reference_id(entity_dict.get(reference.source_key))
+                for entity_dict in pending.values()
+            }
+            gitlab_ids.discard(None)
+            foreign_key_maps.append(
+                (
+                    reference,
+                    self.model._meta.get_field(reference.field).attname,
+                    self._resolve_references(
+                        lookup_model=reference.model,
+                        lookup_field=reference.lookup_field,
+                        gitlab_ids=gitlab_ids,
+                    ),
+                )
+            )
+
+        to_create: list[models.Model] = []
+        to_update: list[models.Model] = []
+        update_field_names: set[str] = set()
+
+        for key, entity_dict in pending.items():
+            existing_row = existing_rows.get(key)
+            values: dict[str, Any] = {
+                **self.build_fields(entity_dict),
+                **extra_fields,
+                self.unique_field: key,
+            }
+
+            for reference, attname, id_map in foreign_key_maps:
+                gitlab_id = _extract_reference_id(entity_dict.get(reference.source_key))
+                resolved_pk = id_map.get(gitlab_id)
+                if resolved_pk is None and existing_row is not None:
+                    # Referenced row not synced yet - keep whatever link is already stored
+                    resolved_pk = existing_row.get(attname)
+                values[attname] = resolved_pk
+
+            update_field_names.update(
+                self.model._meta.get_field(name).name
+                for name in values
+                if name != self.unique_field
+            )
+
+            instance = self.model(**values)
+            if existing_row is not None and not self._uses_native_upsert:
+                instance.pk = existing_row["pk"]
+                to_update.append(instance)
+            else:
+                to_create.append(instance)
+
+        with transaction.atomic():
+            if to_create and self._uses_native_upsert:
+                self.model.objects.bulk_create(
+                    to_create,
+                    batch_size=self.batch_size,
+                    update_conflicts=True,
+                    unique_fields=[self.unique_field],
+                    update_fields=sorted(update_field_names),
+                )
+            elif to_create:
+                self.model.objects.bulk_create(to_create, batch_size=self.batch_size)
+
+            if to_update:
+                self.model.objects.bulk_update(
+                    to_update,
+                    fields=sorted(update_field_names),
+                    batch_size=self.batch_size,
+                )
+
+            if self.many_to_many:
+                self._write_many_to_many(pending=pending)
+
+    def _write_many_to_many(self, pending: dict[Any, dict]) -> None:
+        """Replace through-table rows for every pending entity whose payload lists the relation."""
+        if self._uses_native_upsert and self.model._meta.get_field(self.unique_field).primary_key:
+            pk_by_key = {key: key for key in pending}
+        else:
+            pk_by_key = dict(
+                self.model.objects.filter(
+                    **{f"{self.unique_field}__in": list(pending.keys())}
+                ).values_list(self.unique_field, "pk")
+            )
+
+        for reference in self.many_to_many:
+            m2m_field = self.model._meta.get_field(reference.field)
+            through = m2m_field.remote_field.through
+            source_column = f"{m2m_field.m2m_field_name()}_id"
+            target_column = f"{m2m_field.m2m_reverse_field_name()}_id"
+
+            related_ids_by_pk: dict[Any, list[Any]] = {}
+            for key, entity_dict in pending.items():
+                if reference.source_key not in entity_dict or key not in pk_by_key:
+                    continue
+                related_ids_by_pk[pk_by_key[key]] = [
+                    _extract_reference_id(item)
+                    for item in entity_dict.get(reference.source_key) or []
+                    if _extract_reference_id(item) is not None
+                ]
+
+            if not related_ids_by_pk:
+                continue
+
+            id_map = self._resolve_references(
+                lookup_model=reference.model,
+                lookup_field=reference.lookup_field,
+                gitlab_ids={
+                    gitlab_id
+                    for gitlab_ids in related_ids_by_pk.values()
+                    for gitlab_id in gitlab_ids
+                },
+            )
+
+            through.objects.filter(
+                **{f"{source_column}__in": list(related_ids_by_pk.keys())}
+            ).delete()
+            through.objects.bulk_create(
+                [
+                    through(**{source_column: source_pk, target_column: id_map[gitlab_id]})
+                    for source_pk, gitlab_ids in related_ids_by_pk.items()
+                    for gitlab_id in dict.fromkeys(gitlab_ids)
+                    if gitlab_id in id_map
+                ],
+                batch_size=self.batch_size,
+                ignore_conflicts=True,
+            )
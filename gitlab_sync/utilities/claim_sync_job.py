@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.db.models import Count, F, QuerySet
+from django.utils import timezone
+
+from gitlab_sync.models import GitLabSyncJobTracker
+
+
+def claim_sync_job(
+    worker_id: str,
+    lease_seconds: int = 120,
+    max_running_per_type: int = 1,
+) -> GitLabSyncJobTracker | None:
+    """
+    Lease the next pending sync job for a worker.
+
+    Jobs are taken by highest priority, then oldest first. Job types that already
+    have ``max_running_per_type`` jobs holding a live lease are skipped, so two
+    syncs of the same entity never write the same tables concurrently. The limit
+    is checked again inside the claiming UPDATE itself, while the job type's
+    rows are locked (see _claim_candidate), so competing workers can neither
+    lease the same job nor together exceed the limit.
+
+    Args:
+        worker_id: Identifier of the claiming worker (stored as lease_owner)
+        lease_seconds: How long the lease lasts without a heartbeat
+        max_running_per_type: Maximum concurrently leased jobs per job type
+
+    Returns:
+        The leased job tracker, or None if nothing can run right now
+    """
+    now = timezone.now()
+    candidates = list(
+        _claimable_sync_jobs(now=now, max_running_per_type=max_running_per_type)
+        .order_by("-priority", "queued_at", "id")
+        .values_list("id", "job_type")[:10]
+    )
+    for candidate_id, job_type in candidates:
+        if _claim_candidate(
+            candidate_id=candidate_id,
+            job_type=job_type,
+            lease_seconds=lease_seconds,
+            max_running_per_type=max_running_per_type,
+            now=now,
+            worker_id=worker_id,
+        ):
+            return GitLabSyncJobTracker.objects.get(id=candidate_id)
+
+    return None
+
+
+def _claimable_sync_jobs(now: datetime, max_running_per_type: int) -> QuerySet[GitLabSyncJobTracker]:
+    """Pending jobs whose type has fewer than ``max_running_per_type`` live leases."""
+    saturated_job_types = (
+        GitLabSyncJobTracker.objects.filter(status="running", lease_expires_at__gt=now)
+        .values("job_type")
+        .annotate(running_count=Count("id"))
+        .filter(running_count__gte=max_running_per_type)
+        .values("job_type")
+    )
+    return GitLabSyncJobTracker.objects.filter(status="pending").exclude(
+        job_type__in=saturated_job_types
+    )
+
+
+def _claim_candidate(
+    candidate_id: int,
+    job_type: str,
+    lease_seconds: int,
+    max_running_per_type: int,
+    now: datetime,
+    worker_id: str,
+) -> bool:
+    """
+    Lease one candidate if it is still pending and its type still has room.
+
+    The pending and running rows of the job type are locked first, so a
+    competing claim of the same type waits until this one commits and then
+    counts it. The count and the claim are one conditional UPDATE, which is
+    what keeps SQLite (where select_for_update is a no-op and writes are
+    serialized) within the limit.
+    """
+    with transaction.atomic():
+        list(
+            GitLabSyncJobTracker.objects.select_for_update()
+            .filter(job_type=job_type, status__in=("pending", "running"))
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        claimed = (
+            _claimable_sync_jobs(now=now, max_running_per_type=max_running_per_type)
+            .filter(id=candidate_id)
+            .update(
+                status="running",
+                start_time=now,
+                end_time=None,
+                attempts=F("attempts") + 1,
+                lease_owner=worker_id,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                heartbeat_at=now,
+            )
+        )
+    return claimed == 1
@@ -11,6 +11,8 @@ def cleanup_stale_jobs(max_runtime_minutes: int = 60) -> int:
 
     Jobs that are marked as "running" but haven't been updated in X minutes
     are likely orphaned by a server restart or thread crash. Mark them as failed.
+    Jobs leased by a sync worker are left alone - an expired lease is requeued
+    by requeue_expired_sync_jobs instead.
 
     Args:
         max_runtime_minutes: Maximum runtime before considering a job stale (default: 60 minutes)
@@ -22,7 +24,7 @@ def cleanup_stale_jobs(max_runtime_minutes: int = 60) -> int:
 
     # Find jobs that are still "running" but started more than max_runtime_minutes ago
     stale_jobs = GitLabSyncJobTracker.objects.filter(
-        status="running", start_time__lt=cutoff_time
+        status="running", start_time__lt=cutoff_time, lease_expires_at__isnull=True
     )
 
     count = 0
@@ -38,13 +40,11 @@ def cleanup_stale_jobs(max_runtime_minutes: int = 60) -> int:
             "Likely orphaned by server restart or thread crash."
         )
 
-        if not job.detailed_logs:
-            job.detailed_logs = []
-        job.detailed_logs.append(
-            f"[{timezone.now().strftime('%H:%M:%S')}] ⚠️ Job automatically marked as failed - exceeded runtime limit"
-        )
-
         job.save()
+
+        job.append_logs(
+            [f"[{timezone.now().strftime('%H:%M:%S')}] ⚠️ Job automatically marked as failed - exceeded runtime limit"]
+        )
         count += 1
 
         print(
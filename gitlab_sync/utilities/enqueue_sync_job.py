@@ -0,0 +1,67 @@
+from django.db import transaction
+from django.http import HttpRequest
+from django.utils import timezone
+
+from core.utilities.coerce_integer import coerce_integer
+from gitlab_sync.models import GitLabSyncJobTracker
+from gitlab_sync.utilities.get_sync_job_function import SYNC_JOB_FUNCTIONS
+
+
+def enqueue_sync_job(job_type: str, request: HttpRequest) -> GitLabSyncJobTracker:
+    """
+    Queue a sync job for the sync worker (``manage.py run_gitlab_sync_worker``).
+
+    The request's query parameters are stored with the job and replayed by the
+    worker, so options such as ``?full_resync=1`` survive restarts. Queuing the
+    same job type with the same parameters while one is still pending returns
+    the pending job instead of adding a duplicate. ``?priority=N`` puts the job
+    ahead of lower priority work (default 0).
+
+    Args:
+        job_type: Type of sync job (see SYNC_JOB_FUNCTIONS)
+        request: Django HTTP request that triggered the sync
+
+    Returns:
+        GitLabSyncJobTracker: The queued (or already pending) job tracker
+    """
+    if job_type not in SYNC_JOB_FUNCTIONS:
+        raise ValueError(f"Unknown GitLab sync job type: {job_type}")
+
+    query = request.GET.dict()
+    priority = coerce_integer(query.pop("priority", None))
+    parameters = {"query": dict(sorted(query.items()))}
+    user = request.user if request.user.is_authenticated else None
+
+    with transaction.atomic():
+        pending_job = (
+            GitLabSyncJobTracker.objects.filter(
+                status="pending", job_type=job_type, parameters=parameters
+            )
+            .order_by("id")
+            .first()
+        )
+        if pending_job is not None:
+            if priority > pending_job.priority:
+                pending_job.priority = priority
+                pending_job.save(update_fields=["priority"])
+            print(f"[EnqueueSync] Reusing pending job {pending_job.id} for {job_type}")
+            return pending_job
+
+        job_tracker = GitLabSyncJobTracker.objects.create(
+            job_type=job_type,
+            status="pending",
+            progress_percent=0,
+            current_count=0,
+            total_count=0,
+            priority=priority,
+            parameters=parameters,
+            queued_at=timezone.now(),
+            user=user,
+        )
+
+    job_tracker.append_logs(
+        [f"[{timezone.now().strftime('%H:%M:%S')}] ⏳ Queued - waiting for a sync worker"]
+    )
+    print(f"[EnqueueSync] Queued job {job_tracker.id} for {job_type} (priority {priority})")
+
+    return job_tracker
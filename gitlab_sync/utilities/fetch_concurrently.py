@@ -0,0 +1,75 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def fetch_concurrently(
+    items: Iterable[T],
+    fetch: Callable[[T], R],
+    max_workers: int,
+) -> Iterator[tuple[T, R]]:
+    """
+    Run GitLab fetches for many items on a bounded thread pool.
+
+    The calling thread stays the single database writer: ``fetch`` runs on worker
+    threads and must only talk to GitLab (wrap it in ``handle_gitlab_api_errors``
+    to keep the usual retry and 403 behavior), while results are yielded back to
+    the caller in submission order. At most ``max_workers * 2`` fetches are in
+    flight, so memory stays bounded and a caller that stops iterating (e.g. after
+    ``check_job_cancelled``) abandons at most that many requests. Each fetch runs
+    in a copy of the caller's context, so its GitLab requests are counted in the
+    calling job's request metrics.
+
+    Args:
+        items: Items to fetch for (e.g. GitLabSyncProject rows), iterated on the caller's thread
+        fetch: Function performing the GitLab API call for one item
+        max_workers: Maximum number of concurrent fetches
+
+    Yields:
+        Tuples of (item, fetch(item)) in the same order as ``items``
+
+    Example:
+        for project, (issues, error) in fetch_concurrently(
+            items=projects,
+            fetch=lambda project: handle_gitlab_api_errors(
+                func=lambda: project_issues(project),
+                entity_name=f"Issues for project {project.path_with_namespace}",
+            ),
+            max_workers=config.coerced_gitlab_sync_fetch_concurrency,
+        ):
+            if check_job_cancelled(sync_result.job_tracker_id):
+                return
+            save_issues(project, issues)
+    """
+    max_workers = max(max_workers, 1)
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="gitlab-sync-fetch"
+    )
+    in_flight: deque[tuple[T, Future]] = deque()
+    item_iterator = iter(items)
+
+    def submit_next() -> bool:
+        try:
+            item = next(item_iterator)
+        except StopIteration:
+            return False
+        in_flight.append((item, executor.submit(copy_context().run, fetch, item)))
+        return True
+
+    try:
+        for _ in range(max_workers * 2):
+            if not submit_next():
+                break
+
+        while in_flight:
+            item, future = in_flight.popleft()
+            result = future.result()
+            submit_next()
+            yield item, result
+    finally:
+        # Runs when the caller finishes or stops iterating early (cancellation)
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,124 @@
+from django.core.cache import cache
+from django.db.models import Count, Max, Model
+
+from gitlab_sync.models import (
+    GitLabSyncArtifact,
+    GitLabSyncBranch,
+    GitLabSyncCommit,
+    GitLabSyncEpic,
+    GitLabSyncEvent,
+    GitLabSyncGroup,
+    GitLabSyncIssue,
+    GitLabSyncIteration,
+    GitLabSyncJob,
+    GitLabSyncJobTracker,
+    GitLabSyncMergeRequest,
+    GitLabSyncMilestone,
+    GitLabSyncPipeline,
+    GitLabSyncProject,
+    GitLabSyncRepository,
+    GitLabSyncSecurityReport,
+    GitLabSyncSnippet,
+    GitLabSyncTag,
+    GitLabSyncUser,
+    GitLabSyncVulnerability,
+)
+from gitlab_sync.utilities.get_sync_row_counts import get_sync_row_counts
+
+GITLAB_SYNC_DASHBOARD_STATS_CACHE_KEY = "gitlab_sync_dashboard_stats"
+GITLAB_SYNC_DASHBOARD_STATS_TTL_SECONDS = 30
+
+# Dashboard stat name -> synced model whose rows it counts
+DASHBOARD_ENTITY_MODELS: dict[str, type[Model]] = {
+    "groups": GitLabSyncGroup,
+    "projects": GitLabSyncProject,
+    "users": GitLabSyncUser,
+    "issues": GitLabSyncIssue,
+    "merge_requests": GitLabSyncMergeRequest,
+    "repositories": GitLabSyncRepository,
+    "commits": GitLabSyncCommit,
+    "branches": GitLabSyncBranch,
+    "tags": GitLabSyncTag,
+    "pipelines": GitLabSyncPipeline,
+    "jobs": GitLabSyncJob,
+    "artifacts": GitLabSyncArtifact,
+    "epics": GitLabSyncEpic,
+    "milestones": GitLabSyncMilestone,
+    "iterations": GitLabSyncIteration,
+    "snippets": GitLabSyncSnippet,
+    "events": GitLabSyncEvent,
+    "security_reports": GitLabSyncSecurityReport,
+    "vulnerabilities": GitLabSyncVulnerability,
+}
+
+
+def _count_by(model: type[Model], field_name: str, values: tuple[str, ...]) -> dict[str, int]:
+    """Break a table down by one column with a single GROUP BY query."""
+    counts = dict(
+        model.objects.order_by()
+        .values(field_name)
+        .annotate(row_count=Count("pk"))
+        .values_list(field_name, "row_count")
+    )
+    return {
+        "total": sum(counts.values()),
+        **{value: counts.get(value, 0) for value in values},
+    }
+
+
+def _compute_dashboard_stats() -> dict:
+    """Compute dashboard statistics: one query for totals plus one per breakdown."""
+    row_counts = get_sync_row_counts(DASHBOARD_ENTITY_MODELS.values())
+    stats = {
+        stat_name: row_counts[model.__name__]
+        for stat_name, model in DASHBOARD_ENTITY_MODELS.items()
+    }
+
+    pipeline_stats = _count_by(
+        GitLabSyncPipeline, "status", ("success", "failed", "running", "pending")
+    )
+    mr_stats = _count_by(GitLabSyncMergeRequest, "state", ("merged", "opened", "closed"))
+    vulnerability_stats = _count_by(
+        GitLabSyncVulnerability, "severity", ("critical", "high", "medium", "low")
+    )
+
+    # The breakdowns count these tables exactly anyway
+    stats["pipelines"] = pipeline_stats["total"]
+    stats["merge_requests"] = mr_stats["total"]
+    stats["vulnerabilities"] = vulnerability_stats["total"]
+    stats["total_entities"] = sum(stats.values())
+
+    return {
+        "stats": stats,
+        "pipeline_stats": pipeline_stats,
+        "mr_stats": mr_stats,
+        "vulnerability_stats": vulnerability_stats,
+        "recent_projects": list(GitLabSyncProject.objects.order_by("-updated_at")[:5]),
+        "recent_pipelines": list(GitLabSyncPipeline.objects.order_by("-created_at")[:5]),
+        "recent_merge_requests": list(GitLabSyncMergeRequest.objects.order_by("-updated_at")[:5]),
+    }
+
+
+def get_gitlab_sync_dashboard_stats() -> dict:
+    """
+    Entity totals, status breakdowns and recent rows for the GitLab sync dashboard.
+
+    Served from the cache for up to ``GITLAB_SYNC_DASHBOARD_STATS_TTL_SECONDS``.
+    The cache key includes the newest job end time, so a sync job finishing (in
+    this process or a sync worker) invalidates it immediately.
+
+    Returns:
+        Dict with "stats", "pipeline_stats", "mr_stats", "vulnerability_stats",
+        "recent_projects", "recent_pipelines" and "recent_merge_requests"
+    """
+    latest_end_time = GitLabSyncJobTracker.objects.aggregate(latest=Max("end_time"))["latest"]
+    cache_key = (
+        f"{GITLAB_SYNC_DASHBOARD_STATS_CACHE_KEY}:"
+        f"{latest_end_time.timestamp() if latest_end_time else 0}"
+    )
+
+    dashboard_stats = cache.get(cache_key)
+    if dashboard_stats is None:
+        dashboard_stats = _compute_dashboard_stats()
+        cache.set(cache_key, dashboard_stats, timeout=GITLAB_SYNC_DASHBOARD_STATS_TTL_SECONDS)
+    return dashboard_stats
@@ -0,0 +1,47 @@
+from typing import Callable
+
+from django.http import HttpRequest
+from django.utils.module_loading import import_string
+
+from gitlab_sync.models import GitLabSyncJobTracker
+
+# Job type -> background sync function run by the sync worker.
+# Dotted paths keep this module importable from the API modules themselves.
+SYNC_JOB_FUNCTIONS: dict[str, str] = {
+    "branches": "gitlab_sync.apis.gitlab_sync_branches_api._sync_branches_background",
+    "commits": "gitlab_sync.apis.gitlab_sync_commits_api._sync_commits_background",
+    "epics": "gitlab_sync.apis.gitlab_sync_epics_api._sync_epics_background",
+    "events": "gitlab_sync.apis.gitlab_sync_events_api._sync_events_background",
+    "full-sync": "gitlab_sync.apis.gitlab_sync_full_sync_api._sync_full_background",
+    "groups": "gitlab_sync.apis.gitlab_sync_groups_api._sync_groups_background",
+    "issues": "gitlab_sync.apis.gitlab_sync_issues_api._sync_issues_background",
+    "iterations": "gitlab_sync.apis.gitlab_sync_iterations_api._sync_iterations_background",
+    "jobs": "gitlab_sync.apis.gitlab_sync_jobs_api._sync_jobs_background",
+    "merge-requests": "gitlab_sync.apis.gitlab_sync_merge_requests_api._sync_merge_requests_background",
+    "milestones": "gitlab_sync.apis.gitlab_sync_milestones_api._sync_milestones_background",
+    "pipelines": "gitlab_sync.apis.gitlab_sync_pipelines_api._sync_pipelines_background",
+    "projects": "gitlab_sync.apis.gitlab_sync_projects_api._sync_projects_background",
+    "repositories": "gitlab_sync.apis.gitlab_sync_repositories_api._sync_repositories_background",
+    "snippets": "gitlab_sync.apis.gitlab_sync_snippets_api._sync_snippets_background",
+    "tags": "gitlab_sync.apis.gitlab_sync_tags_api._sync_tags_background",
+    "users": "gitlab_sync.apis.gitlab_sync_users_api._sync_users_background",
+    "vulnerabilities": "gitlab_sync.apis.gitlab_sync_vulnerabilities_api._sync_vulnerabilities_background",
+}
+
+
+def get_sync_job_function(
+    job_type: str | None,
+) -> Callable[[HttpRequest, GitLabSyncJobTracker], None] | None:
+    """
+    Resolve the background sync function for a queued job type.
+
+    Args:
+        job_type: GitLabSyncJobTracker.job_type (e.g. "merge-requests")
+
+    Returns:
+        The sync function, or None if the job type is unknown
+    """
+    dotted_path = SYNC_JOB_FUNCTIONS.get(job_type or "")
+    if dotted_path is None:
+        return None
+    return import_string(dotted_path)
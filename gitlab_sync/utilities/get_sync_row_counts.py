@@ -0,0 +1,43 @@
+from datetime import timedelta
+from typing import Iterable
+
+from django.db.models import Model
+from django.utils import timezone
+
+from gitlab_sync.models import GitLabSyncRowCount
+from gitlab_sync.utilities.refresh_sync_row_count import refresh_sync_row_count
+
+
+def get_sync_row_counts(
+    models: Iterable[type[Model]], max_age: timedelta = timedelta(hours=1)
+) -> dict[str, int]:
+    """
+    Read approximate row counts for synced tables with a single query.
+
+    Counts are kept current by the sync writers; a table is only counted
+    exactly when it has no stored count yet or its last exact count is older
+    than ``max_age`` (catching rows deleted outside a sync).
+
+    Args:
+        models: Synced models to report
+        max_age: Maximum age of the last exact count before recounting
+
+    Returns:
+        Model class name -> row count
+    """
+    models = list(models)
+    stale_before = timezone.now() - max_age
+    stored = {
+        model_name: (row_count, counted_at)
+        for model_name, row_count, counted_at in GitLabSyncRowCount.objects.filter(
+            model_name__in=[model.__name__ for model in models]
+        ).values_list("model_name", "row_count", "counted_at")
+    }
+
+    row_counts: dict[str, int] = {}
+    for model in models:
+        row_count, counted_at = stored.get(model.__name__, (None, None))
+        if row_count is None or counted_at is None or counted_at < stale_before:
+            row_count = refresh_sync_row_count(model)
+        row_counts[model.__name__] = row_count
+    return row_counts
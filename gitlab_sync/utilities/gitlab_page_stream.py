@@ -0,0 +1,174 @@
+from dataclasses import dataclass, field
+from math import ceil
+from typing import Any, Callable, Iterator
+
+from gitlab.base import RESTObjectList
+
+from gitlab_sync.utilities.handle_gitlab_api_errors import handle_gitlab_api_errors
+from gitlab_sync.utilities.sync_result import SyncResult
+
+# GitLab caps per_page at 100
+GITLAB_MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class GitLabPageStream:
+    """
+    Streams a python-gitlab list to the database writer one page at a time.
+
+    Built on ``list(iterator=True)``, which follows GitLab's ``Link: rel="next"``
+    header lazily, so only the page being written is held in memory no matter
+    how large the project is. ``open`` fetches the first page (call it from a
+    ``fetch_concurrently`` worker so first pages of many projects load in
+    parallel); ``pages`` fetches the rest on the caller's thread as it goes.
+
+    Pass ``keyset=True`` for endpoints that support keyset pagination (projects,
+    groups, users, project jobs, repository tree) - offset pagination gets slow
+    and stops reporting totals on very large lists. Other endpoints (merge
+    requests, issues, commits) only page by offset.
+
+    Example:
+        def fetch_commits(project):
+            return GitLabPageStream.open(
+                list_objects=git_lab_client.projects.get(id=project.id, lazy=True).commits.list,
+                entity_name=f"Commits for project {project.path_with_namespace}",
+                since=since.isoformat(),
+            )
+
+        for project, (stream, error) in fetch_concurrently(projects, fetch_commits, 4):
+            for page in stream.pages(sync_result=sync_result):
+                save_commits(project, page)
+            if stream.error:
+                sync_result.add_failure(stream.error)
+    """
+
+    entity_name: str
+    page_size: int = GITLAB_MAX_PAGE_SIZE
+    max_items: int | None = None
+    page_number: int = 0
+    item_count: int = 0
+    error: str | None = None
+    _objects: RESTObjectList | None = field(default=None, init=False, repr=False)
+    _first_page: list[dict] | None = field(default=None, init=False, repr=False)
+    _buffer: list[dict] = field(default_factory=list, init=False, repr=False)
+    _exhausted: bool = field(default=False, init=False, repr=False)
+
+    @classmethod
+    def open(
+        cls,
+        list_objects: Callable[..., RESTObjectList],
+        entity_name: str,
+        page_size: int = GITLAB_MAX_PAGE_SIZE,
+        max_items: int | None = None,
+        keyset: bool = False,
+        max_retries: int = 3,
+        **list_parameters: Any,
+    ) -> tuple["GitLabPageStream | None", str | None]:
+        """
+        Start a list request and fetch its first page.
+
+        Args:
+            list_objects: A manager's ``list`` method (e.g. ``project.commits.list``)
+            entity_name: Name of the entity being synced (for logging)
+            page_size: Items per page, capped at GitLab's maximum of 100
+            max_items: Stop after this many items (None for no limit)
+            keyset: Use keyset pagination ordered by ascending id
+            max_retries: Attempts per page before giving up
+            **list_parameters: Extra filters passed to ``list``
+
+        Returns:
+            Tuple of (stream, error_message), like ``handle_gitlab_api_errors``
+        """
+        page_size = min(page_size, GITLAB_MAX_PAGE_SIZE)
+        if max_items is not None:
+            page_size = max(1, min(page_size, max_items))
+        if keyset:
+            list_parameters = {
+                "pagination": "keyset",
+                "order_by": "id",
+                "sort": "asc",
+                **list_parameters,
+            }
+
+        stream = cls(entity_name=entity_name, page_size=page_size, max_items=max_items)
+
+        def start() -> GitLabPageStream:
+            if stream._objects is None:
+                stream._objects = list_objects(
+                    iterator=True, per_page=page_size, **list_parameters
+                )
+            stream._first_page = stream._read_page()
+            return stream
+
+        return handle_gitlab_api_errors(
+            func=start, entity_name=entity_name, max_retries=max_retries
+        )
+
+    @property
+    def total(self) -> int | None:
+        """Total number of items GitLab reported, or None if it did not say."""
+        total = self._objects.total if self._objects is not None else None
+        if total is None or self.max_items is None:
+            return total
+        return min(total, self.max_items)
+
+    @property
+    def total_pages(self) -> int | None:
+        """Total number of pages this stream will yield, or None if unknown."""
+        total = self.total
+        if total is None:
+            return None
+        return max(1, ceil(total / self.page_size))
+
+    def pages(
+        self, sync_result: SyncResult | None = None, max_retries: int = 3
+    ) -> Iterator[list[dict]]:
+        """
+        Yield each page as a list of dicts, fetching the next one only when asked.
+
+        A page that still fails after ``max_retries`` ends the stream and sets
+        ``error``; pages already yielded stay written, so callers should not move
+        incremental cursors past a stream that ended with an error.
+
+        Args:
+            sync_result: Receives a page-level progress line for every page
+            max_retries: Attempts per page before giving up
+        """
+        page, self._first_page = self._first_page, None
+        while page:
+            if sync_result is not None:
+                sync_result.add_page(
+                    self.entity_name, self.page_number, self.total_pages, len(page)
+                )
+            yield page
+
+            if self._exhausted:
+                return
+            page, self.error = handle_gitlab_api_errors(
+                func=self._read_page,
+                entity_name=self.entity_name,
+                max_retries=max_retries,
+            )
+
+    def _read_page(self) -> list[dict]:
+        """Read up to one page of items, requesting the next page from GitLab if needed."""
+        limit = self.page_size
+        if self.max_items is not None:
+            limit = min(limit, self.max_items - self.item_count)
+
+        # Items read before a failed request stay buffered, so a retry resumes
+        # instead of dropping them
+        while len(self._buffer) < limit:
+            gitlab_object = next(self._objects, None)
+            if gitlab_object is None:
+                self._exhausted = True
+                break
+            self._buffer.append(gitlab_object.asdict())
+
+        page, self._buffer = self._buffer, []
+        if page:
+            self.page_number += 1
+            self.item_count += len(page)
+        if self.max_items is not None and self.item_count >= self.max_items:
+            self._exhausted = True
+        return page
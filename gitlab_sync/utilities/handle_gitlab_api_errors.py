@@ -8,9 +8,16 @@ from gitlab.exceptions import (
     GitlabListError,
 )
 
+from core.utilities.git_lab.git_lab_rate_limiter import git_lab_rate_limiter
+
 T = TypeVar("T")
 
 
+def _retry_delay_seconds(attempt: int, backoff_factor: float) -> float:
+    """Exponential backoff, stretched to any rate limit pause GitLab asked for."""
+    return max(backoff_factor**attempt, git_lab_rate_limiter.blocked_seconds())
+
+
 def handle_gitlab_api_errors(
     func: Callable[[], T],
     entity_name: str,
@@ -24,7 +31,8 @@ def handle_gitlab_api_errors(
         func: Function to execute that makes GitLab API calls
         entity_name: Name of the entity being synced (for logging)
         max_retries: Maximum number of retry attempts (default: 3)
-        backoff_factor: Exponential backoff multiplier (default: 2.0)
+        backoff_factor: Exponential backoff multiplier (default: 2.0); retries
+            also wait out any rate limit pause signalled by GitLab (429 / Retry-After)
 
     Returns:
         Tuple of (result, error_message)
@@ -68,9 +76,9 @@ def handle_gitlab_api_errors(
             last_error = error_msg
 
             if attempt < max_retries - 1:
-                sleep_time = backoff_factor**attempt
+                sleep_time = _retry_delay_seconds(attempt, backoff_factor)
                 print(
-                    f"[GitLabSync] Retrying in {sleep_time}s "
+                    f"[GitLabSync] Retrying in {sleep_time:.1f}s "
                     f"(attempt {attempt + 1}/{max_retries})..."
                 )
                 time.sleep(sleep_time)
@@ -88,9 +96,9 @@ def handle_gitlab_api_errors(
             last_error = error_msg
 
             if attempt < max_retries - 1:
-                sleep_time = backoff_factor**attempt
+                sleep_time = _retry_delay_seconds(attempt, backoff_factor)
                 print(
-                    f"[GitLabSync] Retrying in {sleep_time}s "
+                    f"[GitLabSync] Retrying in {sleep_time:.1f}s "
                     f"(attempt {attempt + 1}/{max_retries})..."
                 )
                 time.sleep(sleep_time)
@@ -102,9 +110,9 @@ def handle_gitlab_api_errors(
             last_error = error_msg
 
             if attempt < max_retries - 1:
-                sleep_time = backoff_factor**attempt
+                sleep_time = _retry_delay_seconds(attempt, backoff_factor)
                 print(
-                    f"[GitLabSync] Retrying in {sleep_time}s "
+                    f"[GitLabSync] Retrying in {sleep_time:.1f}s "
                     f"(attempt {attempt + 1}/{max_retries})..."
                 )
                 time.sleep(sleep_time)
@@ -0,0 +1,21 @@
+from django.db.models import F, Model
+
+from gitlab_sync.models import GitLabSyncRowCount
+
+
+def increment_sync_row_count(model: type[Model], created_count: int) -> None:
+    """
+    Add rows a sync writer just inserted to the table's stored row count.
+
+    One UPDATE per written page; tables without a stored count are left alone
+    and counted exactly the first time their count is read.
+
+    Args:
+        model: The synced model rows were inserted into
+        created_count: Number of rows inserted
+    """
+    if created_count <= 0:
+        return
+    GitLabSyncRowCount.objects.filter(model_name=model.__name__).update(
+        row_count=F("row_count") + created_count
+    )
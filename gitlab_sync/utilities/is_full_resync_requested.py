@@ -0,0 +1,10 @@
+from django.http import HttpRequest
+
+
+def is_full_resync_requested(request: HttpRequest) -> bool:
+    """
+    Check whether a sync request asked to ignore incremental cursors.
+
+    Triggered with ``?full_resync=1`` (or ``true``) on any sync API endpoint.
+    """
+    return request.GET.get("full_resync", "").lower() in ("1", "true", "yes")
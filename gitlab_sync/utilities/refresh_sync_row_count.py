@@ -0,0 +1,22 @@
+from django.db.models import Model
+from django.utils import timezone
+
+from gitlab_sync.models import GitLabSyncRowCount
+
+
+def refresh_sync_row_count(model: type[Model]) -> int:
+    """
+    Count a synced table exactly and store the result.
+
+    Args:
+        model: The synced model (e.g. GitLabSyncEvent)
+
+    Returns:
+        The current row count
+    """
+    row_count = model.objects.count()
+    GitLabSyncRowCount.objects.update_or_create(
+        model_name=model.__name__,
+        defaults={"row_count": row_count, "counted_at": timezone.now()},
+    )
+    return row_count
@@ -0,0 +1,25 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from gitlab_sync.models import GitLabSyncJobTracker
+
+
+def renew_sync_job_leases(worker_id: str, lease_seconds: int = 120) -> int:
+    """
+    Heartbeat every running job leased by a worker.
+
+    Args:
+        worker_id: Identifier of the worker holding the leases
+        lease_seconds: New lease duration from now
+
+    Returns:
+        Number of leases renewed
+    """
+    now = timezone.now()
+    return GitLabSyncJobTracker.objects.filter(
+        status="running", lease_owner=worker_id
+    ).update(
+        lease_expires_at=now + timedelta(seconds=lease_seconds),
+        heartbeat_at=now,
+    )
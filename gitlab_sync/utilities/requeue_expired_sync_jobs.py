@@ -0,0 +1,58 @@
+from django.utils import timezone
+
+from gitlab_sync.models import GitLabSyncJobTracker
+
+
+def requeue_expired_sync_jobs(max_attempts: int = 3) -> int:
+    """
+    Recover running jobs whose worker stopped heartbeating.
+
+    A lease only expires when its worker died or hung (restart, deploy, crash).
+    Such jobs go back to "pending" so the next worker resumes them - syncs are
+    idempotent upserts and incremental cursors skip work already written. Jobs
+    that already used ``max_attempts`` leases, and full sync stage jobs, are
+    marked failed instead.
+
+    Args:
+        max_attempts: Maximum number of leases a job may take
+
+    Returns:
+        Number of jobs requeued or failed
+    """
+    now = timezone.now()
+    expired_jobs = GitLabSyncJobTracker.objects.filter(
+        status="running", lease_expires_at__lt=now
+    )
+
+    count = 0
+    for job in expired_jobs:
+        timestamp = now.strftime("%H:%M:%S")
+        # Full sync stage jobs are rerun by their requeued parent, never on their own
+        if job.attempts < max_attempts and job.parent_id is None:
+            updated = GitLabSyncJobTracker.objects.filter(
+                id=job.id, status="running", lease_expires_at__lt=now
+            ).update(status="pending", lease_owner=None, lease_expires_at=None)
+            message = (
+                f"[{timestamp}] ♻️ Worker {job.lease_owner} stopped responding - "
+                f"job requeued to resume (attempt {job.attempts}/{max_attempts})"
+            )
+        else:
+            error_message = (
+                f"Job lease expired after {job.attempts} attempts - "
+                "worker stopped responding"
+            )
+            updated = GitLabSyncJobTracker.objects.filter(
+                id=job.id, status="running", lease_expires_at__lt=now
+            ).update(
+                status="failed",
+                end_time=now,
+                error_messages=[*(job.error_messages or []), error_message],
+            )
+            message = f"[{timestamp}] ❌ {error_message}"
+
+        if updated:
+            job.append_logs([message])
+            count += 1
+            print(f"[RequeueSync] {message}")
+
+    return count
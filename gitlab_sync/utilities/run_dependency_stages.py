@@ -0,0 +1,95 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from graphlib import TopologicalSorter
+from typing import Callable, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+def run_dependency_stages(
+    stages: dict[str, tuple[str, ...]],
+    run_stage: Callable[[str], bool],
+    max_workers: int,
+    completed: Iterable[str] = (),
+    should_stop: Callable[[], bool] = lambda: False,
+    poll_seconds: float = 5.0,
+    on_stage_error: Callable[[str, Exception], None] | None = None,
+) -> Iterator[tuple[str, str]]:
+    """
+    Run a DAG of stages, starting each one as soon as its dependencies finish.
+
+    Independent branches run concurrently on a bounded thread pool. A stage whose
+    dependency failed (or was itself blocked) is not run, so downstream syncs never
+    resolve links against missing rows. Dependencies outside ``stages`` are treated
+    as already satisfied, which lets callers rerun a subgraph.
+
+    Args:
+        stages: Stage name -> names of the stages it depends on
+        run_stage: Runs one stage on a worker thread; returns False if dependents must not run
+        max_workers: Maximum number of stages running at once
+        completed: Stages already finished by an earlier attempt (not run again)
+        should_stop: Polled while stages run; once True no new stages are started
+        poll_seconds: How often ``should_stop`` is polled
+        on_stage_error: Called on the calling thread with a stage that raised and its
+            exception, before the stage is yielded as "failed"; the traceback is logged
+
+    Yields:
+        (stage, outcome) on the calling thread as stages finish, where outcome is
+        "completed", "failed", "blocked" or "skipped"
+
+    Raises:
+        graphlib.CycleError: If the stage dependencies contain a cycle
+    """
+    dependencies = {
+        stage: {dependency for dependency in stage_dependencies if dependency in stages}
+        for stage, stage_dependencies in stages.items()
+    }
+    sorter = TopologicalSorter(dependencies)
+    sorter.prepare()
+
+    already_completed = set(completed)
+    unsuccessful: set[str] = set()
+    running: dict[Future, str] = {}
+    stopping = False
+    executor = ThreadPoolExecutor(
+        max_workers=max(max_workers, 1), thread_name_prefix="gitlab-sync-stage"
+    )
+
+    try:
+        while sorter.is_active():
+            if not stopping:
+                for stage in sorter.get_ready():
+                    if stage in already_completed:
+                        sorter.done(stage)
+                        yield stage, "skipped"
+                    elif dependencies[stage] & unsuccessful:
+                        unsuccessful.add(stage)
+                        sorter.done(stage)
+                        yield stage, "blocked"
+                    else:
+                        running[executor.submit(run_stage, stage)] = stage
+
+            if not running:
+                if stopping:
+                    break
+                continue
+
+            finished, _ = wait(running, timeout=poll_seconds, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                try:
+                    succeeded = future.result()
+                except Exception as error:
+                    logger.exception("Stage %s raised", stage)
+                    if on_stage_error is not None:
+                        on_stage_error(stage, error)
+                    succeeded = False
+                if not succeeded:
+                    unsuccessful.add(stage)
+                sorter.done(stage)
+                yield stage, "completed" if succeeded else "failed"
+
+            if not stopping and should_stop():
+                stopping = True
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
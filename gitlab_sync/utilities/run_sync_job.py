@@ -0,0 +1,114 @@
+import traceback
+
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.http import HttpRequest, QueryDict
+from django.utils import timezone
+
+from core.utilities.git_lab.git_lab_request_metrics import (
+    GitLabRequestMetrics,
+    collect_git_lab_request_metrics,
+)
+from gitlab_sync.models import GitLabSyncJobTracker
+from gitlab_sync.utilities.get_sync_job_function import get_sync_job_function
+
+
+def _build_job_request(job_tracker: GitLabSyncJobTracker) -> HttpRequest:
+    """Rebuild the triggering request's query parameters and user for a queued job."""
+    request = HttpRequest()
+    request.method = "GET"
+    query_dict = QueryDict(mutable=True)
+    query_dict.update((job_tracker.parameters or {}).get("query", {}))
+    query_dict._mutable = False
+    request.GET = query_dict
+    request.user = job_tracker.user or AnonymousUser()
+    return request
+
+
+def _mark_job_failed(job_tracker: GitLabSyncJobTracker, log_lines: list[str], error_message: str) -> None:
+    """Mark a job failed unless it already finished or was cancelled."""
+    job_tracker.refresh_from_db()
+    if job_tracker.status != "running":
+        return
+    job_tracker.status = "failed"
+    job_tracker.append_logs(log_lines)
+    if not job_tracker.error_messages:
+        job_tracker.error_messages = []
+    job_tracker.error_messages.append(error_message)
+    job_tracker.end_time = timezone.now()
+    job_tracker.save(update_fields=["status", "error_messages", "end_time"])
+
+
+def _record_request_metrics(
+    job_tracker: GitLabSyncJobTracker, request_metrics: GitLabRequestMetrics
+) -> None:
+    """Store the job's GitLab request metrics and add a summary log line."""
+    if request_metrics.request_count == 0:
+        return
+    GitLabSyncJobTracker.objects.filter(id=job_tracker.id).update(
+        request_metrics=request_metrics.to_dict()
+    )
+    timestamp = timezone.now().strftime("%H:%M:%S")
+    job_tracker.append_logs([f"[{timestamp}] 🌐 {request_metrics}"])
+    print(f"[RunSync] Job {job_tracker.id}: {request_metrics}")
+
+
+def run_sync_job(job_tracker: GitLabSyncJobTracker) -> None:
+    """
+    Execute a leased sync job on the current thread.
+
+    Called by the sync worker for each job returned by ``claim_sync_job``. Uses
+    its own database connection and always leaves the job in a final state.
+    GitLab requests made by the sync are recorded in ``request_metrics``.
+
+    Args:
+        job_tracker: The leased (status "running") job tracker
+    """
+    try:
+        sync_function = get_sync_job_function(job_tracker.job_type)
+        if sync_function is None:
+            error_timestamp = timezone.now().strftime("%H:%M:%S")
+            _mark_job_failed(
+                job_tracker,
+                [f"[{error_timestamp}] ❌ Unknown sync job type: {job_tracker.job_type}"],
+                f"Unknown sync job type: {job_tracker.job_type}",
+            )
+            return
+
+        print(f"[RunSync] Starting sync function for job {job_tracker.id} ({job_tracker.job_type})")
+        with collect_git_lab_request_metrics() as request_metrics:
+            try:
+                sync_function(_build_job_request(job_tracker), job_tracker)
+            finally:
+                _record_request_metrics(job_tracker, request_metrics)
+
+        # Sync functions finish through SyncResult; only a silent return is left running
+        completed = GitLabSyncJobTracker.objects.filter(
+            id=job_tracker.id, status="running"
+        ).update(status="completed", end_time=timezone.now())
+        if completed:
+            print(f"[RunSync] Job {job_tracker.id} completed successfully")
+
+    except Exception as error:
+        print(f"[RunSync] Job {job_tracker.id} failed with error: {error}")
+        error_trace = traceback.format_exc()
+        traceback.print_exc()
+
+        try:
+            error_timestamp = timezone.now().strftime("%H:%M:%S")
+            _mark_job_failed(
+                job_tracker,
+                [
+                    f"[{error_timestamp}] ❌ Critical error: {str(error)}",
+                    f"[{error_timestamp}] Stack trace: {error_trace}",
+                ],
+                str(error),
+            )
+            print(f"[RunSync] Job {job_tracker.id} marked as failed")
+        except Exception as update_error:
+            print(f"[RunSync] CRITICAL: Failed to update job tracker on error: {update_error}")
+            traceback.print_exc()
+
+    finally:
+        # Worker threads each hold their own connection - release it with the job
+        connection.close()
@@ -1,3 +1,4 @@
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -11,6 +12,12 @@ class SyncResult:
 
     Provides detailed statistics about the sync process including
     success/failure counts, error messages, and real-time progress updates.
+
+    Log lines and progress are buffered in memory and flushed to the job tracker
+    at most every ``flush_interval_seconds`` or once ``flush_max_lines`` lines are
+    pending, whichever comes first. Each flush is one UPDATE of the tracker row
+    plus one INSERT of the pending GitLabSyncJobLog rows. ``finish()`` always
+    flushes.
     """
 
     entity_type: str
@@ -25,6 +32,12 @@ class SyncResult:
     job_tracker_id: int | None = None
     current_count: int = 0
     estimated_total: int = 0
+    pages_fetched: int = 0
+    flush_interval_seconds: float = 2.0
+    flush_max_lines: int = 200
+    _pending_logs: list[str] = field(default_factory=list, init=False, repr=False)
+    _flushed_error_count: int = field(default=0, init=False, repr=False)
+    _last_flush_time: float = field(default_factory=time.monotonic, init=False, repr=False)
 
     def add_success(self) -> None:
         """Increment successful sync count."""
@@ -42,56 +55,100 @@ class SyncResult:
         self.skipped_count += 1
 
     def finish(self) -> None:
-        """Mark sync as finished and record end time."""
+        """Mark sync as finished, record end time and flush all buffered logs."""
         self.end_time = timezone.now()
-        self._update_job_tracker()
+        self._refresh_row_count()
+        self.flush()
 
     def add_log(self, message: str) -> None:
-        """Add a log message and update job tracker."""
+        """Add a log message and flush to the job tracker if the buffer budget is spent."""
         timestamp = timezone.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}"
         self.logs.append(log_entry)
-        self._update_job_tracker()
+        self._pending_logs.append(log_entry)
+        self._flush_if_due()
+
+    def add_page(
+        self,
+        description: str,
+        page_number: int,
+        total_pages: int | None,
+        item_count: int,
+    ) -> None:
+        """Record one fetched page of a paginated GitLab list."""
+        self.pages_fetched += 1
+        self.add_log(
+            f"📄 {description}: page {page_number}/{total_pages or '?'} ({item_count} items)"
+        )
 
     def update_progress(
         self, current: int, total: int, message: str | None = None
     ) -> None:
-        """Update progress tracking and job tracker."""
+        """Update progress tracking and flush to the job tracker if due."""
         self.current_count = current
         self.estimated_total = total
         if message:
             self.add_log(message)
         else:
-            self._update_job_tracker()
+            self._flush_if_due()
+
+    def flush(self) -> None:
+        """Write buffered progress, errors and log lines to the job tracker now."""
+        self._update_job_tracker()
+
+    def _flush_if_due(self) -> None:
+        """Flush when enough lines are pending or enough time has passed since the last flush."""
+        if (
+            len(self._pending_logs) >= self.flush_max_lines
+            or time.monotonic() - self._last_flush_time >= self.flush_interval_seconds
+        ):
+            self.flush()
 
     def _update_job_tracker(self) -> None:
-        """Update the database job tracker with current progress."""
+        """Update the database job tracker with current progress and pending logs."""
+        self._last_flush_time = time.monotonic()
         if not self.job_tracker_id:
+            self._pending_logs.clear()
             return
 
         try:
-            from gitlab_sync.models import GitLabSyncJobTracker
-
-            job_tracker = GitLabSyncJobTracker.objects.filter(
+            from gitlab_sync.models import GitLabSyncJobLog, GitLabSyncJobTracker
+
+            tracker_updates = {
+                "current_count": self.current_count,
+                "total_count": self.estimated_total,
+                "progress_percent": self._calculate_progress_percent(),
+                "end_time": self.end_time,
+            }
+            if len(self.errors) != self._flushed_error_count:
+                tracker_updates["error_messages"] = list(self.errors)
+
+            updated_rows = GitLabSyncJobTracker.objects.filter(
                 id=self.job_tracker_id
-            ).first()
-            if not job_tracker:
+            ).update(**tracker_updates)
+            if not updated_rows:
                 error_msg = f"Job tracker {self.job_tracker_id} not found!"
                 print(f"[SyncResult] {error_msg}")
                 self.logs.append(f"[{timezone.now().strftime('%H:%M:%S')}] ❌ {error_msg}")
+                self._pending_logs.clear()
                 return
-
-            job_tracker.current_count = self.current_count
-            job_tracker.total_count = self.estimated_total
-            job_tracker.progress_percent = self._calculate_progress_percent()
-            job_tracker.error_messages = self.errors
-            job_tracker.detailed_logs = self.logs
-            job_tracker.end_time = self.end_time
+            self._flushed_error_count = len(self.errors)
 
             if self.end_time:
-                job_tracker.status = "failed" if not self.success else "completed"
+                # Never overwrite a cancellation recorded by the cancel API
+                GitLabSyncJobTracker.objects.filter(
+                    id=self.job_tracker_id, status="running"
+                ).update(status="failed" if not self.success else "completed")
+
+            if self._pending_logs:
+                GitLabSyncJobLog.objects.bulk_create(
+                    [
+                        GitLabSyncJobLog(job_tracker_id=self.job_tracker_id, message=message)
+                        for message in self._pending_logs
+                    ]
+                )
+                self._pending_logs.clear()
 
-            job_tracker.save()
             print(
                 f"[SyncResult] Updated job {self.job_tracker_id}: {self.current_count}/{self.estimated_total} ({self._calculate_progress_percent()}%)"
             )
@@ -103,10 +160,27 @@ class SyncResult:
 
             # Add error to logs so it's visible if we can update later
             timestamp = timezone.now().strftime("%H:%M:%S")
-            self.logs.append(f"[{timestamp}] ❌ Database update error: {str(e)}")
+            log_entry = f"[{timestamp}] ❌ Database update error: {str(e)}"
+            self.logs.append(log_entry)
+            self._pending_logs.append(log_entry)
             self.errors.append(f"Job tracker update failed: {str(e)}")
             self.success = False
 
+    def _refresh_row_count(self) -> None:
+        """Recount the synced table so the dashboard shows exact totals after a sync."""
+        from django.apps import apps
+
+        from gitlab_sync.utilities.refresh_sync_row_count import refresh_sync_row_count
+
+        try:
+            model = apps.get_model("gitlab_sync", self.entity_type)
+        except LookupError:
+            return
+        try:
+            refresh_sync_row_count(model)
+        except Exception as e:
+            print(f"[SyncResult] Error refreshing row count for {self.entity_type}: {e}")
+
     def _calculate_progress_percent(self) -> int:
         """Calculate progress as a percentage (0-100)."""
         if self.estimated_total == 0:
@@ -143,6 +217,7 @@ class SyncResult:
             "job_tracker_id": self.job_tracker_id,
             "current_count": self.current_count,
             "estimated_total": self.estimated_total,
+            "pages_fetched": self.pages_fetched,
             "progress_percent": self._calculate_progress_percent(),
         }
 
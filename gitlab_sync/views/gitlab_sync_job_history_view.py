@@ -1,3 +1,4 @@
+from django.db.models import F
 from django.http import HttpRequest, HttpResponse
 
 from core.utilities.base_render import base_render
@@ -18,7 +19,8 @@ def gitlab_sync_job_history_view(request: HttpRequest) -> HttpResponse:
     else:
         jobs = GitLabSyncJobTracker.objects.filter(status=status_filter)
 
-    jobs = jobs.order_by("-start_time")[:100]  # Last 100 jobs
+    # Queued jobs have no start_time yet - list them first
+    jobs = jobs.order_by(F("start_time").desc(nulls_first=True), "-id")[:100]  # Last 100 jobs
 
     context = {
         "jobs": jobs,
@@ -0,0 +1,11 @@
+from typing import TypedDict
+
+
+class DeveloperChartDataModel(TypedDict):
+    accuracy: list[float]
+    velocity: list[float]
+
+
+class ChartDataForDevelopersModel(TypedDict):
+    developers: dict[str, DeveloperChartDataModel]
+    labels: list[str]
@@ -0,0 +1,67 @@
+from collections.abc import Iterable
+
+from core.models.person import Person
+from core.models.sprint import Sprint
+from kpi.ajax.chart_data.common.chart_data_for_developers_model import (
+    ChartDataForDevelopersModel,
+    DeveloperChartDataModel,
+)
+from kpi.models.key_performance_indicator_sprint import KeyPerformanceIndicatorSprint
+
+NO_SPRINT_DATA_LABEL = "No Sprint Data"
+
+
+def get_velocity_and_accuracy(sprint_kpi: KeyPerformanceIndicatorSprint | None) -> tuple[float, float]:
+    if sprint_kpi is None:
+        return 0, 0
+    number_of_story_points_delivered: int = sprint_kpi.coerced_number_of_story_points_delivered
+    number_of_story_points_committed_to: int = sprint_kpi.coerced_number_of_story_points_committed_to
+    adjusted_capacity: int = sprint_kpi.coerced_scrum_capacity_base - sprint_kpi.coerced_number_of_paid_time_off_days
+    velocity: float = 0
+    if adjusted_capacity > 0:
+        velocity = round(ndigits=2, number=number_of_story_points_delivered / adjusted_capacity)
+    accuracy: float = 0
+    if number_of_story_points_committed_to > 0:
+        accuracy = round(ndigits=2, number=number_of_story_points_delivered / number_of_story_points_committed_to)
+    return velocity, accuracy
+
+
+def get_chart_data_for_developers(
+        developers: Iterable[Person],
+        number_of_sprints: int = 5,
+) -> ChartDataForDevelopersModel:
+    """
+    Velocity and accuracy series of many developers over the last sprints.
+
+    One query loads the sprints and one loads every matching KPI row, so the
+    cost does not grow with the number of developers. Series run from the
+    oldest to the newest sprint and are padded at the start with zeros when
+    fewer sprints exist.
+    """
+    developers: list[Person] = list(developers)
+    sprints: list[Sprint] = list(Sprint.objects.all().order_by('-date_end')[:number_of_sprints])
+
+    sprint_kpis: dict[tuple[int, int], KeyPerformanceIndicatorSprint] = {}
+    for sprint_kpi in KeyPerformanceIndicatorSprint.objects.filter(
+            person_developer__in=[developer.id for developer in developers],
+            sprint__in=[sprint.id for sprint in sprints],
+    ).select_related("person_developer"):
+        # Keep the row .first() picked under the default ordering
+        sprint_kpis.setdefault((sprint_kpi.person_developer_id, sprint_kpi.sprint_id), sprint_kpi)
+
+    padding: list[float] = [0] * (number_of_sprints - len(sprints))
+    chart_data: dict[str, DeveloperChartDataModel] = {}
+    for developer in developers:
+        series: list[tuple[float, float]] = [
+            get_velocity_and_accuracy(sprint_kpi=sprint_kpis.get((developer.id, sprint.id)))
+            for sprint in reversed(sprints)
+        ]
+        chart_data[str(developer.uuid)] = {
+            "accuracy": padding + [accuracy for _, accuracy in series],
+            "velocity": padding + [velocity for velocity, _ in series],
+        }
+
+    return {
+        "developers": chart_data,
+        "labels": [NO_SPRINT_DATA_LABEL] * len(padding) + [sprint.name for sprint in reversed(sprints)],
+    }
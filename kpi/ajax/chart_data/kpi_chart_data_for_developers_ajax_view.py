@@ -0,0 +1,54 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils.cache import get_conditional_response
+
+from core.models.person import Person
+from core.models.sprint import Sprint
+from core.models.this_server_configuration import ThisServerConfiguration
+from kpi.ajax.chart_data.common.chart_data_for_developers_model import ChartDataForDevelopersModel
+from kpi.ajax.chart_data.common.get_chart_data_for_developers import get_chart_data_for_developers
+from kpi.models.key_performance_indicator_sprint import KeyPerformanceIndicatorSprint
+
+DEFAULT_NUMBER_OF_SPRINTS = 5
+MAX_NUMBER_OF_SPRINTS = 26
+
+
+def kpi_chart_data_for_developers_ajax_view(request: HttpRequest) -> JsonResponse | HttpResponse:
+    """
+    Velocity and accuracy series of every actively employed developer.
+
+    Revalidated with an ETag derived from everything the series are built
+    from: the KPI rows, the charted sprints, the developers and their
+    capacity. Unchanged data is answered with a 304 after three small queries.
+    """
+    try:
+        number_of_sprints: int = int(request.GET.get("sprints", DEFAULT_NUMBER_OF_SPRINTS))
+    except ValueError:
+        number_of_sprints: int = DEFAULT_NUMBER_OF_SPRINTS
+    number_of_sprints = min(max(number_of_sprints, 1), MAX_NUMBER_OF_SPRINTS)
+
+    latest = KeyPerformanceIndicatorSprint.objects.aggregate(modified=Max("modified"), count=Count("id"))
+    sprints = list(Sprint.objects.order_by("-date_end").values_list("id", "name")[:number_of_sprints])
+    developers: list[Person] = list(Person.developers_actively_employed())
+    version: str = ":".join([
+        latest["modified"].isoformat() if latest["modified"] else "",
+        str(latest["count"]),
+        str(number_of_sprints),
+        repr(sprints),
+        repr([(developer.id, developer.uuid, developer.scrum_capacity_base) for developer in developers]),
+        str(ThisServerConfiguration.current().coerced_scrum_capacity_base),
+    ])
+    etag: str = f'"{hashlib.sha256(version.encode()).hexdigest()[:32]}"'
+
+    response: HttpResponse | None = get_conditional_response(request, etag=etag)
+    if response is None:
+        data: ChartDataForDevelopersModel = get_chart_data_for_developers(
+            developers=developers,
+            number_of_sprints=number_of_sprints,
+        )
+        response = JsonResponse(data=data)
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    return response
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.7 on 2026-10-18 22:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kpi', '0004_add_database_flavors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='keyperformanceindicatorsprint',
+            name='modified',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from django.db import models
 from django.db.models import QuerySet, Q
 from math import ceil
@@ -17,6 +19,13 @@ from git_lab.models.git_lab_iteration import GitLabIteration
 from git_lab.models.git_lab_user import GitLabUser
 from scrum.models.scrum_sprint import ScrumSprint
 
+KPI_SPRINT_CACHED_METRIC_FIELDS: list[str] = [
+    "cached_capacity_adjusted",
+    "cached_capacity_base_velocity",
+    "cached_capacity_per_day",
+    "cached_commitment_accuracy",
+]
+
 
 class KeyPerformanceIndicatorSprint(
     AbstractBaseModel,
@@ -32,6 +41,7 @@ class KeyPerformanceIndicatorSprint(
     git_lab_issues: set[GitLabIssue] | None = models.ManyToManyField(GitLabIssue, related_name="kpi_sprints", blank=True)
     git_lab_iterations: set[GitLabIteration] | None = models.ManyToManyField(GitLabIteration, related_name="kpi_sprints", blank=True)
     git_lab_user: GitLabUser | None = models.ForeignKey(GitLabUser, on_delete=models.SET_NULL, null=True, blank=True, related_name="kpi_sprints")
+    modified: datetime = models.DateTimeField(auto_now=True, db_index=True)
     number_of_code_lines_added: int | None = models.IntegerField(null=True, blank=True)
     number_of_code_lines_removed: int | None = models.IntegerField(null=True, blank=True)
     number_of_comments_made: int | None = models.IntegerField(null=True, blank=True)
@@ -48,10 +58,7 @@ class KeyPerformanceIndicatorSprint(
 
     @property
     def adjusted_capacity(self) -> int:
-        value: int = min(self.coerced_scrum_capacity_base, self.calculated_capacity)
-        self.cached_capacity_adjusted = value
-        self.save()
-        return value
+        return min(self.coerced_scrum_capacity_base, self.calculated_capacity)
 
     @property
     def calculated_capacity(self) -> int:
@@ -59,29 +66,23 @@ class KeyPerformanceIndicatorSprint(
 
     @property
     def capacity_based_velocity(self) -> float:
-        value: float = round(
+        return round(
             ndigits=2,
             number=safe_divide(
                 dividend=self.coerced_number_of_story_points_delivered,
                 divisor=self.adjusted_capacity,
             )
         )
-        self.cached_capacity_based_velocity = value
-        self.save()
-        return value
 
     @property
     def capacity_per_day(self) -> float:
-        value: float = round(
+        return round(
             ndigits=2,
             number=safe_divide(
                 dividend=self.coerced_scrum_capacity_base,
                 divisor=self.coerced_number_of_business_days_in_sprint
             )
         )
-        self.cached_capacity_per_day = value
-        self.save()
-        return value
 
     @property
     def coerced_cached_capacity_adjusted(self) -> int:
@@ -162,16 +163,13 @@ class KeyPerformanceIndicatorSprint(
 
     @property
     def commitment_accuracy(self) -> float:
-        value: float = round(
+        return round(
             ndigits=2,
             number=safe_divide(
                 dividend=self.coerced_number_of_story_points_delivered,
                 divisor=self.coerced_number_of_story_points_committed_to,
             )
         )
-        self.cached_commitment_accuracy = value
-        self.save()
-        return value
 
     @property
     def effective_days(self) -> int:
@@ -181,15 +179,28 @@ class KeyPerformanceIndicatorSprint(
                 - self.coerced_number_of_paid_time_off_days
         )
 
+    def refresh_cached_metrics(self) -> None:
+        """Copy freshly computed metrics into the cached_* fields; the caller saves."""
+        self.cached_capacity_adjusted = self.adjusted_capacity
+        self.cached_capacity_base_velocity = self.capacity_based_velocity
+        self.cached_capacity_per_day = self.capacity_per_day
+        self.cached_commitment_accuracy = self.commitment_accuracy
+
     @staticmethod
     def developers_actively_employed() -> QuerySet['KeyPerformanceIndicatorSprint']:
         developers_actively_employed: QuerySet[Person] = Person.developers_actively_employed()
+        this_server_configuration: ThisServerConfiguration = ThisServerConfiguration.current()
+        kpi_sprints: QuerySet[KeyPerformanceIndicatorSprint] = KeyPerformanceIndicatorSprint.objects.filter(
+            Q(person_developer__in=developers_actively_employed),
+        )
+        # The unsaved default configuration of a fresh install has no exclusions (and no id to query them by)
+        if this_server_configuration.pk is not None:
+            kpi_sprints = kpi_sprints.filter(
+                ~Q(person_developer__in=this_server_configuration.kpi_developers_to_exclude.all())
+            )
         return cast_query_set(
             typ=KeyPerformanceIndicatorSprint,
-            val=KeyPerformanceIndicatorSprint.objects.filter(
-                Q(person_developer__in=developers_actively_employed),
-                ~Q(person_developer__in=ThisServerConfiguration.current().kpi_developers_to_exclude.all())
-            )
+            val=kpi_sprints
         )
 
     @staticmethod
@@ -223,7 +234,9 @@ class KeyPerformanceIndicatorSprint(
     def from_sprint(sprint: Sprint) -> QuerySet['KeyPerformanceIndicatorSprint']:
         return cast_query_set(
             typ=KeyPerformanceIndicatorSprint,
-            val=KeyPerformanceIndicatorSprint.developers_actively_employed().filter(sprint=sprint)
+            val=KeyPerformanceIndicatorSprint.developers_actively_employed().filter(
+                sprint=sprint
+            ).select_related("person_developer", "sprint")
         )
 
     def __str__(self) -> str:
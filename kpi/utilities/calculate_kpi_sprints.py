@@ -0,0 +1,139 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from git_lab.models.git_lab_change import GitLabChange
+from git_lab.models.git_lab_issue import GitLabIssue
+from git_lab.models.git_lab_iteration import GitLabIteration
+from git_lab.models.git_lab_merge_request import GitLabMergeRequest
+from git_lab.models.git_lab_note import GitLabNote
+from git_lab.models.git_lab_user import GitLabUser
+from kpi.models.key_performance_indicator_sprint import KeyPerformanceIndicatorSprint
+from scrum.models.scrum_sprint import ScrumSprint
+
+KPI_SPRINT_METRIC_FIELDS: list[str] = [
+    "number_of_code_lines_added",
+    "number_of_code_lines_removed",
+    "number_of_comments_made",
+    "number_of_context_switches",
+    "number_of_issues_written",
+    "number_of_merge_requests_approved",
+    "number_of_story_points_committed_to",
+    "number_of_story_points_delivered",
+    "number_of_threads_made",
+]
+
+
+def calculate_kpi_sprints(scrum_sprint: ScrumSprint) -> int:
+    """
+    Compute the KPI row of every GitLab user for one sprint.
+
+    Each metric is one grouped query over the whole sprint instead of a set
+    of queries per user; rows and their issue/iteration links are written in
+    bulk. Links are only ever added, as before.
+
+    Returns:
+        Number of KPI rows written
+    """
+    sprint_issues = GitLabIssue.objects.filter(iteration__scrum_sprint=scrum_sprint)
+
+    issues_written: dict[int, int] = dict(
+        sprint_issues.filter(author__isnull=False)
+        .values("author").annotate(count=Count("id")).values_list("author", "count")
+    )
+    story_points: dict[int, tuple[int | None, int | None]] = {
+        row["assignees"]: (row["committed"], row["delivered"])
+        for row in sprint_issues.filter(assignees__isnull=False).values("assignees").annotate(
+            committed=Sum("weight"),
+            delivered=Sum("weight", filter=Q(state="closed", closed_at__date__lte=scrum_sprint.date_end)),
+        )
+    }
+    merge_requests_approved: dict[int, int] = dict(
+        GitLabMergeRequest.objects.filter(
+            reviewers__isnull=False,
+            merged_at__date__gte=scrum_sprint.date_start,
+            merged_at__date__lte=scrum_sprint.date_end,
+        ).values("reviewers").annotate(count=Count("id", distinct=True)).values_list("reviewers", "count")
+    )
+    notes: dict[int, tuple[int, int]] = {
+        row["author"]: (row["comments"], row["threads"])
+        for row in GitLabNote.objects.filter(
+            scrum_sprint=scrum_sprint, author__isnull=False, system=False
+        ).values("author").annotate(comments=Count("id"), threads=Count("discussion", distinct=True))
+    }
+    code_lines: dict[int, tuple[int | None, int | None]] = {
+        row["author"]: (row["added"], row["removed"])
+        for row in GitLabChange.objects.filter(
+            scrum_sprint=scrum_sprint, author__isnull=False
+        ).values("author").annotate(added=Sum("total_lines_added"), removed=Sum("total_lines_removed"))
+    }
+
+    # Context switches: distinct projects of the issues a user wrote or was assigned
+    projects: defaultdict[int, set[int]] = defaultdict(set)
+    for user_id, project_id in sprint_issues.filter(
+        author__isnull=False, project__isnull=False
+    ).values_list("author", "project").order_by().distinct():
+        projects[user_id].add(project_id)
+    for user_id, project_id in sprint_issues.filter(
+        assignees__isnull=False, project__isnull=False
+    ).values_list("assignees", "project").order_by().distinct():
+        projects[user_id].add(project_id)
+
+    issues_authored: defaultdict[int, list[int]] = defaultdict(list)
+    for user_id, issue_id in sprint_issues.filter(author__isnull=False).values_list("author", "id"):
+        issues_authored[user_id].append(issue_id)
+    iteration_ids: list[int] = list(
+        GitLabIteration.objects.filter(scrum_sprint=scrum_sprint).values_list("id", flat=True)
+    )
+
+    existing: dict[int, KeyPerformanceIndicatorSprint] = {}
+    for kpi_sprint in KeyPerformanceIndicatorSprint.objects.filter(
+        scrum_sprint=scrum_sprint, git_lab_user__isnull=False
+    ).order_by("id"):
+        existing.setdefault(kpi_sprint.git_lab_user_id, kpi_sprint)
+
+    to_create: list[KeyPerformanceIndicatorSprint] = []
+    to_update: list[KeyPerformanceIndicatorSprint] = []
+    now = timezone.now()
+    for user_id in GitLabUser.objects.values_list("id", flat=True):
+        kpi_sprint = existing.get(user_id)
+        if kpi_sprint is None:
+            kpi_sprint = KeyPerformanceIndicatorSprint(git_lab_user_id=user_id, scrum_sprint=scrum_sprint)
+            to_create.append(kpi_sprint)
+        else:
+            # bulk_update skips auto_now
+            kpi_sprint.modified = now
+            to_update.append(kpi_sprint)
+        committed, delivered = story_points.get(user_id, (0, 0))
+        comments, threads = notes.get(user_id, (0, 0))
+        lines_added, lines_removed = code_lines.get(user_id, (0, 0))
+        kpi_sprint.number_of_code_lines_added = lines_added or 0
+        kpi_sprint.number_of_code_lines_removed = lines_removed or 0
+        kpi_sprint.number_of_comments_made = comments
+        kpi_sprint.number_of_context_switches = len(projects.get(user_id, ()))
+        kpi_sprint.number_of_issues_written = issues_written.get(user_id, 0)
+        kpi_sprint.number_of_merge_requests_approved = merge_requests_approved.get(user_id, 0)
+        kpi_sprint.number_of_story_points_committed_to = committed or 0
+        kpi_sprint.number_of_story_points_delivered = delivered or 0
+        kpi_sprint.number_of_threads_made = threads
+
+    kpi_sprints = to_create + to_update
+    iteration_through = KeyPerformanceIndicatorSprint.git_lab_iterations.through
+    issue_through = KeyPerformanceIndicatorSprint.git_lab_issues.through
+    with transaction.atomic():
+        KeyPerformanceIndicatorSprint.objects.bulk_create(to_create, batch_size=500)
+        KeyPerformanceIndicatorSprint.objects.bulk_update(to_update, KPI_SPRINT_METRIC_FIELDS + ["modified"], batch_size=500)
+        iteration_through.objects.bulk_create([
+            iteration_through(keyperformanceindicatorsprint_id=kpi_sprint.id, gitlabiteration_id=iteration_id)
+            for kpi_sprint in kpi_sprints
+            for iteration_id in iteration_ids
+        ], batch_size=1000, ignore_conflicts=True)
+        issue_through.objects.bulk_create([
+            issue_through(keyperformanceindicatorsprint_id=kpi_sprint.id, gitlabissue_id=issue_id)
+            for kpi_sprint in kpi_sprints
+            for issue_id in issues_authored.get(kpi_sprint.git_lab_user_id, ())
+        ], batch_size=1000, ignore_conflicts=True)
+
+    return len(kpi_sprints)
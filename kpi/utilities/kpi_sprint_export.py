@@ -0,0 +1,67 @@
+from typing import Any
+
+from django.db.models import QuerySet
+
+from core.utilities.tabular_export import ExportColumn
+from kpi.models.key_performance_indicator_sprint import KeyPerformanceIndicatorSprint
+
+KPI_SPRINT_EXPORT_COLUMNS: list[ExportColumn] = [
+    ExportColumn(title="Developer", group="Developer"),
+    ExportColumn(title="Base Capacity", group="Availability"),
+    ExportColumn(title="Holidays", group="Availability"),
+    ExportColumn(title="PTO Days", group="Availability"),
+    ExportColumn(title="Adjusted Capacity", group="Availability"),
+    ExportColumn(title="Committed", group="Commitments"),
+    ExportColumn(title="Delivered", group="Commitments"),
+    ExportColumn(title="Reviews", group="Code Review Activity"),
+    ExportColumn(title="Comments", group="Code Review Activity"),
+    ExportColumn(title="Threads", group="Code Review Activity"),
+    ExportColumn(title="Issues", group="Development Output"),
+    ExportColumn(title="Code Changes", group="Development Output"),
+    ExportColumn(title="Context Switching", group="Development Output"),
+    ExportColumn(title="Velocity", group="Performance Metrics", number_format="0.00"),
+    ExportColumn(title="Accuracy", group="Performance Metrics", number_format="0.00"),
+]
+
+KPI_SPRINT_HISTORY_EXPORT_COLUMNS: list[ExportColumn] = [
+    ExportColumn(title="Sprint", group="Sprint", width=25),
+    ExportColumn(title="Start", group="Sprint", number_format="yyyy-mm-dd", width=12),
+    ExportColumn(title="End", group="Sprint", number_format="yyyy-mm-dd", width=12),
+    *KPI_SPRINT_EXPORT_COLUMNS,
+]
+
+# Rows fetched per database round trip while exporting
+EXPORT_CHUNK_SIZE = 1000
+
+
+def kpi_sprint_export_row(kpi: KeyPerformanceIndicatorSprint) -> list[Any]:
+    person = kpi.person_developer
+    sprint = kpi.sprint
+    return [
+        person.gitlab_sync_username if person else "N/A",
+        kpi.coerced_scrum_capacity_base,
+        sprint.number_of_holidays_during_sprint if sprint else 0,
+        kpi.coerced_number_of_paid_time_off_days,
+        kpi.adjusted_capacity,
+        kpi.coerced_number_of_story_points_committed_to,
+        kpi.coerced_number_of_story_points_delivered,
+        kpi.coerced_number_of_merge_requests_approved,
+        kpi.coerced_number_of_comments_made,
+        kpi.coerced_number_of_threads_made,
+        kpi.coerced_number_of_issues_written,
+        f"+{kpi.coerced_number_of_code_lines_added}/-{kpi.coerced_number_of_code_lines_removed} lines",
+        kpi.coerced_number_of_context_switches,
+        kpi.capacity_based_velocity,
+        kpi.commitment_accuracy,
+    ]
+
+
+def iter_kpi_sprint_export_rows(kpi_sprints: QuerySet[KeyPerformanceIndicatorSprint]):
+    for kpi in kpi_sprints.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield kpi_sprint_export_row(kpi=kpi)
+
+
+def iter_kpi_sprint_history_export_rows(kpi_sprints: QuerySet[KeyPerformanceIndicatorSprint]):
+    for kpi in kpi_sprints.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        sprint = kpi.sprint
+        yield [sprint.name, sprint.date_start, sprint.date_end, *kpi_sprint_export_row(kpi=kpi)]
@@ -0,0 +1,62 @@
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from core.models.sprint import SPRINT_CACHED_METRIC_FIELDS, Sprint
+from kpi.models.key_performance_indicator_sprint import (
+    KPI_SPRINT_CACHED_METRIC_FIELDS,
+    KeyPerformanceIndicatorSprint,
+)
+
+
+def materialize_sprint_metrics(sprint: Sprint) -> int:
+    """
+    Write the cached_* metric columns of a sprint and its KPI rows.
+
+    Runs once when a sprint closes (see materialize_closed_sprint_metrics);
+    afterwards dashboards read the cached columns (Sprint.metrics) instead of
+    recomputing them.
+
+    Returns:
+        Number of KPI rows materialized
+    """
+    kpi_sprints: list[KeyPerformanceIndicatorSprint] = list(
+        KeyPerformanceIndicatorSprint.objects.filter(sprint=sprint).select_related("person_developer", "sprint")
+    )
+    now = timezone.now()
+    for kpi_sprint in kpi_sprints:
+        kpi_sprint.refresh_cached_metrics()
+        kpi_sprint.modified = now
+    sprint.refresh_cached_metrics()
+
+    with transaction.atomic():
+        KeyPerformanceIndicatorSprint.objects.bulk_update(kpi_sprints, KPI_SPRINT_CACHED_METRIC_FIELDS + ["modified"], batch_size=500)
+        sprint.save(update_fields=SPRINT_CACHED_METRIC_FIELDS)
+    return len(kpi_sprints)
+
+
+def closed_sprints_to_materialize(include_materialized: bool = False) -> QuerySet[Sprint]:
+    """Sprints that ended before today, by default only those without cached metrics yet."""
+    sprints: QuerySet[Sprint] = Sprint.objects.filter(date_end__lt=date.today())
+    if not include_materialized:
+        sprints = sprints.filter(Q(cached_velocity__isnull=True) | Q(cached_accuracy__isnull=True))
+    return sprints
+
+
+def materialize_closed_sprint_metrics() -> int:
+    """
+    Materialize every sprint that closed since the last call.
+
+    The GitLab sync calls this after writing the current sprint's KPI rows,
+    so a sprint is materialized on the first sync after its end date.
+
+    Returns:
+        Number of sprints materialized
+    """
+    materialized: int = 0
+    for sprint in closed_sprints_to_materialize():
+        materialize_sprint_metrics(sprint=sprint)
+        materialized += 1
+    return materialized
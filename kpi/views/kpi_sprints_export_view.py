@@ -0,0 +1,29 @@
+from django.db.models import QuerySet
+from django.http import HttpRequest, HttpResponse
+
+from core.models.sprint import Sprint
+from core.utilities.tabular_export import EXPORT_FORMAT_XLSX, EXPORT_FORMATS, stream_tabular_export
+from core.views.generic.generic_500 import generic_500
+from kpi.models.key_performance_indicator_sprint import KeyPerformanceIndicatorSprint
+from kpi.utilities.kpi_sprint_export import KPI_SPRINT_HISTORY_EXPORT_COLUMNS, iter_kpi_sprint_history_export_rows
+
+
+def kpi_sprints_export_view(request: HttpRequest) -> HttpResponse:
+    """KPI rows of every sprint (or the last ?sprints=N), newest sprint first, in one sheet."""
+    export_format: str = request.GET.get("format", EXPORT_FORMAT_XLSX)
+    if export_format not in EXPORT_FORMATS:
+        return generic_500(request=request)
+    sprint_kpis: QuerySet[KeyPerformanceIndicatorSprint] = KeyPerformanceIndicatorSprint.developers_actively_employed().filter(
+        sprint__isnull=False,
+    ).select_related("person_developer", "sprint").order_by("-sprint__date_end", "sprint_id", "person_developer__name_last", "id")
+    number_of_sprints: str = request.GET.get("sprints", "")
+    if number_of_sprints.isdigit() and int(number_of_sprints) > 0:
+        sprint_ids = list(Sprint.objects.order_by("-date_end").values_list("id", flat=True)[:int(number_of_sprints)])
+        sprint_kpis = sprint_kpis.filter(sprint__in=sprint_ids)
+    return stream_tabular_export(
+        columns=KPI_SPRINT_HISTORY_EXPORT_COLUMNS,
+        export_format=export_format,
+        filename="sprint_kpi_history",
+        rows=iter_kpi_sprint_history_export_rows(kpi_sprints=sprint_kpis),
+        sheet_title="Sprint KPI History",
+    )
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from core.models.common.abstract.abstract_alias import AbstractAlias
 from core.models.common.abstract.abstract_base_model import AbstractBaseModel
@@ -6,6 +8,7 @@ from core.models.common.abstract.abstract_comment import AbstractComment
 from core.models.common.abstract.abstract_name import AbstractName
 from core.models.common.abstract.abstract_start_end_dates import AbstractStartEndDates
 from core.utilities.cast_query_set import cast_query_set
+from core.utilities.sprint_interval_index import SPRINT_INTERVAL_FIELDS, invalidate_sprint_interval_indexes
 
 
 class ScrumSprint(
@@ -76,3 +79,11 @@ class ScrumSprint(
         ordering = ['-date_end', '-id']
         verbose_name = "Scrum Sprint"
         verbose_name_plural = "Scrum Sprints"
+
+
+@receiver(post_save, sender=ScrumSprint)
+@receiver(post_delete, sender=ScrumSprint)
+def invalidate_scrum_sprint_interval_index(sender, update_fields=None, **kwargs) -> None:
+    if update_fields is not None and not SPRINT_INTERVAL_FIELDS.intersection(update_fields):
+        return  # Dates untouched, e.g. cached metrics being saved
+    invalidate_sprint_interval_indexes()